@@ -0,0 +1,100 @@
+"""
+Benchmark: incremental dataset sync vs full re-download.
+
+Serves two releases of a synthetic dataset from an in-process
+``httpx.MockTransport`` and compares
+
+* ``full``: downloading every item of the new release, and
+* ``diff``: ``sync_dataset`` patching the cached previous release,
+
+reporting wall time and response bytes transferred. Network latency is not
+simulated, so the timings are a lower bound for the full download.
+
+Usage:
+    python benchmarks/bench_dataset_sync.py --items 1000000 --changed 0.01
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+import httpx
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_cache import DatasetSnapshotCache
+from noveum_api_client.dataset_sync import sync_dataset
+
+
+def _item(index: int, revision: int = 0) -> dict:
+    return {
+        "item_id": f"item-{index}",
+        "item_type": "qa",
+        "content": {"input": f"question {index}", "expected_output": f"answer {index}.{revision}"},
+    }
+
+
+class _Server:
+    def __init__(self, items: int, changed: int):
+        self.base = [_item(i) for i in range(items)]
+        step = max(items // max(changed, 1), 1)
+        modified = {i: _item(i, 1) for i in range(0, items, step)[:changed]}
+        removed = {i + 1 for i in list(modified)[: changed // 2] if i + 1 < items and i + 1 not in modified}
+        added = [_item(items + i) for i in range(len(removed))]
+        self.target = [modified.get(i, item) for i, item in enumerate(self.base) if i not in removed] + added
+        self.diff = json.dumps(
+            {
+                "from_version": "1.0.0",
+                "to_version": "1.1.0",
+                "added": added,
+                "removed": [f"item-{i}" for i in sorted(removed)],
+                "modified": list(modified.values()),
+            }
+        ).encode()
+        self.bytes_sent = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/versions/diff"):
+            body = self.diff
+        elif path.endswith("/items"):
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            body = json.dumps({"items": self.target[offset : offset + limit]}).encode()
+        else:
+            body = json.dumps({"data": {"version": path.rsplit("/", 1)[-1], "status": "published"}}).encode()
+        self.bytes_sent += len(body)
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+
+def _run(server: _Server, directory: str, full: bool, page_size: int) -> tuple[float, int, str]:
+    client = Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+    cache = DatasetSnapshotCache(directory, page_size=page_size)
+    cache.store("bench", "1.0.0", server.base, {"status": "published"})
+    server.bytes_sent = 0
+    started = time.perf_counter()
+    if full:
+        cache.load(client, "bench", "1.1.0").close()
+        mode = "full"
+    else:
+        mode = sync_dataset(client, "bench", cache).mode
+    return time.perf_counter() - started, server.bytes_sent, mode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000, help="items in the base release")
+    parser.add_argument("--changed", type=float, default=0.01, help="fraction of items modified")
+    parser.add_argument("--page-size", type=int, default=1000, help="items per page for the full download")
+    args = parser.parse_args()
+
+    server = _Server(args.items, int(args.items * args.changed))
+    print(f"{args.items:,} items, {args.changed:.1%} changed")
+    for full in (True, False):
+        with tempfile.TemporaryDirectory() as directory:
+            elapsed, transferred, mode = _run(server, directory, full, args.page_size)
+        print(f"{mode:>5}: {elapsed:8.2f}s  {transferred / 1e6:10.1f} MB transferred")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: columnar ResultsFrame aggregation vs dict loops.
+
+Generates synthetic scorer result records page by page and compares
+
+* ``dicts``: per-scorer pass rate, mean and percentiles computed with Python
+  loops over the result dicts, as done on raw ``get_results`` pages, and
+* ``frame``: loading the same records into a ``ResultsFrame`` and calling
+  ``aggregate()`` / ``histogram()``, with NumPy and (``--python``) without.
+
+Usage:
+    python benchmarks/bench_results_frame.py --results 10000000 --scorers 20
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Iterator
+
+from noveum_api_client import results_frame
+from noveum_api_client.results_frame import ResultsFrame, _percentile
+
+PERCENTILES = (50, 90, 99)
+
+
+def _records(count: int, scorers: int, datasets: int, seed: int = 1) -> Iterator[dict]:
+    rng = random.Random(seed)
+    scorer_ids = [f"scorer-{i}" for i in range(scorers)]
+    dataset_slugs = [f"dataset-{i}" for i in range(datasets)]
+    for i in range(count):
+        score = rng.random()
+        yield {
+            "datasetSlug": dataset_slugs[i % datasets],
+            "itemId": f"item-{i}",
+            "scorerId": scorer_ids[i % scorers],
+            "score": score,
+            "passed": score >= 0.5,
+            "executionTimeMs": rng.random() * 100,
+        }
+
+
+def _dict_loop(records: Iterator[dict]) -> dict[str, dict]:
+    groups: dict[str, list[dict]] = {}
+    for record in records:
+        groups.setdefault(record["scorerId"], []).append(record)
+    summary = {}
+    for scorer_id, group in groups.items():
+        scores = sorted(record["score"] for record in group)
+        summary[scorer_id] = {
+            "pass_rate": sum(record["passed"] for record in group) / len(group),
+            "mean": sum(scores) / len(scores),
+            "percentiles": {q: _percentile(scores, q) for q in PERCENTILES},
+        }
+    return summary
+
+
+def _timed(label: str, fn, *args):
+    started = time.perf_counter()
+    value = fn(*args)
+    print(f"{label:>28}: {time.perf_counter() - started:8.2f}s")
+    return value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=10_000_000, help="number of results")
+    parser.add_argument("--scorers", type=int, default=20, help="distinct scorer IDs")
+    parser.add_argument("--datasets", type=int, default=5, help="distinct dataset slugs")
+    parser.add_argument("--python", action="store_true", help="also time the pure-Python aggregation")
+    parser.add_argument("--skip-dicts", action="store_true", help="skip the dict-loop baseline")
+    args = parser.parse_args()
+
+    records = args.results, args.scorers, args.datasets
+    print(f"{args.results:,} results, {args.scorers} scorers, {args.datasets} datasets")
+    if not args.skip_dicts:
+        _timed("dicts: group + aggregate", _dict_loop, _records(*records))
+
+    frame = _timed("frame: load", ResultsFrame, _records(*records))
+    print(f"{'frame: memory':>28}: {len(frame) * 25 / 1e6:8.1f} MB")
+    if results_frame.np is None:
+        print("NumPy is not installed: the frame timings below are pure Python")
+    _timed("frame: aggregate(scorer)", frame.aggregate, "scorer", PERCENTILES)
+    _timed("frame: aggregate(ds, scorer)", frame.aggregate, "dataset_scorer", PERCENTILES)
+    _timed("frame: histogram(scorer)", frame.histogram, "scorer", 20)
+    if args.python and results_frame.np is not None:
+        results_frame.np = None
+        _timed("python: aggregate(scorer)", frame.aggregate, "scorer", PERCENTILES)
+        _timed("python: histogram(scorer)", frame.histogram, "scorer", 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Internal helpers shared by the hand-written convenience modules."""
+
+import asyncio
+import contextlib
+import json
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, TypeVar
+
+import httpx
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .types import Response
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parse_json(response: Response[Any]) -> Any:
+    """
+    Decode the JSON body of a successful response.
+
+    Many generated endpoints leave ``parsed`` as ``None``, so the helpers read
+    ``content`` directly.
+
+    Raises:
+        errors.UnexpectedStatus: If the response is not a 2xx response.
+    """
+    if not 200 <= response.status_code < 300:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    if not response.content:
+        return None
+    return json.loads(response.content)
+
+
+def unwrap(data: Any, key: str) -> Any:
+    """Return ``data[key]`` when the API wrapped the payload in an envelope, else ``data``."""
+    if isinstance(data, dict) and key in data:
+        return data[key]
+    return data
+
+
+def page_total(data: Any) -> int | None:
+    """Return the total item count of a paginated list response, if it reports one."""
+    if not isinstance(data, dict):
+        return None
+    pagination = data.get("pagination")
+    total = pagination.get("total", pagination.get("totalCount")) if isinstance(pagination, dict) else None
+    if total is None:
+        total = data.get("total")
+    return total if isinstance(total, int) else None
+
+
+def record_field(record: Any, name: str, default: Any = None) -> Any:
+    """Read ``name`` from a raw API record by its snake_case or camelCase key."""
+    if name in record:
+        return record[name]
+    head, *rest = name.split("_")
+    return record.get(head + "".join(part.title() for part in rest), default)
+
+
+# Statuses worth retrying: timeouts, rate limiting and transient server errors
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# The subset where the server refused the request without acting on it, so
+# that even a request that is not idempotent can be sent again
+REFUSED_STATUSES = frozenset({408, 425, 429, 503})
+# Transport errors raised before the request reached the server
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Longest wait honoured from a server's Retry-After header
+MAX_RETRY_AFTER = 60.0
+
+
+def send_raw(
+    endpoint: ModuleType, client: AuthenticatedClient | Client, content: bytes, *args: Any, **kwargs: Any
+) -> Response[Any]:
+    """
+    Send a generated endpoint's request with a pre-serialized JSON body.
+
+    Uses the endpoint module's own URL and header construction, but skips
+    building and ``to_dict()``-ing the body model, which dominates the cost of
+    large batch requests.
+    """
+    request_kwargs = endpoint._get_kwargs(*args, **kwargs)
+    request_kwargs.pop("json", None)
+    request_kwargs["content"] = content
+    request_kwargs.setdefault("headers", {}).setdefault("Content-Type", "application/json")
+    response = client.get_httpx_client().request(**request_kwargs)
+    return endpoint._build_response(client=client, response=response)
+
+
+async def asend_raw(
+    endpoint: ModuleType, client: AuthenticatedClient | Client, content: bytes, *args: Any, **kwargs: Any
+) -> Response[Any]:
+    """Async version of ``send_raw``."""
+    request_kwargs = endpoint._get_kwargs(*args, **kwargs)
+    request_kwargs.pop("json", None)
+    request_kwargs["content"] = content
+    request_kwargs.setdefault("headers", {}).setdefault("Content-Type", "application/json")
+    response = await client.get_async_httpx_client().request(**request_kwargs)
+    return endpoint._build_response(client=client, response=response)
+
+
+def send_unparsed(
+    endpoint: ModuleType, client: AuthenticatedClient | Client, *args: Any, **kwargs: Any
+) -> Response[Any]:
+    """
+    Send a generated endpoint's request without parsing the body into models.
+
+    For callers that only need a few fields of a large response (read them
+    with ``parse_json``); ``parsed`` is always ``None``.
+    """
+    response = client.get_httpx_client().request(**endpoint._get_kwargs(*args, **kwargs))
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=None,
+    )
+
+
+def _retry_delay(response: Response[Any] | None, attempt: int, backoff: float) -> float:
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after is not None:
+        with contextlib.suppress(ValueError):
+            return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+    return backoff * 2**attempt * (0.5 + random.random() / 2)
+
+
+def _retryable(failure: Exception | int, idempotent: bool) -> bool:
+    if isinstance(failure, Exception):
+        return idempotent or isinstance(failure, _UNSENT_ERRORS)
+    return failure in (RETRY_STATUSES if idempotent else REFUSED_STATUSES)
+
+
+def call_with_retry(
+    send: Callable[[], Response[Any]], *, max_retries: int = 3, backoff: float = 0.5, idempotent: bool = True
+) -> tuple[Response[Any], int]:
+    """
+    Call ``send`` until it returns a 2xx response, retrying transient failures.
+
+    Transport errors and ``RETRY_STATUSES`` are retried with jittered
+    exponential backoff (or the server's ``Retry-After``, capped at
+    ``MAX_RETRY_AFTER``); other statuses fail immediately. With
+    ``idempotent=False`` only failures after which the server cannot have
+    acted on the request are retried: connection errors and
+    ``REFUSED_STATUSES``.
+
+    Returns:
+        The successful response and the number of retries it took
+
+    Raises:
+        errors.UnexpectedStatus: If the final response is not a 2xx response.
+        httpx.TransportError: If the final attempt failed to connect.
+    """
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = send()
+        except httpx.TransportError as exc:
+            if attempt >= max_retries or not _retryable(exc, idempotent):
+                raise
+        except errors.UnexpectedStatus as exc:
+            if attempt >= max_retries or not _retryable(exc.status_code, idempotent):
+                raise
+        else:
+            if 200 <= response.status_code < 300:
+                return response, attempt
+            if attempt >= max_retries or not _retryable(response.status_code, idempotent):
+                raise errors.UnexpectedStatus(response.status_code, response.content)
+        time.sleep(_retry_delay(response, attempt, backoff))
+        attempt += 1
+
+
+async def acall_with_retry(
+    send: Callable[[], Awaitable[Response[Any]]], *, max_retries: int = 3, backoff: float = 0.5, idempotent: bool = True
+) -> tuple[Response[Any], int]:
+    """Async version of ``call_with_retry``."""
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = await send()
+        except httpx.TransportError as exc:
+            if attempt >= max_retries or not _retryable(exc, idempotent):
+                raise
+        except errors.UnexpectedStatus as exc:
+            if attempt >= max_retries or not _retryable(exc.status_code, idempotent):
+                raise
+        else:
+            if 200 <= response.status_code < 300:
+                return response, attempt
+            if attempt >= max_retries or not _retryable(response.status_code, idempotent):
+                raise errors.UnexpectedStatus(response.status_code, response.content)
+        await asyncio.sleep(_retry_delay(response, attempt, backoff))
+        attempt += 1
+
+
+def run_bounded(
+    fn: Callable[[T], R],
+    tasks: Iterable[T],
+    on_done: Callable[[T, R], None],
+    *,
+    concurrency: int,
+    max_pending: int | None = None,
+    executor: Executor | None = None,
+) -> None:
+    """
+    Run ``fn`` over ``tasks`` in a thread pool with bounded buffering.
+
+    At most ``max_pending`` (default ``2 * concurrency``) tasks are submitted
+    at a time, so ``tasks`` can be a lazy, unbounded generator. ``on_done`` is
+    called in the calling thread, in completion order. ``executor`` replaces
+    the thread pool (e.g. with a ``ProcessPoolExecutor``); it is not shut down.
+
+    On the first failure, tasks that have not started are cancelled, tasks
+    that still complete successfully are passed to ``on_done``, and the
+    error is re-raised.
+    """
+    max_pending = max_pending or 2 * concurrency
+    futures: dict[Future[R], T] = {}
+
+    def drain(done: Iterable[Future[R]]) -> None:
+        for future in done:
+            task = futures.pop(future)
+            on_done(task, future.result())
+
+    with contextlib.ExitStack() as stack:
+        pool = executor or stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+        try:
+            for task in tasks:
+                if len(futures) >= max_pending:
+                    drain(wait(futures, return_when=FIRST_COMPLETED).done)
+                futures[pool.submit(fn, task)] = task
+            while futures:
+                drain(wait(futures, return_when=FIRST_COMPLETED).done)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            for future in wait(futures).done:
+                if not future.cancelled() and future.exception() is None:
+                    drain([future])
+            raise
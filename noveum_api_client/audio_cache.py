@@ -0,0 +1,370 @@
+"""
+Content-addressed on-disk audio cache.
+
+Evaluation jobs fetch the same clips over and over, across runs and across
+worker processes. ``AudioCache`` keeps every downloaded clip on disk once,
+stored under the SHA-256 of its content::
+
+    <root>/
+        blobs/<aa>/<sha256>.audio   the audio, named by its content hash
+        ids/<audio id>              the content hash of that audio ID
+        tmp/                        downloads in progress
+
+* **content addressed**: IDs point to blobs by hash, so identical clips
+  uploaded under several IDs are stored once, and a caller that knows the
+  hash of the clip it wants gets it verified;
+* **LRU eviction**: blobs are evicted least recently used first once their
+  total size exceeds ``max_bytes``; recency is the blob's mtime, bumped on
+  every hit, so all processes sharing the directory share one LRU order;
+* **atomic writes**: clips are downloaded into ``tmp/`` and renamed into
+  place, pointers are written the same way, so concurrent processes never
+  see partial files;
+* **memory-mapped reads**: ``open()`` returns an ``AudioBlob`` backed by
+  ``mmap``, so workers reading the same clip share the OS page cache;
+* **metrics**: ``stats`` counts hits, misses, evictions and the bytes that
+  hits saved from being downloaded (per ``AudioCache`` instance).
+
+Example:
+    ```python
+    from noveum_api_client.audio_cache import AudioCache
+
+    cache = AudioCache("/var/cache/noveum/audio", max_bytes=2 * 1024**3)
+    with cache.open(client, "audio-id") as blob:
+        transcribe(blob.data)
+    print(cache.stats.to_dict())
+    ```
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from attrs import define
+
+from .audio_download import download_audio
+from .client import AuthenticatedClient, Client
+from .dataset_cache import _segment
+
+_HASH = re.compile(r"[0-9a-f]{64}")
+
+
+def default_audio_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/noveum/audio`` (``~/.cache/noveum/audio`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "noveum" / "audio"
+
+
+@define
+class AudioCacheStats:
+    """Counters describing audio cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    bytes_downloaded: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+            "bytes_downloaded": self.bytes_downloaded,
+        }
+
+
+class AudioBlob:
+    """Read-only, memory-mapped view of one cached clip."""
+
+    def __init__(self, audio_id: str, checksum: str, path: Path):
+        self.audio_id = audio_id
+        self.checksum = checksum
+        self.path = path
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    @property
+    def data(self) -> mmap.mmap | bytes:
+        """The clip's bytes, without copying them into memory."""
+        return self._map if self._map is not None else b""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def read(self) -> bytes:
+        """A copy of the clip's bytes."""
+        return bytes(self.data)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self) -> "AudioBlob":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AudioCache:
+    """
+    On-disk audio cache shared by any number of threads and processes.
+
+    Args:
+        directory: Cache root, created if missing (default:
+            ``default_audio_cache_dir()``)
+        max_bytes: Total size of the cached clips above which the least
+            recently used are evicted
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None, max_bytes: int = 1024 * 1024 * 1024):
+        self.directory = Path(directory) if directory is not None else default_audio_cache_dir()
+        self.max_bytes = max_bytes
+        self.stats = AudioCacheStats()
+        for name in ("blobs", "ids", "tmp"):
+            (self.directory / name).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Per-ID download lock and the number of threads using it
+        self._fetching: dict[str, tuple[threading.Lock, int]] = {}
+        # Running size estimate; the blobs are only rescanned when it
+        # suggests the budget is exceeded (other processes may write too)
+        self._size = self._scan()[1]
+
+    def _blob(self, checksum: str) -> Path:
+        return self.directory / "blobs" / checksum[:2] / f"{checksum}.audio"
+
+    def _pointer(self, audio_id: str) -> Path:
+        return self.directory / "ids" / _segment(audio_id)
+
+    def _write_atomic(self, target: Path, data: bytes) -> None:
+        fd, temporary = tempfile.mkstemp(dir=self.directory / "tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temporary, target)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def checksum(self, audio_id: str) -> str | None:
+        """SHA-256 of the cached clip of ``audio_id``, or ``None`` if it is not cached."""
+        try:
+            checksum = self._pointer(audio_id).read_text().strip()
+        except OSError:
+            return None
+        if not _HASH.fullmatch(checksum) or not self._blob(checksum).exists():
+            return None
+        return checksum
+
+    def __contains__(self, audio_id: object) -> bool:
+        return isinstance(audio_id, str) and self.checksum(audio_id) is not None
+
+    def _hit(self, audio_id: str, checksum: str | None) -> AudioBlob | None:
+        cached = self.checksum(audio_id)
+        if checksum is not None and cached != checksum.lower():
+            if not self._blob(checksum.lower()).exists():
+                return None
+            # The expected content is already cached, possibly under another ID
+            cached = checksum.lower()
+            self._write_atomic(self._pointer(audio_id), cached.encode())
+        if cached is None:
+            return None
+        path = self._blob(cached)
+        try:
+            os.utime(path)
+            blob = AudioBlob(audio_id, cached, path)
+        except (OSError, ValueError):
+            # Evicted by another process in between
+            return None
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += len(blob)
+        return blob
+
+    def _add(self, audio_id: str, temporary: Path) -> AudioBlob:
+        """Move the finished file ``temporary`` into the cache and map it."""
+        hasher = hashlib.sha256()
+        with temporary.open("rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        checksum = hasher.hexdigest()
+        path = self._blob(checksum)
+        path.parent.mkdir(exist_ok=True)
+        # Map the file before it can be seen, and evicted, by anyone else;
+        # the mapping stays valid when the file is renamed or unlinked
+        blob = AudioBlob(audio_id, checksum, temporary)
+        blob.path = path
+        added = 0
+        try:
+            if path.exists():
+                temporary.unlink()
+            else:
+                os.replace(temporary, path)
+                added = len(blob)
+        except PermissionError:
+            # Mapped files cannot be renamed or deleted on this platform
+            blob.close()
+            if path.exists():
+                temporary.unlink()
+            else:
+                os.replace(temporary, path)
+                added = path.stat().st_size
+            blob = AudioBlob(audio_id, checksum, path)
+        self._write_atomic(self._pointer(audio_id), checksum.encode())
+        with self._lock:
+            self.stats.stores += 1
+            self._size += added
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+        return blob
+
+    def store(self, audio_id: str, source: str | os.PathLike[str] | bytes) -> str:
+        """
+        Add a clip from a local file (which is moved into the cache) or ``bytes``.
+
+        Returns:
+            The clip's SHA-256
+        """
+        if isinstance(source, bytes):
+            temporary = self.directory / "tmp" / f"{uuid.uuid4().hex}.audio"
+            self._write_atomic(temporary, source)
+        else:
+            temporary = Path(source)
+        with self._add(audio_id, temporary) as blob:
+            return blob.checksum
+
+    def open(
+        self,
+        client: AuthenticatedClient | Client,
+        audio_id: str,
+        *,
+        checksum: str | None = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ) -> AudioBlob:
+        """
+        Get a clip from the cache, downloading it on a miss.
+
+        Args:
+            client: API client used on a miss
+            audio_id: Audio ID
+            checksum: SHA-256 the clip must have; a cached clip with another
+                hash is downloaded again, a download with another hash fails
+            max_retries: Download retries for transient failures
+            retry_backoff: Base delay in seconds between retries
+
+        Returns:
+            ``AudioBlob`` memory-mapping the clip; close it when done
+
+        Raises:
+            audio_download.AudioIntegrityError: If the download does not match ``checksum``.
+            errors.UnexpectedStatus: If the clip cannot be downloaded.
+        """
+        blob = self._hit(audio_id, checksum)
+        if blob is not None:
+            return blob
+        with self._lock:
+            fetching, users = self._fetching.get(audio_id) or (threading.Lock(), 0)
+            self._fetching[audio_id] = fetching, users + 1
+        # One download per ID in this process; other threads wait and then hit.
+        # The lock lives while any thread uses it, so a thread arriving while
+        # a waiter retries a failed download still waits for it
+        try:
+            with fetching:
+                blob = self._hit(audio_id, checksum)
+                if blob is not None:
+                    return blob
+                with self._lock:
+                    self.stats.misses += 1
+                temporary = self.directory / "tmp" / f"{uuid.uuid4().hex}.audio"
+                downloaded = download_audio(
+                    client,
+                    audio_id,
+                    temporary,
+                    checksum=checksum,
+                    resume=False,
+                    max_retries=max_retries,
+                    retry_backoff=retry_backoff,
+                )
+                with self._lock:
+                    self.stats.bytes_downloaded += downloaded.size
+                return self._add(audio_id, temporary)
+        finally:
+            with self._lock:
+                fetching, users = self._fetching[audio_id]
+                if users == 1:
+                    del self._fetching[audio_id]
+                else:
+                    self._fetching[audio_id] = fetching, users - 1
+
+    def get(self, client: AuthenticatedClient | Client, audio_id: str, **options: Any) -> bytes:
+        """Like ``open()``, returning a copy of the clip's bytes."""
+        with self.open(client, audio_id, **options) as blob:
+            return blob.read()
+
+    def _scan(self) -> tuple[list[tuple[float, int, Path]], int]:
+        files = []
+        total = 0
+        for path in (self.directory / "blobs").glob("*/*.audio"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return files, total
+
+    def _evict(self, keep: Path | None = None) -> None:
+        files, total = self._scan()
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still mapped on a platform that refuses to delete open files
+                continue
+            total -= size
+            self.stats.evictions += 1
+        self._size = total
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached clips."""
+        return self._scan()[1]
+
+    def clear(self) -> None:
+        """Remove every cached clip and pointer."""
+        with self._lock:
+            for pattern in ("blobs/*/*.audio", "ids/*"):
+                for path in self.directory.glob(pattern):
+                    path.unlink(missing_ok=True)
+            self._size = 0
+
+
+__all__ = [
+    "AudioBlob",
+    "AudioCache",
+    "AudioCacheStats",
+    "default_audio_cache_dir",
+]
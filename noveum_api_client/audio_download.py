@@ -0,0 +1,435 @@
+"""
+Streaming audio downloads.
+
+``get_api_v1_audio_by_id_serve`` returns the whole recording as
+``Response.content``, so large audio is held in memory in full. The helpers
+here read ``GET /api/v1/audio/{id}/serve`` as a stream instead:
+
+* **streaming**: ``stream_audio`` / ``astream_audio`` yield the audio in
+  ``chunk_size`` pieces; ``start`` / ``end`` request a byte range;
+* **to disk**: ``download_audio`` writes chunks straight to ``<path>.part``
+  and renames it into place once complete;
+* **resume**: a ``.part`` file left by an interrupted download, or a
+  connection dropped mid-transfer, continues with a ``Range`` request from
+  the bytes already on disk. Servers that ignore ``Range`` are handled by
+  skipping (partial reads) or restarting (downloads);
+* **verification**: the size announced by ``Content-Range`` /
+  ``Content-Length`` (or passed as ``expected_size``) and, when given, a
+  ``checksum`` are checked before the file is renamed into place;
+* **bulk**: ``download_audio_files`` downloads many recordings concurrently,
+  either by ID or every recording listed by ``GET /api/v1/audio``.
+
+Example:
+    ```python
+    from noveum_api_client.audio_download import download_audio, download_audio_files, stream_audio
+
+    for chunk in stream_audio(client, "audio-id", start=0, end=1023):
+        header = chunk
+
+    download_audio(client, "audio-id", "call.wav", checksum="9f86d0...")
+    result = download_audio_files(client, "recordings/", concurrency=4)
+    print(result.downloaded, result.skipped, result.bytes_received, result.failed)
+    ```
+"""
+
+import contextlib
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from ._utils import RETRY_STATUSES, _retry_delay, record_field, run_bounded
+from .api.audio import get_api_v1_audio_by_id_serve
+from .audio_listing import iter_audio
+from .client import AuthenticatedClient, Client
+from .coalescing import NO_COALESCE
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+class AudioIntegrityError(ValueError):
+    """Raised when downloaded audio does not have the announced size or checksum."""
+
+    def __init__(self, audio_id: str, message: str):
+        self.audio_id = audio_id
+        super().__init__(f"Audio {audio_id}: {message}")
+
+
+@define
+class DownloadedAudio:
+    """A recording written to disk by ``download_audio``."""
+
+    audio_id: str
+    path: Path
+    size: int
+    checksum: str
+    resumed_from: int = 0
+    retries: int = 0
+
+
+def _range_headers(start: int, end: int | None) -> dict[str, str]:
+    if start <= 0 and end is None:
+        return {}
+    return {"Range": f"bytes={start}-{'' if end is None else end}"}
+
+
+def _total_size(response: httpx.Response) -> int | None:
+    """Full size of the recording as announced by the response, if it says."""
+    if response.status_code == 206:
+        match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+        return int(match.group(3)) if match and match.group(3) != "*" else None
+    if "content-encoding" in response.headers or "content-length" not in response.headers:
+        return None
+    return int(response.headers["content-length"])
+
+
+@define
+class _Window:
+    """Cuts ``[start, end]`` out of a full-body response sent by a server that ignored ``Range``."""
+
+    skip: int
+    remaining: int | None
+
+    def take(self, chunk: bytes) -> bytes:
+        if self.skip:
+            if len(chunk) <= self.skip:
+                self.skip -= len(chunk)
+                return b""
+            chunk, self.skip = chunk[self.skip :], 0
+        if self.remaining is not None:
+            chunk = chunk[: self.remaining]
+            self.remaining -= len(chunk)
+        return chunk
+
+    @property
+    def done(self) -> bool:
+        return self.remaining == 0
+
+
+def _window(response: httpx.Response, start: int, end: int | None) -> _Window:
+    if response.status_code == 206:
+        return _Window(0, None)
+    return _Window(start, None if end is None else end - start + 1)
+
+
+@contextlib.contextmanager
+def _open(
+    client: AuthenticatedClient | Client, audio_id: str, start: int = 0, end: int | None = None
+) -> Iterator[httpx.Response]:
+    request_kwargs = get_api_v1_audio_by_id_serve._get_kwargs(audio_id)
+    request_kwargs["headers"] = _range_headers(start, end)
+    request_kwargs["extensions"] = {NO_COALESCE: True}
+    with client.get_httpx_client().stream(**request_kwargs) as response:
+        if response.status_code not in (200, 206):
+            raise errors.UnexpectedStatus(response.status_code, response.read())
+        yield response
+
+
+def stream_audio(
+    client: AuthenticatedClient | Client,
+    audio_id: str,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yield the bytes of a recording without buffering it.
+
+    Args:
+        client: API client
+        audio_id: Audio ID
+        start: First byte to read
+        end: Last byte to read, inclusive (default: to the end)
+        chunk_size: Bytes per yielded chunk
+
+    Yields:
+        Chunks of audio, at most ``chunk_size`` bytes each
+
+    Raises:
+        errors.UnexpectedStatus: If the audio cannot be served.
+    """
+    with _open(client, audio_id, start, end) as response:
+        window = _window(response, start, end)
+        for chunk in response.iter_bytes(chunk_size):
+            chunk = window.take(chunk)
+            if chunk:
+                yield chunk
+            if window.done:
+                break
+
+
+async def astream_audio(
+    client: AuthenticatedClient | Client,
+    audio_id: str,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async version of ``stream_audio``."""
+    request_kwargs = get_api_v1_audio_by_id_serve._get_kwargs(audio_id)
+    request_kwargs["headers"] = _range_headers(start, end)
+    request_kwargs["extensions"] = {NO_COALESCE: True}
+    async with client.get_async_httpx_client().stream(**request_kwargs) as response:
+        if response.status_code not in (200, 206):
+            raise errors.UnexpectedStatus(response.status_code, await response.aread())
+        window = _window(response, start, end)
+        async for chunk in response.aiter_bytes(chunk_size):
+            chunk = window.take(chunk)
+            if chunk:
+                yield chunk
+            if window.done:
+                break
+
+
+def _hash_file(path: Path, algorithm: str) -> tuple[Any, int]:
+    hasher = hashlib.new(algorithm)
+    size = 0
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    return hasher, size
+
+
+def download_audio(
+    client: AuthenticatedClient | Client,
+    audio_id: str,
+    path: str | os.PathLike[str],
+    *,
+    expected_size: int | None = None,
+    checksum: str | None = None,
+    algorithm: str = "sha256",
+    resume: bool = True,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> DownloadedAudio:
+    """
+    Download a recording straight to disk, resuming partial downloads.
+
+    Args:
+        client: API client
+        audio_id: Audio ID
+        path: Destination file; data is written to ``<path>.part`` first
+        expected_size: Size the recording must have, in bytes
+        checksum: Hex digest the recording must have
+        algorithm: ``hashlib`` algorithm of ``checksum``
+        resume: Continue from an existing ``.part`` file instead of starting over
+        max_retries: Retries (each resuming where the last attempt stopped)
+            for dropped connections and transient statuses
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``DownloadedAudio`` with the final size and checksum
+
+    Raises:
+        AudioIntegrityError: If the size or checksum does not match; the
+            partial file is removed.
+        errors.UnexpectedStatus: If the audio cannot be served.
+        httpx.TransportError: If the final attempt failed to connect.
+    """
+    path = Path(path)
+    part = path.with_name(path.name + ".part")
+    if resume and part.exists():
+        hasher, offset = _hash_file(part, algorithm)
+    else:
+        hasher, offset = hashlib.new(algorithm), 0
+        part.unlink(missing_ok=True)
+    resumed_from = offset
+    total = expected_size
+    attempt = 0
+
+    def fail(message: str) -> AudioIntegrityError:
+        part.unlink(missing_ok=True)
+        return AudioIntegrityError(audio_id, message)
+
+    while total is None or offset < total:
+        try:
+            with _open(client, audio_id, offset) as response:
+                if response.status_code == 200 and offset:
+                    # Range was ignored: the body is the whole recording again
+                    hasher, offset = hashlib.new(algorithm), 0
+                announced = _total_size(response)
+                if announced is not None and total is not None and announced != total:
+                    raise fail(f"size is {announced} bytes, expected {total}")
+                total = announced if announced is not None else total
+                with part.open("r+b" if offset else "wb") as file:
+                    file.seek(offset)
+                    file.truncate()
+                    # Unchunked, so everything received is on disk before a connection drops
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+                        hasher.update(chunk)
+                        offset += len(chunk)
+            if total is None:
+                total = offset
+            if offset > total:
+                raise fail(f"received {offset} bytes, expected {total}")
+            if offset == total:
+                break
+            if attempt >= max_retries:
+                raise fail(f"received {offset} of {total} bytes")
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+        except errors.UnexpectedStatus as exc:
+            if exc.status_code == 416 and offset:
+                # The partial file does not fit the recording (anymore): start over
+                hasher, offset = hashlib.new(algorithm), 0
+                part.unlink(missing_ok=True)
+            elif attempt >= max_retries or exc.status_code not in RETRY_STATUSES:
+                raise
+        time.sleep(_retry_delay(None, attempt, retry_backoff))
+        attempt += 1
+
+    if total is not None and offset != total:
+        raise fail(f"has {offset} bytes, expected {total}")
+    digest = hasher.hexdigest()
+    if checksum is not None and digest != checksum.lower():
+        raise fail(f"{algorithm} checksum is {digest}, expected {checksum}")
+    os.replace(part, path)
+    return DownloadedAudio(audio_id, path, offset, digest, resumed_from=resumed_from, retries=attempt)
+
+
+@define
+class AudioDownloadResult:
+    """Progress and outcome of a bulk audio download."""
+
+    downloaded: int = 0
+    skipped: int = 0
+    bytes_received: int = 0
+    files: list[DownloadedAudio] = field(factory=list)
+    failed: list[tuple[str, str]] = field(factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "downloaded": self.downloaded,
+            "skipped": self.skipped,
+            "failed": len(self.failed),
+            "bytes_received": self.bytes_received,
+        }
+
+
+def _field(record: dict[str, Any], *names: str) -> Any:
+    for name in names:
+        value = record_field(record, name)
+        if value is not None:
+            return value
+    return None
+
+
+def _file_name(audio_id: str, record: dict[str, Any] | None) -> str:
+    safe = re.sub(r"[^\w.-]", "_", audio_id)
+    if record is None:
+        return safe
+    original = _field(record, "file_name", "filename", "original_name")
+    mime_type = _field(record, "mime_type", "content_type")
+    suffix = Path(original).suffix if original else (mimetypes.guess_extension(mime_type) if mime_type else None)
+    return safe + (suffix or "")
+
+
+def download_audio_files(
+    client: AuthenticatedClient | Client,
+    directory: str | os.PathLike[str],
+    audio_ids: Iterable[str] | None = None,
+    *,
+    concurrency: int = 4,
+    page_size: int = 100,
+    skip_existing: bool = True,
+    on_progress: Callable[[AudioDownloadResult], None] | None = None,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> AudioDownloadResult:
+    """
+    Download many recordings concurrently into ``directory``.
+
+    Args:
+        client: API client
+        directory: Destination directory, created if missing
+        audio_ids: Audio IDs (default: every recording listed by
+            ``GET /api/v1/audio``, downloaded while later pages are listed)
+        concurrency: Downloads in flight
+        page_size: Recordings per listing page
+        skip_existing: Skip recordings whose file already exists (with the
+            listed size, when the listing reports one)
+        on_progress: Called with the running result after every finished download
+        max_retries: Retries per download and listing page
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``AudioDownloadResult``; listed recordings are named by ID with the
+        extension of their original file name
+
+    Raises:
+        errors.UnexpectedStatus: If a listing page cannot be fetched.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    result = AudioDownloadResult()
+    if audio_ids is None:
+        tasks: Iterable[tuple[str, dict[str, Any] | None]] = (
+            (str(record_field(record, "id")), record)
+            for record in iter_audio(
+                client, page_size=page_size, raw=True, max_retries=max_retries, retry_backoff=retry_backoff
+            )
+        )
+    else:
+        tasks = ((audio_id, None) for audio_id in audio_ids)
+
+    def fetch(task: tuple[str, dict[str, Any] | None]) -> DownloadedAudio | str | None:
+        audio_id, record = task
+        path = directory / _file_name(audio_id, record)
+        size = _field(record, "file_size", "size") if record is not None else None
+        expected_size = int(size) if size is not None else None
+        if skip_existing and path.exists() and expected_size in (None, path.stat().st_size):
+            return None
+        try:
+            return download_audio(
+                client,
+                audio_id,
+                path,
+                expected_size=expected_size,
+                max_retries=max_retries,
+                retry_backoff=retry_backoff,
+            )
+        except (errors.UnexpectedStatus, httpx.HTTPError, AudioIntegrityError, OSError) as exc:
+            return f"{type(exc).__name__}: {exc}"
+
+    def finish(task: tuple[str, dict[str, Any] | None], outcome: DownloadedAudio | str | None) -> None:
+        if outcome is None:
+            result.skipped += 1
+        elif isinstance(outcome, str):
+            result.failed.append((task[0], outcome))
+        else:
+            result.downloaded += 1
+            result.bytes_received += outcome.size - outcome.resumed_from
+            result.files.append(outcome)
+        if on_progress is not None:
+            on_progress(result)
+
+    client.get_httpx_client()
+    run_bounded(fetch, tasks, finish, concurrency=concurrency)
+    return result
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "AudioDownloadResult",
+    "AudioIntegrityError",
+    "DownloadedAudio",
+    "astream_audio",
+    "download_audio",
+    "download_audio_files",
+    "stream_audio",
+]
@@ -0,0 +1,285 @@
+"""
+Iteration over the audio listing.
+
+``GET /api/v1/audio`` pages with ``page``/``pageSize`` instead of the
+``offset``/``limit`` used elsewhere. ``iter_audio`` (and its async twin
+``aiter_audio``) walks those pages and yields one ``AudioRecord`` per
+recording:
+
+* **prefetch**: the next ``prefetch`` pages are requested while the current
+  one is being consumed;
+* **parallel pages**: once the first page reports the total count, up to
+  ``parallel`` pages are fetched at the same time. Records are still
+  yielded in listing order;
+* **lightweight records**: ``AudioRecord`` keeps only the listing's scalar
+  fields (``raw=True`` yields the API dicts instead);
+* **hydration**: with ``hydrate=True`` every record is completed from
+  ``GET /api/v1/audio/{id}``, ``hydrate_concurrency`` requests at a time.
+
+Example:
+    ```python
+    from noveum_api_client.audio_listing import iter_audio
+
+    for audio in iter_audio(client, page_size=100, parallel=4):
+        print(audio.id, audio.file_name, audio.size)
+    ```
+"""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from attrs import define
+
+from ._utils import acall_with_retry, call_with_retry, page_total, parse_json, record_field, unwrap
+from .api.audio import get_api_v1_audio, get_api_v1_audio_by_id
+from .client import AuthenticatedClient, Client
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _first(record: Mapping[str, Any], *names: str) -> Any:
+    for name in names:
+        value = record_field(record, name)
+        if value is not None:
+            return value
+    return None
+
+
+@define(frozen=True)
+class AudioRecord:
+    """Metadata of one recording."""
+
+    id: str
+    file_name: str | None = None
+    mime_type: str | None = None
+    size: int | None = None
+    duration: float | None = None
+    trace_id: str | None = None
+    span_id: str | None = None
+    created_at: str | None = None
+    metadata: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "AudioRecord":
+        """Build a record from an API audio object (camelCase or snake_case keys)."""
+        size = _first(record, "file_size", "size")
+        duration = _first(record, "duration", "duration_seconds")
+        return cls(
+            id=str(_first(record, "id", "audio_uuid") or ""),
+            file_name=_first(record, "file_name", "filename", "original_name"),
+            mime_type=_first(record, "mime_type", "content_type"),
+            size=int(size) if size is not None else None,
+            duration=float(duration) if duration is not None else None,
+            trace_id=_first(record, "trace_id"),
+            span_id=_first(record, "span_id"),
+            created_at=_first(record, "created_at"),
+            metadata=_first(record, "metadata"),
+        )
+
+
+@define
+class _Page:
+    number: int
+    records: list[dict[str, Any]]
+    total: int | None
+
+
+class _PagePlan:
+    """Page numbers to request next, given what the pages returned so far."""
+
+    def __init__(self, page_size: int):
+        self.per_page = page_size
+        self.next_page = 2
+        self.last_page: int | None = None
+        self.done = False
+
+    def start(self, first: _Page) -> None:
+        count = len(first.records)
+        total = first.total
+        if not count or (count < self.per_page and (total is None or count >= total)):
+            self.done = True
+        elif total is not None:
+            if total <= count:
+                self.done = True
+            # A short first page with more to come means the server capped pageSize
+            self.per_page = min(self.per_page, count)
+            self.last_page = math.ceil(total / self.per_page)
+
+    def next_request(self) -> int | None:
+        if self.done or (self.last_page is not None and self.next_page > self.last_page):
+            return None
+        self.next_page += 1
+        return self.next_page - 1
+
+    def finish(self, page: _Page) -> bool:
+        """Record a page; return whether it is the last one."""
+        if page.number == self.last_page or len(page.records) < self.per_page:
+            self.done = True
+        return self.done
+
+
+def _page(response: Any, number: int) -> _Page:
+    data = parse_json(response)
+    return _Page(number, unwrap(unwrap(data, "data"), "audio") or [], page_total(data))
+
+
+def _detail(response: Any, record: dict[str, Any]) -> dict[str, Any]:
+    detail = unwrap(unwrap(parse_json(response), "data"), "audio")
+    return {**record, **detail} if isinstance(detail, dict) else record
+
+
+def _converted(records: Iterable[dict[str, Any]], raw: bool) -> Iterator[Any]:
+    return iter(records) if raw else map(AudioRecord.from_dict, records)
+
+
+def iter_audio(
+    client: AuthenticatedClient | Client,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 1,
+    parallel: int = 1,
+    hydrate: bool = False,
+    hydrate_concurrency: int = 8,
+    raw: bool = False,
+    max_retries: int = 2,
+    retry_backoff: float = 0.5,
+) -> Iterator[Any]:
+    """
+    Iterate over every recording of the organization.
+
+    Args:
+        client: API client
+        page_size: Recordings per page request
+        prefetch: Pages requested ahead of the one being consumed
+        parallel: Pages fetched at the same time once the total count is known
+        hydrate: Complete every record from ``GET /api/v1/audio/{id}``
+        hydrate_concurrency: Metadata requests in flight while hydrating
+        raw: Yield the API's audio dicts instead of ``AudioRecord`` objects
+        max_retries: Retries per request for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Yields:
+        ``AudioRecord`` (or dict) per recording, in listing order
+
+    Raises:
+        errors.UnexpectedStatus: If a page or metadata request fails.
+    """
+    retry = partial(call_with_retry, max_retries=max_retries, backoff=retry_backoff)
+
+    def fetch(number: int) -> _Page:
+        response, _ = retry(partial(get_api_v1_audio.sync_detailed, client=client, page=number, page_size=page_size))
+        return _page(response, number)
+
+    def complete(record: dict[str, Any]) -> dict[str, Any]:
+        send = partial(get_api_v1_audio_by_id.sync_detailed, str(record_field(record, "id")), client=client)
+        return _detail(retry(send)[0], record)
+
+    plan = _PagePlan(page_size)
+    first = fetch(1)
+    plan.start(first)
+    depth = max(prefetch, parallel if plan.last_page is not None else 1, 1)
+
+    # Create the shared httpx client before the worker threads race to do so
+    client.get_httpx_client()
+    window: deque[Future[_Page]] = deque()
+
+    def fill() -> None:
+        while len(window) < depth and (number := plan.next_request()) is not None:
+            window.append(pool.submit(fetch, number))
+
+    with (
+        ThreadPoolExecutor(max_workers=depth) as pool,
+        ThreadPoolExecutor(max_workers=hydrate_concurrency if hydrate else 1) as hydrator,
+    ):
+
+        def records(page: _Page) -> Iterator[Any]:
+            return _converted(hydrator.map(complete, page.records) if hydrate else page.records, raw)
+
+        try:
+            fill()
+            yield from records(first)
+            while window:
+                page = window.popleft().result()
+                last = plan.finish(page)
+                if not last:
+                    fill()
+                yield from records(page)
+                if last:
+                    return
+        finally:
+            for future in window:
+                future.cancel()
+
+
+async def aiter_audio(
+    client: AuthenticatedClient | Client,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 1,
+    parallel: int = 1,
+    hydrate: bool = False,
+    hydrate_concurrency: int = 8,
+    raw: bool = False,
+    max_retries: int = 2,
+    retry_backoff: float = 0.5,
+) -> AsyncIterator[Any]:
+    """Async version of ``iter_audio``."""
+    retry = partial(acall_with_retry, max_retries=max_retries, backoff=retry_backoff)
+    semaphore = asyncio.Semaphore(hydrate_concurrency)
+
+    async def fetch(number: int) -> _Page:
+        response, _ = await retry(
+            partial(get_api_v1_audio.asyncio_detailed, client=client, page=number, page_size=page_size)
+        )
+        return _page(response, number)
+
+    async def complete(record: dict[str, Any]) -> dict[str, Any]:
+        send = partial(get_api_v1_audio_by_id.asyncio_detailed, str(record_field(record, "id")), client=client)
+        async with semaphore:
+            response, _ = await retry(send)
+        return _detail(response, record)
+
+    async def records(page: _Page) -> Iterator[Any]:
+        if hydrate:
+            return _converted(await asyncio.gather(*map(complete, page.records)), raw)
+        return _converted(page.records, raw)
+
+    plan = _PagePlan(page_size)
+    first = await fetch(1)
+    plan.start(first)
+    depth = max(prefetch, parallel if plan.last_page is not None else 1, 1)
+    window: deque[asyncio.Task[_Page]] = deque()
+
+    def fill() -> None:
+        while len(window) < depth and (number := plan.next_request()) is not None:
+            window.append(asyncio.create_task(fetch(number)))
+
+    try:
+        fill()
+        for record in await records(first):
+            yield record
+        while window:
+            page = await window.popleft()
+            last = plan.finish(page)
+            if not last:
+                fill()
+            for record in await records(page):
+                yield record
+            if last:
+                return
+    finally:
+        for task in window:
+            task.cancel()
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "AudioRecord",
+    "aiter_audio",
+    "iter_audio",
+]
@@ -0,0 +1,468 @@
+"""
+Streaming audio uploads.
+
+``post_api_v1_audio`` takes a ``File`` whose payload httpx encodes into the
+multipart body, and callers usually read the recording into ``bytes`` first,
+so long recordings are held in memory at least once. ``AudioUploadBody``
+produces the ``multipart/form-data`` body of ``POST /api/v1/audio`` as a
+stream instead:
+
+* **sources**: file paths, binary file objects, ``bytes`` and (for async
+  uploads) async byte iterators;
+* **bounded buffers**: the audio is read and sent ``chunk_size`` bytes at a
+  time, and larger chunks from an iterator are split, so memory per upload
+  stays at one chunk whatever the recording's length;
+* **Content-Length**: sent when the source size is known (paths, seekable
+  files, ``bytes``), chunked transfer encoding otherwise;
+* **retries**: replayable sources (paths, seekable files, ``bytes``) are
+  re-read from the start when a transient failure is retried; one-shot
+  sources (pipes, async iterators) are sent once.
+
+``upload_audio_files`` / ``aupload_audio_files`` upload many recordings for
+``(trace_id, span_id, audio_uuid, source)`` tuples concurrently, with a
+progress callback and per-file failures collected instead of aborting.
+
+Example:
+    ```python
+    from noveum_api_client.audio_upload import upload_audio, upload_audio_files
+
+    upload_audio(client, "call.wav", trace_id="t1", span_id="s1", audio_uuid="a1")
+
+    result = upload_audio_files(
+        client,
+        [("t1", "s1", "a1", "call-1.wav"), ("t2", "s2", "a2", "call-2.wav")],
+        concurrency=4,
+        on_progress=lambda r: print(r.to_dict()),
+    )
+    print(result.uploaded, result.bytes_sent, result.failed)
+    ```
+"""
+
+import asyncio
+import mimetypes
+import os
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from ._utils import acall_with_retry, call_with_retry, parse_json, run_bounded, unwrap
+from .api.audio import post_api_v1_audio
+from .client import AuthenticatedClient, Client
+from .types import Response
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+AudioSource = str | os.PathLike[str] | BinaryIO | bytes | AsyncIterable[bytes]
+
+
+def _split(chunk: bytes, size: int) -> Iterator[bytes]:
+    if len(chunk) <= size:
+        yield chunk
+        return
+    view = memoryview(chunk)
+    for start in range(0, len(view), size):
+        yield bytes(view[start : start + size])
+
+
+class AudioUploadBody:
+    """
+    Streaming ``multipart/form-data`` body of one audio upload.
+
+    Args:
+        source: File path, binary file object, ``bytes`` or async byte iterator
+        trace_id: Trace ID the audio belongs to
+        span_id: Span ID the audio belongs to
+        audio_uuid: Unique identifier of the audio
+        file_name: File name sent with the audio (default: the path's name)
+        mime_type: Content type of the audio (default: guessed from the file
+            name, else ``application/octet-stream``)
+        chunk_size: Bytes read and sent at a time
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        *,
+        trace_id: str,
+        span_id: str,
+        audio_uuid: str,
+        file_name: str | None = None,
+        mime_type: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if isinstance(source, str | os.PathLike):
+            source = Path(source)
+            file_name = file_name or source.name
+        elif file_name is None and isinstance(getattr(source, "name", None), str):
+            file_name = os.path.basename(source.name)  # type: ignore[union-attr]
+        self.source = source
+        self.chunk_size = chunk_size
+        self.file_name = file_name or audio_uuid
+        self.mime_type = mime_type or mimetypes.guess_type(self.file_name)[0] or "application/octet-stream"
+        self.boundary = secrets.token_hex(16)
+        self.bytes_sent = 0
+        # Position of a file object's audio, restored before every replay
+        self._start = self._tell(source)
+        self._consumed = False
+        fields = {"traceId": trace_id, "spanId": span_id, "audio_uuid": audio_uuid}
+        head = b"".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+            for name, value in fields.items()
+        )
+        quoted = self.file_name.replace("\\", "\\\\").replace('"', '\\"')
+        file_part = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n'
+            f"Content-Type: {self.mime_type}\r\n\r\n"
+        )
+        self._head = head + file_part.encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @staticmethod
+    def _tell(source: Any) -> int | None:
+        if isinstance(source, Path | bytes) or not hasattr(source, "read"):
+            return None
+        try:
+            return source.tell() if source.seekable() else None
+        except (AttributeError, OSError):
+            return None
+
+    @property
+    def audio_size(self) -> int | None:
+        """Bytes of audio, when the source size is known."""
+        if isinstance(self.source, Path):
+            return self.source.stat().st_size
+        if isinstance(self.source, bytes):
+            return len(self.source)
+        if self._start is not None:
+            file: Any = self.source
+            position = file.tell()
+            end = file.seek(0, os.SEEK_END)
+            file.seek(position)
+            return end - self._start
+        return None
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once, e.g. for a retry."""
+        return isinstance(self.source, Path | bytes) or self._start is not None
+
+    def headers(self) -> dict[str, str]:
+        """Content-Type, plus Content-Length when the audio size is known."""
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        size = self.audio_size
+        if size is not None:
+            headers["Content-Length"] = str(len(self._head) + size + len(self._tail))
+        return headers
+
+    def _begin(self) -> None:
+        if self._consumed and not self.replayable:
+            raise RuntimeError("The audio source can only be read once")
+        self._consumed = True
+        self.bytes_sent = 0
+
+    def _sync_chunks(self) -> Iterator[bytes]:
+        if isinstance(self.source, bytes):
+            yield from _split(self.source, self.chunk_size)
+            return
+        if isinstance(self.source, Path):
+            with self.source.open("rb") as file:
+                yield from iter(lambda: file.read(self.chunk_size), b"")
+            return
+        file: Any = self.source
+        if self._start is not None:
+            file.seek(self._start)
+        yield from iter(lambda: file.read(self.chunk_size), b"")
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._begin()
+        yield self._head
+        for chunk in self._sync_chunks():
+            self.bytes_sent += len(chunk)
+            yield chunk
+        yield self._tail
+
+    async def _async_chunks(self) -> AsyncIterator[bytes]:
+        if isinstance(self.source, AsyncIterable):
+            async for chunk in self.source:
+                for part in _split(chunk, self.chunk_size):
+                    yield part
+            return
+        # File reads go to a worker thread so the event loop never waits on disk
+        chunks = self._sync_chunks()
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self._begin()
+        yield self._head
+        async for chunk in self._async_chunks():
+            self.bytes_sent += len(chunk)
+            yield chunk
+        yield self._tail
+
+
+def _request(body: AudioUploadBody, content: Iterable[bytes] | AsyncIterable[bytes]) -> dict[str, Any]:
+    return {"method": "post", "url": "/api/v1/audio", "content": content, "headers": body.headers()}
+
+
+def send_audio_body(
+    client: AuthenticatedClient | Client, body: AudioUploadBody, *, max_retries: int = 3, retry_backoff: float = 0.5
+) -> Any:
+    """
+    Send an ``AudioUploadBody`` to ``POST /api/v1/audio``.
+
+    Returns:
+        The created audio record
+
+    Raises:
+        errors.UnexpectedStatus: If the upload fails.
+        TypeError: If the body streams from an async iterator.
+    """
+    if isinstance(body.source, AsyncIterable):
+        raise TypeError("Async audio sources can only be sent with asend_audio_body")
+
+    def send() -> Response[Any]:
+        response = client.get_httpx_client().request(**_request(body, iter(body)))
+        return post_api_v1_audio._build_response(client=client, response=response)
+
+    response, _ = call_with_retry(send, max_retries=max_retries if body.replayable else 0, backoff=retry_backoff)
+    return unwrap(parse_json(response), "data")
+
+
+async def asend_audio_body(
+    client: AuthenticatedClient | Client, body: AudioUploadBody, *, max_retries: int = 3, retry_backoff: float = 0.5
+) -> Any:
+    """Async version of ``send_audio_body``."""
+
+    async def send() -> Response[Any]:
+        response = await client.get_async_httpx_client().request(**_request(body, body.__aiter__()))
+        return post_api_v1_audio._build_response(client=client, response=response)
+
+    response, _ = await acall_with_retry(send, max_retries=max_retries if body.replayable else 0, backoff=retry_backoff)
+    return unwrap(parse_json(response), "data")
+
+
+def upload_audio(
+    client: AuthenticatedClient | Client,
+    source: AudioSource,
+    *,
+    trace_id: str,
+    span_id: str,
+    audio_uuid: str,
+    file_name: str | None = None,
+    mime_type: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> Any:
+    """
+    Upload one recording, streaming it from ``source``.
+
+    Args:
+        client: API client
+        source: File path, binary file object or ``bytes``
+        trace_id: Trace ID the audio belongs to
+        span_id: Span ID the audio belongs to
+        audio_uuid: Unique identifier of the audio
+        file_name: File name sent with the audio
+        mime_type: Content type of the audio
+        chunk_size: Bytes read and sent at a time
+        max_retries: Retries for transient failures (replayable sources only)
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        The created audio record
+
+    Raises:
+        errors.UnexpectedStatus: If the upload fails.
+    """
+    body = AudioUploadBody(
+        source,
+        trace_id=trace_id,
+        span_id=span_id,
+        audio_uuid=audio_uuid,
+        file_name=file_name,
+        mime_type=mime_type,
+        chunk_size=chunk_size,
+    )
+    return send_audio_body(client, body, max_retries=max_retries, retry_backoff=retry_backoff)
+
+
+async def aupload_audio(
+    client: AuthenticatedClient | Client,
+    source: AudioSource,
+    *,
+    trace_id: str,
+    span_id: str,
+    audio_uuid: str,
+    file_name: str | None = None,
+    mime_type: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> Any:
+    """Async version of ``upload_audio``; ``source`` may also be an async byte iterator."""
+    body = AudioUploadBody(
+        source,
+        trace_id=trace_id,
+        span_id=span_id,
+        audio_uuid=audio_uuid,
+        file_name=file_name,
+        mime_type=mime_type,
+        chunk_size=chunk_size,
+    )
+    return await asend_audio_body(client, body, max_retries=max_retries, retry_backoff=retry_backoff)
+
+
+@define
+class AudioUpload:
+    """One recording of a bulk upload."""
+
+    trace_id: str
+    span_id: str
+    audio_uuid: str
+    source: AudioSource
+    file_name: str | None = None
+    mime_type: str | None = None
+
+    def body(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AudioUploadBody:
+        return AudioUploadBody(
+            self.source,
+            trace_id=self.trace_id,
+            span_id=self.span_id,
+            audio_uuid=self.audio_uuid,
+            file_name=self.file_name,
+            mime_type=self.mime_type,
+            chunk_size=chunk_size,
+        )
+
+
+@define
+class AudioUploadResult:
+    """Progress and outcome of a bulk audio upload."""
+
+    total: int = 0
+    uploaded: int = 0
+    bytes_sent: int = 0
+    records: list[Any] = field(factory=list)
+    failed: list[tuple[AudioUpload, str]] = field(factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "uploaded": self.uploaded,
+            "failed": len(self.failed),
+            "bytes_sent": self.bytes_sent,
+        }
+
+
+def _uploads(uploads: Iterable[AudioUpload | tuple[Any, ...]]) -> list[AudioUpload]:
+    return [upload if isinstance(upload, AudioUpload) else AudioUpload(*upload) for upload in uploads]
+
+
+def upload_audio_files(
+    client: AuthenticatedClient | Client,
+    uploads: Iterable[AudioUpload | tuple[Any, ...]],
+    *,
+    concurrency: int = 4,
+    on_progress: Callable[[AudioUploadResult], None] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> AudioUploadResult:
+    """
+    Upload many recordings concurrently from a thread pool.
+
+    Args:
+        client: API client
+        uploads: ``AudioUpload``s or ``(trace_id, span_id, audio_uuid, source)``
+            tuples; sources are paths, binary file objects or ``bytes``
+        concurrency: Uploads in flight
+        on_progress: Called with the running result after every finished upload
+        chunk_size: Bytes read and sent at a time, per upload
+        max_retries: Retries per upload for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``AudioUploadResult`` with the created records, in completion order,
+        and the uploads that failed with their error
+    """
+    tasks = _uploads(uploads)
+    result = AudioUploadResult(total=len(tasks))
+
+    def send(upload: AudioUpload) -> tuple[Any, int, str | None]:
+        try:
+            body = upload.body(chunk_size)
+            record = send_audio_body(client, body, max_retries=max_retries, retry_backoff=retry_backoff)
+        except (errors.UnexpectedStatus, httpx.HTTPError, OSError, TypeError) as exc:
+            return None, 0, f"{type(exc).__name__}: {exc}"
+        return record, body.bytes_sent, None
+
+    def finish(upload: AudioUpload, outcome: tuple[Any, int, str | None]) -> None:
+        record, sent, error = outcome
+        if error is not None:
+            result.failed.append((upload, error))
+        else:
+            result.uploaded += 1
+            result.bytes_sent += sent
+            result.records.append(record)
+        if on_progress is not None:
+            on_progress(result)
+
+    client.get_httpx_client()
+    run_bounded(send, tasks, finish, concurrency=concurrency)
+    return result
+
+
+async def aupload_audio_files(
+    client: AuthenticatedClient | Client,
+    uploads: Iterable[AudioUpload | tuple[Any, ...]],
+    *,
+    concurrency: int = 4,
+    on_progress: Callable[[AudioUploadResult], None] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> AudioUploadResult:
+    """Async version of ``upload_audio_files``; sources may also be async byte iterators."""
+    tasks = _uploads(uploads)
+    result = AudioUploadResult(total=len(tasks))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(upload: AudioUpload) -> None:
+        async with semaphore:
+            try:
+                body = upload.body(chunk_size)
+                record = await asend_audio_body(client, body, max_retries=max_retries, retry_backoff=retry_backoff)
+            except (errors.UnexpectedStatus, httpx.HTTPError, OSError) as exc:
+                result.failed.append((upload, f"{type(exc).__name__}: {exc}"))
+            else:
+                result.uploaded += 1
+                result.bytes_sent += body.bytes_sent
+                result.records.append(record)
+            if on_progress is not None:
+                on_progress(result)
+
+    await asyncio.gather(*(send(upload) for upload in tasks))
+    return result
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "AudioSource",
+    "AudioUpload",
+    "AudioUploadBody",
+    "AudioUploadResult",
+    "aupload_audio",
+    "aupload_audio_files",
+    "asend_audio_body",
+    "send_audio_body",
+    "upload_audio",
+    "upload_audio_files",
+]
@@ -0,0 +1,547 @@
+"""
+HTTP response cache for read-mostly endpoints.
+
+``CachingTransport`` sits below ``httpx.Client`` / ``httpx.AsyncClient`` so the
+generated ``sync_detailed`` / ``asyncio_detailed`` functions are cached
+transparently. Only GET requests whose path matches a TTL rule are cached.
+Stale entries that carry an ``ETag`` or ``Last-Modified`` validator are
+revalidated with ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not
+Modified`` answer refreshes the entry without transferring the body again.
+Successful POST/PUT/DELETE requests invalidate cached entries for the same
+path and its parent collection, found through the path stored with each
+entry, so entries written by other processes or before a restart are
+invalidated too.
+
+Example:
+    ```python
+    from noveum_api_client import NoveumClient
+    from noveum_api_client.cache import MemoryCacheBackend
+
+    client = NoveumClient(api_key="nv_...", cache=MemoryCacheBackend(max_bytes=32 * 1024 * 1024))
+    ```
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection, Mapping
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+import httpx
+from attrs import define
+
+from .transport import LayeredTransport, decoded_headers
+
+# Default per-endpoint TTLs in seconds. Patterns are matched against the
+# request path with fnmatch; the first matching pattern wins.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/api/v1/scorers": 60.0,
+    "/api/v1/projects": 60.0,
+    "/api/v1/traces/filter-values": 30.0,
+    "/api/v1/traces/directory-tree": 30.0,
+    "/api/v1/traces/environments-by-projects": 30.0,
+}
+
+_UNSAFE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+# Directory mtimes are coarse: one this recent may hide another change made
+# within the same tick, so it is not trusted to prove the index is current
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+@define
+class CachedResponse:
+    """A stored response together with its freshness information."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    expires_at: float
+    path: str = ""
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def etag(self) -> str | None:
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self._header("last-modified")
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    def _header(self, name: str) -> str | None:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+    def to_bytes(self) -> bytes:
+        meta = {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "expires_at": self.expires_at,
+            "path": self.path,
+        }
+        return json.dumps(meta).encode() + b"\n" + self.content
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CachedResponse":
+        meta, _, content = data.partition(b"\n")
+        fields = json.loads(meta)
+        return cls(
+            status_code=fields["status_code"],
+            headers=[tuple(header) for header in fields["headers"]],
+            content=content,
+            expires_at=fields["expires_at"],
+            path=fields.get("path", ""),
+        )
+
+
+class CacheBackend:
+    """Storage interface used by ``CachingTransport``. Implementations must be thread-safe."""
+
+    def get(self, key: str) -> CachedResponse | None:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def delete_paths(self, paths: Collection[str]) -> int:
+        """Delete every entry whose request path is one of ``paths``; return how many were deleted."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache bounded by entry count and total body size.
+
+    Args:
+        max_entries: Maximum number of stored responses
+        max_bytes: Maximum total size of stored response bodies
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def delete_paths(self, paths: Collection[str]) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.path in paths]
+            for key in keys:
+                self._size -= self._entries.pop(key).size
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    On-disk LRU cache bounded by total file size.
+
+    Each entry is one file named after the hash of its key. Writes go to a
+    temporary file that is atomically renamed into place, so several processes
+    can share one directory. Recency is tracked through the file mtime, which
+    is bumped on every hit.
+
+    Invalidation goes through an in-memory index of entry files by request
+    path. It is built from the files' metadata lines on first use and, when
+    the directory changed behind this backend's back, caught up with the
+    files other processes added, so only new files are ever read.
+
+    Args:
+        directory: Cache directory, created if missing
+        max_bytes: Maximum total size of the cache files
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Running size estimate; the directory is only rescanned when it
+        # suggests the budget is exceeded (other processes may write too)
+        self._size = self._scan()[1]
+        # Entry files by request path, and the directory mtime they reflect
+        # (None until the index is first needed)
+        self._files_by_path: dict[str, set[Path]] = {}
+        self._path_of: dict[Path, str] = {}
+        self._indexed: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + ".entry")
+
+    def get(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        try:
+            return CachedResponse.from_bytes(data)
+        except (ValueError, KeyError, TypeError):
+            self.delete(key)
+            return None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        data = entry.to_bytes()
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        before = self._mtime()
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            replaced = self._file_size(path)
+            os.replace(tmp_name, path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._size += len(data) - replaced
+            self._index(path, entry.path)
+            if self._size > self.max_bytes:
+                self._evict()
+            self._caught_up(before)
+
+    def _mtime(self) -> int | None:
+        try:
+            return self.directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _settled(self, mtime: int | None) -> int | None:
+        return mtime if mtime is not None and time.time_ns() - mtime > _MTIME_SLACK_NS else None
+
+    def _caught_up(self, before: int | None) -> None:
+        # Changes made by this backend alone keep the index current
+        if self._indexed is not None and self._indexed == before:
+            self._indexed = self._settled(self._mtime())
+
+    def _index(self, path: Path, entry_path: str) -> None:
+        self._unindex(path)
+        self._path_of[path] = entry_path
+        self._files_by_path.setdefault(entry_path, set()).add(path)
+
+    def _unindex(self, path: Path) -> None:
+        entry_path = self._path_of.pop(path, None)
+        if entry_path is not None:
+            files = self._files_by_path[entry_path]
+            files.discard(path)
+            if not files:
+                del self._files_by_path[entry_path]
+
+    def _catch_up(self) -> None:
+        """Index the entry files added since the index last matched the directory."""
+        mtime = self._mtime()
+        if self._indexed is not None and mtime == self._indexed:
+            return
+        for path in self.directory.glob("*.entry"):
+            if path in self._path_of:
+                continue
+            try:
+                with path.open("rb") as file:
+                    entry_path = json.loads(file.readline()).get("path")
+            except (OSError, ValueError, AttributeError):
+                continue
+            if isinstance(entry_path, str):
+                self._index(path, entry_path)
+        self._indexed = self._settled(mtime)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _unlink(self, path: Path) -> bool:
+        """Delete an entry file; call with the lock held."""
+        size = self._file_size(path)
+        self._unindex(path)
+        try:
+            path.unlink()
+        except OSError:
+            return False
+        self._size = max(0, self._size - size)
+        return True
+
+    def _scan(self) -> tuple[list[tuple[float, int, Path]], int]:
+        files = []
+        total = 0
+        for path in self.directory.glob("*.entry"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return files, total
+
+    def _evict(self) -> None:
+        files, total = self._scan()
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            self._unindex(path)
+            path.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            before = self._mtime()
+            self._unlink(self._path(key))
+            self._caught_up(before)
+
+    def delete_paths(self, paths: Collection[str]) -> int:
+        with self._lock:
+            self._catch_up()
+            files = [file for path in paths for file in self._files_by_path.get(path, ())]
+            before = self._mtime()
+            deleted = sum(self._unlink(file) for file in files)
+            self._caught_up(before)
+        return deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*.entry"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+            self._files_by_path.clear()
+            self._path_of.clear()
+            self._indexed = None
+
+
+@define
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+        }
+
+
+@define
+class _Lookup:
+    key: str
+    ttl: float
+    entry: CachedResponse | None = None
+    revalidate: bool = False
+
+
+class CachingTransport(LayeredTransport):
+    """
+    Transport that caches GET responses according to per-endpoint TTLs.
+
+    Args:
+        backend: Where to store responses (default: ``MemoryCacheBackend()``)
+        ttls: Mapping of path pattern to TTL in seconds
+            (default: ``DEFAULT_CACHE_TTLS``)
+        transport: Wrapped transport, see ``LayeredTransport``
+        **transport_kwargs: Keyword arguments for the default httpx transports
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: Mapping[str, float] | None = None,
+        transport: Any = None,
+        **transport_kwargs: Any,
+    ):
+        super().__init__(transport, **transport_kwargs)
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL configured for ``path`` (0 when it is not cached)."""
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return 0.0
+
+    @staticmethod
+    def cache_key(request: httpx.Request) -> str:
+        """Key a request by its URL and a digest of its credentials."""
+        auth = request.headers.get("authorization", "")
+        auth_digest = hashlib.sha256(auth.encode()).hexdigest()[:16]
+        return f"{auth_digest} {request.url}"
+
+    def _lookup(self, request: httpx.Request) -> _Lookup | None:
+        """Return lookup state for cacheable requests, ``None`` otherwise."""
+        if request.method != "GET":
+            return None
+        ttl = self.ttl_for(request.url.path)
+        cache_control = request.headers.get("cache-control", "").lower()
+        if ttl <= 0 or "no-store" in cache_control:
+            return None
+        key = self.cache_key(request)
+        return _Lookup(key=key, ttl=ttl, entry=self.backend.get(key), revalidate="no-cache" in cache_control)
+
+    def _cached_response(self, request: httpx.Request, lookup: _Lookup) -> httpx.Response | None:
+        """Serve fresh hits, or add validators for stale entries."""
+        entry = lookup.entry
+        if entry is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        if entry.is_fresh() and not lookup.revalidate:
+            with self._lock:
+                self.stats.hits += 1
+            return entry.to_response(request)
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def _store(self, request: httpx.Request, lookup: _Lookup, response: httpx.Response) -> httpx.Response:
+        if response.status_code == 304 and lookup.entry is not None:
+            lookup.entry.expires_at = time.time() + lookup.ttl
+            self.backend.set(lookup.key, lookup.entry)
+            with self._lock:
+                self.stats.revalidated += 1
+            return lookup.entry.to_response(request)
+        if response.status_code != 200 or "no-store" in response.headers.get("cache-control", "").lower():
+            return response
+        entry = CachedResponse(
+            status_code=response.status_code,
+            headers=decoded_headers(response.headers),
+            content=response.content,
+            expires_at=time.time() + lookup.ttl,
+            path=request.url.path,
+        )
+        self.backend.set(lookup.key, entry)
+        with self._lock:
+            self.stats.stores += 1
+        return entry.to_response(request)
+
+    def _invalidate(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Drop entries for the target path and its parent after a successful write."""
+        if request.method not in _UNSAFE_METHODS or response.status_code >= 400:
+            return
+        path = request.url.path.rstrip("/")
+        parent = path.rsplit("/", 1)[0]
+        # Entries are stored under the exact request path, with or without a trailing slash
+        paths = {path, f"{path}/", parent, f"{parent}/"}
+        if not any(self.ttl_for(p) > 0 for p in paths):
+            # Nothing under these paths is ever cached
+            return
+        deleted = self.backend.delete_paths(paths)
+        with self._lock:
+            self.stats.invalidations += deleted
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        lookup = self._lookup(request)
+        if lookup is None:
+            response = super().handle_request(request)
+            self._invalidate(request, response)
+            return response
+        cached = self._cached_response(request, lookup)
+        if cached is not None:
+            return cached
+        response = super().handle_request(request)
+        if response.status_code in (200, 304):
+            response.read()
+            response.close()
+        return self._store(request, lookup, response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        lookup = self._lookup(request)
+        if lookup is None:
+            response = await super().handle_async_request(request)
+            self._invalidate(request, response)
+            return response
+        cached = self._cached_response(request, lookup)
+        if cached is not None:
+            return cached
+        response = await super().handle_async_request(request)
+        if response.status_code in (200, 304):
+            await response.aread()
+            await response.aclose()
+        return self._store(request, lookup, response)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
+
+
+__all__ = [
+    "DEFAULT_CACHE_TTLS",
+    "CacheBackend",
+    "CacheStats",
+    "CachedResponse",
+    "CachingTransport",
+    "DiskCacheBackend",
+    "MemoryCacheBackend",
+]
@@ -0,0 +1,162 @@
+"""
+Request coalescing ("single-flight") for duplicate concurrent GET requests.
+
+When several threads or coroutines issue the same GET while an identical one
+is already in flight, ``CoalescingTransport`` sends only the first request and
+hands a copy of its response to every waiter. Requests are identified by
+method, full URL (including query parameters), ``Accept`` and a digest of the
+``Authorization`` header, so callers with different credentials never share
+responses. Failures are propagated to every waiter.
+
+Shared responses are read into memory, so requests whose response depends on
+per-request state (``Range`` or conditional headers) and requests carrying the
+``NO_COALESCE`` extension, such as streamed downloads, are passed through.
+
+Example:
+    ```python
+    from noveum_api_client import NoveumClient
+
+    client = NoveumClient(api_key="nv_...", coalesce_requests=True)
+    ```
+"""
+
+import asyncio
+import hashlib
+import threading
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from .transport import LayeredTransport, decoded_headers
+
+# Request extension that passes a request through uncoalesced, e.g. for
+# streamed downloads: ``client.stream(..., extensions={NO_COALESCE: True})``
+NO_COALESCE = "noveum_no_coalesce"
+_PER_REQUEST_HEADERS = ("range", "if-range", "if-match", "if-none-match", "if-modified-since", "if-unmodified-since")
+
+
+@define
+class _Flight:
+    """Outcome of one in-flight request, shared with its followers."""
+
+    done: threading.Event
+    status_code: int = 0
+    headers: list[tuple[str, str]] = field(factory=list)
+    content: bytes = b""
+    error: BaseException | None = None
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class CoalescingTransport(LayeredTransport):
+    """
+    Transport that deduplicates identical concurrent GET requests.
+
+    Sync requests are coalesced across threads, async requests across tasks of
+    the same event loop.
+
+    Args:
+        transport: Wrapped transport, see ``LayeredTransport``
+        **transport_kwargs: Keyword arguments for the default httpx transports
+    """
+
+    def __init__(self, transport: Any = None, **transport_kwargs: Any):
+        super().__init__(transport, **transport_kwargs)
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[tuple[int, str], asyncio.Future[_Flight]] = {}
+        self.requests_sent = 0
+        self.requests_coalesced = 0
+
+    @staticmethod
+    def flight_key(request: httpx.Request) -> str | None:
+        """Return the dedupe key for ``request``, or ``None`` if it must not be coalesced."""
+        if request.method != "GET" or request.extensions.get(NO_COALESCE):
+            return None
+        if any(name in request.headers for name in _PER_REQUEST_HEADERS):
+            return None
+        auth = request.headers.get("authorization", "")
+        accept = request.headers.get("accept", "")
+        return f"{hashlib.sha256(auth.encode()).hexdigest()[:16]} {accept} {request.url}"
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.flight_key(request)
+        if key is None:
+            return super().handle_request(request)
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(done=threading.Event())
+                self.requests_sent += 1
+            else:
+                self.requests_coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.response(request)
+
+        try:
+            response = super().handle_request(request)
+            try:
+                response.read()
+            finally:
+                response.close()
+            flight.status_code = response.status_code
+            flight.headers = decoded_headers(response.headers)
+            flight.content = response.content
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.flight_key(request)
+        if key is None:
+            return await super().handle_async_request(request)
+
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        waiting = self._async_flights.get(loop_key)
+        if waiting is not None:
+            self.requests_coalesced += 1
+            # shield: a cancelled follower must not cancel the shared future
+            flight = await asyncio.shield(waiting)
+            if isinstance(flight.error, asyncio.CancelledError):
+                # The leader was cancelled, not this caller: send our own request
+                return await self.handle_async_request(request)
+            return flight.response(request)
+
+        future: asyncio.Future[_Flight] = loop.create_future()
+        self._async_flights[loop_key] = future
+        self.requests_sent += 1
+        flight = _Flight(done=threading.Event())
+        try:
+            response = await super().handle_async_request(request)
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            flight.status_code = response.status_code
+            flight.headers = decoded_headers(response.headers)
+            flight.content = response.content
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self._async_flights[loop_key]
+            flight.done.set()
+            future.set_result(flight)
+        return flight.response(request)
+
+
+__all__ = ["CoalescingTransport"]
@@ -0,0 +1,388 @@
+"""
+Versioned on-disk dataset snapshots.
+
+Published dataset versions are immutable, so once downloaded they can be
+served from disk forever. ``DatasetSnapshotCache`` keeps one directory per
+``(dataset slug, version)``::
+
+    <root>/<slug>/<version>/
+        items.jsonl   one compact JSON item per line
+        items.idx     native uint64 byte offsets of every line (n + 1 entries)
+        ids.txt       item IDs, one per line, in item order
+        meta.json     version metadata, fingerprint and published flag
+
+Published versions are permanent hits. Draft versions are revalidated against
+the version metadata on every ``load()`` and re-downloaded when it changed.
+``DatasetSnapshot`` memory-maps the item and index files, so any number of
+worker processes reading the same version share one copy in the OS page cache.
+
+Example:
+    ```python
+    from noveum_api_client import Client
+    from noveum_api_client.dataset_cache import DatasetSnapshotCache
+
+    cache = DatasetSnapshotCache("/var/cache/noveum/datasets")
+    with cache.load(client, "my-dataset", "1.0.0") as snapshot:
+        for item in snapshot:
+            ...
+    ```
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import uuid
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from attrs import define
+
+from ._utils import page_total, parse_json, unwrap
+from .api.datasets import (
+    get_api_v1_datasets_by_dataset_slug_items,
+    get_api_v1_datasets_by_dataset_slug_versions_by_version,
+)
+from .client import AuthenticatedClient, Client
+from .types import UNSET, Unset
+
+_PUBLISHED_STATUSES = frozenset({"published", "released"})
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/noveum/datasets`` (``~/.cache/noveum/datasets`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "noveum" / "datasets"
+
+
+def is_published(version_data: Mapping[str, Any]) -> bool:
+    """Return whether version metadata describes an immutable, published version."""
+    status = str(version_data.get("status") or "").lower()
+    return status in _PUBLISHED_STATUSES or bool(version_data.get("published_at"))
+
+
+def _fingerprint(version_data: Mapping[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(version_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _item_id(item: Mapping[str, Any]) -> str:
+    return str(item.get("item_id") or item.get("id") or "")
+
+
+def _segment(value: str) -> str:
+    # Percent-encode separators, and a leading dot so "." / ".." / staging
+    # directory names can never be produced by a slug or version
+    segment = quote(value, safe="")
+    return "%2E" + segment[1:] if segment.startswith(".") or not segment else segment
+
+
+def _map(path: Path) -> mmap.mmap | None:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _last_page(items: list[Any], offset: int, total: int | None) -> bool:
+    # The server may cap the page size below the requested limit, so a short
+    # page is not the end: page until the reported total, or an empty page
+    return not items or (total is not None and offset >= total)
+
+
+def iter_dataset_items(
+    client: AuthenticatedClient | Client,
+    slug: str,
+    *,
+    version: str | Unset = UNSET,
+    page_size: int = 500,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield every item of a dataset (version), fetching one page at a time.
+
+    Raises:
+        errors.UnexpectedStatus: If fetching a page fails.
+    """
+    offset = 0
+    while True:
+        response = get_api_v1_datasets_by_dataset_slug_items.sync_detailed(
+            slug, client=client, version=version, limit=page_size, offset=offset
+        )
+        data = parse_json(response)
+        items = unwrap(data, "items") or []
+        yield from items
+        offset += len(items)
+        if _last_page(items, offset, page_total(data)):
+            return
+
+
+async def aiter_dataset_items(
+    client: AuthenticatedClient | Client,
+    slug: str,
+    *,
+    version: str | Unset = UNSET,
+    page_size: int = 500,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async version of ``iter_dataset_items``."""
+    offset = 0
+    while True:
+        response = await get_api_v1_datasets_by_dataset_slug_items.asyncio_detailed(
+            slug, client=client, version=version, limit=page_size, offset=offset
+        )
+        data = parse_json(response)
+        items = unwrap(data, "items") or []
+        for item in items:
+            yield item
+        offset += len(items)
+        if _last_page(items, offset, page_total(data)):
+            return
+
+
+class DatasetSnapshot:
+    """
+    Read-only, memory-mapped view of one cached dataset version.
+
+    Items are decoded lazily on access; ``raw(i)`` returns the undecoded JSON
+    bytes of item ``i``.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self.meta: dict[str, Any] = json.loads((self.path / "meta.json").read_text())
+        self._items = _map(self.path / "items.jsonl")
+        self._index = _map(self.path / "items.idx")
+        self._offsets = memoryview(self._index).cast("Q") if self._index is not None else memoryview(b"")
+        self._positions: dict[str, int] | None = None
+
+    @property
+    def slug(self) -> str:
+        return self.meta["slug"]
+
+    @property
+    def version(self) -> str:
+        return self.meta["version"]
+
+    @property
+    def published(self) -> bool:
+        return self.meta["published"]
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    def raw(self, index: int) -> bytes:
+        """Return the JSON bytes of item ``index``."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset snapshot index out of range")
+        items = self._items if self._items is not None else b""
+        # Each line ends with a newline that is not part of the item
+        return items[self._offsets[index] : self._offsets[index + 1] - 1]
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        return json.loads(self.raw(index))
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def ids(self) -> list[str]:
+        """Return the item IDs in item order."""
+        return (self.path / "ids.txt").read_text(encoding="utf-8").splitlines()
+
+    def get(self, item_id: str) -> dict[str, Any] | None:
+        """Look up an item by ID (the ID index is loaded on first use)."""
+        if self._positions is None:
+            self._positions = {value: position for position, value in enumerate(self.ids())}
+        position = self._positions.get(item_id)
+        return None if position is None else self[position]
+
+    def close(self) -> None:
+        self._offsets.release()
+        for mapped in (self._items, self._index):
+            if mapped is not None:
+                mapped.close()
+
+    def __enter__(self) -> "DatasetSnapshot":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+@define
+class SnapshotCacheStats:
+    """Counters describing snapshot cache effectiveness."""
+
+    hits: int = 0
+    revalidated: int = 0
+    downloads: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "revalidated": self.revalidated, "downloads": self.downloads}
+
+
+class DatasetSnapshotCache:
+    """
+    Directory of dataset snapshots keyed by ``(slug, version)``.
+
+    Args:
+        directory: Cache root (default: ``default_cache_dir()``)
+        page_size: Items requested per page when downloading a version
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None, page_size: int = 500):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.page_size = page_size
+        self.stats = SnapshotCacheStats()
+
+    def path_for(self, slug: str, version: str) -> Path:
+        return self.directory / _segment(slug) / _segment(version)
+
+    def read_meta(self, slug: str, version: str) -> dict[str, Any] | None:
+        """Return the stored metadata of a cached version, or ``None`` if it is not cached."""
+        try:
+            return json.loads((self.path_for(slug, version) / "meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def open(self, slug: str, version: str) -> DatasetSnapshot | None:
+        """Open a cached version without contacting the API."""
+        if self.read_meta(slug, version) is None:
+            return None
+        return DatasetSnapshot(self.path_for(slug, version))
+
+    def load(self, client: AuthenticatedClient | Client, slug: str, version: str) -> DatasetSnapshot:
+        """
+        Return a snapshot of ``slug@version``, downloading it if needed.
+
+        Raises:
+            errors.UnexpectedStatus: If fetching the version or its items fails.
+        """
+        local = self.read_meta(slug, version)
+        if local is not None and local["published"]:
+            self.stats.hits += 1
+            return DatasetSnapshot(self.path_for(slug, version))
+
+        version_data = self.fetch_version_data(client, slug, version)
+        if self.is_current(slug, version, version_data):
+            self.stats.revalidated += 1
+            return DatasetSnapshot(self.path_for(slug, version))
+
+        self.stats.downloads += 1
+        return DatasetSnapshot(self.store(slug, version, self._iter_remote_items(client, slug, version), version_data))
+
+    @staticmethod
+    def fetch_version_data(client: AuthenticatedClient | Client, slug: str, version: str) -> dict[str, Any]:
+        """Fetch the metadata of ``slug@version`` (without any embedded items)."""
+        response = get_api_v1_datasets_by_dataset_slug_versions_by_version.sync_detailed(slug, version, client=client)
+        version_data = unwrap(parse_json(response), "data") or {}
+        return {key: value for key, value in version_data.items() if key != "items"}
+
+    def is_current(self, slug: str, version: str, version_data: Mapping[str, Any]) -> bool:
+        """Return whether the cached copy of ``slug@version`` matches ``version_data``."""
+        local = self.read_meta(slug, version)
+        return local is not None and (local["published"] or local["fingerprint"] == _fingerprint(version_data))
+
+    def _iter_remote_items(
+        self, client: AuthenticatedClient | Client, slug: str, version: str
+    ) -> Iterator[dict[str, Any]]:
+        return iter_dataset_items(client, slug, version=version, page_size=self.page_size)
+
+    def store(
+        self,
+        slug: str,
+        version: str,
+        items: Iterable[Mapping[str, Any]],
+        version_data: Mapping[str, Any],
+    ) -> Path:
+        """
+        Write ``items`` as the snapshot of ``slug@version`` and return its directory.
+
+        The snapshot is built in a temporary directory and renamed into place,
+        so readers never observe a partially written version.
+        """
+        records = (
+            (_item_id(item), json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode()) for item in items
+        )
+        return self.store_raw(slug, version, records, version_data)
+
+    def store_raw(
+        self,
+        slug: str,
+        version: str,
+        records: Iterable[tuple[str, bytes]],
+        version_data: Mapping[str, Any],
+    ) -> Path:
+        """
+        Like ``store()``, but takes ``(item_id, compact JSON bytes)`` records.
+
+        Lets callers copy unchanged items from another snapshot (see
+        ``DatasetSnapshot.raw()``) without decoding and re-encoding them.
+        """
+        target = self.path_for(slug, version)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.parent / f".{target.name}.{uuid.uuid4().hex}.tmp"
+        staging.mkdir()
+        try:
+            offsets = array("Q", [0])
+            with (
+                open(staging / "items.jsonl", "wb") as items_file,
+                open(staging / "ids.txt", "w", encoding="utf-8") as ids_file,
+            ):
+                for item_id, data in records:
+                    items_file.write(data)
+                    items_file.write(b"\n")
+                    offsets.append(offsets[-1] + len(data) + 1)
+                    ids_file.write(item_id + "\n")
+            with open(staging / "items.idx", "wb") as index_file:
+                offsets.tofile(index_file)
+            meta = {
+                "slug": slug,
+                "version": version,
+                "published": is_published(version_data),
+                "fingerprint": _fingerprint(version_data),
+                "item_count": len(offsets) - 1,
+                "version_data": dict(version_data),
+            }
+            (staging / "meta.json").write_text(json.dumps(meta, default=str))
+            self._install(staging, target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return target
+
+    @staticmethod
+    def _install(staging: Path, target: Path) -> None:
+        retired = None
+        if target.exists():
+            retired = target.parent / f".{target.name}.{uuid.uuid4().hex}.old"
+            try:
+                os.rename(target, retired)
+            except OSError:
+                retired = None
+        # Fails when another process installed this version first; keep theirs
+        with contextlib.suppress(OSError):
+            os.rename(staging, target)
+        if retired is not None:
+            # Open snapshots keep their memory maps of the retired files
+            shutil.rmtree(retired, ignore_errors=True)
+
+    def evict(self, slug: str, version: str | None = None) -> None:
+        """Delete one cached version, or every cached version of ``slug``."""
+        path = self.path_for(slug, version) if version is not None else self.directory / _segment(slug)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+__all__ = [
+    "DatasetSnapshot",
+    "DatasetSnapshotCache",
+    "SnapshotCacheStats",
+    "aiter_dataset_items",
+    "default_cache_dir",
+    "is_published",
+    "iter_dataset_items",
+]
@@ -0,0 +1,203 @@
+"""
+Content-hash deduplication for dataset item uploads.
+
+Every item is identified by a stable hash of its canonical JSON (sorted keys,
+compact separators) over ``item_type`` and ``content``. A ``HashIndex`` keeps
+the hashes of the items a dataset is known to hold, persisted as one
+``item_id<TAB>hash`` line per item, and can be seeded from the dataset's item
+listing.
+
+Passed to ``dataset_upload.upload_items(dedup=...)``, the index lets the
+uploader
+
+* skip items whose hash is unchanged (or, without an ``item_id``, whose hash
+  is already present),
+* replace items whose ``item_id`` is known but whose hash changed, and
+* record the hashes of uploaded items once their chunk is acknowledged, so a
+  failed upload never marks unsent items as present.
+
+The API has no upsert endpoint, so a changed item is replaced by deleting the
+old item (one bulk ``DELETE /api/v1/datasets/{slug}/items`` per chunk) once
+the chunk holding its new version was acknowledged. A failed post therefore
+never loses the old version, and items already deleted by an interrupted
+run (``404``) count as deleted.
+
+Example:
+    ```python
+    from noveum_api_client.dataset_dedup import HashIndex
+    from noveum_api_client.dataset_upload import upload_items
+
+    index = HashIndex.for_dataset("my-dataset")
+    result = upload_items(client, "my-dataset", items, dedup=index)
+    print(result.dedup_hit_rate, result.bytes_saved)
+    ```
+"""
+
+import hashlib
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+
+from .client import AuthenticatedClient, Client
+from .dataset_cache import _item_id, _segment, default_cache_dir, iter_dataset_items
+
+
+def content_hash(item: Mapping[str, Any]) -> bytes:
+    """Return the 16-byte digest of an item's canonical ``item_type`` and ``content`` JSON."""
+    canonical = json.dumps(
+        {"item_type": item.get("item_type"), "content": item.get("content")},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+class HashIndex:
+    """
+    Known content hashes of one dataset's items.
+
+    Args:
+        path: File the index is loaded from and saved to (optional; without
+            it the index only lives in memory)
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None):
+        self.path = Path(path) if path is not None else None
+        self._by_id: dict[str, bytes] = {}
+        self._digests: set[bytes] = set()
+        if self.path is not None and self.path.exists():
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    item_id, _, digest = line.rstrip("\n").rpartition("\t")
+                    self.add(item_id, bytes.fromhex(digest))
+
+    @classmethod
+    def for_dataset(cls, dataset_slug: str, directory: str | os.PathLike[str] | None = None) -> "HashIndex":
+        """Open the index of ``dataset_slug`` (default directory: ``~/.cache/noveum/dataset-hashes``)."""
+        root = Path(directory) if directory is not None else default_cache_dir().parent / "dataset-hashes"
+        return cls(root / f"{_segment(dataset_slug)}.tsv")
+
+    def get(self, item_id: str) -> bytes | None:
+        return self._by_id.get(item_id)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._digests
+
+    def add(self, item_id: str, digest: bytes) -> None:
+        """Record ``digest`` (under ``item_id`` when the item has one)."""
+        if item_id:
+            self._by_id[item_id] = digest
+        self._digests.add(digest)
+
+    def seed(self, client: AuthenticatedClient | Client, dataset_slug: str, page_size: int = 500) -> int:
+        """
+        Add the hashes of every item the dataset currently holds.
+
+        Returns:
+            Number of items read
+
+        Raises:
+            errors.UnexpectedStatus: If listing the items fails.
+        """
+        count = 0
+        for item in iter_dataset_items(client, dataset_slug, page_size=page_size):
+            self.add(_item_id(item), content_hash(item))
+            count += 1
+        return count
+
+    def save(self) -> None:
+        """Write the index to ``path`` atomically (no-op for in-memory indexes)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f"{self.path.name}.tmp")
+        named = set(self._by_id.values())
+        with open(temp, "w", encoding="utf-8") as file:
+            for item_id, digest in self._by_id.items():
+                file.write(f"{item_id}\t{digest.hex()}\n")
+            for digest in self._digests - named:
+                file.write(f"\t{digest.hex()}\n")
+        os.replace(temp, self.path)
+
+
+@define
+class DedupBatch:
+    """Dedup bookkeeping for one upload chunk."""
+
+    replaces: list[str] = field(factory=list)
+    hashes: list[tuple[str, bytes]] = field(factory=list)
+
+
+@define
+class DedupStats:
+    """Counters describing deduplication during one upload."""
+
+    items_seen: int = 0
+    unchanged: int = 0
+    replaced: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of items skipped as unchanged."""
+        return self.unchanged / self.items_seen if self.items_seen else 0.0
+
+
+class DedupFilter:
+    """
+    Filters an encoded item stream against a ``HashIndex``.
+
+    ``filter()`` drops unchanged items and notes replacements and hashes by
+    stream position; ``take(end)`` hands the notes for every position below
+    ``end`` to the chunk that was just packed, and ``commit()`` records them
+    once that chunk was acknowledged.
+    """
+
+    def __init__(self, index: HashIndex):
+        self.index = index
+        self.stats = DedupStats()
+        self._replaces: deque[tuple[int, str]] = deque()
+        self._hashes: deque[tuple[int, str, bytes]] = deque()
+        # Hashes queued in this run, so in-run duplicates are skipped too
+        self._queued: set[bytes] = set()
+
+    def filter(self, items: Iterable[tuple[int, bytes]]) -> Iterator[tuple[int, bytes]]:
+        for index, data in items:
+            self.stats.items_seen += 1
+            item = json.loads(data)
+            item_id = str(item.get("item_id") or "")
+            digest = content_hash(item)
+            known = self.index.get(item_id) if item_id else None
+            if known == digest or (not item_id and (digest in self.index or digest in self._queued)):
+                self.stats.unchanged += 1
+                self.stats.bytes_saved += len(data)
+                continue
+            if known is not None:
+                self.stats.replaced += 1
+                self._replaces.append((index, item_id))
+            self._queued.add(digest)
+            self._hashes.append((index, item_id, digest))
+            yield index, data
+
+    def take(self, end: int) -> DedupBatch:
+        batch = DedupBatch()
+        while self._replaces and self._replaces[0][0] < end:
+            batch.replaces.append(self._replaces.popleft()[1])
+        while self._hashes and self._hashes[0][0] < end:
+            _, item_id, digest = self._hashes.popleft()
+            batch.hashes.append((item_id, digest))
+        return batch
+
+    def commit(self, batch: DedupBatch) -> None:
+        for item_id, digest in batch.hashes:
+            self.index.add(item_id, digest)
+
+
+__all__ = ["DedupBatch", "DedupFilter", "DedupStats", "HashIndex", "content_hash"]
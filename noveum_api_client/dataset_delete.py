@@ -0,0 +1,203 @@
+"""
+Bulk deletion of dataset items.
+
+``bulk_delete_items`` deletes items either by ID or by predicate, in chunks
+sent to ``DELETE /api/v1/datasets/{slug}/items`` from a thread pool, with
+transient failures retried per chunk.
+
+In predicate mode the dataset is scanned page by page and matching items are
+deleted while the scan continues. Deleting items shifts the offsets of every
+item behind them, so the scan walks the pages from the last one to the first:
+deletions then only ever affect positions that were already read. When the
+listing does not report a total, the matching IDs are collected first and
+deleted afterwards. A server capping the page size below ``page_size`` does
+not end the scan early: offsets follow the items actually received.
+
+Example:
+    ```python
+    from noveum_api_client.dataset_delete import bulk_delete_items
+
+    bulk_delete_items(client, "my-dataset", ["item-1", "item-2"])
+    bulk_delete_items(client, "my-dataset", lambda item: item["item_type"] == "draft")
+    ```
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from attrs import define
+
+from . import errors
+from ._utils import call_with_retry, page_total, parse_json, run_bounded, unwrap
+from .api.datasets import delete_api_v1_datasets_by_dataset_slug_items, get_api_v1_datasets_by_dataset_slug_items
+from .client import AuthenticatedClient, Client
+from .dataset_cache import _item_id
+from .models.delete_api_v1_datasets_by_dataset_slug_items_body import DeleteApiV1DatasetsByDatasetSlugItemsBody
+
+ItemPredicate = Callable[[dict[str, Any]], bool]
+
+
+@define
+class DeleteResult:
+    """Counters describing one ``bulk_delete_items`` run."""
+
+    items_deleted: int = 0
+    items_scanned: int = 0
+    chunks: int = 0
+    retries: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "items_deleted": self.items_deleted,
+            "items_scanned": self.items_scanned,
+            "chunks": self.chunks,
+            "retries": self.retries,
+        }
+
+
+def delete_chunk(
+    client: AuthenticatedClient | Client,
+    dataset_slug: str,
+    item_ids: list[str],
+    *,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+    missing_ok: bool = False,
+) -> int:
+    """
+    Delete ``item_ids`` with one request, retrying transient failures.
+
+    Args:
+        missing_ok: Treat ``404 Not Found`` as done, for items that an
+            earlier, interrupted run may already have deleted
+
+    Returns:
+        Number of retries it took
+
+    Raises:
+        errors.UnexpectedStatus: If the request fails permanently.
+    """
+    body = DeleteApiV1DatasetsByDatasetSlugItemsBody(item_ids=item_ids)
+    try:
+        _, retries = call_with_retry(
+            lambda: delete_api_v1_datasets_by_dataset_slug_items.sync_detailed(dataset_slug, client=client, body=body),
+            max_retries=max_retries,
+            backoff=retry_backoff,
+        )
+    except errors.UnexpectedStatus as exc:
+        if not (missing_ok and exc.status_code == 404):
+            raise
+        return 0
+    return retries
+
+
+def _chunked(item_ids: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(item_ids)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _fetch_page(
+    client: AuthenticatedClient | Client, dataset_slug: str, offset: int, limit: int
+) -> tuple[list[dict[str, Any]], int | None]:
+    response = get_api_v1_datasets_by_dataset_slug_items.sync_detailed(
+        dataset_slug, client=client, limit=limit, offset=offset
+    )
+    data = parse_json(response)
+    return unwrap(data, "items") or [], page_total(data)
+
+
+def _matching_ids(
+    client: AuthenticatedClient | Client,
+    dataset_slug: str,
+    predicate: ItemPredicate,
+    page_size: int,
+    result: DeleteResult,
+) -> Iterator[str]:
+    def matches(items: list[dict[str, Any]]) -> list[str]:
+        result.items_scanned += len(items)
+        return [_item_id(item) for item in items if predicate(item)]
+
+    def read(offset: int, end: int, size: int) -> list[dict[str, Any]]:
+        # A page may come back shorter than asked; re-request the rest of the range
+        items: list[dict[str, Any]] = []
+        while offset < end:
+            page, _ = _fetch_page(client, dataset_slug, offset, min(size, end - offset))
+            if not page:
+                break
+            items.extend(page)
+            offset += len(page)
+        return items
+
+    first, total = _fetch_page(client, dataset_slug, 0, page_size)
+    if total is None:
+        # Without a total the pages cannot be walked backwards: collect first, delete after.
+        # A short page may only mean the server capped the limit, so read until an empty one
+        collected = matches(first)
+        offset = len(first)
+        while first:
+            first, _ = _fetch_page(client, dataset_slug, offset, page_size)
+            collected.extend(matches(first))
+            offset += len(first)
+        yield from collected
+        return
+
+    # A short first page with more items to come is the server's page size cap
+    size = len(first) if first and len(first) < min(page_size, total) else page_size
+    # Last page first; the first page was already read and is deleted last
+    last_offset = ((max(total, 1) - 1) // size) * size
+    for offset in range(last_offset, 0, -size):
+        yield from matches(read(offset, min(offset + size, total), size))
+    yield from matches(first)
+
+
+def bulk_delete_items(
+    client: AuthenticatedClient | Client,
+    dataset_slug: str,
+    items: Iterable[str] | ItemPredicate,
+    *,
+    concurrency: int = 8,
+    chunk_size: int = 500,
+    page_size: int = 500,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> DeleteResult:
+    """
+    Delete dataset items by ID or by predicate.
+
+    Args:
+        client: API client
+        dataset_slug: The dataset slug
+        items: Item IDs to delete, or a predicate called with every item dict
+            of the dataset
+        concurrency: Number of delete requests in flight
+        chunk_size: Item IDs per delete request
+        page_size: Items per page when scanning for a predicate
+        max_retries: Retries per chunk for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``DeleteResult`` with deleted / scanned item, chunk and retry counts
+
+    Raises:
+        errors.UnexpectedStatus: If listing fails or a chunk fails permanently.
+    """
+    result = DeleteResult()
+    item_ids = _matching_ids(client, dataset_slug, items, page_size, result) if callable(items) else items
+
+    def send(chunk: list[str]) -> int:
+        return delete_chunk(client, dataset_slug, chunk, max_retries=max_retries, retry_backoff=retry_backoff)
+
+    def finish(chunk: list[str], retries: int) -> None:
+        result.items_deleted += len(chunk)
+        result.chunks += 1
+        result.retries += retries
+
+    # Create the shared httpx client before the worker threads race to do so
+    client.get_httpx_client()
+    run_bounded(send, _chunked(item_ids, chunk_size), finish, concurrency=concurrency)
+    return result
+
+
+__all__ = ["DeleteResult", "ItemPredicate", "bulk_delete_items", "delete_chunk"]
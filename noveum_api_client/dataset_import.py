@@ -0,0 +1,321 @@
+"""
+Streaming JSONL/CSV import of dataset items.
+
+Raw records (log lines, CSV exports) are mapped onto the fields of
+``PostApiV1DatasetsByDatasetSlugItemsBodyItemsItemContent`` through a
+declarative ``ImportSchema`` and emitted as ready-to-send item JSON bytes.
+The pipeline never builds the nested attrs models: values are coerced to the
+field's JSON type (string, number, list or object) and serialized once, which
+is what ``dataset_upload.upload_items`` sends as-is.
+
+Every stage is a generator, and records are validated in fixed-size batches,
+so memory use does not grow with the size of the input. In ``"raise"`` mode a
+batch containing invalid records raises one ``ImportValidationError`` listing
+every problem in the batch; in ``"skip"`` mode invalid records are dropped
+and counted.
+
+Example:
+    ```python
+    from noveum_api_client.dataset_import import ImportSchema, import_items
+    from noveum_api_client.dataset_upload import upload_items
+
+    schema = ImportSchema(
+        item_type="conversational",
+        item_id_column="id",
+        content={"input_text": "prompt", "output_text": "completion", "tool_calls": "tools"},
+        metadata_columns=["source"],
+    )
+    upload_items(client, "my-dataset", import_items("logs.jsonl", schema))
+    ```
+"""
+
+import csv
+import json
+import math
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal
+
+import attrs
+from attrs import define, field
+
+from .models.post_api_v1_datasets_by_dataset_slug_items_body_items_item_content import (
+    PostApiV1DatasetsByDatasetSlugItemsBodyItemsItemContent,
+)
+
+FieldSource = str | Callable[[Mapping[str, Any]], Any]
+
+_MAX_RECORDED_ERRORS = 100
+
+
+def _content_field_types() -> dict[str, type]:
+    # The generated model stores its annotations as strings ("str | Unset",
+    # "list[Any] | Unset", "...ContentTraceData | Unset"); nested models are
+    # plain JSON objects on the wire
+    types: dict[str, type] = {}
+    for attribute in attrs.fields(PostApiV1DatasetsByDatasetSlugItemsBodyItemsItemContent):
+        if attribute.name == "additional_properties":
+            continue
+        annotation = str(attribute.type)
+        if annotation.startswith("str"):
+            types[attribute.name] = str
+        elif annotation.startswith("float"):
+            types[attribute.name] = float
+        elif annotation.startswith("list"):
+            types[attribute.name] = list
+        else:
+            types[attribute.name] = dict
+    return types
+
+
+CONTENT_FIELD_TYPES: dict[str, type] = _content_field_types()
+
+
+@define(frozen=True)
+class RowError:
+    """A validation problem in one input record (``line`` is its 1-based position in the input)."""
+
+    line: int
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}: {self.field}: {self.message}"
+
+
+class ImportValidationError(ValueError):
+    """Raised in ``"raise"`` mode for a batch containing invalid records."""
+
+    def __init__(self, errors: list[RowError]):
+        self.errors = errors
+        shown = "; ".join(str(error) for error in errors[:5])
+        more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} invalid field(s): {shown}{more}")
+
+
+@define(kw_only=True)
+class ImportSchema:
+    """
+    Declarative mapping from input records to dataset items.
+
+    Attributes:
+        item_type: Item type of every imported item
+        content: Content field name to source: a column / key name (dotted
+            paths reach into nested JSON objects) or a callable taking the
+            whole record
+        item_id_column: Column holding the item ID (optional)
+        item_type_column: Column overriding ``item_type`` per record (optional)
+        metadata_columns: Columns copied into the item ``metadata`` object
+        required: Content fields that must be present in every record
+
+    Raises:
+        ValueError: If ``content`` names a field the content model does not have,
+            or ``required`` names a field that is not mapped.
+    """
+
+    item_type: str
+    content: Mapping[str, FieldSource]
+    item_id_column: str | None = None
+    item_type_column: str | None = None
+    metadata_columns: Sequence[str] = ()
+    required: Sequence[str] = ()
+
+    def __attrs_post_init__(self) -> None:
+        unknown = sorted(set(self.content) - set(CONTENT_FIELD_TYPES))
+        if unknown:
+            raise ValueError(f"Unknown content field(s): {', '.join(unknown)}")
+        unmapped = sorted(set(self.required) - set(self.content))
+        if unmapped:
+            raise ValueError(f"Required field(s) not mapped: {', '.join(unmapped)}")
+
+
+@define
+class ImportStats:
+    """Counters describing one import; ``errors`` keeps the first 100 problems."""
+
+    records: int = 0
+    items: int = 0
+    invalid: int = 0
+    errors: list[RowError] = field(factory=list)
+
+    def to_dict(self) -> dict[str, int]:
+        return {"records": self.records, "items": self.items, "invalid": self.invalid}
+
+
+def read_jsonl(path: str | os.PathLike[str]) -> Iterator[dict[str, Any] | ValueError]:
+    """
+    Yield the records of a JSONL file, one per line.
+
+    Blank lines yield an empty record, so positions match line numbers.
+    Malformed lines yield the ``ValueError`` describing them instead of
+    aborting the read, which lets callers report them with the line number.
+    """
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.strip():
+                yield {}
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield exc
+
+
+def read_csv(path: str | os.PathLike[str], **reader_options: Any) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a CSV file with a header row (``csv.DictReader`` options apply)."""
+    with open(path, newline="", encoding="utf-8") as file:
+        yield from csv.DictReader(file, **reader_options)
+
+
+def read_records(
+    path: str | os.PathLike[str], format: Literal["jsonl", "csv"] | None = None
+) -> Iterator[dict[str, Any] | ValueError]:
+    """
+    Yield the records of a JSONL or CSV file.
+
+    Raises:
+        ValueError: If ``format`` is omitted and cannot be told from the file suffix.
+    """
+    suffix = Path(path).suffix.lower()
+    if format == "csv" or (format is None and suffix == ".csv"):
+        return read_csv(path)
+    if format == "jsonl" or (format is None and suffix in (".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    raise ValueError(f"Cannot tell the format of {path}; pass format='jsonl' or format='csv'")
+
+
+_MISSING = object()
+
+
+def _lookup(record: Mapping[str, Any], source: FieldSource) -> Any:
+    if callable(source):
+        return source(record)
+    if source in record:
+        return record[source]
+    value: Any = record
+    for key in source.split("."):
+        if not isinstance(value, Mapping) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    # CSV cells are always strings: lists, objects and numbers arrive as text
+    if expected is str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bool | int | float):
+            return json.dumps(value)
+        raise TypeError(f"expected a string, got {type(value).__name__}")
+    if expected is float:
+        if isinstance(value, bool):
+            raise TypeError("expected a number, got bool")
+        number = float(value)
+        # NaN and infinities are not valid JSON, so the serialized item would be rejected
+        if not math.isfinite(number):
+            raise ValueError(f"expected a finite number, got {value!r}")
+        return number
+    if isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, expected):
+        raise TypeError(f"expected {'a list' if expected is list else 'an object'}, got {type(value).__name__}")
+    return value
+
+
+def _convert(schema: ImportSchema, record: Mapping[str, Any], line: int, errors: list[RowError]) -> dict[str, Any]:
+    content: dict[str, Any] = {}
+    for name, source in schema.content.items():
+        try:
+            value = _lookup(record, source)
+            if value is _MISSING or value is None or value == "":
+                if name in schema.required:
+                    errors.append(RowError(line, name, "missing"))
+                continue
+            content[name] = _coerce(value, CONTENT_FIELD_TYPES[name])
+        except (KeyError, TypeError, ValueError) as exc:
+            errors.append(RowError(line, name, str(exc)))
+
+    item: dict[str, Any] = {"item_type": schema.item_type, "content": content}
+    if schema.item_type_column is not None and record.get(schema.item_type_column):
+        item["item_type"] = str(record[schema.item_type_column])
+    if schema.item_id_column is not None and record.get(schema.item_id_column) not in (None, ""):
+        item["item_id"] = str(record[schema.item_id_column])
+    if schema.metadata_columns:
+        item["metadata"] = {
+            column: record[column] for column in schema.metadata_columns if record.get(column) not in (None, "")
+        }
+    return item
+
+
+def import_items(
+    source: str | os.PathLike[str] | Iterable[Mapping[str, Any]],
+    schema: ImportSchema,
+    *,
+    format: Literal["jsonl", "csv"] | None = None,
+    batch_size: int = 1000,
+    on_error: Literal["raise", "skip"] = "raise",
+    stats: ImportStats | None = None,
+) -> Iterator[bytes]:
+    """
+    Convert records into dataset item JSON bytes.
+
+    Args:
+        source: JSONL/CSV file path, or an iterable of record dicts
+        schema: Mapping from records to items
+        format: File format, by default taken from the file suffix
+        batch_size: Records validated together
+        on_error: ``"raise"`` to stop at the first batch with invalid
+            records, ``"skip"`` to drop invalid records
+        stats: Optional ``ImportStats`` updated as records are processed
+
+    Yields:
+        Compact JSON bytes of one item each, ready for ``upload_items``
+
+    Raises:
+        ImportValidationError: In ``"raise"`` mode, for a batch with invalid records.
+    """
+    records = read_records(source, format) if isinstance(source, str | os.PathLike) else iter(source)
+    stats = stats if stats is not None else ImportStats()
+    line = 0
+    while batch := list(islice(records, batch_size)):
+        encoded: list[bytes] = []
+        batch_errors: list[RowError] = []
+        for record in batch:
+            line += 1
+            stats.records += 1
+            if isinstance(record, Mapping) and not record:
+                continue
+            record_errors: list[RowError] = []
+            if isinstance(record, ValueError):
+                record_errors.append(RowError(line, "<record>", str(record)))
+            elif not isinstance(record, Mapping):
+                record_errors.append(RowError(line, "<record>", f"expected an object, got {type(record).__name__}"))
+            else:
+                item = _convert(schema, record, line, record_errors)
+            if record_errors:
+                batch_errors.extend(record_errors)
+                stats.invalid += 1
+                room = _MAX_RECORDED_ERRORS - len(stats.errors)
+                stats.errors.extend(record_errors[: max(room, 0)])
+            else:
+                encoded.append(json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode())
+        if batch_errors and on_error == "raise":
+            raise ImportValidationError(batch_errors)
+        stats.items += len(encoded)
+        yield from encoded
+
+
+__all__ = [
+    "CONTENT_FIELD_TYPES",
+    "ImportSchema",
+    "ImportStats",
+    "ImportValidationError",
+    "RowError",
+    "import_items",
+    "read_csv",
+    "read_jsonl",
+    "read_records",
+]
@@ -0,0 +1,182 @@
+"""
+Incremental dataset synchronisation using version diffs.
+
+``sync_dataset`` brings a local ``DatasetSnapshotCache`` up to date with the
+next release of a dataset. Instead of downloading every item of the new
+version, it asks ``GET /api/v1/datasets/{slug}/versions/diff`` for the items
+added, removed and modified between the current and the next release, and
+builds the new snapshot from the local copy of the current release:
+
+* unchanged items are copied as raw JSON bytes (no decode / re-encode),
+* removed items are dropped,
+* modified items are replaced in place and added items are appended.
+
+A full download is used instead when the base version is not cached locally,
+or when the diff touches more than ``max_change_ratio`` of the items (at that
+point downloading is cheaper than patching).
+
+Example:
+    ```python
+    from noveum_api_client import Client
+    from noveum_api_client.dataset_cache import DatasetSnapshotCache
+    from noveum_api_client.dataset_sync import sync_dataset
+
+    cache = DatasetSnapshotCache()
+    result = sync_dataset(client, "my-dataset", cache)
+    print(result.mode, result.added, result.removed, result.modified)
+    ```
+"""
+
+import json
+from collections.abc import Iterator, Mapping
+from typing import Any, Literal
+
+from attrs import define
+
+from ._utils import parse_json, unwrap
+from .api.datasets import get_api_v1_datasets_by_dataset_slug_versions_diff
+from .client import AuthenticatedClient, Client
+from .dataset_cache import DatasetSnapshot, DatasetSnapshotCache
+from .models.get_api_v1_datasets_by_dataset_slug_versions_diff_response_200 import (
+    GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200,
+)
+from .models.get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item import (
+    GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem,
+)
+from .types import Unset
+
+SyncMode = Literal["up_to_date", "diff", "full"]
+
+_CHANGE_LISTS = ("added", "removed", "modified")
+
+
+@define
+class SyncResult:
+    """
+    Outcome of one ``sync_dataset`` call.
+
+    Attributes:
+        version: Version the local snapshot now holds
+        mode: ``"up_to_date"`` (nothing transferred), ``"diff"`` (patched from
+            the base version) or ``"full"`` (every item downloaded)
+        added: Items added by the diff
+        removed: Items removed by the diff
+        modified: Items modified by the diff
+    """
+
+    version: str
+    mode: SyncMode
+    added: int = 0
+    removed: int = 0
+    modified: int = 0
+
+
+def fetch_version_diff(
+    client: AuthenticatedClient | Client, slug: str
+) -> GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200:
+    """
+    Fetch the diff between the current and the next release of ``slug``.
+
+    Raises:
+        errors.UnexpectedStatus: If the request fails.
+        ValueError: If the response holds none of the change lists.
+    """
+    response = get_api_v1_datasets_by_dataset_slug_versions_diff.sync_detailed(slug, client=client)
+    data = unwrap(parse_json(response), "data")
+    return GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200.from_dict(_normalized_diff(data, slug))
+
+
+def _normalized_diff(data: Any, slug: str) -> dict[str, Any]:
+    """Bring the response variants the endpoint is known to send into the shape of the model."""
+    diff = dict(data) if isinstance(data, Mapping) else {}
+    # Removals are reported as "deleted" by some server versions
+    if diff.get("removed") is None and "deleted" in diff:
+        diff["removed"] = diff.pop("deleted")
+    if not any(isinstance(diff.get(key), list) for key in _CHANGE_LISTS):
+        # Patching with an unrecognised diff would silently keep stale items
+        raise ValueError(f"Version diff of dataset {slug!r} lists no added, removed or modified items")
+    for key in _CHANGE_LISTS:
+        changes = diff.pop(key, None)
+        if isinstance(changes, list):
+            # Removed items may be reported as bare item IDs
+            diff[key] = [{"item_id": change} if isinstance(change, str) else change for change in changes]
+    return diff
+
+
+def _changes(
+    value: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset,
+) -> list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem]:
+    return [] if isinstance(value, Unset) else value
+
+
+def _encode(change: GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem) -> tuple[str, bytes]:
+    # Some diffs carry the new item under "after" rather than inline
+    after = change.additional_properties.get("after")
+    item = after if isinstance(after, dict) else change.to_dict()
+    return change.item_id, json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _patched_records(
+    base: DatasetSnapshot, diff: GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200
+) -> Iterator[tuple[str, bytes]]:
+    removed = {change.item_id for change in _changes(diff.removed)}
+    modified = dict(_encode(change) for change in _changes(diff.modified))
+    for index, item_id in enumerate(base.ids()):
+        if item_id in removed:
+            continue
+        replacement = modified.pop(item_id, None)
+        yield (item_id, replacement) if replacement is not None else (item_id, base.raw(index))
+    # Modified items missing from the base are treated as additions
+    yield from modified.items()
+    for change in _changes(diff.added):
+        yield _encode(change)
+
+
+def sync_dataset(
+    client: AuthenticatedClient | Client,
+    slug: str,
+    local_store: DatasetSnapshotCache,
+    *,
+    max_change_ratio: float = 0.5,
+) -> SyncResult:
+    """
+    Update ``local_store`` to the latest version of ``slug``, transferring only changes when possible.
+
+    Args:
+        client: API client
+        slug: Dataset slug
+        local_store: Snapshot cache holding (or receiving) the dataset versions
+        max_change_ratio: Fall back to a full download when the diff touches
+            more than this fraction of the base version's items
+
+    Returns:
+        ``SyncResult`` describing what was transferred
+
+    Raises:
+        errors.UnexpectedStatus: If any request fails.
+        ValueError: If the diff response holds none of the change lists.
+    """
+    diff = fetch_version_diff(client, slug)
+    base_version = diff.from_version if isinstance(diff.from_version, str) else None
+    target = diff.to_version if isinstance(diff.to_version, str) else base_version
+    if target is None:
+        raise ValueError(f"Dataset {slug!r} has no release to sync")
+
+    added, removed, modified = (len(_changes(changes)) for changes in (diff.added, diff.removed, diff.modified))
+    version_data = local_store.fetch_version_data(client, slug, target)
+    if local_store.is_current(slug, target, version_data):
+        return SyncResult(version=target, mode="up_to_date")
+
+    base = local_store.open(slug, base_version) if base_version is not None and base_version != target else None
+    if base is None or added + removed + modified > max_change_ratio * max(len(base), 1):
+        if base is not None:
+            base.close()
+        local_store.load(client, slug, target).close()
+        return SyncResult(version=target, mode="full", added=added, removed=removed, modified=modified)
+
+    with base:
+        local_store.store_raw(slug, target, _patched_records(base, diff), version_data)
+    return SyncResult(version=target, mode="diff", added=added, removed=removed, modified=modified)
+
+
+__all__ = ["SyncResult", "fetch_version_diff", "sync_dataset"]
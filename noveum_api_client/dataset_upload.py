@@ -0,0 +1,328 @@
+"""
+Bulk upload of dataset items.
+
+``upload_items`` streams items from any iterable (or a JSONL file), packs them
+into request bodies limited by both item count and serialized size, and sends
+the chunks to ``POST /api/v1/datasets/{slug}/items`` from a thread pool.
+Transient failures are retried per chunk with exponential backoff. Posting
+items is not idempotent, so failures after which the server may already have
+created them (read timeouts, ``500``/``502``/``504``) are only retried with
+``idempotent=True``.
+
+Items are serialized once, straight into the request body: dicts and models
+are JSON-encoded, ``bytes`` (e.g. the lines of a JSONL file) are sent as-is.
+At most ``2 * concurrency`` chunks are buffered, so memory stays constant
+regardless of the size of the import.
+
+With a ``checkpoint`` file, the index ranges of acknowledged items are
+recorded after every chunk. Re-running the same import with the same
+checkpoint skips everything that was already uploaded, so a crashed
+multi-million item import resumes where it stopped.
+
+With a ``dedup`` ``HashIndex`` (see ``dataset_dedup``), items whose content
+hash the dataset already holds are not sent at all.
+
+Example:
+    ```python
+    from noveum_api_client.dataset_upload import upload_items
+
+    result = upload_items(client, "my-dataset", "items.jsonl", checkpoint="items.ckpt")
+    print(result.items_uploaded, result.items_skipped, result.bytes_sent)
+    ```
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+
+from ._utils import call_with_retry, run_bounded, send_raw
+from .api.datasets import post_api_v1_datasets_by_dataset_slug_items
+from .client import AuthenticatedClient, Client
+from .dataset_dedup import DedupBatch, DedupFilter, HashIndex
+from .dataset_delete import delete_chunk
+
+DEFAULT_MAX_ITEMS = 500
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+_BODY_PREFIX = b'{"items":['
+_BODY_SUFFIX = b"]}"
+
+ItemSource = Iterable[Mapping[str, Any] | bytes | str | Any] | str | os.PathLike[str]
+
+
+def iter_jsonl(path: str | os.PathLike[str]) -> Iterator[bytes]:
+    """Yield the non-blank lines of a JSONL file as raw JSON bytes."""
+    with open(path, "rb") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def encode_item(item: Mapping[str, Any] | bytes | str | Any) -> bytes:
+    """
+    Serialize one item for an upload body.
+
+    ``bytes`` and ``str`` are taken to be JSON already; models are converted
+    with ``to_dict()``.
+    """
+    if isinstance(item, bytes | bytearray | memoryview):
+        return bytes(item)
+    if isinstance(item, str):
+        return item.encode()
+    if hasattr(item, "to_dict"):
+        item = item.to_dict()
+    return json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@define
+class UploadCheckpoint:
+    """
+    Persistent record of the item index ranges that were uploaded.
+
+    Ranges are half-open ``[start, end)`` positions in the input stream, kept
+    sorted and merged. The file is replaced atomically on every ``save()``.
+    """
+
+    path: Path
+    dataset_slug: str
+    done: list[list[int]] = field(factory=list)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], dataset_slug: str) -> "UploadCheckpoint":
+        """
+        Read ``path``, or start an empty checkpoint if it does not exist.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another dataset.
+        """
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls(path, dataset_slug)
+        if data.get("dataset_slug") != dataset_slug:
+            raise ValueError(f"Checkpoint {path} belongs to dataset {data.get('dataset_slug')!r}")
+        return cls(path, dataset_slug, [list(span) for span in data.get("done", [])])
+
+    @property
+    def completed(self) -> int:
+        """Number of items recorded as uploaded."""
+        return sum(end - start for start, end in self.done)
+
+    def add(self, start: int, end: int) -> None:
+        merged: list[list[int]] = []
+        for span in sorted([*self.done, [start, end]]):
+            if merged and span[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], span[1])
+            else:
+                merged.append(list(span))
+        self.done = merged
+
+    def save(self) -> None:
+        temp = self.path.with_name(f"{self.path.name}.tmp")
+        temp.write_text(json.dumps({"dataset_slug": self.dataset_slug, "done": self.done}))
+        os.replace(temp, self.path)
+
+
+@define
+class UploadResult:
+    """Counters describing one ``upload_items`` run."""
+
+    items_uploaded: int = 0
+    items_skipped: int = 0
+    chunks: int = 0
+    bytes_sent: int = 0
+    retries: int = 0
+    items_unchanged: int = 0
+    items_replaced: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def dedup_hit_rate(self) -> float:
+        """Fraction of the items considered for upload that were skipped as unchanged."""
+        seen = self.items_uploaded + self.items_unchanged
+        return self.items_unchanged / seen if seen else 0.0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "items_uploaded": self.items_uploaded,
+            "items_skipped": self.items_skipped,
+            "chunks": self.chunks,
+            "bytes_sent": self.bytes_sent,
+            "retries": self.retries,
+            "items_unchanged": self.items_unchanged,
+            "items_replaced": self.items_replaced,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+@define
+class _Chunk:
+    # Index range [start, end) of the input stream covered by this chunk;
+    # items inside it that are not in the body were already uploaded
+    start: int
+    end: int
+    count: int
+    body: bytes
+
+
+def _pending_items(items: Iterable[Any], done: list[list[int]], result: UploadResult) -> Iterator[tuple[int, Any]]:
+    spans = iter(sorted(done))
+    span = next(spans, None)
+    for index, item in enumerate(items):
+        while span is not None and index >= span[1]:
+            span = next(spans, None)
+        if span is not None and index >= span[0]:
+            result.items_skipped += 1
+            continue
+        yield index, item
+
+
+def pack_chunks(
+    items: Iterable[tuple[int, bytes]], max_items: int = DEFAULT_MAX_ITEMS, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Iterator[_Chunk]:
+    """
+    Pack ``(index, encoded item)`` pairs into request bodies.
+
+    A chunk is closed when adding the next item would exceed ``max_items`` or
+    ``max_bytes``; an item larger than ``max_bytes`` is sent in a chunk of its
+    own.
+    """
+    parts: list[bytes] = []
+    size = len(_BODY_PREFIX) + len(_BODY_SUFFIX)
+    start = end = 0
+    for index, data in items:
+        if parts and (len(parts) >= max_items or size + len(data) + 1 > max_bytes):
+            yield _Chunk(start, end, len(parts), _BODY_PREFIX + b",".join(parts) + _BODY_SUFFIX)
+            parts = []
+            size = len(_BODY_PREFIX) + len(_BODY_SUFFIX)
+        if not parts:
+            start = index
+        parts.append(data)
+        size += len(data) + 1
+        end = index + 1
+    if parts:
+        yield _Chunk(start, end, len(parts), _BODY_PREFIX + b",".join(parts) + _BODY_SUFFIX)
+
+
+def upload_items(
+    client: AuthenticatedClient | Client,
+    dataset_slug: str,
+    items: ItemSource,
+    *,
+    concurrency: int = 8,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    checkpoint: str | os.PathLike[str] | None = None,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+    dedup: HashIndex | None = None,
+    idempotent: bool = False,
+) -> UploadResult:
+    """
+    Upload items to a dataset in parallel, size-limited chunks.
+
+    Args:
+        client: API client
+        dataset_slug: Target dataset
+        items: Iterable of item dicts, models or pre-serialized JSON
+            (``bytes``/``str``), or the path of a JSONL file
+        concurrency: Number of chunks in flight
+        max_items: Maximum items per request
+        max_bytes: Maximum serialized request body size
+        checkpoint: File recording uploaded items, for resuming an import
+            that was interrupted. The input must be replayed in the same order.
+        max_retries: Retries per chunk for transient failures
+        retry_backoff: Base delay in seconds between retries
+        dedup: Content-hash index of the dataset: unchanged items are
+            skipped, changed items replace their old version, and the index
+            is updated and saved as chunks are acknowledged (see
+            ``dataset_dedup``)
+        idempotent: Whether resending a chunk cannot create duplicates (e.g.
+            every item carries an ``item_id`` the dataset deduplicates on);
+            only then are ambiguous failures retried
+
+    Returns:
+        ``UploadResult`` with item, chunk, byte and retry counts
+
+    Raises:
+        errors.UnexpectedStatus: If a chunk fails permanently. Chunks that
+            completed before the failure are recorded in the checkpoint.
+        ValueError: If ``checkpoint`` belongs to another dataset.
+    """
+    if isinstance(items, str | os.PathLike):
+        items = iter_jsonl(items)
+    progress = UploadCheckpoint.load(checkpoint, dataset_slug) if checkpoint is not None else None
+    result = UploadResult()
+    pending_items = _pending_items(items, progress.done if progress is not None else [], result)
+    encoded = ((index, encode_item(item)) for index, item in pending_items)
+    dedup_filter = DedupFilter(dedup) if dedup is not None else None
+    if dedup_filter is not None:
+        encoded = dedup_filter.filter(encoded)
+    chunks = pack_chunks(encoded, max_items, max_bytes)
+
+    # The dedup notes are taken as each chunk is submitted, i.e. right after
+    # pack_chunks consumed its items
+    tasks = ((chunk, dedup_filter.take(chunk.end) if dedup_filter is not None else None) for chunk in chunks)
+
+    def send(task: tuple[_Chunk, DedupBatch | None]) -> int:
+        chunk, batch = task
+        _, retries = call_with_retry(
+            lambda: send_raw(post_api_v1_datasets_by_dataset_slug_items, client, chunk.body, dataset_slug),
+            max_retries=max_retries,
+            backoff=retry_backoff,
+            idempotent=idempotent,
+        )
+        if batch is not None and batch.replaces:
+            # Only once the new versions are stored, so a failed post never loses the old ones
+            retries += delete_chunk(
+                client,
+                dataset_slug,
+                batch.replaces,
+                max_retries=max_retries,
+                retry_backoff=retry_backoff,
+                missing_ok=True,
+            )
+        return retries
+
+    def finish(task: tuple[_Chunk, DedupBatch | None], retries: int) -> None:
+        chunk, batch = task
+        result.retries += retries
+        if batch is not None:
+            dedup_filter.commit(batch)
+        result.items_uploaded += chunk.count
+        result.chunks += 1
+        result.bytes_sent += len(chunk.body)
+        if progress is not None:
+            progress.add(chunk.start, chunk.end)
+            progress.save()
+
+    # Create the shared httpx client before the worker threads race to do so
+    client.get_httpx_client()
+    try:
+        # Chunks that complete after a failure are still recorded, so a resume does not resend them
+        run_bounded(send, tasks, finish, concurrency=concurrency)
+    finally:
+        if dedup_filter is not None:
+            result.items_unchanged = dedup_filter.stats.unchanged
+            result.items_replaced = dedup_filter.stats.replaced
+            result.bytes_saved = dedup_filter.stats.bytes_saved
+            dedup_filter.index.save()
+    return result
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ITEMS",
+    "UploadCheckpoint",
+    "UploadResult",
+    "encode_item",
+    "iter_jsonl",
+    "pack_chunks",
+    "upload_items",
+]
@@ -0,0 +1,361 @@
+"""
+Sharded ETL backfills.
+
+Backfilling months of traces with a single
+``POST /api/v1/etl-jobs/{id}/trigger`` makes one huge run that times out.
+``backfill_etl_job`` splits the work into shards instead, either time
+windows of a date range (``filterConfig.startDate`` / ``endDate``) or chunks
+of a trace ID list (``traceIds``), and triggers one run per shard:
+
+* **bounded in-flight runs**: at most ``in_flight`` runs are active; a new
+  shard is triggered as soon as one finishes;
+* **progress**: all active runs belong to the same job, so a single
+  ``GET /api/v1/etl-jobs/{id}/runs`` request per poll updates every shard,
+  polled adaptively like ``etl_watch``;
+* **backpressure**: when a trigger is refused with ``429`` or ``503``, the
+  in-flight limit is halved and the shard re-queued; every finished run
+  raises the limit by one again, up to ``in_flight``;
+* **totals**: ``traces_processed``, ``traces_failed`` and
+  ``dataset_items_created`` are summed over all shards. Shards whose trigger
+  or run failed are reported and can be passed back in via ``shards=``;
+  shards whose trigger was lost in transport are reported separately as
+  ``unknown_shards`` and never re-triggered automatically;
+* **deadline**: with ``timeout`` the backfill returns once it is exceeded,
+  leaving untriggered and still-running shards as they are, so passing
+  ``result.shards`` back in resumes it.
+
+Example:
+    ```python
+    from datetime import datetime, timedelta, timezone
+
+    from noveum_api_client.etl_backfill import backfill_etl_job, time_shards
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    shards = time_shards(start, start + timedelta(days=90), timedelta(days=1))
+    result = backfill_etl_job(client, "job-id", shards, in_flight=4)
+    print(result.traces_processed, result.traces_failed, len(result.failed_shards))
+    ```
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from ._utils import _retry_delay, call_with_retry, parse_json, record_field, unwrap
+from .api.etl_jobs import get_api_v1_etl_jobs_by_id_runs, post_api_v1_etl_jobs_by_id_trigger
+from .client import AuthenticatedClient, Client
+from .etl_watch import EtlRun, PollSchedule, is_terminal
+from .models.post_api_v1_etl_jobs_by_id_trigger_body import PostApiV1EtlJobsByIdTriggerBody
+from .models.post_api_v1_etl_jobs_by_id_trigger_body_filter_config import (
+    PostApiV1EtlJobsByIdTriggerBodyFilterConfig,
+)
+from .models.post_api_v1_etl_jobs_by_id_trigger_response_200 import PostApiV1EtlJobsByIdTriggerResponse200
+from .types import UNSET, Unset
+
+# Trigger statuses meaning "not now": the run was not created
+_BACKPRESSURE_STATUSES = frozenset({429, 503})
+_SUCCESS_STATUSES = frozenset({"completed", "complete", "succeeded", "success"})
+
+
+@define
+class BackfillShard:
+    """One trigger's worth of a backfill: a time window or a chunk of trace IDs."""
+
+    start: str | None = None
+    end: str | None = None
+    trace_ids: list[str] | None = None
+    run_id: str | None = None
+    status: str | None = None
+    traces_processed: float = 0
+    traces_failed: float = 0
+    dataset_items_created: float = 0
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.error is not None or is_terminal(self.status)
+
+    @property
+    def unknown(self) -> bool:
+        """Whether the trigger was lost in transport, so a run may have started."""
+        return self.error is not None and self.run_id is None and self.status == "unknown"
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.status is not None and self.status.lower() in _SUCCESS_STATUSES
+
+    def reset(self) -> "BackfillShard":
+        """A copy of this shard without run progress, for triggering it again."""
+        return BackfillShard(self.start, self.end, self.trace_ids)
+
+    def update(self, run: EtlRun) -> bool:
+        """Take progress from the shard's run record; return whether the status changed."""
+        changed = run.status != self.status
+        self.status = run.status
+        self.traces_processed = run.traces_processed
+        self.traces_failed = run.traces_failed
+        self.dataset_items_created = run.dataset_items_created
+        if is_terminal(run.status) and not self.succeeded:
+            self.error = run.error or f"Run ended with status {run.status!r}"
+        return changed
+
+
+@define
+class BackfillResult:
+    """Shards of a backfill and their summed run counters."""
+
+    shards: list[BackfillShard]
+    triggers: int = 0
+    throttled: int = 0
+    elapsed_seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def traces_processed(self) -> float:
+        return sum(shard.traces_processed for shard in self.shards)
+
+    @property
+    def traces_failed(self) -> float:
+        return sum(shard.traces_failed for shard in self.shards)
+
+    @property
+    def dataset_items_created(self) -> float:
+        return sum(shard.dataset_items_created for shard in self.shards)
+
+    @property
+    def active(self) -> int:
+        """Shards whose run has been triggered and not finished yet."""
+        return sum(1 for shard in self.shards if shard.run_id is not None and not shard.finished)
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for shard in self.shards if shard.succeeded)
+
+    @property
+    def failed_shards(self) -> list[BackfillShard]:
+        """Shards known not to have succeeded; passing them back in runs them again."""
+        return [shard for shard in self.shards if shard.error is not None and not shard.unknown]
+
+    @property
+    def unknown_shards(self) -> list[BackfillShard]:
+        """Shards whose trigger may or may not have started a run."""
+        return [shard for shard in self.shards if shard.unknown]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "shards": len(self.shards),
+            "completed": self.completed,
+            "failed": len(self.failed_shards),
+            "unknown": len(self.unknown_shards),
+            "active": self.active,
+            "traces_processed": self.traces_processed,
+            "traces_failed": self.traces_failed,
+            "dataset_items_created": self.dataset_items_created,
+            "triggers": self.triggers,
+            "throttled": self.throttled,
+            "elapsed_seconds": self.elapsed_seconds,
+            "timed_out": self.timed_out,
+        }
+
+
+def time_shards(start: datetime, end: datetime, window: timedelta) -> list[BackfillShard]:
+    """Split ``[start, end)`` into consecutive windows of at most ``window``."""
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    shards = []
+    while start < end:
+        stop = min(start + window, end)
+        shards.append(BackfillShard(start=start.isoformat(), end=stop.isoformat()))
+        start = stop
+    return shards
+
+
+def trace_id_shards(trace_ids: Iterable[str], size: int = 500) -> list[BackfillShard]:
+    """Split ``trace_ids`` into chunks of at most ``size`` IDs."""
+    ids = list(trace_ids)
+    return [BackfillShard(trace_ids=ids[i : i + size]) for i in range(0, len(ids), size)]
+
+
+@define
+class _Limit:
+    """In-flight limit: halved on backpressure, grown by one per finished run."""
+
+    maximum: int
+    current: int = field()
+
+    @current.default
+    def _current(self) -> int:
+        return self.maximum
+
+    def shrink(self) -> None:
+        self.current = max(1, self.current // 2)
+
+    def grow(self) -> None:
+        self.current = min(self.maximum, self.current + 1)
+
+
+def _run_id(response: Any) -> str | None:
+    if isinstance(response.parsed, PostApiV1EtlJobsByIdTriggerResponse200):
+        return response.parsed.id
+    data = unwrap(parse_json(response), "data")
+    if not isinstance(data, dict):
+        return None
+    run_id = record_field(data, "run_id") or record_field(data, "id")
+    return str(run_id) if run_id else None
+
+
+def backfill_etl_job(
+    client: AuthenticatedClient | Client,
+    job_id: str,
+    shards: Sequence[BackfillShard],
+    *,
+    in_flight: int = 4,
+    project_id: str | Unset = UNSET,
+    dataset_slug: str | Unset = UNSET,
+    organization_slug: str | Unset = UNSET,
+    initial_interval: float = 1.0,
+    max_interval: float = 30.0,
+    backoff: float = 1.5,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+    timeout: float | None = None,
+    on_progress: Callable[[BackfillResult], None] | None = None,
+) -> BackfillResult:
+    """
+    Trigger an ETL job once per shard, keeping at most ``in_flight`` runs active.
+
+    Args:
+        client: API client
+        job_id: ETL job ID
+        shards: Shards from ``time_shards`` / ``trace_id_shards``, or the
+            ``failed_shards`` of an earlier backfill to retry them
+        in_flight: Most runs active at the same time
+        project_id: Project filter added to time-window shards
+        dataset_slug: Target dataset, overriding the job's
+        organization_slug: Organization the job belongs to
+        initial_interval: Seconds between progress polls after a change
+        max_interval: Longest time between progress polls
+        backoff: Growth of the poll interval while nothing changes
+        max_retries: Retries of progress polls for transient failures
+        retry_backoff: Base delay in seconds between retries
+        timeout: Seconds after which the backfill returns with ``timed_out``
+            set, leaving unfinished shards to be resumed
+        on_progress: Called with the running ``BackfillResult`` after every poll
+
+    Returns:
+        ``BackfillResult`` with per-shard progress and summed counters
+
+    A trigger request that fails in transport is not retried: whether that
+    shard's run started is unknown, so the shard gets status ``"unknown"``, is
+    listed in ``unknown_shards`` and the backfill goes on with the others.
+    Passed back in, such shards are kept as they are rather than triggered
+    again, which could process their traces twice; once the job's run list
+    shows no run for one, ``shard.reset()`` makes it retriable.
+
+    Raises:
+        errors.UnexpectedStatus: If progress cannot be polled.
+    """
+    started = time.monotonic()
+    # Failed shards of an earlier backfill start over; succeeded and unknown ones are kept as they are
+    result = BackfillResult(
+        [shard.reset() if shard.error is not None and not shard.unknown else shard for shard in shards]
+    )
+    pending = deque(shard for shard in result.shards if shard.run_id is None and not shard.finished)
+    active = {shard.run_id: shard for shard in result.shards if shard.run_id is not None and not shard.finished}
+    limit = _Limit(in_flight)
+    schedule = PollSchedule(initial_interval, max_interval, backoff)
+    throttled_until = 0.0
+    deadline = started + timeout if timeout is not None else None
+
+    def trigger(shard: BackfillShard) -> Any:
+        filter_config: PostApiV1EtlJobsByIdTriggerBodyFilterConfig | Unset = UNSET
+        if shard.start is not None or shard.end is not None:
+            filter_config = PostApiV1EtlJobsByIdTriggerBodyFilterConfig(
+                start_date=shard.start or UNSET, end_date=shard.end or UNSET, project_id=project_id
+            )
+        body = PostApiV1EtlJobsByIdTriggerBody(
+            trace_ids=shard.trace_ids if shard.trace_ids is not None else UNSET,
+            filter_config=filter_config,
+            dataset_slug=dataset_slug,
+        )
+        # Not retried blindly: a trigger that timed out may still have started a run
+        return post_api_v1_etl_jobs_by_id_trigger.sync_detailed(
+            job_id, client=client, body=body, organization_slug=organization_slug
+        )
+
+    while pending or active:
+        if deadline is not None and time.monotonic() >= deadline:
+            result.timed_out = True
+            break
+        changed = False
+        while pending and len(active) < limit.current and time.monotonic() >= throttled_until:
+            shard = pending.popleft()
+            result.triggers += 1
+            try:
+                response = trigger(shard)
+            except httpx.TransportError as exc:
+                shard.status = "unknown"
+                shard.error = f"Trigger failed, run may have started: {type(exc).__name__}: {exc}"
+                changed = True
+                continue
+            if response.status_code in _BACKPRESSURE_STATUSES:
+                result.throttled += 1
+                limit.shrink()
+                pending.appendleft(shard)
+                throttled_until = time.monotonic() + _retry_delay(response, 0, retry_backoff)
+                break
+            run_id = _run_id(response) if 200 <= response.status_code < 300 else None
+            if run_id is None:
+                shard.error = f"Trigger failed with status {response.status_code}: {response.content[:200]!r}"
+            else:
+                shard.run_id = run_id
+                active[run_id] = shard
+            changed = True
+
+        if active:
+            response, _ = call_with_retry(
+                lambda: get_api_v1_etl_jobs_by_id_runs.sync_detailed(
+                    job_id, client=client, organization_slug=organization_slug
+                ),
+                max_retries=max_retries,
+                backoff=retry_backoff,
+            )
+            if not isinstance(response.parsed, list):
+                raise errors.UnexpectedStatus(response.status_code, response.content)
+            for run in response.parsed:
+                shard = active.get(run.id)
+                if shard is None:
+                    continue
+                changed = shard.update(run) or changed
+                if shard.finished:
+                    del active[run.id]
+                    limit.grow()
+
+        result.elapsed_seconds = time.monotonic() - started
+        if on_progress is not None:
+            on_progress(result)
+        if active or pending:
+            delay = schedule.next(changed)
+            if pending and len(active) < limit.current:
+                # A slot is free but throttled: wait only as long as the server asked
+                delay = max(0.0, throttled_until - time.monotonic())
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+    result.elapsed_seconds = time.monotonic() - started
+    return result
+
+
+__all__ = [
+    "BackfillResult",
+    "BackfillShard",
+    "backfill_etl_job",
+    "time_shards",
+    "trace_id_shards",
+]
@@ -0,0 +1,362 @@
+"""
+Compact, incrementally refreshed index of ETL run history.
+
+``GET /api/v1/etl-jobs/{id}/runs`` returns every run of a job, each with its
+full ``traceIds`` list, on every call. ``EtlRunIndex`` keeps that history
+locally in a compact form:
+
+* **summaries**: every run is kept as a ``RunSummary`` (the run record
+  without its trace IDs plus ``trace_count``);
+* **trace IDs on demand**: each run's trace IDs are stored as one
+  zlib-compressed blob and only decompressed by ``trace_ids()`` /
+  ``hydrate()``;
+* **incremental refresh**: runs whose ``updatedAt`` is not newer than the
+  stored copy are skipped without being parsed into models or recompressed;
+  runs missing from the listing are dropped;
+* **inverted index**: ``runs_for_trace(trace_id)`` answers "which run
+  processed trace X" from sorted arrays of 64-bit trace ID hashes (12 bytes
+  per trace), verified against the candidate runs' trace IDs.
+
+Example:
+    ```python
+    from noveum_api_client.etl_run_index import EtlRunIndex
+
+    index = EtlRunIndex("~/.cache/noveum/etl-runs.jsonl")
+    index.refresh_all(client, ["job-1", "job-2"])
+    for run in index.runs_for_trace("trace-123"):
+        print(run.etl_job_id, run.id, run.status)
+    index.save()
+    ```
+"""
+
+import base64
+import hashlib
+import json
+import os
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from attrs import asdict, define
+
+from ._utils import call_with_retry, parse_json, record_field, run_bounded, send_unparsed, unwrap
+from .api.etl_jobs import get_api_v1_etl_jobs_by_id_runs
+from .client import AuthenticatedClient, Client
+from .etl_watch import EtlRun
+from .types import UNSET, Unset
+
+
+@define(frozen=True)
+class RunSummary:
+    """An ETL run without its trace IDs."""
+
+    id: str
+    etl_job_id: str
+    status: str
+    created_at: str
+    updated_at: str
+    dataset_slug: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
+    traces_processed: float = 0
+    traces_failed: float = 0
+    dataset_items_created: float = 0
+    error: str | None = None
+    filter_config: dict[str, Any] | None = None
+    trace_count: int = 0
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any], job_id: str = "") -> "RunSummary":
+        """Build a summary from an API run record (camelCase or snake_case keys)."""
+        return cls(
+            id=str(record_field(record, "id")),
+            etl_job_id=record_field(record, "etl_job_id") or job_id,
+            status=record_field(record, "status") or "",
+            created_at=record_field(record, "created_at") or "",
+            updated_at=record_field(record, "updated_at") or "",
+            dataset_slug=record_field(record, "dataset_slug"),
+            start_time=record_field(record, "start_time"),
+            end_time=record_field(record, "end_time"),
+            traces_processed=record_field(record, "traces_processed") or 0,
+            traces_failed=record_field(record, "traces_failed") or 0,
+            dataset_items_created=record_field(record, "dataset_items_created") or 0,
+            error=record_field(record, "error"),
+            filter_config=record_field(record, "filter_config"),
+            trace_count=len(record_field(record, "trace_ids") or ()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@define
+class RefreshStats:
+    """What one refresh changed in an ``EtlRunIndex``."""
+
+    fetched: int = 0
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def merge(self, other: "RefreshStats") -> None:
+        self.fetched += other.fetched
+        self.added += other.added
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.removed += other.removed
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "fetched": self.fetched,
+            "added": self.added,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+        }
+
+
+def _trace_hash(trace_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(trace_id.encode(), digest_size=8).digest(), "little")
+
+
+def _compress(trace_ids: Iterable[str]) -> bytes:
+    return zlib.compress("\n".join(trace_ids).encode())
+
+
+def _decompress(blob: bytes) -> list[str]:
+    text = zlib.decompress(blob).decode()
+    return text.split("\n") if text else []
+
+
+@define
+class _Entry:
+    summary: RunSummary
+    traces: bytes
+    ordinal: int
+
+
+class EtlRunIndex:
+    """
+    Run history of any number of ETL jobs.
+
+    Args:
+        path: JSON lines file the index is loaded from and saved to
+            (optional; without it the index only lives in memory)
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None):
+        self.path = Path(path).expanduser() if path is not None else None
+        self._entries: dict[str, _Entry] = {}
+        # Run ID per ordinal; None once the run was removed
+        self._ordinals: list[str | None] = []
+        # Inverted index: trace ID hashes sorted ascending, with the owning run's ordinal
+        self._hashes = array("Q")
+        self._owners = array("I")
+        self._pending: list[tuple[int, int]] = []
+        self._watermarks: dict[str, str] = {}
+        if self.path is not None and self.path.exists():
+            self._load(self.path)
+
+    def _put(self, summary: RunSummary, trace_ids: list[str]) -> None:
+        entry = self._entries.get(summary.id)
+        if entry is None:
+            ordinal = len(self._ordinals)
+            self._ordinals.append(summary.id)
+            known: set[str] = set()
+        else:
+            ordinal = entry.ordinal
+            known = set(_decompress(entry.traces))
+        self._entries[summary.id] = _Entry(summary, _compress(trace_ids), ordinal)
+        # Postings of trace IDs a run no longer lists are filtered out on lookup
+        self._pending.extend((_trace_hash(trace_id), ordinal) for trace_id in trace_ids if trace_id not in known)
+        if summary.updated_at > self._watermarks.get(summary.etl_job_id, ""):
+            self._watermarks[summary.etl_job_id] = summary.updated_at
+
+    def _remove(self, run_id: str) -> None:
+        entry = self._entries.pop(run_id)
+        self._ordinals[entry.ordinal] = None
+
+    def apply(self, job_id: str, records: Iterable[Mapping[str, Any]]) -> RefreshStats:
+        """
+        Merge a full run listing of ``job_id`` into the index.
+
+        Runs not newer than the stored copy are skipped; stored runs of the
+        job that the listing no longer contains are removed.
+        """
+        stats = RefreshStats()
+        seen = set()
+        for record in records:
+            stats.fetched += 1
+            run_id = str(record_field(record, "id"))
+            seen.add(run_id)
+            entry = self._entries.get(run_id)
+            if entry is not None and (record_field(record, "updated_at") or "") <= entry.summary.updated_at:
+                stats.unchanged += 1
+                continue
+            self._put(RunSummary.from_dict(record, job_id), list(record_field(record, "trace_ids") or ()))
+            if entry is None:
+                stats.added += 1
+            else:
+                stats.updated += 1
+        for run_id in [run_id for run_id, e in self._entries.items() if e.summary.etl_job_id == job_id]:
+            if run_id not in seen:
+                self._remove(run_id)
+                stats.removed += 1
+        return stats
+
+    def _fetch(
+        self, client: AuthenticatedClient | Client, job_id: str, organization_slug: str | Unset, max_retries: int
+    ) -> list[dict[str, Any]]:
+        response, _ = call_with_retry(
+            lambda: send_unparsed(get_api_v1_etl_jobs_by_id_runs, client, job_id, organization_slug=organization_slug),
+            max_retries=max_retries,
+        )
+        return unwrap(parse_json(response), "runs") or []
+
+    def refresh(
+        self,
+        client: AuthenticatedClient | Client,
+        job_id: str,
+        organization_slug: str | Unset = UNSET,
+        max_retries: int = 3,
+    ) -> RefreshStats:
+        """
+        Fetch the runs of ``job_id`` and merge the changed ones.
+
+        Raises:
+            errors.UnexpectedStatus: If the run listing fails.
+        """
+        return self.apply(job_id, self._fetch(client, job_id, organization_slug, max_retries))
+
+    def refresh_all(
+        self,
+        client: AuthenticatedClient | Client,
+        job_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        organization_slug: str | Unset = UNSET,
+        max_retries: int = 3,
+    ) -> RefreshStats:
+        """
+        Refresh several jobs, fetching their run listings concurrently.
+
+        Listings are merged in the calling thread as they arrive.
+
+        Raises:
+            errors.UnexpectedStatus: If a run listing fails.
+        """
+        stats = RefreshStats()
+        # Create the shared httpx client before the worker threads race to do so
+        client.get_httpx_client()
+        run_bounded(
+            lambda job_id: self._fetch(client, job_id, organization_slug, max_retries),
+            job_ids,
+            lambda job_id, records: stats.merge(self.apply(job_id, records)),
+            concurrency=concurrency,
+        )
+        return stats
+
+    def get(self, run_id: str) -> RunSummary | None:
+        entry = self._entries.get(run_id)
+        return entry.summary if entry is not None else None
+
+    def runs(self, job_id: str | None = None, status: str | None = None) -> list[RunSummary]:
+        """Stored runs, oldest first, optionally of one job and/or with one status."""
+        summaries = [
+            entry.summary
+            for entry in self._entries.values()
+            if (job_id is None or entry.summary.etl_job_id == job_id)
+            and (status is None or entry.summary.status == status)
+        ]
+        return sorted(summaries, key=lambda summary: summary.created_at)
+
+    def watermark(self, job_id: str) -> str | None:
+        """Latest ``updated_at`` seen for ``job_id``."""
+        return self._watermarks.get(job_id)
+
+    def trace_ids(self, run_id: str) -> list[str]:
+        """Decompress the trace IDs of one run."""
+        return _decompress(self._entries[run_id].traces)
+
+    def hydrate(self, run_id: str) -> EtlRun:
+        """The full run record, trace IDs included."""
+        entry = self._entries[run_id]
+        record = {
+            "id": entry.summary.id,
+            "etlJobId": entry.summary.etl_job_id,
+            "datasetSlug": entry.summary.dataset_slug,
+            "startTime": entry.summary.start_time,
+            "endTime": entry.summary.end_time,
+            "status": entry.summary.status,
+            "tracesProcessed": entry.summary.traces_processed,
+            "tracesFailed": entry.summary.traces_failed,
+            "datasetItemsCreated": entry.summary.dataset_items_created,
+            "error": entry.summary.error,
+            "traceIds": _decompress(entry.traces),
+            "filterConfig": entry.summary.filter_config,
+            "createdAt": entry.summary.created_at,
+            "updatedAt": entry.summary.updated_at,
+        }
+        return EtlRun.from_dict(record)
+
+    def _merge_pending(self) -> None:
+        if not self._pending:
+            return
+        live = [(h, o) for h, o in zip(self._hashes, self._owners, strict=True) if self._ordinals[o] is not None]
+        pairs = sorted(live + self._pending)
+        self._hashes = array("Q", (h for h, _ in pairs))
+        self._owners = array("I", (o for _, o in pairs))
+        self._pending = []
+
+    def runs_for_trace(self, trace_id: str) -> list[RunSummary]:
+        """Runs whose trace IDs include ``trace_id``, oldest first."""
+        self._merge_pending()
+        target = _trace_hash(trace_id)
+        position = bisect_left(self._hashes, target)
+        candidates = set()
+        while position < len(self._hashes) and self._hashes[position] == target:
+            run_id = self._ordinals[self._owners[position]]
+            if run_id is not None:
+                candidates.add(run_id)
+            position += 1
+        # Hash collisions and trace IDs a run no longer lists are ruled out here
+        found = [self._entries[run_id].summary for run_id in candidates if trace_id in self.trace_ids(run_id)]
+        return sorted(found, key=lambda summary: summary.created_at)
+
+    def memory_bytes(self) -> int:
+        """Approximate size of the stored trace IDs and inverted index."""
+        blobs = sum(len(entry.traces) for entry in self._entries.values())
+        postings = len(self._hashes) * 12 + len(self._pending) * 12
+        return blobs + postings
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._entries
+
+    def _load(self, path: Path) -> None:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                data = json.loads(line)
+                summary = RunSummary(**data["run"])
+                self._put(summary, _decompress(base64.b64decode(data["traces"])))
+
+    def save(self) -> None:
+        """Write the index to ``path`` atomically (no-op for in-memory indexes)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temp, "w", encoding="utf-8") as file:
+            for entry in self._entries.values():
+                traces = base64.b64encode(entry.traces).decode()
+                file.write(json.dumps({"run": entry.summary.to_dict(), "traces": traces}) + "\n")
+        os.replace(temp, self.path)
+
+
+__all__ = ["EtlRunIndex", "RefreshStats", "RunSummary"]
@@ -0,0 +1,294 @@
+"""
+Watching ETL job runs until they finish.
+
+``watch_etl_job`` (and ``watch_etl_jobs`` for several jobs) is an async
+iterator of status transitions that replaces fixed ``sleep`` loops around
+``GET /api/v1/etl-jobs/{id}/status``:
+
+* **adaptive polling**: a job is polled right away and then every
+  ``initial_interval`` seconds, backing off by ``backoff`` up to
+  ``max_interval`` while nothing changes. A transition resets the interval,
+  so a run that just moved on is followed closely;
+* **one poll loop**: all watched jobs share a single scheduler; jobs that
+  are due at the same time are polled together, at most ``concurrency`` at
+  once;
+* **cheap change detection**: only the status endpoint is polled. The run
+  list (``GET /api/v1/etl-jobs/{id}/runs``) is fetched when the reported
+  status changes, and at least every ``confirm_interval`` seconds in case
+  the status endpoint reports the job rather than the run;
+* **termination**: a job leaves the loop once its run reaches one of
+  ``TERMINAL_STATUSES``; the iterator ends when every job has.
+
+Each ``EtlJobEvent`` carries the run as ``GetApiV1EtlJobsByIdRunsResponse200Item``;
+for the terminal event that is the final run record.
+
+Example:
+    ```python
+    from noveum_api_client.api.etl_jobs import post_api_v1_etl_jobs_by_id_trigger
+    from noveum_api_client.etl_watch import watch_etl_job
+
+    run = post_api_v1_etl_jobs_by_id_trigger.sync_detailed("job-id", client=client).parsed
+    async for event in watch_etl_job(client, "job-id", run_id=run.id):
+        print(event.status, event.run.traces_processed if event.run else None)
+    ```
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import Any
+
+from attrs import define, field
+
+from . import errors
+from ._utils import acall_with_retry, parse_json, unwrap
+from .api.etl_jobs import get_api_v1_etl_jobs_by_id_runs, get_api_v1_etl_jobs_by_id_status
+from .client import AuthenticatedClient, Client
+from .models.get_api_v1_etl_jobs_by_id_runs_response_200_item import GetApiV1EtlJobsByIdRunsResponse200Item
+from .types import UNSET, Unset
+
+EtlRun = GetApiV1EtlJobsByIdRunsResponse200Item
+
+TERMINAL_STATUSES = frozenset(
+    {"completed", "complete", "succeeded", "success", "failed", "error", "cancelled", "canceled", "aborted"}
+)
+
+# Status endpoint fields that describe the current run rather than the job
+_RUN_KEYS = ("run", "currentRun", "latestRun", "lastRun")
+# Jobs due within this many seconds of each other are polled in the same tick
+_TICK = 0.05
+
+
+def is_terminal(status: str | None) -> bool:
+    """Whether ``status`` is a final run status."""
+    return status is not None and status.lower() in TERMINAL_STATUSES
+
+
+@define(frozen=True)
+class EtlJobEvent:
+    """A status transition of one watched ETL job run."""
+
+    job_id: str
+    status: str
+    previous_status: str | None
+    run: EtlRun | None
+    terminal: bool
+    elapsed_seconds: float
+
+
+class PollSchedule:
+    """
+    Poll interval that starts short and backs off while nothing changes.
+
+    Args:
+        initial: Interval after a change, in seconds
+        maximum: Longest interval, in seconds
+        factor: Growth of the interval per unchanged poll
+    """
+
+    def __init__(self, initial: float = 0.5, maximum: float = 15.0, factor: float = 1.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.interval = initial
+
+    def next(self, changed: bool) -> float:
+        """Seconds until the next poll, after a poll that did or did not see a change."""
+        if changed:
+            self.interval = self.initial
+        else:
+            self.interval = min(self.interval * self.factor, self.maximum)
+        return self.interval
+
+
+@define
+class _Watch:
+    job_id: str
+    run_id: str | None
+    schedule: PollSchedule
+    started: float
+    next_poll: float
+    status: str | None = None
+    reported: str | None = None
+    confirmed_at: float = field(default=float("-inf"))
+    # First run list fetch that found the job finished but not the followed run
+    missing_since: float | None = None
+
+
+def reported_status(data: Any) -> str | None:
+    """The run status in a ``/status`` response, falling back to the job status."""
+    data = unwrap(data, "data")
+    if not isinstance(data, Mapping):
+        return None
+    for key in _RUN_KEYS:
+        run = data.get(key)
+        if isinstance(run, Mapping) and isinstance(run.get("status"), str):
+            return run["status"]
+    status = data.get("status")
+    return status if isinstance(status, str) else None
+
+
+def select_run(runs: Iterable[EtlRun], run_id: str | None = None) -> EtlRun | None:
+    """The run with ``run_id``, or the most recently created run."""
+    if run_id is not None:
+        return next((run for run in runs if run.id == run_id), None)
+    return max(runs, key=lambda run: run.created_at, default=None)
+
+
+def _jobs(jobs: Iterable[str] | Mapping[str, str | None]) -> dict[str, str | None]:
+    if isinstance(jobs, Mapping):
+        return dict(jobs)
+    return dict.fromkeys(jobs)
+
+
+async def watch_etl_jobs(
+    client: AuthenticatedClient | Client,
+    jobs: Iterable[str] | Mapping[str, str | None],
+    *,
+    initial_interval: float = 0.5,
+    max_interval: float = 15.0,
+    backoff: float = 1.5,
+    confirm_interval: float = 30.0,
+    concurrency: int = 8,
+    timeout: float | None = None,
+    organization_slug: str | Unset = UNSET,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> AsyncIterator[EtlJobEvent]:
+    """
+    Watch several ETL jobs in one poll loop until each run is finished.
+
+    Args:
+        client: API client
+        jobs: Job IDs, or a mapping of job ID to the run ID to follow
+            (``None``: the job's most recent run)
+        initial_interval: Seconds between polls right after a change
+        max_interval: Longest time between polls of an unchanged job
+        backoff: Growth of the poll interval while a job is unchanged
+        confirm_interval: Longest time between run list fetches of a job
+        concurrency: Requests in flight
+        timeout: Seconds after which a job still running raises ``TimeoutError``
+        organization_slug: Organization the jobs belong to
+        max_retries: Retries per request for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Yields:
+        ``EtlJobEvent`` per status transition, the terminal one last for each job
+
+    Raises:
+        errors.UnexpectedStatus: If a status or run request fails permanently.
+        TimeoutError: If a job does not finish within ``timeout``.
+        LookupError: If a followed run is still not listed a ``confirm_interval``
+            after its job finished.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    now = time.monotonic()
+    watches = [
+        _Watch(job_id, run_id, PollSchedule(initial_interval, max_interval, backoff), now, now)
+        for job_id, run_id in _jobs(jobs).items()
+    ]
+
+    async def request(endpoint: Any, job_id: str) -> Any:
+        async with semaphore:
+            response, _ = await acall_with_retry(
+                lambda: endpoint.asyncio_detailed(job_id, client=client, organization_slug=organization_slug),
+                max_retries=max_retries,
+                backoff=retry_backoff,
+            )
+        return response
+
+    async def poll(watch: _Watch) -> EtlJobEvent | None:
+        reported = reported_status(parse_json(await request(get_api_v1_etl_jobs_by_id_status, watch.job_id)))
+        polled_at = time.monotonic()
+        changed = reported is None or reported != watch.reported
+        watch.reported = reported
+        if not changed and polled_at - watch.confirmed_at < confirm_interval:
+            return None
+        response = await request(get_api_v1_etl_jobs_by_id_runs, watch.job_id)
+        if not isinstance(response.parsed, list):
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        run = select_run(response.parsed, watch.run_id)
+        if run is None and watch.run_id is not None:
+            # Not listed yet: the job-level status may still be the previous run's.
+            # A job that stays finished for a whole confirm interval without
+            # listing the run never will
+            watch.confirmed_at = polled_at
+            if not is_terminal(reported):
+                watch.missing_since = None
+            elif watch.missing_since is None:
+                watch.missing_since = polled_at
+            elif polled_at - watch.missing_since >= confirm_interval:
+                raise LookupError(
+                    f"Run {watch.run_id} of ETL job {watch.job_id} is not listed although the job is {reported!r}"
+                )
+            return None
+        watch.missing_since = None
+        watch.confirmed_at = polled_at
+        status = run.status if run is not None else reported
+        if status is None or status == watch.status:
+            return None
+        event = EtlJobEvent(
+            job_id=watch.job_id,
+            status=status,
+            previous_status=watch.status,
+            run=run,
+            terminal=is_terminal(status),
+            elapsed_seconds=polled_at - watch.started,
+        )
+        watch.status = status
+        return event
+
+    while watches:
+        now = time.monotonic()
+        wake = min(watch.next_poll for watch in watches)
+        if wake > now:
+            await asyncio.sleep(wake - now)
+            now = time.monotonic()
+        due = [watch for watch in watches if watch.next_poll <= now + _TICK]
+        events = await asyncio.gather(*(poll(watch) for watch in due))
+        now = time.monotonic()
+        for watch, event in zip(due, events, strict=True):
+            if event is not None:
+                yield event
+                if event.terminal:
+                    watches.remove(watch)
+                    continue
+            if timeout is not None and now - watch.started >= timeout:
+                raise TimeoutError(f"ETL job {watch.job_id} did not finish within {timeout}s")
+            watch.next_poll = now + watch.schedule.next(event is not None)
+
+
+async def watch_etl_job(
+    client: AuthenticatedClient | Client,
+    job_id: str,
+    run_id: str | None = None,
+    **options: Any,
+) -> AsyncIterator[EtlJobEvent]:
+    """
+    Watch one ETL job until its run is finished.
+
+    Args:
+        client: API client
+        job_id: ETL job ID
+        run_id: Run to follow, e.g. the ``id`` returned by the trigger
+            request (default: the job's most recent run)
+        **options: Further ``watch_etl_jobs`` options
+
+    Yields:
+        ``EtlJobEvent`` per status transition, the terminal one last
+    """
+    async for event in watch_etl_jobs(client, {job_id: run_id}, **options):
+        yield event
+
+
+__all__ = [
+    "TERMINAL_STATUSES",
+    "EtlJobEvent",
+    "EtlRun",
+    "PollSchedule",
+    "is_terminal",
+    "reported_status",
+    "select_run",
+    "watch_etl_job",
+    "watch_etl_jobs",
+]
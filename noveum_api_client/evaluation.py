@@ -0,0 +1,699 @@
+"""
+Parallel evaluation of dataset items with local scorers.
+
+``EvaluationRunner`` runs a three-stage pipeline:
+
+1. **fetch** streams items from a dataset (page by page) or any iterable,
+2. **score** runs every scorer callable on each item in a thread pool, a
+   process pool or on an asyncio event loop,
+3. **upload** writes the results in batches through
+   ``POST /api/v1/scorers/results/batch``; results that already exist are
+   updated instead (see ``result_upsert``).
+
+Stages are connected by bounded queues, so a slow stage applies backpressure
+to the ones before it instead of letting results pile up in memory. Each
+stage keeps a ``StageStats`` counter; ``EvaluationStats.bottleneck`` names the
+stage with the lowest throughput.
+
+A scorer takes an item dict and returns a number, a bool, a ``ScoreResult``
+or a mapping with ``score`` (and optionally ``passed`` / ``metadata``).
+Exceptions raised by a scorer are recorded as results with an ``error``.
+
+With ``incremental=True`` the runner first loads the keys of the results that
+already exist (see ``result_index``) and only scores the item/scorer pairs
+that are missing or stale, so a re-run after adding items or a scorer costs
+only the new work.
+
+Example:
+    ```python
+    from noveum_api_client.evaluation import EvaluationRunner
+
+    def exact_match(item):
+        content = item["content"]
+        return content.get("output_text") == content.get("expected_output")
+
+    runner = EvaluationRunner(client, "my-dataset", {"exact-match": exact_match}, workers=16)
+    stats = runner.run()
+    print(stats.to_dict(), stats.bottleneck)
+    ```
+"""
+
+import asyncio
+import inspect
+import json
+import queue
+import threading
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Collection, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Literal
+
+from attrs import define, field
+
+from ._utils import acall_with_retry, asend_raw, run_bounded
+from .api.scorer_results import post_api_v1_scorers_results_batch
+from .client import AuthenticatedClient, Client
+from .dataset_cache import _item_id, aiter_dataset_items, iter_dataset_items
+from .errors import UnexpectedStatus
+from .result_index import ResultKeyIndex
+from .result_upsert import find_conflicts, upsert_results
+from .types import UNSET, Unset
+
+Scorer = Callable[[dict[str, Any]], Any]
+ExecutorKind = Literal["thread", "process", "asyncio"]
+# An item and the scorers to run on it (None: all of them)
+_Task = tuple[dict[str, Any], Collection[str] | None]
+_Scored = tuple[list[dict[str, Any]], float]
+
+_END = object()
+
+
+@define
+class ScoreResult:
+    """
+    Detailed scorer outcome.
+
+    Attributes:
+        score: Numeric score
+        passed: Pass/fail verdict (default: ``score >= pass_threshold``)
+        metadata: Extra JSON-serializable details stored with the result
+    """
+
+    score: float
+    passed: bool | None = None
+    metadata: dict[str, Any] | None = None
+
+
+@define
+class StageStats:
+    """
+    Throughput counters of one pipeline stage.
+
+    Attributes:
+        count: Units processed (items for fetch/score, results for upload)
+        busy_seconds: Time spent working, summed over the stage's workers
+        parallelism: Number of workers of the stage
+    """
+
+    count: int = 0
+    busy_seconds: float = 0.0
+    parallelism: int = 1
+
+    @property
+    def throughput(self) -> float:
+        """Units per second the stage sustains while busy (0.0 before any work)."""
+        return self.count * self.parallelism / self.busy_seconds if self.busy_seconds else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {"count": self.count, "busy_seconds": self.busy_seconds, "throughput": self.throughput}
+
+
+@define
+class EvaluationStats:
+    """Counters describing one evaluation run."""
+
+    fetch: StageStats = field(factory=StageStats)
+    score: StageStats = field(factory=StageStats)
+    upload: StageStats = field(factory=StageStats)
+    results: int = 0
+    errors: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def bottleneck(self) -> str | None:
+        """Name of the stage with the lowest throughput (``None`` before any work)."""
+        stages = {name: getattr(self, name) for name in ("fetch", "score", "upload")}
+        busy = {name: stage.throughput for name, stage in stages.items() if stage.busy_seconds}
+        return min(busy, key=busy.__getitem__) if busy else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fetch": self.fetch.to_dict(),
+            "score": self.score.to_dict(),
+            "upload": self.upload.to_dict(),
+            "results": self.results,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+def make_result(
+    dataset_slug: str,
+    item_id: str,
+    scorer_id: str,
+    outcome: Any,
+    execution_time_ms: float,
+    pass_threshold: float = 0.5,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build the batch-upload payload (wire format, camelCase keys) of one scorer outcome."""
+    result: dict[str, Any] = {"datasetSlug": dataset_slug, "itemId": item_id, "scorerId": scorer_id}
+    if error is None:
+        try:
+            if isinstance(outcome, ScoreResult):
+                score, passed, metadata = float(outcome.score), outcome.passed, outcome.metadata
+            elif isinstance(outcome, Mapping):
+                score, passed, metadata = float(outcome["score"]), outcome.get("passed"), outcome.get("metadata")
+            elif isinstance(outcome, bool):
+                score, passed, metadata = float(outcome), outcome, None
+            else:
+                score, passed, metadata = float(outcome), None, None
+        except (KeyError, TypeError, ValueError):
+            error = f"Invalid scorer output: {outcome!r}"
+    if error is not None:
+        score, passed, metadata = 0.0, False, None
+        result["error"] = error
+    result["score"] = score
+    result["passed"] = bool(passed) if passed is not None else score >= pass_threshold
+    if metadata:
+        result["metadata"] = metadata
+    result["executionTimeMs"] = execution_time_ms
+    return result
+
+
+def score_item(
+    scorers: Mapping[str, Scorer],
+    dataset_slug: str,
+    pass_threshold: float,
+    item: dict[str, Any],
+    scorer_ids: Collection[str] | None = None,
+) -> _Scored:
+    """
+    Run the scorers on ``item``; return the result payloads and the time taken in seconds.
+
+    ``scorer_ids`` restricts the run to some of the scorers.
+    """
+    item_id = _item_id(item)
+    results = []
+    item_started = time.perf_counter()
+    for scorer_id, scorer in scorers.items():
+        if scorer_ids is not None and scorer_id not in scorer_ids:
+            continue
+        started = time.perf_counter()
+        try:
+            outcome, error = scorer(item), None
+        except Exception as exc:
+            outcome, error = None, f"{type(exc).__name__}: {exc}"
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        results.append(make_result(dataset_slug, item_id, scorer_id, outcome, elapsed_ms, pass_threshold, error))
+    return results, time.perf_counter() - item_started
+
+
+def _score_task(scorers: Mapping[str, Scorer], dataset_slug: str, pass_threshold: float, task: _Task) -> _Scored:
+    return score_item(scorers, dataset_slug, pass_threshold, *task)
+
+
+# Process pool workers receive the scorers once, through the pool initializer
+_worker_score: Callable[[_Task], _Scored] | None = None
+
+
+def _init_worker(scorers: Mapping[str, Scorer], dataset_slug: str, pass_threshold: float) -> None:
+    global _worker_score
+    _worker_score = partial(_score_task, scorers, dataset_slug, pass_threshold)
+
+
+def _score_in_worker(task: _Task) -> _Scored:
+    assert _worker_score is not None
+    return _worker_score(task)
+
+
+def _is_async(scorer: Scorer) -> bool:
+    return inspect.iscoroutinefunction(scorer) or inspect.iscoroutinefunction(type(scorer).__call__)
+
+
+def _batch_body(results: list[dict[str, Any]]) -> bytes:
+    return b'{"results":[' + b",".join(json.dumps(result).encode() for result in results) + b"]}"
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _prefetch(source: Iterable[Any], maxsize: int, stats: StageStats) -> Iterator[Any]:
+    """Iterate ``source`` in a background thread, at most ``maxsize`` items ahead."""
+    buffer: queue.Queue[Any] = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(value: Any) -> None:
+        while not stop.is_set():
+            try:
+                buffer.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            iterator = iter(source)
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.busy_seconds += time.perf_counter() - started
+                stats.count += 1
+                put(item)
+        except BaseException as exc:
+            put(_Failure(exc))
+        put(_END)
+
+    threading.Thread(target=produce, name="noveum-eval-fetch", daemon=True).start()
+    try:
+        while (value := buffer.get()) is not _END:
+            if isinstance(value, _Failure):
+                raise value.error
+            yield value
+    finally:
+        stop.set()
+
+
+class _ResultUploader:
+    """Background thread batching results into ``POST /api/v1/scorers/results/batch`` calls."""
+
+    def __init__(self, runner: "EvaluationRunner", stats: StageStats):
+        self.runner = runner
+        self.stats = stats
+        self.queue: queue.Queue[Any] = queue.Queue(runner.queue_size)
+        self.error: BaseException | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="noveum-eval-upload", daemon=True)
+        self._thread.start()
+
+    def put(self, result: Any) -> None:
+        """Queue one result, blocking while the queue is full (backpressure)."""
+        while True:
+            if self.error is not None:
+                raise self.error
+            try:
+                self.queue.put(result, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def close(self) -> None:
+        """Flush every queued result and wait for the uploads to finish."""
+        self.put(_END)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def abort(self) -> None:
+        """Stop after the uploads in flight, dropping queued results."""
+        self._stop.set()
+        self._thread.join()
+
+    def _batches(self) -> Iterator[list[dict[str, Any]]]:
+        batch: list[dict[str, Any]] = []
+        while not self._stop.is_set():
+            try:
+                result = self.queue.get(timeout=self.runner.flush_interval)
+            except queue.Empty:
+                if batch:
+                    yield batch
+                    batch = []
+                continue
+            if result is _END:
+                break
+            batch.append(result)
+            if len(batch) >= self.runner.batch_size:
+                yield batch
+                batch = []
+        if batch and not self._stop.is_set():
+            yield batch
+
+    def _send(self, batch: list[dict[str, Any]]) -> float:
+        started = time.perf_counter()
+        self.runner._send_batch(batch)
+        return time.perf_counter() - started
+
+    def _done(self, batch: list[dict[str, Any]], elapsed: float) -> None:
+        self.stats.count += len(batch)
+        self.stats.busy_seconds += elapsed
+
+    def _run(self) -> None:
+        try:
+            run_bounded(self._send, self._batches(), self._done, concurrency=self.runner.upload_workers)
+        except BaseException as exc:
+            self.error = exc
+
+
+class EvaluationRunner:
+    """
+    Scores dataset items with local scorers and uploads the results.
+
+    Args:
+        client: API client
+        dataset_slug: Dataset whose items are evaluated (and results filed under)
+        scorers: Scorer ID to scorer callable. With ``executor="process"`` the
+            scorers must be picklable; with ``executor="asyncio"`` they may be
+            coroutine functions (plain functions run in worker threads).
+        executor: ``"thread"``, ``"process"`` or ``"asyncio"``
+        workers: Items scored concurrently
+        version: Dataset version to evaluate (default: current release)
+        batch_size: Results per batch upload (the API accepts at most 100)
+        upload_workers: Batch uploads in flight
+        queue_size: Capacity of the queues between stages
+        flush_interval: Seconds after which a partial batch is uploaded
+        page_size: Items fetched per page
+        pass_threshold: ``passed`` for scorers that only return a number
+        organization_slug: Organization the results are written to
+        max_retries: Retries per batch upload for transient failures
+        retry_backoff: Base delay in seconds between retries
+        incremental: Only score item/scorer pairs without an up-to-date
+            result; existing results are loaded with ``ResultKeyIndex.fetch``
+            unless ``existing`` is given
+        stale_before: Results written before this time are redone
+            (datetime or epoch seconds), e.g. when a scorer changed
+        existing: Prebuilt ``ResultKeyIndex``; implies ``incremental``
+    """
+
+    def __init__(
+        self,
+        client: AuthenticatedClient | Client,
+        dataset_slug: str,
+        scorers: Mapping[str, Scorer],
+        *,
+        executor: ExecutorKind = "thread",
+        workers: int = 8,
+        version: str | Unset = UNSET,
+        batch_size: int = 100,
+        upload_workers: int = 2,
+        queue_size: int = 1000,
+        flush_interval: float = 1.0,
+        page_size: int = 500,
+        pass_threshold: float = 0.5,
+        organization_slug: str | Unset = UNSET,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        incremental: bool = False,
+        stale_before: datetime | float | None = None,
+        existing: ResultKeyIndex | None = None,
+    ):
+        if executor not in ("thread", "process", "asyncio"):
+            raise ValueError(f"Unknown executor {executor!r}")
+        self.client = client
+        self.dataset_slug = dataset_slug
+        self.scorers = dict(scorers)
+        self.executor = executor
+        self.workers = workers
+        self.version = version
+        self.batch_size = batch_size
+        self.upload_workers = upload_workers
+        self.queue_size = queue_size
+        self.flush_interval = flush_interval
+        self.page_size = page_size
+        self.pass_threshold = pass_threshold
+        self.organization_slug = organization_slug
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.incremental = incremental or existing is not None
+        self.stale_before = stale_before.timestamp() if isinstance(stale_before, datetime) else stale_before
+        self.existing = existing
+
+    def _new_stats(self) -> EvaluationStats:
+        return EvaluationStats(
+            score=StageStats(parallelism=self.workers), upload=StageStats(parallelism=self.upload_workers)
+        )
+
+    def result_index(self) -> ResultKeyIndex | None:
+        """The index of existing results in incremental mode (fetched on first use), else ``None``."""
+        if self.incremental and self.existing is None:
+            self.existing = ResultKeyIndex.fetch(
+                self.client, self.dataset_slug, self.scorers, organization_slug=self.organization_slug
+            )
+        return self.existing
+
+    def _task(self, item: dict[str, Any], index: ResultKeyIndex | None, stats: EvaluationStats) -> _Task | None:
+        if index is None:
+            return item, None
+        missing = index.missing(item, self.stale_before)
+        stats.skipped += len(self.scorers) - len(missing)
+        return (item, missing) if missing else None
+
+    def _tasks(
+        self, items: Iterable[dict[str, Any]], index: ResultKeyIndex | None, stats: EvaluationStats
+    ) -> Iterator[_Task]:
+        for item in items:
+            task = self._task(item, index, stats)
+            if task is not None:
+                yield task
+
+    def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+        # Re-scored pairs already have a result: upsert PUTs those instead
+        upsert_results(
+            self.client,
+            batch,
+            batch_size=len(batch),
+            concurrency=1,
+            organization_slug=self.organization_slug,
+            max_retries=self.max_retries,
+            retry_backoff=self.retry_backoff,
+        )
+
+    def run(self, items: Iterable[dict[str, Any]] | None = None) -> EvaluationStats:
+        """
+        Evaluate every item and upload the results.
+
+        Args:
+            items: Items to evaluate instead of streaming the dataset
+
+        Returns:
+            ``EvaluationStats`` of the run
+
+        Raises:
+            errors.UnexpectedStatus: If fetching items or uploading results fails.
+        """
+        if self.executor == "asyncio":
+            return asyncio.run(self.run_async(items))
+
+        stats = self._new_stats()
+        started = time.perf_counter()
+        index = self.result_index()
+        source = (
+            items
+            if items is not None
+            else iter_dataset_items(self.client, self.dataset_slug, version=self.version, page_size=self.page_size)
+        )
+        # Create the shared httpx client before the worker threads race to do so
+        self.client.get_httpx_client()
+        uploader = _ResultUploader(self, stats.upload)
+
+        def scored(task: _Task, outcome: _Scored) -> None:
+            results, elapsed = outcome
+            stats.score.count += 1
+            stats.score.busy_seconds += elapsed
+            for result in results:
+                stats.results += 1
+                stats.errors += "error" in result
+                uploader.put(result)
+
+        pool = None
+        try:
+            if self.executor == "process":
+                pool = ProcessPoolExecutor(
+                    self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.scorers, self.dataset_slug, self.pass_threshold),
+                )
+                fn: Callable[[_Task], _Scored] = _score_in_worker
+            else:
+                fn = partial(_score_task, self.scorers, self.dataset_slug, self.pass_threshold)
+            run_bounded(
+                fn,
+                self._tasks(_prefetch(source, self.queue_size, stats.fetch), index, stats),
+                scored,
+                concurrency=self.workers,
+                executor=pool,
+            )
+        except BaseException:
+            uploader.abort()
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        uploader.close()
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    async def _aitems(
+        self, items: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]] | None, stats: StageStats
+    ) -> AsyncIterator[dict[str, Any]]:
+        if items is None:
+            items = aiter_dataset_items(self.client, self.dataset_slug, version=self.version, page_size=self.page_size)
+        if not isinstance(items, AsyncIterable):
+            for item in items:
+                stats.count += 1
+                yield item
+            return
+        iterator = items.__aiter__()
+        while True:
+            started = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            stats.busy_seconds += time.perf_counter() - started
+            stats.count += 1
+            yield item
+
+    async def _ascore(self, item: dict[str, Any], scorer_ids: Collection[str] | None) -> list[dict[str, Any]]:
+        item_id = _item_id(item)
+        results = []
+        for scorer_id, scorer in self.scorers.items():
+            if scorer_ids is not None and scorer_id not in scorer_ids:
+                continue
+            started = time.perf_counter()
+            try:
+                if _is_async(scorer):
+                    outcome = await scorer(item)
+                else:
+                    outcome = await asyncio.to_thread(scorer, item)
+                error = None
+            except Exception as exc:
+                outcome, error = None, f"{type(exc).__name__}: {exc}"
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            results.append(
+                make_result(self.dataset_slug, item_id, scorer_id, outcome, elapsed_ms, self.pass_threshold, error)
+            )
+        return results
+
+    async def _asend_batch(self, batch: list[dict[str, Any]], stats: StageStats) -> None:
+        started = time.perf_counter()
+        body = _batch_body(batch)
+        try:
+            response, _ = await acall_with_retry(
+                lambda: asend_raw(
+                    post_api_v1_scorers_results_batch, self.client, body, organization_slug=self.organization_slug
+                ),
+                max_retries=self.max_retries,
+                backoff=self.retry_backoff,
+            )
+            conflicts = find_conflicts(response.content, batch)
+        except UnexpectedStatus as exc:
+            if exc.status_code != 409:
+                raise
+            conflicts = batch
+        if conflicts:
+            # Existing results are rare; the synchronous upsert isolates and PUTs them
+            await asyncio.to_thread(self._send_batch, conflicts)
+        stats.count += len(batch)
+        stats.busy_seconds += time.perf_counter() - started
+
+    async def _aupload(self, results: "asyncio.Queue[Any]", stats: StageStats) -> None:
+        semaphore = asyncio.Semaphore(self.upload_workers)
+        sending: set[asyncio.Task[None]] = set()
+
+        async def send(batch: list[dict[str, Any]]) -> None:
+            for task in [task for task in sending if task.done()]:
+                sending.discard(task)
+                task.result()
+            await semaphore.acquire()
+            task = asyncio.create_task(self._asend_batch(batch, stats))
+            task.add_done_callback(lambda _: semaphore.release())
+            sending.add(task)
+
+        batch: list[dict[str, Any]] = []
+        try:
+            while True:
+                try:
+                    result = (
+                        await asyncio.wait_for(results.get(), self.flush_interval) if batch else await results.get()
+                    )
+                except asyncio.TimeoutError:
+                    await send(batch)
+                    batch = []
+                    continue
+                if result is _END:
+                    break
+                batch.append(result)
+                if len(batch) >= self.batch_size:
+                    await send(batch)
+                    batch = []
+            if batch:
+                await send(batch)
+            await asyncio.gather(*sending)
+        except BaseException:
+            for task in sending:
+                task.cancel()
+            raise
+
+    async def run_async(
+        self, items: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]] | None = None
+    ) -> EvaluationStats:
+        """
+        Evaluate on the running event loop; see ``run()``.
+
+        Scoring is limited to ``workers`` concurrent items; coroutine scorers
+        are awaited and plain scorers run in worker threads.
+        """
+        stats = self._new_stats()
+        started = time.perf_counter()
+        index = await asyncio.to_thread(self.result_index)
+        results: asyncio.Queue[Any] = asyncio.Queue(self.queue_size)
+        uploader = asyncio.create_task(self._aupload(results, stats.upload))
+        semaphore = asyncio.Semaphore(self.workers)
+        scoring: set[asyncio.Task[None]] = set()
+
+        async def put(result: Any) -> None:
+            # Wait for queue space, unless the uploader stopped (it would never make room)
+            if results.full():
+                putting = asyncio.ensure_future(results.put(result))
+                await asyncio.wait({putting, uploader}, return_when=asyncio.FIRST_COMPLETED)
+                if not putting.done():
+                    putting.cancel()
+                    uploader.result()
+                    raise RuntimeError("Result uploader stopped")
+            else:
+                results.put_nowait(result)
+
+        async def score(item: dict[str, Any], scorer_ids: Collection[str] | None) -> None:
+            try:
+                item_started = time.perf_counter()
+                item_results = await self._ascore(item, scorer_ids)
+                stats.score.count += 1
+                stats.score.busy_seconds += time.perf_counter() - item_started
+                for result in item_results:
+                    stats.results += 1
+                    stats.errors += "error" in result
+                    await put(result)
+            finally:
+                semaphore.release()
+
+        try:
+            async for item in self._aitems(items, stats.fetch):
+                pending = self._task(item, index, stats)
+                if pending is None:
+                    continue
+                await semaphore.acquire()
+                if uploader.done():
+                    uploader.result()
+                task = asyncio.create_task(score(*pending))
+                scoring.add(task)
+                task.add_done_callback(scoring.discard)
+            await asyncio.gather(*scoring)
+            await put(_END)
+            await uploader
+        except BaseException:
+            for task in (*scoring, uploader):
+                task.cancel()
+            raise
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+
+__all__ = [
+    "EvaluationRunner",
+    "EvaluationStats",
+    "ExecutorKind",
+    "ScoreResult",
+    "Scorer",
+    "StageStats",
+    "make_result",
+    "score_item",
+]
@@ -0,0 +1,420 @@
+"""
+Local dry runs of ETL mapper code.
+
+``POST /api/v1/etl-jobs/run-mapper`` runs a mapper against one trace per
+request, so trying a mapper on hundreds of traces means hundreds of slow
+round-trips. ``dry_run_mapper`` runs the mapper locally instead:
+
+* **traces** are given as dicts, or as trace IDs read from a local mirror
+  directory (``<mirror>/<trace_id>.json``) or fetched with
+  ``GET /api/v1/traces/{id}``; fetched traces are written to the mirror, so
+  the next run needs no requests at all;
+* **isolation**: the mapper code only runs in a process pool, so a crashing
+  or memory-hungry mapper cannot take the caller down. A trace that kills
+  its worker is reported as failed and the pool is restarted for the rest.
+  This is not a security sandbox: only run mapper code you trust;
+* **timeouts**: each trace gets ``timeout`` seconds (enforced with
+  ``SIGALRM`` inside the worker where available) and is reported as timed
+  out instead of blocking the run;
+* **report**: the dataset items each trace would produce, errors, and the
+  per-trace mapper time.
+
+The mapper code must define ``map_trace(trace)`` (or ``entrypoint``)
+returning one dataset item dict, a list of them, or ``None`` to skip the
+trace.
+
+Example:
+    ```python
+    from noveum_api_client.mapper_dry_run import dry_run_mapper
+
+    report = dry_run_mapper(mapper_code, trace_ids, client=client, mirror="~/.cache/noveum/traces")
+    print(len(report.items), report.timing())
+    for run in report.failed:
+        print(run.trace_id, run.error)
+    ```
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+
+from ._utils import call_with_retry, parse_json, run_bounded, unwrap
+from .api.traces import get_api_v1_traces_by_id
+from .client import AuthenticatedClient, Client
+from .results_frame import _percentile
+
+Mapper = Callable[[Mapping[str, Any]], Any]
+# (input index, trace ID, trace, timeout)
+_Task = tuple[int, str, dict[str, Any], float | None]
+
+
+class MapperTimeout(BaseException):
+    """
+    Raised inside a worker when a mapper exceeds its time budget.
+
+    Derives from ``BaseException`` so ``except Exception`` blocks in mapper
+    code do not swallow it.
+    """
+
+
+@define
+class MapperRun:
+    """Outcome of the mapper on one trace."""
+
+    trace_id: str
+    items: list[dict[str, Any]] = field(factory=list)
+    seconds: float = 0.0
+    error: str | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "items": self.items,
+            "seconds": self.seconds,
+            "error": self.error,
+            "timed_out": self.timed_out,
+        }
+
+
+@define
+class DryRunReport:
+    """Per-trace outcomes of a mapper dry run, in input order."""
+
+    runs: list[MapperRun]
+    fetched: int = 0
+    fetch_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def items(self) -> list[dict[str, Any]]:
+        """Every dataset item the mapper would produce."""
+        return [item for run in self.runs for item in run.items]
+
+    @property
+    def failed(self) -> list[MapperRun]:
+        """Runs that raised, produced invalid output or timed out."""
+        return [run for run in self.runs if not run.ok]
+
+    def timing(self, percentiles: Iterable[float] = (50, 90, 99)) -> dict[str, float]:
+        """Mapper time per trace in seconds: ``mean``, ``max`` and ``p<q>`` entries."""
+        seconds = sorted(run.seconds for run in self.runs)
+        if not seconds:
+            return {}
+        summary = {"mean": sum(seconds) / len(seconds), "max": seconds[-1]}
+        for q in percentiles:
+            summary[f"p{q:g}"] = _percentile(seconds, q)
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "traces": len(self.runs),
+            "items": len(self.items),
+            "failed": len(self.failed),
+            "fetched": self.fetched,
+            "fetch_seconds": self.fetch_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+            "timing": self.timing(),
+        }
+
+
+def check_mapper(mapper_code: str, entrypoint: str = "map_trace") -> None:
+    """
+    Check that ``mapper_code`` compiles and can define ``entrypoint``, without running it.
+
+    Raises:
+        SyntaxError: If the code does not compile.
+        ValueError: If the code never binds the name ``entrypoint``.
+    """
+    code = compile(mapper_code, "<mapper>", "exec")
+    # Every module-level binding is a name of the module's code object
+    if entrypoint not in code.co_names:
+        raise ValueError(f"Mapper code does not define a function {entrypoint!r}")
+
+
+def load_mapper(mapper_code: str, entrypoint: str = "map_trace") -> Mapper:
+    """
+    Execute ``mapper_code`` and return its ``entrypoint`` function.
+
+    Raises:
+        SyntaxError: If the code does not compile.
+        ValueError: If the code does not define a callable ``entrypoint``.
+    """
+    namespace: dict[str, Any] = {"__name__": "__mapper__"}
+    exec(compile(mapper_code, "<mapper>", "exec"), namespace)
+    mapper = namespace.get(entrypoint)
+    if not callable(mapper):
+        raise ValueError(f"Mapper code does not define a function {entrypoint!r}")
+    return mapper
+
+
+def _dataset_items(output: Any) -> list[dict[str, Any]]:
+    if output is None:
+        return []
+    items = [output] if isinstance(output, Mapping) else output
+    if not isinstance(items, list) or not all(isinstance(item, Mapping) for item in items):
+        raise TypeError(f"Mapper must return a dict, a list of dicts or None, not {type(output).__name__}")
+    # Items are stored as JSON; round-trip to catch values the API cannot store
+    return json.loads(json.dumps([dict(item) for item in items]))
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise MapperTimeout
+
+
+def run_mapper(mapper: Mapper, trace_id: str, trace: Mapping[str, Any], timeout: float | None) -> MapperRun:
+    """Run ``mapper`` on one trace, catching errors and enforcing ``timeout`` where possible."""
+    use_alarm = (
+        timeout is not None and hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    )
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    run = MapperRun(trace_id)
+    started = time.perf_counter()
+    try:
+        run.items = _dataset_items(mapper(trace))
+    except MapperTimeout:
+        run.timed_out = True
+        run.error = f"Timed out after {timeout}s"
+    except Exception as exc:
+        frames = traceback.extract_tb(exc.__traceback__)
+        line = next((frame.lineno for frame in reversed(frames) if frame.filename == "<mapper>"), None)
+        run.error = f"{type(exc).__name__}: {exc}" + (f" (mapper line {line})" if line else "")
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        run.seconds = time.perf_counter() - started
+    return run
+
+
+_worker_mapper: Mapper | None = None
+_worker_error: str | None = None
+
+
+def _init_worker(mapper_code: str, entrypoint: str) -> None:
+    global _worker_mapper, _worker_error
+    try:
+        _worker_mapper = load_mapper(mapper_code, entrypoint)
+    except Exception as exc:
+        # Raising here would break the pool; report the error per trace instead
+        _worker_error = f"Loading the mapper failed: {type(exc).__name__}: {exc}"
+
+
+def _run_in_worker(task: _Task) -> MapperRun:
+    if _worker_mapper is None:
+        return MapperRun(task[1], error=_worker_error)
+    return run_mapper(_worker_mapper, *task[1:])
+
+
+def _drain_pool(
+    pool: ProcessPoolExecutor, tasks: "deque[_Task]", done: Callable[[_Task, MapperRun], None], concurrency: int
+) -> list[_Task]:
+    """Run ``tasks`` in ``pool``; return the tasks in flight when a worker died."""
+    futures: dict[Future[MapperRun], _Task] = {}
+    broken: list[_Task] = []
+    while futures or (tasks and not broken):
+        while tasks and not broken and len(futures) < concurrency:
+            task = tasks.popleft()
+            futures[pool.submit(_run_in_worker, task)] = task
+        for future in wait(futures, return_when=FIRST_COMPLETED).done:
+            task = futures.pop(future)
+            try:
+                run = future.result()
+            except BrokenProcessPool:
+                broken.append(task)
+                continue
+            done(task, run)
+    return broken
+
+
+def _run_in_pools(
+    tasks: list[_Task], done: Callable[[_Task, MapperRun], None], mapper_code: str, entrypoint: str, workers: int
+) -> None:
+    """Run ``tasks`` in process pools, restarting the pool whenever a mapper kills its worker."""
+    queue = deque(tasks)
+    suspects: deque[_Task] = deque()
+    while queue or suspects:
+        # The traces in flight when a worker died are re-run one per pool,
+        # which tells the culprit from the innocent bystanders
+        solo = bool(suspects)
+        batch = deque([suspects.popleft()]) if solo else queue
+        size = 1 if solo else workers
+        with ProcessPoolExecutor(size, initializer=_init_worker, initargs=(mapper_code, entrypoint)) as pool:
+            broken = _drain_pool(pool, batch, done, size)
+        if solo:
+            for task in broken:
+                done(task, MapperRun(task[1], error="Mapper worker process died"))
+        else:
+            suspects.extend(broken)
+
+
+class TraceMirror:
+    """
+    Directory of traces stored as ``<trace_id>.json`` files.
+
+    Args:
+        path: Mirror directory, created on first write
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path).expanduser()
+
+    def _file(self, trace_id: str) -> Path:
+        return self.path / f"{trace_id.replace(os.sep, '_')}.json"
+
+    def get(self, trace_id: str) -> dict[str, Any] | None:
+        """The mirrored trace, or ``None`` when it is not mirrored."""
+        try:
+            return json.loads(self._file(trace_id).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def put(self, trace_id: str, trace: Mapping[str, Any]) -> None:
+        """Store a trace, atomically replacing an older copy."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self._file(trace_id)
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_text(json.dumps(trace))
+        os.replace(temporary, target)
+
+    def __contains__(self, trace_id: object) -> bool:
+        return isinstance(trace_id, str) and self._file(trace_id).exists()
+
+
+def fetch_trace(client: AuthenticatedClient | Client, trace_id: str, max_retries: int = 3) -> dict[str, Any]:
+    """
+    Fetch one trace with ``GET /api/v1/traces/{id}``.
+
+    Raises:
+        errors.UnexpectedStatus: If the trace cannot be fetched.
+    """
+    response, _ = call_with_retry(
+        lambda: get_api_v1_traces_by_id.sync_detailed(trace_id, client=client), max_retries=max_retries
+    )
+    return unwrap(unwrap(parse_json(response), "data"), "trace")
+
+
+def _trace_id(trace: Mapping[str, Any]) -> str:
+    return str(trace.get("trace_id") or trace.get("traceId") or trace.get("id") or "")
+
+
+def dry_run_mapper(
+    mapper_code: str,
+    traces: Iterable[str | Mapping[str, Any]],
+    *,
+    client: AuthenticatedClient | Client | None = None,
+    mirror: TraceMirror | str | os.PathLike[str] | None = None,
+    entrypoint: str = "map_trace",
+    workers: int = 4,
+    timeout: float | None = 5.0,
+    fetch_concurrency: int = 8,
+    max_retries: int = 3,
+) -> DryRunReport:
+    """
+    Run mapper code locally against traces and report what it would produce.
+
+    Args:
+        mapper_code: Python source defining ``entrypoint``
+        traces: Trace dicts, or trace IDs to read from ``mirror`` or fetch
+        client: API client for traces missing from the mirror
+        mirror: Trace mirror directory; fetched traces are added to it
+        entrypoint: Name of the mapper function
+        workers: Mapper processes; ``0`` runs the mapper in this process
+            (handy with a debugger)
+        timeout: Seconds the mapper may spend on one trace (``None``: no limit)
+        fetch_concurrency: Trace fetches in flight
+        max_retries: Retries per trace fetch for transient failures
+
+    Returns:
+        ``DryRunReport`` with one ``MapperRun`` per trace, in input order
+
+    Raises:
+        SyntaxError: If the mapper code does not compile.
+        ValueError: If the mapper does not define ``entrypoint``, or a trace
+            ID is neither mirrored nor fetchable without a ``client``.
+        errors.UnexpectedStatus: If a trace fetch fails.
+    """
+    started = time.perf_counter()
+    # Fail fast on code that cannot even be loaded, before any trace is fetched;
+    # with workers the code itself only ever runs in the worker processes
+    check_mapper(mapper_code, entrypoint)
+    mapper = load_mapper(mapper_code, entrypoint) if workers <= 0 else None
+    if mirror is not None and not isinstance(mirror, TraceMirror):
+        mirror = TraceMirror(mirror)
+
+    resolved: list[tuple[str, dict[str, Any] | None]] = []
+    for trace in traces:
+        if isinstance(trace, str):
+            resolved.append((trace, mirror.get(trace) if mirror is not None else None))
+        else:
+            resolved.append((_trace_id(trace), dict(trace)))
+    missing = [index for index, (_, trace) in enumerate(resolved) if trace is None]
+    if missing and client is None:
+        raise ValueError(f"{len(missing)} trace(s) are not mirrored and no client was given to fetch them")
+
+    def fetched(index: int, trace: dict[str, Any]) -> None:
+        trace_id = resolved[index][0]
+        resolved[index] = (trace_id, trace)
+        if mirror is not None:
+            mirror.put(trace_id, trace)
+
+    fetch_started = time.perf_counter()
+    if missing:
+        assert client is not None
+        # Create the shared httpx client before the worker threads race to do so
+        client.get_httpx_client()
+        run_bounded(
+            lambda index: fetch_trace(client, resolved[index][0], max_retries),
+            missing,
+            fetched,
+            concurrency=fetch_concurrency,
+        )
+    fetch_seconds = time.perf_counter() - fetch_started
+
+    runs: list[MapperRun | None] = [None] * len(resolved)
+    tasks = [(index, trace_id, trace or {}, timeout) for index, (trace_id, trace) in enumerate(resolved)]
+
+    def done(task: _Task, run: MapperRun) -> None:
+        runs[task[0]] = run
+
+    if mapper is not None:
+        for task in tasks:
+            done(task, run_mapper(mapper, *task[1:]))
+    else:
+        _run_in_pools(tasks, done, mapper_code, entrypoint, workers)
+    return DryRunReport(
+        [run for run in runs if run is not None],
+        fetched=len(missing),
+        fetch_seconds=fetch_seconds,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+
+__all__ = [
+    "DryRunReport",
+    "MapperRun",
+    "MapperTimeout",
+    "TraceMirror",
+    "check_mapper",
+    "dry_run_mapper",
+    "fetch_trace",
+    "load_mapper",
+    "run_mapper",
+]
@@ -3,6 +3,12 @@
 from .delete_api_v1_audio_by_id_response_200 import DeleteApiV1AudioByIdResponse200
 from .delete_api_v1_datasets_by_dataset_slug_items_body import DeleteApiV1DatasetsByDatasetSlugItemsBody
 from .get_api_v1_datasets_by_dataset_slug_items_sort_order import GetApiV1DatasetsByDatasetSlugItemsSortOrder
+from .get_api_v1_datasets_by_dataset_slug_versions_diff_response_200 import (
+    GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200,
+)
+from .get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item import (
+    GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem,
+)
 from .get_api_v1_datasets_visibility import GetApiV1DatasetsVisibility
 from .get_api_v1_etl_jobs_by_id_response_200 import GetApiV1EtlJobsByIdResponse200
 from .get_api_v1_etl_jobs_by_id_runs_response_200_item import GetApiV1EtlJobsByIdRunsResponse200Item
@@ -123,6 +129,8 @@ __all__ = (
     "DeleteApiV1AudioByIdResponse200",
     "DeleteApiV1DatasetsByDatasetSlugItemsBody",
     "GetApiV1DatasetsByDatasetSlugItemsSortOrder",
+    "GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200",
+    "GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem",
     "GetApiV1DatasetsVisibility",
     "GetApiV1EtlJobsByIdResponse200",
     "GetApiV1EtlJobsByIdRunsResponse200Item",
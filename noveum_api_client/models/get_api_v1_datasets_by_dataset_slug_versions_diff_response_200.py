@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item import (
+        GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem,
+    )
+
+
+T = TypeVar("T", bound="GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200")
+
+
+@_attrs_define
+class GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200:
+    """
+    Attributes:
+        from_version (str | Unset):
+        to_version (str | Unset):
+        added (list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset):
+        removed (list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset):
+        modified (list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset):
+        summary (Any | Unset):
+    """
+
+    from_version: str | Unset = UNSET
+    to_version: str | Unset = UNSET
+    added: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+    removed: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+    modified: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+    summary: Any | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        from_version = self.from_version
+
+        to_version = self.to_version
+
+        added: list[dict[str, Any]] | Unset = UNSET
+        if not isinstance(self.added, Unset):
+            added = []
+            for added_item_data in self.added:
+                added_item = added_item_data.to_dict()
+                added.append(added_item)
+
+        removed: list[dict[str, Any]] | Unset = UNSET
+        if not isinstance(self.removed, Unset):
+            removed = []
+            for removed_item_data in self.removed:
+                removed_item = removed_item_data.to_dict()
+                removed.append(removed_item)
+
+        modified: list[dict[str, Any]] | Unset = UNSET
+        if not isinstance(self.modified, Unset):
+            modified = []
+            for modified_item_data in self.modified:
+                modified_item = modified_item_data.to_dict()
+                modified.append(modified_item)
+
+        summary = self.summary
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update({})
+        if from_version is not UNSET:
+            field_dict["from_version"] = from_version
+        if to_version is not UNSET:
+            field_dict["to_version"] = to_version
+        if added is not UNSET:
+            field_dict["added"] = added
+        if removed is not UNSET:
+            field_dict["removed"] = removed
+        if modified is not UNSET:
+            field_dict["modified"] = modified
+        if summary is not UNSET:
+            field_dict["summary"] = summary
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item import (
+            GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem,
+        )
+
+        d = dict(src_dict)
+        from_version = d.pop("from_version", UNSET)
+
+        to_version = d.pop("to_version", UNSET)
+
+        _added = d.pop("added", UNSET)
+        added: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+        if _added is not UNSET:
+            added = []
+            for added_item_data in _added:
+                added_item = GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem.from_dict(added_item_data)
+
+                added.append(added_item)
+
+        _removed = d.pop("removed", UNSET)
+        removed: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+        if _removed is not UNSET:
+            removed = []
+            for removed_item_data in _removed:
+                removed_item = GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem.from_dict(
+                    removed_item_data
+                )
+
+                removed.append(removed_item)
+
+        _modified = d.pop("modified", UNSET)
+        modified: list[GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem] | Unset = UNSET
+        if _modified is not UNSET:
+            modified = []
+            for modified_item_data in _modified:
+                modified_item = GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem.from_dict(
+                    modified_item_data
+                )
+
+                modified.append(modified_item)
+
+        summary = d.pop("summary", UNSET)
+
+        get_api_v1_datasets_by_dataset_slug_versions_diff_response_200 = cls(
+            from_version=from_version,
+            to_version=to_version,
+            added=added,
+            removed=removed,
+            modified=modified,
+            summary=summary,
+        )
+
+        get_api_v1_datasets_by_dataset_slug_versions_diff_response_200.additional_properties = d
+        return get_api_v1_datasets_by_dataset_slug_versions_diff_response_200
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
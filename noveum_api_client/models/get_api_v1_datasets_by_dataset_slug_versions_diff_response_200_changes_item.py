@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem")
+
+
+@_attrs_define
+class GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200ChangesItem:
+    """
+    Attributes:
+        item_id (str):
+        item_type (str | Unset):
+        content (Any | Unset):
+        metadata (Any | Unset):
+    """
+
+    item_id: str
+    item_type: str | Unset = UNSET
+    content: Any | Unset = UNSET
+    metadata: Any | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        item_id = self.item_id
+
+        item_type = self.item_type
+
+        content = self.content
+
+        metadata = self.metadata
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "item_id": item_id,
+            }
+        )
+        if item_type is not UNSET:
+            field_dict["item_type"] = item_type
+        if content is not UNSET:
+            field_dict["content"] = content
+        if metadata is not UNSET:
+            field_dict["metadata"] = metadata
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        item_id = d.pop("item_id")
+
+        item_type = d.pop("item_type", UNSET)
+
+        content = d.pop("content", UNSET)
+
+        metadata = d.pop("metadata", UNSET)
+
+        get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item = cls(
+            item_id=item_id,
+            item_type=item_type,
+            content=content,
+            metadata=metadata,
+        )
+
+        get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item.additional_properties = d
+        return get_api_v1_datasets_by_dataset_slug_versions_diff_response_200_changes_item
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -5,11 +5,44 @@ This module provides a user-friendly wrapper around the generated API client
 with convenience methods for common operations like evaluation and result aggregation.
 """
 
-from typing import Any
+import asyncio
+import contextlib
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Literal
+
+import httpx
 
 from .api.datasets import get_api_v1_datasets_by_dataset_slug_items
+from .api.health import get_api_health
 from .api.scorer_results import get_api_v1_scorers_results
+from .audio_cache import AudioBlob, AudioCache
+from .audio_download import AudioDownloadResult, DownloadedAudio, download_audio, download_audio_files, stream_audio
+from .audio_listing import AudioRecord, iter_audio
+from .audio_upload import AudioSource, AudioUpload, AudioUploadResult, upload_audio, upload_audio_files
+from .cache import CacheBackend, CachingTransport
 from .client import Client
+from .coalescing import NO_COALESCE, CoalescingTransport
+from .dataset_cache import DatasetSnapshot, DatasetSnapshotCache
+from .dataset_delete import DeleteResult, ItemPredicate, bulk_delete_items
+from .dataset_import import ImportSchema, ImportStats, import_items
+from .dataset_sync import SyncResult, sync_dataset
+from .dataset_upload import ItemSource, UploadResult, upload_items
+from .etl_backfill import BackfillResult, backfill_etl_job, time_shards, trace_id_shards
+from .etl_run_index import EtlRunIndex
+from .etl_watch import EtlJobEvent, watch_etl_jobs
+from .evaluation import EvaluationRunner, EvaluationStats, ExecutorKind, Scorer
+from .mapper_dry_run import DryRunReport, dry_run_mapper
+from .project_datasets import ReconcileResult, reconcile_associations
+from .project_health import HealthMatrix, HealthMonitor
+from .result_stream import ResultRecord, iter_results
+from .result_upsert import UpsertResult, upsert_results
+from .results_frame import ResultsFrame
+from .scorer_registry import ScorerDefinition, ScorerRegistry, fetch_scorer
+from .transport import LatencyTransport, WriteHookTransport
 from .types import UNSET, Unset
 
 
@@ -35,23 +68,94 @@ class NoveumClient:
         ```
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.noveum.ai"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.noveum.ai",
+        *,
+        track_latency: bool = False,
+        cache: CacheBackend | None = None,
+        cache_ttls: Mapping[str, float] | None = None,
+        coalesce_requests: bool = False,
+        scorer_registry_ttl: float | None = None,
+        audio_cache: AudioCache | None = None,
+    ):
         """
         Initialize the Noveum client.
 
         Args:
             api_key: Your Noveum API key (from environment or explicit)
             base_url: Base URL for the API (default: production)
+            track_latency: Record cold (new connection) vs warm (pooled
+                connection) request timings, see ``latency_stats()``
+            cache: Backend for caching read-mostly GET endpoints, e.g.
+                ``MemoryCacheBackend()`` or ``DiskCacheBackend(path)``;
+                disabled when omitted
+            cache_ttls: Path pattern to TTL (seconds) mapping for the cache
+                (default: ``cache.DEFAULT_CACHE_TTLS``)
+            coalesce_requests: Send identical concurrent GET requests only
+                once and share the response between all callers
+            scorer_registry_ttl: Serve ``get_scorer()`` from an in-process
+                ``ScorerRegistry`` whose entries live this many seconds and
+                are dropped when this client updates or deletes them
+            audio_cache: On-disk cache used by ``open_audio()`` (default: an
+                ``AudioCache`` in ``default_audio_cache_dir()``, created on first use)
         """
         self.api_key = api_key
         self.base_url = base_url
-        self._client = Client(base_url=base_url, headers={"Authorization": f"Bearer {api_key}"})
+        # One SSL context for the lifetime of the wrapper: every connection
+        # pool (sync, async, or rebuilt after close) reuses the loaded CA store
+        # and settings instead of building its own. TLS sessions are not
+        # resumed across connections; that would need ``session=`` per socket.
+        self._ssl_context = httpx.create_ssl_context()
+        self._latency: LatencyTransport | None = None
+        self._cache: CachingTransport | None = None
+        transport: Any = None
+        if track_latency:
+            self._latency = LatencyTransport(verify=self._ssl_context)
+            transport = self._latency
+        if coalesce_requests:
+            transport = CoalescingTransport(transport, verify=self._ssl_context)
+        if cache is not None:
+            # Outermost layer, so cache hits never reach the network layers
+            self._cache = CachingTransport(cache, cache_ttls, transport=transport, verify=self._ssl_context)
+            transport = self._cache
+        self._scorers: ScorerRegistry | None = None
+        self._health: HealthMonitor | None = None
+        self._audio_cache = audio_cache
+        hooks: WriteHookTransport | None = None
+        if scorer_registry_ttl is not None:
+            hooks = WriteHookTransport(transport, verify=self._ssl_context)
+            transport = hooks
+        httpx_args: dict[str, Any] = {}
+        if transport is not None:
+            httpx_args["transport"] = transport
+        self._client = Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            verify_ssl=self._ssl_context,
+            httpx_args=httpx_args,
+        )
+        if hooks is not None:
+            self._scorers = ScorerRegistry(self._client, ttl=scorer_registry_ttl)
+            hooks.subscribe(self._scorers.on_write)
 
     @property
     def client(self) -> Client:
         """Get the underlying generated API client."""
         return self._client
 
+    @property
+    def scorers(self) -> ScorerRegistry:
+        """
+        Get the in-process scorer registry.
+
+        Requires ``scorer_registry_ttl``.
+        """
+        if self._scorers is None:
+            raise RuntimeError("The scorer registry is disabled; create the client with scorer_registry_ttl=...")
+        return self._scorers
+
     def list_datasets(
         self,
         limit: int = 20,
@@ -109,6 +213,155 @@ class NoveumClient:
             "headers": dict(response.headers),
         }
 
+    def get_dataset_snapshot(
+        self,
+        dataset_slug: str,
+        version: str,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> DatasetSnapshot:
+        """
+        Get all items of a dataset version from the local snapshot cache.
+
+        Published versions are downloaded once and then served from disk;
+        draft versions are revalidated against the server on every call.
+
+        Args:
+            dataset_slug: The dataset slug
+            version: The dataset version
+            cache_dir: Snapshot cache directory (default: ``~/.cache/noveum/datasets``)
+
+        Returns:
+            Memory-mapped ``DatasetSnapshot`` of the version's items
+        """
+        return DatasetSnapshotCache(cache_dir).load(self._client, dataset_slug, version)
+
+    def sync_dataset(
+        self,
+        dataset_slug: str,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> SyncResult:
+        """
+        Bring the local snapshot cache up to date with the dataset's next release.
+
+        Only the items added, removed or modified since the locally cached
+        release are downloaded; see ``dataset_sync.sync_dataset``.
+
+        Args:
+            dataset_slug: The dataset slug
+            cache_dir: Snapshot cache directory (default: ``~/.cache/noveum/datasets``)
+
+        Returns:
+            ``SyncResult`` with the synced version and change counts
+        """
+        return sync_dataset(self._client, dataset_slug, DatasetSnapshotCache(cache_dir))
+
+    def upload_items(
+        self,
+        dataset_slug: str,
+        items: ItemSource,
+        concurrency: int = 8,
+        checkpoint: str | os.PathLike[str] | None = None,
+        **options: Any,
+    ) -> UploadResult:
+        """
+        Upload items to a dataset in parallel, size-limited chunks.
+
+        Args:
+            dataset_slug: The dataset slug
+            items: Iterable of item dicts, models or JSON bytes, or a JSONL file path
+            concurrency: Number of chunks in flight
+            checkpoint: File recording progress, so an interrupted import can resume
+            **options: Further ``dataset_upload.upload_items`` options
+                (``max_items``, ``max_bytes``, ``max_retries``, ``retry_backoff``,
+                ``dedup``)
+
+        Returns:
+            ``UploadResult`` with item, chunk, byte and retry counts
+        """
+        return upload_items(
+            self._client, dataset_slug, items, concurrency=concurrency, checkpoint=checkpoint, **options
+        )
+
+    def bulk_delete_items(
+        self,
+        dataset_slug: str,
+        items: Iterable[str] | ItemPredicate,
+        concurrency: int = 8,
+        **options: Any,
+    ) -> DeleteResult:
+        """
+        Delete dataset items by ID, or every item matching a predicate.
+
+        Args:
+            dataset_slug: The dataset slug
+            items: Item IDs, or a predicate called with each item dict
+            concurrency: Number of delete requests in flight
+            **options: Further ``dataset_delete.bulk_delete_items`` options
+                (``chunk_size``, ``page_size``, ``max_retries``, ``retry_backoff``)
+
+        Returns:
+            ``DeleteResult`` with deleted / scanned item, chunk and retry counts
+        """
+        return bulk_delete_items(self._client, dataset_slug, items, concurrency=concurrency, **options)
+
+    def import_items(
+        self,
+        dataset_slug: str,
+        source: str | os.PathLike[str],
+        schema: ImportSchema,
+        format: Literal["jsonl", "csv"] | None = None,
+        on_error: Literal["raise", "skip"] = "raise",
+        stats: ImportStats | None = None,
+        **upload_options: Any,
+    ) -> UploadResult:
+        """
+        Import a JSONL or CSV file into a dataset through a declarative schema.
+
+        Records are converted straight to item JSON (see
+        ``dataset_import.import_items``) and streamed into ``upload_items``.
+
+        Args:
+            dataset_slug: The dataset slug
+            source: JSONL or CSV file path
+            schema: Mapping from records to dataset items
+            format: File format, by default taken from the file suffix
+            on_error: ``"raise"`` or ``"skip"`` invalid records
+            stats: Optional ``ImportStats`` receiving record counts and errors
+            **upload_options: ``upload_items`` options (``concurrency``, ``checkpoint``, ...)
+
+        Returns:
+            ``UploadResult`` of the upload
+        """
+        items = import_items(source, schema, format=format, on_error=on_error, stats=stats)
+        return self.upload_items(dataset_slug, items, **upload_options)
+
+    def evaluate(
+        self,
+        dataset_slug: str,
+        scorers: Mapping[str, Scorer],
+        executor: ExecutorKind = "thread",
+        workers: int = 8,
+        items: Iterable[dict[str, Any]] | None = None,
+        **options: Any,
+    ) -> EvaluationStats:
+        """
+        Score a dataset with local scorers and upload the results.
+
+        Args:
+            dataset_slug: The dataset slug
+            scorers: Scorer ID to scorer callable
+            executor: ``"thread"``, ``"process"`` or ``"asyncio"``
+            workers: Items scored concurrently
+            items: Items to evaluate instead of streaming the dataset
+            **options: Further ``evaluation.EvaluationRunner`` options
+                (``batch_size``, ``queue_size``, ``version``, ...)
+
+        Returns:
+            ``EvaluationStats`` with per-stage throughput
+        """
+        runner = EvaluationRunner(self._client, dataset_slug, scorers, executor=executor, workers=workers, **options)
+        return runner.run(items)
+
     def get_results(
         self,
         dataset_slug: str | None = None,
@@ -149,6 +402,563 @@ class NoveumClient:
             "headers": dict(response.headers),
         }
 
+    def upsert_results(
+        self,
+        results: Iterable[Mapping[str, Any]],
+        concurrency: int = 8,
+        **options: Any,
+    ) -> UpsertResult:
+        """
+        Create or update scorer results.
+
+        Results are posted in batches; only those that already exist are sent
+        as individual PUTs (see ``result_upsert.upsert_results``).
+
+        Args:
+            results: Result dicts keyed by ``dataset_slug``, ``item_id`` and ``scorer_id``
+            concurrency: Requests in flight
+            **options: Further ``upsert_results`` options (``batch_size``, ``max_retries``, ...)
+
+        Returns:
+            ``UpsertResult`` with created / updated counts
+        """
+        return upsert_results(self._client, results, concurrency=concurrency, **options)
+
+    def get_results_frame(
+        self,
+        dataset_slug: str | None = None,
+        scorer_id: str | None = None,
+        page_size: int | None = None,
+        shards: int = 4,
+    ) -> ResultsFrame:
+        """
+        Load every matching evaluation result into a columnar ``ResultsFrame``.
+
+        Args:
+            dataset_slug: Filter by dataset
+            scorer_id: Filter by scorer
+            page_size: Results fetched per request (default: adaptive)
+            shards: Pages fetched in parallel once the total is known
+
+        Returns:
+            ``ResultsFrame`` offering vectorized ``aggregate()`` / ``histogram()``
+        """
+        return ResultsFrame.fetch(
+            self._client,
+            dataset_slug=UNSET if dataset_slug is None else dataset_slug,
+            scorer_id=UNSET if scorer_id is None else scorer_id,
+            page_size=page_size,
+            shards=shards,
+        )
+
+    def iter_results(
+        self,
+        dataset_slug: str | None = None,
+        item_id: str | None = None,
+        scorer_id: str | None = None,
+        **options: Any,
+    ) -> Iterator[ResultRecord]:
+        """
+        Iterate over every matching evaluation result.
+
+        Args:
+            dataset_slug: Filter by dataset
+            item_id: Filter by item
+            scorer_id: Filter by scorer
+            **options: Further ``result_stream.iter_results`` options
+                (``page_size``, ``prefetch``, ``shards``, ``raw``)
+
+        Returns:
+            Iterator of ``ResultRecord`` objects, in offset order
+        """
+        return iter_results(
+            self._client,
+            dataset_slug=UNSET if dataset_slug is None else dataset_slug,
+            item_id=UNSET if item_id is None else item_id,
+            scorer_id=UNSET if scorer_id is None else scorer_id,
+            **options,
+        )
+
+    def get_scorer(self, scorer_id: str) -> ScorerDefinition:
+        """
+        Get a scorer definition.
+
+        With ``scorer_registry_ttl`` set, the scorer is served from the
+        in-process registry, which the first call fills with one list request
+        (``ScorerRegistry.preload``); otherwise it is fetched from the API.
+
+        Args:
+            scorer_id: Scorer ID
+
+        Returns:
+            ``GetApiV1ScorersByIdResponse200`` with the scorer definition
+        """
+        if self._scorers is not None:
+            if self._scorers.stats.loads == 0:
+                self._scorers.preload()
+            return self._scorers.get(scorer_id)
+        return fetch_scorer(self._client, scorer_id)
+
+    def watch_etl_job(self, job_id: str, run_id: str | None = None, **options: Any) -> AsyncIterator[EtlJobEvent]:
+        """
+        Follow an ETL job run until it finishes.
+
+        Polls adaptively: quickly right after a trigger or a status change,
+        then backing off (see ``etl_watch.watch_etl_jobs``).
+
+        Args:
+            job_id: ETL job ID
+            run_id: Run to follow, e.g. the ``id`` returned by the trigger
+                request (default: the job's most recent run)
+            **options: Further ``watch_etl_jobs`` options (``initial_interval``,
+                ``max_interval``, ``timeout``, ...)
+
+        Returns:
+            Async iterator of ``EtlJobEvent`` status transitions, each carrying
+            the run record; the last one is terminal
+        """
+        return watch_etl_jobs(self._client, {job_id: run_id}, **options)
+
+    def watch_etl_jobs(
+        self, jobs: Iterable[str] | Mapping[str, str | None], **options: Any
+    ) -> AsyncIterator[EtlJobEvent]:
+        """
+        Follow several ETL job runs in one poll loop until all of them finish.
+
+        Args:
+            jobs: Job IDs, or a mapping of job ID to the run ID to follow
+            **options: Further ``etl_watch.watch_etl_jobs`` options
+
+        Returns:
+            Async iterator of ``EtlJobEvent`` status transitions of all jobs
+        """
+        return watch_etl_jobs(self._client, jobs, **options)
+
+    def upload_audio(
+        self,
+        source: AudioSource,
+        trace_id: str,
+        span_id: str,
+        audio_uuid: str,
+        file_name: str | None = None,
+        mime_type: str | None = None,
+    ) -> Any:
+        """
+        Upload a recording, streamed from a path, file object or ``bytes``.
+
+        The audio is sent in bounded chunks instead of being read into memory
+        first; see ``noveum_api_client.audio_upload``.
+
+        Args:
+            source: File path, binary file object or ``bytes``
+            trace_id: Trace ID the audio belongs to
+            span_id: Span ID the audio belongs to
+            audio_uuid: Unique identifier of the audio
+            file_name: File name sent with the audio
+            mime_type: Content type of the audio
+
+        Returns:
+            The created audio record
+        """
+        return upload_audio(
+            self._client,
+            source,
+            trace_id=trace_id,
+            span_id=span_id,
+            audio_uuid=audio_uuid,
+            file_name=file_name,
+            mime_type=mime_type,
+        )
+
+    def upload_audio_files(
+        self,
+        uploads: Iterable[AudioUpload | tuple[Any, ...]],
+        concurrency: int = 4,
+        on_progress: Callable[[AudioUploadResult], None] | None = None,
+        max_retries: int = 3,
+    ) -> AudioUploadResult:
+        """
+        Upload many recordings concurrently, each streamed from its source.
+
+        Args:
+            uploads: ``AudioUpload``s or ``(trace_id, span_id, audio_uuid, source)`` tuples
+            concurrency: Uploads in flight
+            on_progress: Called with the running result after every finished upload
+            max_retries: Retries per upload for transient failures
+
+        Returns:
+            ``AudioUploadResult`` with the created records and failed uploads
+        """
+        return upload_audio_files(
+            self._client, uploads, concurrency=concurrency, on_progress=on_progress, max_retries=max_retries
+        )
+
+    def iter_audio(self, hydrate: bool = False, **options: Any) -> Iterator[AudioRecord]:
+        """
+        Iterate over every recording, prefetching the next page.
+
+        Args:
+            hydrate: Complete every record from the per-recording metadata endpoint
+            **options: Further ``audio_listing.iter_audio`` options
+                (``page_size``, ``prefetch``, ``parallel``, ``hydrate_concurrency``, ``raw``)
+
+        Returns:
+            Iterator of ``AudioRecord`` objects, in listing order
+        """
+        return iter_audio(self._client, hydrate=hydrate, **options)
+
+    def stream_audio(self, audio_id: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """
+        Yield the bytes of a recording without buffering it in memory.
+
+        Args:
+            audio_id: Audio ID
+            start: First byte to read
+            end: Last byte to read, inclusive (default: to the end)
+
+        Yields:
+            Chunks of audio
+        """
+        return stream_audio(self._client, audio_id, start=start, end=end)
+
+    def download_audio(
+        self,
+        audio_id: str,
+        path: str | os.PathLike[str],
+        expected_size: int | None = None,
+        checksum: str | None = None,
+    ) -> DownloadedAudio:
+        """
+        Download a recording straight to disk, resuming a partial download.
+
+        Args:
+            audio_id: Audio ID
+            path: Destination file
+            expected_size: Size the recording must have, in bytes
+            checksum: SHA-256 hex digest the recording must have
+
+        Returns:
+            ``DownloadedAudio`` with the final size and checksum
+        """
+        return download_audio(self._client, audio_id, path, expected_size=expected_size, checksum=checksum)
+
+    def download_audio_files(
+        self,
+        directory: str | os.PathLike[str],
+        audio_ids: Iterable[str] | None = None,
+        concurrency: int = 4,
+        on_progress: Callable[[AudioDownloadResult], None] | None = None,
+    ) -> AudioDownloadResult:
+        """
+        Download many recordings concurrently into ``directory``.
+
+        Args:
+            directory: Destination directory
+            audio_ids: Audio IDs (default: every listed recording)
+            concurrency: Downloads in flight
+            on_progress: Called with the running result after every finished download
+
+        Returns:
+            ``AudioDownloadResult`` with the downloaded files and failures
+        """
+        return download_audio_files(
+            self._client, directory, audio_ids, concurrency=concurrency, on_progress=on_progress
+        )
+
+    def open_audio(self, audio_id: str, checksum: str | None = None) -> AudioBlob:
+        """
+        Open a recording through the on-disk audio cache.
+
+        Cached recordings are memory-mapped without a request; misses are
+        downloaded once and shared with every process using the same cache.
+
+        Args:
+            audio_id: Audio ID
+            checksum: SHA-256 hex digest the recording must have
+
+        Returns:
+            ``AudioBlob`` memory-mapping the recording; close it when done
+        """
+        return self.audio_cache.open(self._client, audio_id, checksum=checksum)
+
+    @property
+    def audio_cache(self) -> AudioCache:
+        """The ``AudioCache`` behind ``open_audio()``, with its hit/miss ``stats``."""
+        if self._audio_cache is None:
+            self._audio_cache = AudioCache()
+        return self._audio_cache
+
+    def reconcile_associations(
+        self,
+        desired: Mapping[str, Iterable[str]],
+        dry_run: bool = False,
+        prune: bool = True,
+        concurrency: int = 8,
+    ) -> ReconcileResult:
+        """
+        Make project ↔ dataset associations match ``desired``.
+
+        The current associations of every listed project are fetched
+        concurrently; only the missing associations are created and, with
+        ``prune``, the unwanted ones removed, in parallel.
+
+        Args:
+            desired: Wanted dataset IDs per project ID; other projects are left alone
+            dry_run: Only return the plan
+            prune: Remove associations that are not wanted
+            concurrency: Requests in flight
+
+        Returns:
+            ``ReconcileResult`` with the plan and what was applied
+        """
+        return reconcile_associations(self._client, desired, dry_run=dry_run, prune=prune, concurrency=concurrency)
+
+    def fetch_health_matrix(
+        self,
+        projects: Iterable[str] | None = None,
+        scorers: Iterable[str] = (),
+        environments: Iterable[str | None] | None = None,
+        ttl: float = 5.0,
+        concurrency: int = 8,
+    ) -> HealthMatrix:
+        """
+        Fetch project and per-scorer health for a dashboard, concurrently.
+
+        Cells are cached for ``ttl`` seconds across calls on this client and
+        identical in-flight requests are shared, so frequent refreshes only
+        hit the API for expired cells.
+
+        Args:
+            projects: Project IDs (default: every project)
+            scorers: Scorer IDs to add per-scorer health for
+            environments: Environments (default: the all-environments view)
+            ttl: Seconds a cell is served from memory
+            concurrency: Most health requests in flight
+
+        Returns:
+            ``HealthMatrix`` of all cells; failed cells are ``None`` with the
+            error in ``HealthMatrix.errors``
+        """
+        if self._health is None:
+            self._health = HealthMonitor(self._client)
+        self._health.ttl = ttl
+        self._health.concurrency = concurrency
+        return self._health.fetch(projects, scorers, environments)
+
+    def refresh_etl_run_index(
+        self,
+        job_ids: Iterable[str],
+        index: EtlRunIndex | None = None,
+        concurrency: int = 8,
+    ) -> EtlRunIndex:
+        """
+        Fetch the run history of ETL jobs into a compact local index.
+
+        Passing the index of an earlier call refreshes it incrementally: only
+        runs updated since are parsed and stored again.
+
+        Args:
+            job_ids: ETL job IDs
+            index: Index to refresh (default: a new in-memory index)
+            concurrency: Run listings fetched in parallel
+
+        Returns:
+            The refreshed ``EtlRunIndex``
+        """
+        index = index if index is not None else EtlRunIndex()
+        index.refresh_all(self._client, job_ids, concurrency=concurrency)
+        return index
+
+    def backfill_etl_job(
+        self,
+        job_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        window: timedelta = timedelta(days=1),
+        trace_ids: Iterable[str] | None = None,
+        shard_size: int = 500,
+        in_flight: int = 4,
+        **options: Any,
+    ) -> BackfillResult:
+        """
+        Run an ETL job over a time range or a trace ID set in shards.
+
+        Either ``start`` and ``end`` (split into ``window`` long shards) or
+        ``trace_ids`` (split into chunks of ``shard_size``) must be given. At
+        most ``in_flight`` runs are active at a time.
+
+        Args:
+            job_id: ETL job ID
+            start: Start of the time range to backfill
+            end: End of the time range to backfill
+            window: Length of one time shard
+            trace_ids: Trace IDs to backfill instead of a time range
+            shard_size: Trace IDs per shard
+            in_flight: Most runs active at the same time
+            **options: Further ``etl_backfill.backfill_etl_job`` options
+                (``project_id``, ``dataset_slug``, ``on_progress``, ...)
+
+        Returns:
+            ``BackfillResult`` with per-shard progress and summed counters
+        """
+        if trace_ids is not None:
+            shards = trace_id_shards(trace_ids, shard_size)
+        elif start is not None and end is not None:
+            shards = time_shards(start, end, window)
+        else:
+            raise ValueError("Pass either start and end, or trace_ids")
+        return backfill_etl_job(self._client, job_id, shards, in_flight=in_flight, **options)
+
+    def dry_run_mapper(
+        self,
+        mapper_code: str,
+        traces: Iterable[str | Mapping[str, Any]],
+        workers: int = 4,
+        timeout: float | None = 5.0,
+        **options: Any,
+    ) -> DryRunReport:
+        """
+        Run ETL mapper code locally instead of calling the run-mapper endpoint per trace.
+
+        Args:
+            mapper_code: Python source defining ``map_trace(trace)``
+            traces: Trace dicts or trace IDs (fetched when not in ``mirror``)
+            workers: Mapper processes (``0``: run in this process)
+            timeout: Seconds the mapper may spend on one trace
+            **options: Further ``mapper_dry_run.dry_run_mapper`` options
+                (``mirror``, ``entrypoint``, ``fetch_concurrency``, ...)
+
+        Returns:
+            ``DryRunReport`` with the items each trace would produce and per-trace timing
+        """
+        return dry_run_mapper(mapper_code, traces, client=self._client, workers=workers, timeout=timeout, **options)
+
+    def warmup(self, n_connections: int = 4, timeout: float = 10.0) -> int:
+        """
+        Open ``n_connections`` pooled connections to ``base_url`` ahead of time.
+
+        Each connection is opened by a concurrent health check request that is
+        held open until all of them are established, so the pool ends up with
+        ``n_connections`` distinct keep-alive connections and the first real
+        request skips the DNS, TCP and TLS handshakes. Connections beyond the
+        pool's ``max_keepalive_connections`` limit (httpx default: 20) are
+        closed again when released.
+
+        Args:
+            n_connections: Number of connections to open
+            timeout: Maximum seconds to wait for all connections to open
+
+        Returns:
+            Number of connections opened whose health check succeeded
+        """
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+
+        http = self._client.get_httpx_client()
+        kwargs = get_api_health._get_kwargs()
+        # Every request must open its own connection, not join another's flight
+        kwargs["extensions"] = {NO_COALESCE: True}
+        barrier = threading.Barrier(n_connections)
+
+        def _open() -> bool:
+            with contextlib.ExitStack() as stack:
+                response: httpx.Response | None = None
+                with contextlib.suppress(httpx.HTTPError):
+                    response = stack.enter_context(http.stream(**kwargs))
+                # Hold the connection until every worker has its own one
+                with contextlib.suppress(threading.BrokenBarrierError):
+                    barrier.wait(timeout)
+                if response is None:
+                    return False
+                # Consuming the body returns the connection to the pool
+                # instead of closing it
+                try:
+                    response.read()
+                except httpx.HTTPError:
+                    return False
+            return response.is_success
+
+        with ThreadPoolExecutor(max_workers=n_connections) as executor:
+            results = list(executor.map(lambda _: _open(), range(n_connections)))
+        return sum(results)
+
+    async def warmup_async(self, n_connections: int = 4, timeout: float = 10.0) -> int:
+        """
+        Async version of ``warmup()`` for the underlying ``httpx.AsyncClient``.
+
+        Args:
+            n_connections: Number of connections to open
+            timeout: Maximum seconds to wait for all connections to open
+
+        Returns:
+            Number of connections opened whose health check succeeded
+        """
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+
+        http = self._client.get_async_httpx_client()
+        kwargs = get_api_health._get_kwargs()
+        # Every request must open its own connection, not join another's flight
+        kwargs["extensions"] = {NO_COALESCE: True}
+        arrived = 0
+        all_arrived = asyncio.Event()
+
+        async def _open() -> bool:
+            nonlocal arrived
+            async with contextlib.AsyncExitStack() as stack:
+                response: httpx.Response | None = None
+                with contextlib.suppress(httpx.HTTPError):
+                    response = await stack.enter_async_context(http.stream(**kwargs))
+                arrived += 1
+                if arrived == n_connections:
+                    all_arrived.set()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(all_arrived.wait(), timeout)
+                if response is None:
+                    return False
+                try:
+                    await response.aread()
+                except httpx.HTTPError:
+                    return False
+            return response.is_success
+
+        results = await asyncio.gather(*(_open() for _ in range(n_connections)))
+        return sum(results)
+
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get cold vs warm request timings.
+
+        Requires ``track_latency=True``. A request is cold when it opened a new
+        connection and warm when it reused a pooled one.
+
+        Returns:
+            Dictionary with ``cold`` and ``warm`` entries, each holding
+            ``requests``, ``mean_ms``, ``max_ms``, ``total_ms`` and ``connect_ms``
+        """
+        if self._latency is None:
+            raise RuntimeError("Latency tracking is disabled; create the client with track_latency=True")
+        return self._latency.snapshot()
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get response cache counters.
+
+        Requires a ``cache`` backend.
+
+        Returns:
+            Dictionary with ``hits``, ``misses``, ``revalidated``, ``stores``
+            and ``invalidations``
+        """
+        if self._cache is None:
+            raise RuntimeError("Response caching is disabled; create the client with a cache backend")
+        return self._cache.stats.to_dict()
+
+    def clear_cache(self) -> None:
+        """Remove every cached response (no-op when caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def close(self):
         """Close the underlying HTTP client."""
         if self._client._client:
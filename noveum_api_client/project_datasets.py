@@ -0,0 +1,314 @@
+"""
+Bulk reconciliation of project ↔ dataset associations.
+
+``POST /api/v1/projects/{id}/datasets/associate`` and
+``DELETE /api/v1/projects/{id}/datasets/{dataset_id}`` change one pair at a
+time. ``reconcile_associations(client, desired)`` takes the desired datasets
+of every project instead and applies only the difference:
+
+* **current state**: ``GET /api/v1/projects/{id}/datasets/associated`` is
+  fetched for all projects of ``desired`` concurrently;
+* **minimal plan**: ``plan_associations`` diffs current against desired;
+  pairs that already match cost no request;
+* **parallel apply**: associate and remove calls run in a bounded thread
+  pool, each retried for transient failures. "Already associated" (409) and
+  "already removed" (404) count as done;
+* **dry run**: with ``dry_run=True`` the plan is returned without changing
+  anything.
+
+Only projects listed in ``desired`` are touched. Datasets associated with
+them but not listed are removed, unless ``prune=False``.
+
+Example:
+    ```python
+    from noveum_api_client.project_datasets import reconcile_associations
+
+    desired = {"project-1": {"dataset-a", "dataset-b"}, "project-2": set()}
+    plan = reconcile_associations(client, desired, dry_run=True).plan
+    print(plan.to_dict())
+    result = reconcile_associations(client, desired)
+    print(result.associated, result.removed, result.failed)
+    ```
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from ._utils import call_with_retry, parse_json, record_field, run_bounded, send_raw, unwrap
+from .api.projects import (
+    delete_api_v1_projects_by_id_datasets_by_dataset_id,
+    get_api_v1_projects_by_id_datasets_associated,
+    post_api_v1_projects_by_id_datasets_associate,
+)
+from .client import AuthenticatedClient, Client
+from .types import UNSET, Unset
+
+Action = Literal["associate", "remove"]
+# (action, project ID, dataset ID)
+Change = tuple[Action, str, str]
+
+# Statuses meaning the change is already in effect
+_DONE_STATUSES = {"associate": 409, "remove": 404}
+
+
+@define
+class AssociationPlan:
+    """Changes needed to turn the current associations into the desired ones."""
+
+    associate: list[tuple[str, str]] = field(factory=list)
+    remove: list[tuple[str, str]] = field(factory=list)
+    unchanged: int = 0
+
+    @property
+    def changes(self) -> list[Change]:
+        return [("associate", p, d) for p, d in self.associate] + [("remove", p, d) for p, d in self.remove]
+
+    def __bool__(self) -> bool:
+        return bool(self.associate or self.remove)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "associate": [list(pair) for pair in self.associate],
+            "remove": [list(pair) for pair in self.remove],
+            "unchanged": self.unchanged,
+        }
+
+
+@define
+class ReconcileResult:
+    """Outcome of one ``reconcile_associations`` call."""
+
+    plan: AssociationPlan
+    dry_run: bool = False
+    associated: int = 0
+    removed: int = 0
+    retries: int = 0
+    failed: list[tuple[Change, str]] = field(factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "plan": self.plan.to_dict(),
+            "dry_run": self.dry_run,
+            "associated": self.associated,
+            "removed": self.removed,
+            "retries": self.retries,
+            "failed": [{"action": a, "project_id": p, "dataset_id": d, "error": e} for (a, p, d), e in self.failed],
+        }
+
+
+def _dataset_id(record: Any) -> str:
+    if isinstance(record, str):
+        return record
+    return str(record_field(record, "dataset_id") or record_field(record, "id"))
+
+
+def fetch_associated(
+    client: AuthenticatedClient | Client,
+    project_id: str,
+    *,
+    organization_slug: str | Unset = UNSET,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> set[str]:
+    """
+    Get the IDs of the datasets associated with a project.
+
+    Raises:
+        errors.UnexpectedStatus: If the associations cannot be fetched.
+    """
+    response, _ = call_with_retry(
+        lambda: get_api_v1_projects_by_id_datasets_associated.sync_detailed(
+            project_id, client=client, organization_slug=organization_slug
+        ),
+        max_retries=max_retries,
+        backoff=retry_backoff,
+    )
+    records = unwrap(unwrap(parse_json(response), "data"), "datasets") or []
+    return {_dataset_id(record) for record in records}
+
+
+def fetch_associations(
+    client: AuthenticatedClient | Client,
+    project_ids: Iterable[str],
+    *,
+    concurrency: int = 8,
+    **options: Any,
+) -> dict[str, set[str]]:
+    """
+    Get the associated dataset IDs of several projects concurrently.
+
+    Args:
+        client: API client
+        project_ids: Project IDs
+        concurrency: Requests in flight
+        **options: ``fetch_associated`` options
+
+    Returns:
+        Dataset IDs per project ID
+
+    Raises:
+        errors.UnexpectedStatus: If any project's associations cannot be fetched.
+    """
+    current: dict[str, set[str]] = {}
+
+    def store(project_id: str, dataset_ids: set[str]) -> None:
+        current[project_id] = dataset_ids
+
+    client.get_httpx_client()
+    run_bounded(
+        lambda project_id: fetch_associated(client, project_id, **options),
+        dict.fromkeys(project_ids),
+        store,
+        concurrency=concurrency,
+    )
+    return current
+
+
+def plan_associations(
+    current: Mapping[str, Iterable[str]], desired: Mapping[str, Iterable[str]], *, prune: bool = True
+) -> AssociationPlan:
+    """
+    Diff current associations against desired ones.
+
+    Args:
+        current: Associated dataset IDs per project ID
+        desired: Wanted dataset IDs per project ID; projects missing here are
+            left alone
+        prune: Remove associations of desired projects that are not wanted
+
+    Returns:
+        ``AssociationPlan`` with the pairs to associate and remove, sorted
+    """
+    plan = AssociationPlan()
+    for project_id, wanted in desired.items():
+        have = set(current.get(project_id, ()))
+        want = set(wanted)
+        plan.associate.extend((project_id, dataset_id) for dataset_id in sorted(want - have))
+        if prune:
+            plan.remove.extend((project_id, dataset_id) for dataset_id in sorted(have - want))
+        plan.unchanged += len(want & have)
+    return plan
+
+
+def apply_change(
+    client: AuthenticatedClient | Client,
+    change: Change,
+    *,
+    organization_slug: str | Unset = UNSET,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> int:
+    """
+    Associate or remove one project ↔ dataset pair.
+
+    Returns:
+        The number of retries it took
+
+    Raises:
+        errors.UnexpectedStatus: If the change fails permanently.
+    """
+    action, project_id, dataset_id = change
+    if action == "associate":
+        body = json.dumps({"datasetId": dataset_id}).encode()
+
+        def send() -> Any:
+            return send_raw(
+                post_api_v1_projects_by_id_datasets_associate,
+                client,
+                body,
+                project_id,
+                organization_slug=organization_slug,
+            )
+
+    else:
+
+        def send() -> Any:
+            return delete_api_v1_projects_by_id_datasets_by_dataset_id.sync_detailed(
+                project_id, dataset_id, client=client, organization_slug=organization_slug
+            )
+
+    try:
+        _, retries = call_with_retry(send, max_retries=max_retries, backoff=retry_backoff)
+    except errors.UnexpectedStatus as exc:
+        if exc.status_code != _DONE_STATUSES[action]:
+            raise
+        retries = 0
+    return retries
+
+
+def reconcile_associations(
+    client: AuthenticatedClient | Client,
+    desired: Mapping[str, Iterable[str]],
+    *,
+    dry_run: bool = False,
+    prune: bool = True,
+    concurrency: int = 8,
+    organization_slug: str | Unset = UNSET,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> ReconcileResult:
+    """
+    Make project ↔ dataset associations match ``desired`` with as few calls as possible.
+
+    Args:
+        client: API client
+        desired: Wanted dataset IDs per project ID; projects missing here are
+            left alone
+        dry_run: Only fetch the current state and return the plan
+        prune: Remove associations of desired projects that are not wanted
+        concurrency: Requests in flight, both while fetching and applying
+        organization_slug: Organization the projects belong to
+        max_retries: Retries per request for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``ReconcileResult`` with the plan and what was applied; changes that
+        failed are listed in ``failed`` with their error
+
+    Raises:
+        errors.UnexpectedStatus: If the current associations cannot be fetched.
+    """
+    options: dict[str, Any] = {
+        "organization_slug": organization_slug,
+        "max_retries": max_retries,
+        "retry_backoff": retry_backoff,
+    }
+    current = fetch_associations(client, desired, concurrency=concurrency, **options)
+    result = ReconcileResult(plan_associations(current, desired, prune=prune), dry_run=dry_run)
+    if dry_run:
+        return result
+
+    def send(change: Change) -> tuple[int, str | None]:
+        try:
+            return apply_change(client, change, **options), None
+        except (errors.UnexpectedStatus, httpx.HTTPError) as exc:
+            return 0, f"{type(exc).__name__}: {exc}"
+
+    def finish(change: Change, outcome: tuple[int, str | None]) -> None:
+        retries, error = outcome
+        result.retries += retries
+        if error is not None:
+            result.failed.append((change, error))
+        elif change[0] == "associate":
+            result.associated += 1
+        else:
+            result.removed += 1
+
+    run_bounded(send, result.plan.changes, finish, concurrency=concurrency)
+    return result
+
+
+__all__ = [
+    "AssociationPlan",
+    "ReconcileResult",
+    "apply_change",
+    "fetch_associated",
+    "fetch_associations",
+    "plan_associations",
+    "reconcile_associations",
+]
@@ -0,0 +1,337 @@
+"""
+Project health matrix for dashboards.
+
+An ops dashboard needs ``GET /api/v1/projects/{id}/health`` for every
+project and environment, plus
+``GET /api/v1/projects/{id}/health/scorers/{scorer_id}`` for every scorer on
+top. ``HealthMonitor.fetch(projects, scorers, environments)`` issues all of
+them at once:
+
+* **bounded fan-out**: cells are fetched in a thread pool of at most
+  ``concurrency`` requests;
+* **single-flight**: a cell already being fetched, by this call or by a
+  concurrent refresh, is awaited instead of requested again;
+* **short TTL cache**: cells fetched less than ``ttl`` seconds ago are served
+  from memory, so refreshing the dashboard every few seconds stays cheap;
+* **compact result**: ``HealthMatrix`` keeps the cells in flat lists indexed
+  by project, scorer and environment position, with failed cells recorded in
+  ``errors`` instead of failing the whole matrix.
+
+Example:
+    ```python
+    from noveum_api_client.project_health import HealthMonitor
+
+    monitor = HealthMonitor(client, ttl=5)
+    matrix = monitor.fetch(scorers=["accuracy_scorer"], environments=["production", "staging"])
+    for project_id in matrix.projects:
+        print(project_id, matrix.project(project_id, "production"))
+        print(matrix.scorer(project_id, "accuracy_scorer", "production"))
+    ```
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from ._utils import call_with_retry, parse_json, record_field, run_bounded, send_unparsed, unwrap
+from .api.projects import (
+    get_api_v1_projects,
+    get_api_v1_projects_by_id_health,
+    get_api_v1_projects_by_id_health_scorers_by_scorer_id,
+)
+from .client import AuthenticatedClient, Client
+from .types import UNSET, Unset
+
+# (project ID, scorer ID or None for the project itself, environment or None for all)
+CellKey = tuple[str, str | None, str | None]
+
+
+@define
+class HealthStats:
+    """Request counters of a ``HealthMonitor``."""
+
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"requests": self.requests, "hits": self.hits, "coalesced": self.coalesced}
+
+
+@define
+class HealthMatrix:
+    """
+    Health of projects × scorers × environments.
+
+    ``health`` holds one cell per project and environment, ``scorer_health``
+    one per project, scorer and environment, both in row-major order. Cells
+    are the endpoints' JSON payloads; ``None`` when the server has no data
+    (404) or the request failed, in which case ``errors`` has the reason.
+    """
+
+    projects: tuple[str, ...]
+    scorers: tuple[str, ...]
+    environments: tuple[str | None, ...]
+    health: list[Any]
+    scorer_health: list[Any]
+    errors: dict[CellKey, str] = field(factory=dict)
+    fetched_at: float = 0.0
+
+    def _position(self, project_id: str, environment: str | None) -> tuple[int, int]:
+        return self.projects.index(project_id), self.environments.index(environment)
+
+    def project(self, project_id: str, environment: str | None = None) -> Any:
+        """Health cell of a project in an environment (``None``: all environments)."""
+        p, e = self._position(project_id, environment)
+        return self.health[p * len(self.environments) + e]
+
+    def scorer(self, project_id: str, scorer_id: str, environment: str | None = None) -> Any:
+        """Health cell of a scorer in a project and environment."""
+        p, e = self._position(project_id, environment)
+        s = self.scorers.index(scorer_id)
+        return self.scorer_health[(p * len(self.scorers) + s) * len(self.environments) + e]
+
+    def rows(self) -> list[dict[str, Any]]:
+        """One dict per cell, project cells first (``scorer_id`` is ``None`` for them)."""
+        rows = []
+        for project_id in self.projects:
+            for environment in self.environments:
+                rows.append(self._row(project_id, None, environment, self.project(project_id, environment)))
+        for project_id in self.projects:
+            for scorer_id in self.scorers:
+                for environment in self.environments:
+                    cell = self.scorer(project_id, scorer_id, environment)
+                    rows.append(self._row(project_id, scorer_id, environment, cell))
+        return rows
+
+    def _row(self, project_id: str, scorer_id: str | None, environment: str | None, cell: Any) -> dict[str, Any]:
+        return {
+            "project_id": project_id,
+            "scorer_id": scorer_id,
+            "environment": environment,
+            "health": cell,
+            "error": self.errors.get((project_id, scorer_id, environment)),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "projects": list(self.projects),
+            "scorers": list(self.scorers),
+            "environments": list(self.environments),
+            "fetched_at": self.fetched_at,
+            "cells": self.rows(),
+        }
+
+
+class HealthMonitor:
+    """
+    Fetches health matrices with a short-lived cell cache shared by all calls.
+
+    Args:
+        client: API client
+        ttl: Seconds a fetched cell (and the project list) is served from memory
+        concurrency: Most health requests in flight per ``fetch``
+        organization_slug: Organization the projects belong to
+        max_retries: Retries per cell for transient failures
+        retry_backoff: Base delay in seconds between retries
+    """
+
+    def __init__(
+        self,
+        client: AuthenticatedClient | Client,
+        *,
+        ttl: float = 5.0,
+        concurrency: int = 8,
+        organization_slug: str | Unset = UNSET,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+    ):
+        self._client = client
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.organization_slug = organization_slug
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.stats = HealthStats()
+        self._lock = threading.Lock()
+        self._cells: dict[CellKey, tuple[Any, float]] = {}
+        self._flights: dict[CellKey, Future[Any]] = {}
+        self._projects: tuple[list[str], float] | None = None
+
+    def _send(self, key: CellKey) -> Any:
+        project_id, scorer_id, environment = key
+        options: dict[str, Any] = {
+            "client": self._client,
+            "organization_slug": self.organization_slug,
+            "environment": environment if environment is not None else UNSET,
+        }
+        if scorer_id is None:
+            endpoint: Any = get_api_v1_projects_by_id_health
+            args: tuple[str, ...] = (project_id,)
+        else:
+            endpoint = get_api_v1_projects_by_id_health_scorers_by_scorer_id
+            args = (project_id, scorer_id)
+        try:
+            response, _ = call_with_retry(
+                lambda: endpoint.sync_detailed(*args, **options),
+                max_retries=self.max_retries,
+                backoff=self.retry_backoff,
+            )
+        except errors.UnexpectedStatus as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+        return unwrap(parse_json(response), "data")
+
+    def cell(self, key: CellKey) -> Any:
+        """
+        Get one cell, from memory while fresh, joining an identical in-flight fetch.
+
+        Raises:
+            errors.UnexpectedStatus: If the cell cannot be fetched.
+            httpx.TransportError: If the final attempt failed to connect.
+        """
+        with self._lock:
+            cached = self._cells.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self.ttl:
+                self.stats.hits += 1
+                return cached[0]
+            following = self._flights.get(key)
+            if following is None:
+                flight: Future[Any] = Future()
+                self._flights[key] = flight
+                self.stats.requests += 1
+            else:
+                self.stats.coalesced += 1
+        if following is not None:
+            return following.result()
+        try:
+            value = self._send(key)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(value)
+            with self._lock:
+                self._cells[key] = (value, time.monotonic())
+            return value
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def project_ids(self) -> list[str]:
+        """IDs of every project, listed at most once per ``ttl``."""
+        with self._lock:
+            if self._projects is not None and time.monotonic() - self._projects[1] < self.ttl:
+                return self._projects[0]
+        response, _ = call_with_retry(
+            lambda: send_unparsed(get_api_v1_projects, self._client, organization_slug=self.organization_slug),
+            max_retries=self.max_retries,
+            backoff=self.retry_backoff,
+        )
+        records = unwrap(parse_json(response), "data") or []
+        ids = [str(record_field(record, "id")) for record in records]
+        with self._lock:
+            self._projects = (ids, time.monotonic())
+        return ids
+
+    def fetch(
+        self,
+        projects: Iterable[str] | None = None,
+        scorers: Iterable[str] = (),
+        environments: Iterable[str | None] | None = None,
+    ) -> HealthMatrix:
+        """
+        Fetch the health of every project, scorer and environment combination.
+
+        Args:
+            projects: Project IDs (default: every project)
+            scorers: Scorer IDs to add per-scorer health for
+            environments: Environments (default: only the all-environments
+                view, which ``None`` also stands for)
+
+        Returns:
+            ``HealthMatrix`` of all cells; failed cells are ``None`` with the
+            error in ``HealthMatrix.errors``
+
+        Raises:
+            errors.UnexpectedStatus: If ``projects`` is omitted and the
+                project list cannot be fetched.
+        """
+        project_ids = tuple(dict.fromkeys(self.project_ids() if projects is None else projects))
+        scorer_ids = tuple(dict.fromkeys(scorers))
+        envs = tuple(dict.fromkeys(environments)) if environments is not None else (None,)
+        keys: list[CellKey] = [(p, None, e) for p in project_ids for e in envs]
+        keys += [(p, s, e) for p in project_ids for s in scorer_ids for e in envs]
+        values: dict[CellKey, Any] = {}
+        failures: dict[CellKey, str] = {}
+
+        def fetch_cell(key: CellKey) -> tuple[Any, str | None]:
+            try:
+                return self.cell(key), None
+            except (errors.UnexpectedStatus, httpx.HTTPError) as exc:
+                return None, f"{type(exc).__name__}: {exc}"
+
+        def store(key: CellKey, outcome: tuple[Any, str | None]) -> None:
+            values[key], error = outcome
+            if error is not None:
+                failures[key] = error
+
+        # Create the shared httpx client before the worker threads race to do so
+        self._client.get_httpx_client()
+        run_bounded(fetch_cell, keys, store, concurrency=self.concurrency)
+        return HealthMatrix(
+            projects=project_ids,
+            scorers=scorer_ids,
+            environments=envs,
+            health=[values[key] for key in keys[: len(project_ids) * len(envs)]],
+            scorer_health=[values[key] for key in keys[len(project_ids) * len(envs) :]],
+            errors=failures,
+            fetched_at=time.time(),
+        )
+
+    def clear(self) -> None:
+        """Forget every cached cell and the project list."""
+        with self._lock:
+            self._cells.clear()
+            self._projects = None
+
+
+def fetch_health_matrix(
+    client: AuthenticatedClient | Client,
+    projects: Iterable[str] | None = None,
+    scorers: Iterable[str] = (),
+    environments: Iterable[str | None] | None = None,
+    **options: Any,
+) -> HealthMatrix:
+    """
+    Fetch a health matrix once, without keeping a cache.
+
+    Use a long-lived ``HealthMonitor`` to refresh a dashboard repeatedly.
+
+    Args:
+        client: API client
+        projects: Project IDs (default: every project)
+        scorers: Scorer IDs to add per-scorer health for
+        environments: Environments (default: the all-environments view)
+        **options: ``HealthMonitor`` options such as ``concurrency``
+
+    Returns:
+        ``HealthMatrix`` of all cells
+    """
+    return HealthMonitor(client, **options).fetch(projects, scorers, environments)
+
+
+__all__ = [
+    "CellKey",
+    "HealthMatrix",
+    "HealthMonitor",
+    "HealthStats",
+    "fetch_health_matrix",
+]
@@ -0,0 +1,181 @@
+"""
+Index of existing scorer results, for incremental evaluations.
+
+``ResultKeyIndex`` records which ``(item_id, scorer_id)`` pairs of a dataset
+already have a result, and when each was written. It is built by paging
+through ``GET /api/v1/scorers/results`` once, and stored as a dense
+item × scorer matrix of timestamps: item IDs are kept once, scorer IDs are
+columns, and each key costs 8 bytes (``NaN`` marks a missing result).
+
+``EvaluationRunner(incremental=True)`` uses the index to score only the
+pairs that are missing or stale: written before ``stale_before``, or before
+the item's own ``updated_at``.
+
+Example:
+    ```python
+    from noveum_api_client.result_index import ResultKeyIndex
+
+    index = ResultKeyIndex.fetch(client, "my-dataset", ["exact-match", "llm-judge"])
+    print(len(index), index.missing(item))
+    ```
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+from dateutil.parser import isoparse
+
+from ._utils import record_field
+from .client import AuthenticatedClient, Client
+from .dataset_cache import _item_id
+from .result_stream import iter_results
+from .types import UNSET, Unset
+
+_MISSING = math.nan
+# Timestamp of results that do not report when they were written: never stale by age
+_UNKNOWN = math.inf
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Convert an ISO-8601 string or datetime to epoch seconds (``None`` if absent or invalid)."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return isoparse(value).timestamp()
+    except ValueError:
+        return None
+
+
+def iter_result_records(
+    client: AuthenticatedClient | Client,
+    *,
+    dataset_slug: str | Unset = UNSET,
+    scorer_id: str | Unset = UNSET,
+    organization_slug: str | Unset = UNSET,
+    page_size: int | None = None,
+    shards: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """Yield every raw scorer result record matching the filters (see ``result_stream.iter_results``)."""
+    return iter_results(
+        client,
+        dataset_slug=dataset_slug,
+        scorer_id=scorer_id,
+        organization_slug=organization_slug,
+        page_size=page_size,
+        shards=shards,
+        raw=True,
+    )
+
+
+class ResultKeyIndex:
+    """
+    Existing results of one dataset, keyed by ``(item_id, scorer_id)``.
+
+    Args:
+        scorer_ids: Scorers tracked by the index; results of other scorers
+            are ignored
+    """
+
+    def __init__(self, scorer_ids: Iterable[str]):
+        self.scorer_ids = list(dict.fromkeys(scorer_ids))
+        self._columns = {scorer_id: column for column, scorer_id in enumerate(self.scorer_ids)}
+        self._rows: dict[str, int] = {}
+        self._scored_at = array("d")
+        self._count = 0
+
+    @classmethod
+    def fetch(
+        cls,
+        client: AuthenticatedClient | Client,
+        dataset_slug: str,
+        scorer_ids: Iterable[str],
+        *,
+        organization_slug: str | Unset = UNSET,
+        page_size: int | None = None,
+        shards: int = 4,
+    ) -> "ResultKeyIndex":
+        """
+        Build the index from the results stored for ``dataset_slug``.
+
+        Pages are fetched ``shards`` at a time once the total is known;
+        ``page_size`` fixes the otherwise adaptive page size.
+
+        Raises:
+            errors.UnexpectedStatus: If listing the results fails.
+        """
+        index = cls(scorer_ids)
+        # A single scorer can be filtered server-side; otherwise one pass over the dataset serves all
+        scorer_filter = index.scorer_ids[0] if len(index.scorer_ids) == 1 else UNSET
+        for record in iter_result_records(
+            client,
+            dataset_slug=dataset_slug,
+            scorer_id=scorer_filter,
+            organization_slug=organization_slug,
+            page_size=page_size,
+            shards=shards,
+        ):
+            index.add_record(record)
+        return index
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return self.scored_at(*key) is not None
+
+    def add(self, item_id: str, scorer_id: str, scored_at: float | None = None) -> None:
+        """Record a result; ``scored_at`` is in epoch seconds (``None``: unknown)."""
+        column = self._columns.get(scorer_id)
+        if column is None:
+            return
+        row = self._rows.get(item_id)
+        if row is None:
+            row = self._rows[item_id] = len(self._rows)
+            self._scored_at.extend([_MISSING] * len(self.scorer_ids))
+        position = row * len(self.scorer_ids) + column
+        if math.isnan(self._scored_at[position]):
+            self._count += 1
+        self._scored_at[position] = _UNKNOWN if scored_at is None else scored_at
+
+    def add_record(self, record: Mapping[str, Any]) -> None:
+        """Record a raw result record as returned by the API."""
+        scored_at = parse_timestamp(record_field(record, "updated_at") or record_field(record, "created_at"))
+        self.add(str(record_field(record, "item_id")), str(record_field(record, "scorer_id")), scored_at)
+
+    def scored_at(self, item_id: str, scorer_id: str) -> float | None:
+        """Epoch seconds the result was written (``inf`` if unknown), or ``None`` if there is none."""
+        row = self._rows.get(item_id)
+        column = self._columns.get(scorer_id)
+        if row is None or column is None:
+            return None
+        value = self._scored_at[row * len(self.scorer_ids) + column]
+        return None if math.isnan(value) else value
+
+    def missing(self, item: Mapping[str, Any], stale_before: float | None = None) -> list[str]:
+        """
+        Scorers that still need to score ``item``.
+
+        A result counts as stale when it was written before ``stale_before``
+        (epoch seconds) or before the item's ``updated_at``.
+        """
+        row = self._rows.get(_item_id(item))
+        if row is None:
+            return list(self.scorer_ids)
+        cutoff = parse_timestamp(record_field(item, "updated_at"))
+        if stale_before is not None:
+            cutoff = stale_before if cutoff is None else max(cutoff, stale_before)
+        start = row * len(self.scorer_ids)
+        row_values = self._scored_at[start : start + len(self.scorer_ids)]
+        return [
+            scorer_id
+            for scorer_id, scored_at in zip(self.scorer_ids, row_values, strict=True)
+            if math.isnan(scored_at) or (cutoff is not None and scored_at < cutoff)
+        ]
+
+
+__all__ = ["ResultKeyIndex", "iter_result_records", "parse_timestamp"]
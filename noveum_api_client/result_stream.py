@@ -0,0 +1,362 @@
+"""
+Streaming iteration over scorer results.
+
+``iter_results`` (and its async twin ``aiter_results``) pages through
+``GET /api/v1/scorers/results`` with the filters pushed down to the server,
+and yields one ``ResultRecord`` per result:
+
+* **prefetch**: the next ``prefetch`` pages are requested while the current
+  one is being consumed;
+* **adaptive page size**: the page size follows the observed per-result
+  latency and payload size, aiming at ``target_seconds`` and ``max_bytes``
+  per page (grows at most 2x per page, shrinks immediately);
+* **server caps**: a page cut short by a server-side ``limit`` cap clamps
+  the page size, and the records it left out are requested before the
+  next page is yielded;
+* **offset shards**: once the first page reports the total count, up to
+  ``shards`` pages are fetched in parallel. Records are still yielded in
+  offset order.
+
+Example:
+    ```python
+    from noveum_api_client.result_stream import iter_results
+
+    for result in iter_results(client, dataset_slug="my-dataset", shards=4):
+        print(result.item_id, result.scorer_id, result.score)
+    ```
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from attrs import define
+
+from ._utils import page_total, parse_json, unwrap
+from .api.scorer_results import get_api_v1_scorers_results
+from .client import AuthenticatedClient, Client
+from .types import UNSET, Unset
+
+DEFAULT_PAGE_SIZE = 500
+MIN_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 5000
+
+
+@define(frozen=True)
+class ResultRecord:
+    """One scorer result."""
+
+    dataset_slug: str
+    item_id: str
+    scorer_id: str
+    score: float
+    passed: bool
+    execution_time_ms: float | None = None
+    error: str | None = None
+    metadata: dict[str, Any] | None = None
+    updated_at: str | None = None
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "ResultRecord":
+        """Build a record from an API result (camelCase or snake_case keys)."""
+        get = record.get
+        return cls(
+            dataset_slug=get("datasetSlug") or get("dataset_slug") or "",
+            item_id=get("itemId") or get("item_id") or "",
+            scorer_id=get("scorerId") or get("scorer_id") or "",
+            score=float(get("score") or 0.0),
+            passed=bool(get("passed")),
+            execution_time_ms=get("executionTimeMs", get("execution_time_ms")),
+            error=get("error") or None,
+            metadata=get("metadata"),
+            updated_at=get("updatedAt") or get("updated_at") or get("createdAt") or get("created_at"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """The result as a snake_case dict, e.g. for ``upsert_results``."""
+        data = {
+            "dataset_slug": self.dataset_slug,
+            "item_id": self.item_id,
+            "scorer_id": self.scorer_id,
+            "score": self.score,
+            "passed": self.passed,
+        }
+        for name in ("execution_time_ms", "error", "metadata"):
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
+
+class AdaptivePageSize:
+    """
+    Page size tuned from observed page latency and payload size.
+
+    Args:
+        initial: First page size
+        minimum: Smallest page size
+        maximum: Largest page size
+        target_seconds: Aimed-at time per page request
+        max_bytes: Aimed-at response size per page
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_PAGE_SIZE,
+        minimum: int = MIN_PAGE_SIZE,
+        maximum: int = MAX_PAGE_SIZE,
+        target_seconds: float = 0.5,
+        max_bytes: int = 4 * 1024 * 1024,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self.size = max(minimum, min(initial, maximum))
+
+    def observe(self, items: int, seconds: float, nbytes: int) -> None:
+        """Record one page of ``items`` results that took ``seconds`` and ``nbytes``."""
+        if not items:
+            return
+        ideal = float(self.maximum)
+        if seconds > 0:
+            ideal = min(ideal, self.target_seconds * items / seconds)
+        if nbytes > 0:
+            ideal = min(ideal, self.max_bytes * items / nbytes)
+        self.size = int(max(self.minimum, min(ideal, self.size * 2, self.maximum)))
+
+
+@define
+class _Page:
+    offset: int
+    limit: int
+    records: list[dict[str, Any]]
+    total: int | None
+    seconds: float
+    nbytes: int
+
+
+class _PagePlan:
+    """Offsets to request next, given what the pages returned so far."""
+
+    def __init__(self, sizer: AdaptivePageSize):
+        self.sizer = sizer
+        self.total: int | None = None
+        self.next_offset = 0
+        self.done = False
+        # Largest page the server returned in full, i.e. a lower bound of its cap
+        self.full_limit = 0
+
+    def start(self, first: _Page) -> tuple[bool, tuple[int, int] | None]:
+        """Record the first page, see ``finish()``."""
+        self.total = first.total
+        self.next_offset = first.offset + first.limit
+        return self.finish(first)
+
+    def next_request(self) -> tuple[int, int] | None:
+        if self.done or (self.total is not None and self.next_offset >= self.total):
+            return None
+        request = self.next_offset, self.sizer.size
+        self.next_offset += request[1]
+        return request
+
+    def finish(self, page: _Page) -> tuple[bool, tuple[int, int] | None]:
+        """
+        Record a page.
+
+        Returns:
+            Whether it is the last page, and the ``(offset, limit)`` of the
+            records it should have held but did not, which must be requested
+            (and yielded) before the next page
+        """
+        received = len(page.records)
+        self.sizer.observe(received, page.seconds, page.nbytes)
+        end = page.offset + received
+        if received == page.limit:
+            self.full_limit = max(self.full_limit, received)
+        if (
+            not received
+            or (self.total is not None and end >= self.total)
+            or (self.total is None and received < page.limit <= self.full_limit)
+        ):
+            self.done = True
+            return True, None
+        if received < page.limit:
+            # The server capped the page size; without a total a short page
+            # may also be the last one, which the gap request then tells
+            self.sizer.maximum = received
+            self.sizer.minimum = min(self.sizer.minimum, received)
+            self.sizer.size = min(self.sizer.size, received)
+            return False, (end, page.limit - received)
+        return False, None
+
+
+def _page(response: Any, offset: int, limit: int, started: float) -> _Page:
+    data = parse_json(response)
+    records = unwrap(data, "results") or []
+    return _Page(offset, limit, records, page_total(data), time.perf_counter() - started, len(response.content))
+
+
+def _converted(records: list[dict[str, Any]], raw: bool) -> Iterator[Any]:
+    return iter(records) if raw else map(ResultRecord.from_dict, records)
+
+
+def _sizer(page_size: int | None) -> AdaptivePageSize:
+    if page_size is None:
+        return AdaptivePageSize()
+    return AdaptivePageSize(page_size, minimum=page_size, maximum=page_size)
+
+
+def iter_results(
+    client: AuthenticatedClient | Client,
+    *,
+    dataset_slug: str | Unset = UNSET,
+    item_id: str | Unset = UNSET,
+    scorer_id: str | Unset = UNSET,
+    organization_slug: str | Unset = UNSET,
+    page_size: int | None = None,
+    prefetch: int = 1,
+    shards: int = 1,
+    raw: bool = False,
+) -> Iterator[Any]:
+    """
+    Iterate over every scorer result matching the filters.
+
+    Args:
+        client: API client
+        dataset_slug: Only results of this dataset
+        item_id: Only results of this item
+        scorer_id: Only results of this scorer
+        organization_slug: Organization to read from
+        page_size: Fixed page size (default: adaptive)
+        prefetch: Pages requested ahead of the one being consumed
+        shards: Pages fetched in parallel once the total count is known
+        raw: Yield the API's result dicts instead of ``ResultRecord`` objects
+
+    Yields:
+        ``ResultRecord`` (or dict) per result, in offset order
+
+    Raises:
+        errors.UnexpectedStatus: If a page request fails.
+    """
+    filters = {
+        "dataset_slug": dataset_slug,
+        "item_id": item_id,
+        "scorer_id": scorer_id,
+        "organization_slug": organization_slug,
+    }
+
+    def fetch(offset: int, limit: int) -> _Page:
+        started = time.perf_counter()
+        response = get_api_v1_scorers_results.sync_detailed(client=client, limit=limit, offset=offset, **filters)
+        return _page(response, offset, limit, started)
+
+    plan = _PagePlan(_sizer(page_size))
+    first = fetch(0, plan.sizer.size)
+    last, gap = plan.start(first)
+    yield from _converted(first.records, raw)
+    if last:
+        return
+    depth = max(prefetch, shards if plan.total is not None else 1, 1)
+
+    # Create the shared httpx client before the worker threads race to do so
+    client.get_httpx_client()
+    window: deque[Future[_Page]] = deque()
+
+    def fill() -> None:
+        while len(window) < depth and (request := plan.next_request()) is not None:
+            window.append(pool.submit(fetch, *request))
+
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        try:
+            if gap is not None:
+                window.append(pool.submit(fetch, *gap))
+            fill()
+            while window:
+                page = window.popleft().result()
+                last, gap = plan.finish(page)
+                if gap is not None:
+                    window.appendleft(pool.submit(fetch, *gap))
+                if not last:
+                    fill()
+                yield from _converted(page.records, raw)
+                if last:
+                    return
+        finally:
+            for future in window:
+                future.cancel()
+
+
+async def aiter_results(
+    client: AuthenticatedClient | Client,
+    *,
+    dataset_slug: str | Unset = UNSET,
+    item_id: str | Unset = UNSET,
+    scorer_id: str | Unset = UNSET,
+    organization_slug: str | Unset = UNSET,
+    page_size: int | None = None,
+    prefetch: int = 1,
+    shards: int = 1,
+    raw: bool = False,
+) -> AsyncIterator[Any]:
+    """Async version of ``iter_results``."""
+    filters = {
+        "dataset_slug": dataset_slug,
+        "item_id": item_id,
+        "scorer_id": scorer_id,
+        "organization_slug": organization_slug,
+    }
+
+    async def fetch(offset: int, limit: int) -> _Page:
+        started = time.perf_counter()
+        response = await get_api_v1_scorers_results.asyncio_detailed(
+            client=client, limit=limit, offset=offset, **filters
+        )
+        return _page(response, offset, limit, started)
+
+    plan = _PagePlan(_sizer(page_size))
+    first = await fetch(0, plan.sizer.size)
+    last, gap = plan.start(first)
+    for record in _converted(first.records, raw):
+        yield record
+    if last:
+        return
+    depth = max(prefetch, shards if plan.total is not None else 1, 1)
+    window: deque[asyncio.Task[_Page]] = deque()
+
+    def fill() -> None:
+        while len(window) < depth and (request := plan.next_request()) is not None:
+            window.append(asyncio.create_task(fetch(*request)))
+
+    try:
+        if gap is not None:
+            window.append(asyncio.create_task(fetch(*gap)))
+        fill()
+        while window:
+            page = await window.popleft()
+            last, gap = plan.finish(page)
+            if gap is not None:
+                window.appendleft(asyncio.create_task(fetch(*gap)))
+            if not last:
+                fill()
+            for record in _converted(page.records, raw):
+                yield record
+            if last:
+                return
+    finally:
+        for task in window:
+            task.cancel()
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "MIN_PAGE_SIZE",
+    "AdaptivePageSize",
+    "ResultRecord",
+    "aiter_results",
+    "iter_results",
+]
@@ -0,0 +1,256 @@
+"""
+Insert-or-update of scorer results.
+
+The API creates results in batches (``POST /api/v1/scorers/results/batch``)
+but only updates them one at a time
+(``PUT /api/v1/scorers/results/{dataset}/{item}/{scorer}``).
+``upsert_results`` therefore posts every result in batches first and only
+sends the results that already exist as individual PUTs:
+
+* when the batch response lists the conflicting results (by index or by
+  key), exactly those are PUT;
+* when a batch is rejected with ``409 Conflict``, nothing of it was
+  inserted: if the response names the conflicts, those are PUT and the rest
+  is posted again as a new batch; otherwise the batch is split in halves and
+  re-posted, isolating the conflicting results in ``O(k log n)`` requests.
+
+Batches and PUTs share one thread pool, so at most ``concurrency`` requests
+are in flight at any time.
+
+Example:
+    ```python
+    from noveum_api_client.result_upsert import upsert_results
+
+    result = upsert_results(client, results, concurrency=8)
+    print(result.created, result.updated)
+    ```
+"""
+
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import islice
+from typing import Any
+
+from attrs import define
+
+from . import errors
+from ._utils import call_with_retry, record_field, run_bounded, send_raw, unwrap
+from .api.scorer_results import (
+    post_api_v1_scorers_results_batch,
+    put_api_v1_scorers_results_by_dataset_slug_by_item_id_by_scorer_id,
+)
+from .client import AuthenticatedClient, Client
+from .types import UNSET, Unset
+
+_KEY_FIELDS = ("dataset_slug", "item_id", "scorer_id")
+_VALUE_FIELDS = ("score", "passed", "metadata", "error", "execution_time_ms")
+_CAMEL = {
+    "dataset_slug": "datasetSlug",
+    "item_id": "itemId",
+    "scorer_id": "scorerId",
+    "execution_time_ms": "executionTimeMs",
+}
+_KEY_WIRE_FIELDS = frozenset(_CAMEL[name] for name in _KEY_FIELDS)
+# Response fields that may list the results a batch did not insert
+_CONFLICT_LISTS = ("conflicts", "duplicates", "existing")
+_ERROR_LISTS = ("errors", "failed", "failures")
+
+
+@define
+class UpsertResult:
+    """Counters describing one ``upsert_results`` run."""
+
+    created: int = 0
+    updated: int = 0
+    batches: int = 0
+    splits: int = 0
+    retries: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "batches": self.batches,
+            "splits": self.splits,
+            "retries": self.retries,
+        }
+
+
+def wire_result(result: Mapping[str, Any]) -> dict[str, Any]:
+    """Convert a result with snake_case or camelCase keys to the API's camelCase form."""
+    wire = {}
+    for name in (*_KEY_FIELDS, *_VALUE_FIELDS):
+        value = record_field(result, name)
+        if value is not None:
+            wire[_CAMEL.get(name, name)] = value
+    return wire
+
+
+def _key(result: Mapping[str, Any]) -> tuple[str, str, str]:
+    return result["datasetSlug"], result["itemId"], result["scorerId"]
+
+
+def _is_conflict(entry: Any) -> bool:
+    if not isinstance(entry, Mapping):
+        return False
+    if entry.get("status") == 409 or entry.get("statusCode") == 409:
+        return True
+    reason = f"{entry.get('code', '')} {entry.get('error', '')} {entry.get('message', '')}".lower()
+    return any(word in reason for word in ("conflict", "exist", "duplicate"))
+
+
+def find_conflicts(content: bytes, batch: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+    """
+    Results of ``batch`` that a batch response reports as already existing.
+
+    Entries may be indexes into the batch or objects carrying an ``index`` or
+    the result key. Returns ``None`` when the response names no conflicts.
+    """
+    try:
+        data = unwrap(json.loads(content), "data")
+    except ValueError:
+        return None
+    if not isinstance(data, Mapping):
+        return None
+    entries = [entry for name in _CONFLICT_LISTS for entry in data.get(name) or []]
+    entries += [entry for name in _ERROR_LISTS for entry in data.get(name) or [] if _is_conflict(entry)]
+    if not entries:
+        return None
+    by_key = {_key(result): result for result in batch}
+    conflicts = {}
+    for entry in entries:
+        if isinstance(entry, int) and 0 <= entry < len(batch):
+            result = batch[entry]
+        elif isinstance(entry, Mapping) and isinstance(entry.get("index"), int) and 0 <= entry["index"] < len(batch):
+            result = batch[entry["index"]]
+        elif isinstance(entry, Mapping):
+            result = by_key.get(tuple(str(record_field(entry, name)) for name in _KEY_FIELDS))
+        else:
+            result = None
+        if result is not None:
+            conflicts[_key(result)] = result
+    return list(conflicts.values()) or None
+
+
+def upsert_results(
+    client: AuthenticatedClient | Client,
+    results: Iterable[Mapping[str, Any]],
+    *,
+    batch_size: int = 100,
+    concurrency: int = 8,
+    organization_slug: str | Unset = UNSET,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> UpsertResult:
+    """
+    Create or update scorer results.
+
+    Args:
+        client: API client
+        results: Result dicts with ``dataset_slug``, ``item_id``,
+            ``scorer_id``, ``score`` and optionally ``passed``, ``metadata``,
+            ``error``, ``execution_time_ms`` (snake_case or camelCase keys)
+        batch_size: Results per batch POST (the API accepts at most 100)
+        concurrency: Requests in flight
+        organization_slug: Organization the results belong to
+        max_retries: Retries per request for transient failures
+        retry_backoff: Base delay in seconds between retries
+
+    Returns:
+        ``UpsertResult`` with created / updated counts
+
+    Raises:
+        errors.UnexpectedStatus: If a request fails permanently.
+    """
+    outcome = UpsertResult()
+    # Conflicts found by finished batches are sent before the next batch is read
+    follow_ups: deque[tuple[str, Any]] = deque()
+    wired = (wire_result(result) for result in results)
+
+    def tasks() -> Iterator[tuple[str, Any]]:
+        while True:
+            while follow_ups:
+                yield follow_ups.popleft()
+            batch = list(islice(wired, batch_size))
+            if not batch:
+                return
+            yield "batch", batch
+
+    def post(batch: list[dict[str, Any]]) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]], int]:
+        # Returns the conflicts to PUT, the results to post again and the retries
+        body = json.dumps({"results": batch}).encode()
+        try:
+            response, retries = call_with_retry(
+                lambda: send_raw(post_api_v1_scorers_results_batch, client, body, organization_slug=organization_slug),
+                max_retries=max_retries,
+                backoff=retry_backoff,
+            )
+        except errors.UnexpectedStatus as exc:
+            if exc.status_code != 409:
+                raise
+            # Rejected as a whole, so nothing was inserted: without named
+            # conflicts the batch must be split
+            conflicts = find_conflicts(exc.content, batch)
+            if conflicts is None:
+                return batch, [], 0
+            existing = {_key(result) for result in conflicts}
+            return conflicts, [result for result in batch if _key(result) not in existing], 0
+        return find_conflicts(response.content, batch) or [], [], retries
+
+    def put(result: dict[str, Any]) -> int:
+        dataset_slug, item_id, scorer_id = _key(result)
+        body = json.dumps({key: value for key, value in result.items() if key not in _KEY_WIRE_FIELDS}).encode()
+        _, retries = call_with_retry(
+            lambda: send_raw(
+                put_api_v1_scorers_results_by_dataset_slug_by_item_id_by_scorer_id,
+                client,
+                body,
+                dataset_slug,
+                item_id,
+                scorer_id,
+                dataset_slug_query=dataset_slug,
+                item_id_query=item_id,
+                scorer_id_query=scorer_id,
+                organization_slug=organization_slug,
+            ),
+            max_retries=max_retries,
+            backoff=retry_backoff,
+        )
+        return retries
+
+    def send(task: tuple[str, Any]) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]], int]:
+        kind, payload = task
+        if kind == "put":
+            return None, [], put(payload)
+        return post(payload)
+
+    def done(task: tuple[str, Any], sent: tuple[list[dict[str, Any]] | None, list[dict[str, Any]], int]) -> None:
+        kind, payload = task
+        conflicts, resend, retries = sent
+        outcome.retries += retries
+        if kind == "put":
+            outcome.updated += 1
+            return
+        outcome.batches += 1
+        if conflicts is payload and len(payload) > 1:
+            # Whole batch rejected without details: bisect to isolate the conflicts
+            outcome.splits += 1
+            middle = len(payload) // 2
+            follow_ups.extend((("batch", payload[:middle]), ("batch", payload[middle:])))
+            return
+        outcome.created += len(payload) - len(conflicts) - len(resend)
+        follow_ups.extend(("put", result) for result in conflicts)
+        if resend:
+            follow_ups.append(("batch", resend))
+
+    # Create the shared httpx client before the worker threads race to do so
+    client.get_httpx_client()
+    run_bounded(send, tasks(), done, concurrency=concurrency)
+    # Conflicts of the last batches are found after the input ran out
+    while follow_ups:
+        run_bounded(send, tasks(), done, concurrency=concurrency)
+    return outcome
+
+
+__all__ = ["UpsertResult", "find_conflicts", "upsert_results", "wire_result"]
@@ -0,0 +1,329 @@
+"""
+Columnar, in-memory table of scorer results.
+
+``ResultsFrame`` loads scorer results (e.g. the pages of
+``GET /api/v1/scorers/results``) into flat typed columns instead of keeping
+one dict per result:
+
+* ``score`` and ``execution_time_ms`` as float64,
+* ``passed`` as bool (one byte),
+* scorer IDs and dataset slugs interned to uint32 codes.
+
+A result costs 25 bytes, so tens of millions of results fit in memory.
+``aggregate()`` and ``histogram()`` compute per-group counts, pass rates,
+score statistics and percentiles. With NumPy installed (``pip install
+noveum-sdk[numpy]``) they run vectorized over zero-copy views of the columns;
+without it the same results are computed in pure Python. pandas is not used.
+
+Example:
+    ```python
+    from noveum_api_client.results_frame import ResultsFrame
+
+    frame = ResultsFrame.fetch(client, dataset_slug="my-dataset")
+    for scorer_id, stats in frame.aggregate(by="scorer").items():
+        print(scorer_id, stats.pass_rate, stats.percentiles[90])
+    ```
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Literal
+
+from attrs import define, field
+
+from .client import AuthenticatedClient, Client
+from .result_index import iter_result_records
+from .types import UNSET, Unset
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is not installed
+    np = None  # type: ignore[assignment]
+
+GroupBy = Literal["scorer", "dataset", "dataset_scorer"] | None
+
+
+@define
+class ResultAggregate:
+    """
+    Statistics of one group of results.
+
+    Attributes:
+        count: Number of results
+        passed: Number of passed results
+        mean_score: Mean score
+        min_score: Lowest score
+        max_score: Highest score
+        mean_execution_time_ms: Mean scorer execution time
+        percentiles: Score percentile (0-100) to value, linearly interpolated
+    """
+
+    count: int
+    passed: int
+    mean_score: float
+    min_score: float
+    max_score: float
+    mean_execution_time_ms: float
+    percentiles: dict[float, float] = field(factory=dict)
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "passed": self.passed,
+            "pass_rate": self.pass_rate,
+            "mean_score": self.mean_score,
+            "min_score": self.min_score,
+            "max_score": self.max_score,
+            "mean_execution_time_ms": self.mean_execution_time_ms,
+            "percentiles": dict(self.percentiles),
+        }
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    position = (len(sorted_values) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+class ResultsFrame:
+    """Columnar table of scorer results; see the module docstring."""
+
+    def __init__(self, records: Iterable[Mapping[str, Any]] = ()):
+        self.scorer_ids: list[str] = []
+        self.dataset_slugs: list[str] = []
+        self._scorer_codes: dict[str, int] = {}
+        self._dataset_codes: dict[str, int] = {}
+        self._score = array("d")
+        self._passed = array("B")
+        self._execution_time_ms = array("d")
+        self._scorer = array("I")
+        self._dataset = array("I")
+        self.extend(records)
+
+    @classmethod
+    def fetch(
+        cls,
+        client: AuthenticatedClient | Client,
+        *,
+        dataset_slug: str | Unset = UNSET,
+        scorer_id: str | Unset = UNSET,
+        organization_slug: str | Unset = UNSET,
+        page_size: int | None = None,
+        shards: int = 4,
+    ) -> "ResultsFrame":
+        """
+        Load every result matching the filters.
+
+        Pages are fetched ``shards`` at a time once the total is known;
+        ``page_size`` fixes the otherwise adaptive page size.
+
+        Raises:
+            errors.UnexpectedStatus: If listing the results fails.
+        """
+        return cls(
+            iter_result_records(
+                client,
+                dataset_slug=dataset_slug,
+                scorer_id=scorer_id,
+                organization_slug=organization_slug,
+                page_size=page_size,
+                shards=shards,
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self._score)
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Append raw result records (camelCase or snake_case keys).
+
+        A missing score is stored as 0.0; a missing ``passed`` as ``False``.
+        """
+        scorer_codes, dataset_codes = self._scorer_codes, self._dataset_codes
+        add_score, add_passed = self._score.append, self._passed.append
+        add_time, add_scorer, add_dataset = self._execution_time_ms.append, self._scorer.append, self._dataset.append
+        for record in records:
+            get = record.get
+            scorer_id = get("scorerId") or get("scorer_id") or ""
+            dataset_slug = get("datasetSlug") or get("dataset_slug") or ""
+            scorer_code = scorer_codes.get(scorer_id)
+            if scorer_code is None:
+                scorer_code = scorer_codes[scorer_id] = len(self.scorer_ids)
+                self.scorer_ids.append(scorer_id)
+            dataset_code = dataset_codes.get(dataset_slug)
+            if dataset_code is None:
+                dataset_code = dataset_codes[dataset_slug] = len(self.dataset_slugs)
+                self.dataset_slugs.append(dataset_slug)
+            add_score(float(get("score") or 0.0))
+            add_passed(1 if get("passed") else 0)
+            add_time(float(get("executionTimeMs") or get("execution_time_ms") or 0.0))
+            add_scorer(scorer_code)
+            add_dataset(dataset_code)
+
+    def columns(self) -> dict[str, Any]:
+        """
+        The columns by name: NumPy arrays (zero-copy views) when NumPy is
+        installed, else ``array.array`` objects. ``scorer`` and ``dataset``
+        hold codes into ``scorer_ids`` / ``dataset_slugs``.
+        """
+        columns: dict[str, Any] = {
+            "score": self._score,
+            "passed": self._passed,
+            "execution_time_ms": self._execution_time_ms,
+            "scorer": self._scorer,
+            "dataset": self._dataset,
+        }
+        if np is None:
+            return columns
+        dtypes = {"score": np.float64, "passed": np.bool_, "execution_time_ms": np.float64}
+        return {name: np.frombuffer(column, dtype=dtypes.get(name, np.uint32)) for name, column in columns.items()}
+
+    def _groups(self, by: GroupBy) -> tuple[Any, list[Any]]:
+        """Per-result group codes and the key of every group code."""
+        if by == "scorer":
+            return self._scorer, list(self.scorer_ids)
+        if by == "dataset":
+            return self._dataset, list(self.dataset_slugs)
+        if by == "dataset_scorer":
+            width = len(self.scorer_ids)
+            keys = [(dataset, scorer) for dataset in self.dataset_slugs for scorer in self.scorer_ids]
+            if np is not None:
+                codes = np.frombuffer(self._dataset, dtype=np.uint32).astype(np.int64) * width
+                return codes + np.frombuffer(self._scorer, dtype=np.uint32), keys
+            return array("q", (d * width + s for d, s in zip(self._dataset, self._scorer, strict=True))), keys
+        if by is None:
+            return array("I", [0]) * len(self), [None]
+        raise ValueError(f"Unknown grouping {by!r}")
+
+    def aggregate(
+        self, by: GroupBy = "scorer", percentiles: Sequence[float] = (50, 90, 99)
+    ) -> dict[Any, ResultAggregate]:
+        """
+        Compute per-group statistics.
+
+        Args:
+            by: ``"scorer"``, ``"dataset"``, ``"dataset_scorer"`` (keys are
+                ``(dataset_slug, scorer_id)`` tuples) or ``None`` for one group
+                keyed ``None``
+            percentiles: Score percentiles to compute, between 0 and 100
+
+        Returns:
+            Group key to ``ResultAggregate``, for the groups holding results
+        """
+        codes, keys = self._groups(by)
+        if not len(self):
+            return {}
+        if np is None:
+            return self._aggregate_python(codes, keys, percentiles)
+
+        codes = np.asarray(codes, dtype=np.int64)
+        score = np.frombuffer(self._score, dtype=np.float64)
+        groups = len(keys)
+        counts = np.bincount(codes, minlength=groups)
+        passed = np.bincount(codes, weights=np.frombuffer(self._passed, dtype=np.uint8), minlength=groups)
+        score_sums = np.bincount(codes, weights=score, minlength=groups)
+        time_sums = np.bincount(
+            codes, weights=np.frombuffer(self._execution_time_ms, dtype=np.float64), minlength=groups
+        )
+        # Group the scores into contiguous runs (a stable integer sort), then
+        # select the percentile ranks of each run with a partial sort
+        present = np.flatnonzero(counts)
+        sizes = counts[present]
+        starts = (np.cumsum(counts) - counts)[present]
+        # NumPy radix-sorts 16-bit integers, several times faster than a 64-bit sort
+        sort_codes = codes.astype(np.uint16) if groups <= 1 << 16 else codes
+        grouped = score[np.argsort(sort_codes, kind="stable")]
+        minimums = np.minimum.reduceat(grouped, starts)
+        maximums = np.maximum.reduceat(grouped, starts)
+        quantiles = {q: np.empty(len(present)) for q in percentiles}
+        for i, (start, size) in enumerate(zip(starts.tolist(), sizes.tolist(), strict=True)):
+            positions = {q: (size - 1) * q / 100 for q in percentiles}
+            ranks = sorted(
+                {rank for p in positions.values() for rank in (math.floor(p), min(math.floor(p) + 1, size - 1))}
+            )
+            ranked = np.partition(grouped[start : start + size], ranks) if ranks else grouped[start : start + size]
+            for q, position in positions.items():
+                low = math.floor(position)
+                high = min(low + 1, size - 1)
+                quantiles[q][i] = ranked[low] + (ranked[high] - ranked[low]) * (position - low)
+        return {
+            keys[code]: ResultAggregate(
+                count=int(counts[code]),
+                passed=int(passed[code]),
+                mean_score=float(score_sums[code] / counts[code]),
+                min_score=float(minimums[i]),
+                max_score=float(maximums[i]),
+                mean_execution_time_ms=float(time_sums[code] / counts[code]),
+                percentiles={q: float(values[i]) for q, values in quantiles.items()},
+            )
+            for i, code in enumerate(present.tolist())
+        }
+
+    def _aggregate_python(
+        self, codes: Any, keys: list[Any], percentiles: Sequence[float]
+    ) -> dict[Any, ResultAggregate]:
+        scores: dict[int, list[float]] = {}
+        passed: dict[int, int] = {}
+        times: dict[int, float] = {}
+        for code, score, ok, elapsed in zip(codes, self._score, self._passed, self._execution_time_ms, strict=True):
+            group = scores.get(code)
+            if group is None:
+                group = scores[code] = []
+                passed[code] = 0
+                times[code] = 0.0
+            group.append(score)
+            passed[code] += ok
+            times[code] += elapsed
+        aggregates = {}
+        for code in sorted(scores):
+            values = sorted(scores[code])
+            aggregates[keys[code]] = ResultAggregate(
+                count=len(values),
+                passed=passed[code],
+                mean_score=math.fsum(values) / len(values),
+                min_score=values[0],
+                max_score=values[-1],
+                mean_execution_time_ms=times[code] / len(values),
+                percentiles={q: _percentile(values, q) for q in percentiles},
+            )
+        return aggregates
+
+    def histogram(
+        self, by: GroupBy = "scorer", bins: int = 10, bounds: tuple[float, float] = (0.0, 1.0)
+    ) -> dict[Any, list[int]]:
+        """
+        Count scores in ``bins`` equal-width bins over ``bounds`` per group.
+
+        The last bin includes the upper bound; scores outside ``bounds`` are
+        not counted.
+        """
+        codes, keys = self._groups(by)
+        low, high = bounds
+        width = (high - low) / bins
+        if np is not None:
+            codes = np.asarray(codes, dtype=np.int64)
+            score = np.frombuffer(self._score, dtype=np.float64)
+            inside = (score >= low) & (score <= high)
+            slots = np.minimum(((score[inside] - low) / width).astype(np.int64), bins - 1)
+            counts = np.bincount(codes[inside] * bins + slots, minlength=len(keys) * bins).reshape(len(keys), bins)
+            present = np.flatnonzero(np.bincount(codes, minlength=len(keys)))
+            return {keys[code]: counts[code].tolist() for code in present.tolist()}
+
+        histograms: dict[int, list[int]] = {}
+        for code, score in zip(codes, self._score, strict=True):
+            counts = histograms.get(code)
+            if counts is None:
+                counts = histograms[code] = [0] * bins
+            if low <= score <= high:
+                counts[min(int((score - low) / width), bins - 1)] += 1
+        return {keys[code]: histograms[code] for code in sorted(histograms)}
+
+
+__all__ = ["GroupBy", "ResultAggregate", "ResultsFrame"]
@@ -0,0 +1,221 @@
+"""
+In-process registry of scorer definitions.
+
+Scorers change rarely but are looked up constantly, e.g. once per result
+while rendering an evaluation. ``ScorerRegistry`` loads every scorer with one
+``GET /api/v1/scorers`` request and answers ``get(scorer_id)`` from memory
+instead of issuing ``GET /api/v1/scorers/{id}`` each time:
+
+* **write invalidation**: subscribed to a ``WriteHookTransport``, the registry
+  drops a scorer as soon as a PUT or DELETE of it succeeds through the same
+  client, and reloads the list after a scorer is created;
+* **TTL**: entries older than ``ttl`` seconds are fetched again, which picks
+  up changes made by other clients;
+* **misses**: unknown or expired scorers are fetched individually and cached.
+
+Example:
+    ```python
+    from noveum_api_client import Client
+    from noveum_api_client.scorer_registry import ScorerRegistry
+    from noveum_api_client.transport import WriteHookTransport
+
+    hooks = WriteHookTransport()
+    client = Client(base_url="https://api.noveum.ai", httpx_args={"transport": hooks})
+    registry = ScorerRegistry(client, ttl=300)
+    hooks.subscribe(registry.on_write)
+
+    registry.preload()
+    scorer = registry.get("accuracy_scorer")
+    ```
+"""
+
+import threading
+import time
+from urllib.parse import unquote
+
+from attrs import define
+
+from . import errors
+from ._utils import parse_json, unwrap
+from .api.scorers import get_api_v1_scorers, get_api_v1_scorers_by_id
+from .client import AuthenticatedClient, Client
+from .models.get_api_v1_scorers_by_id_response_200 import GetApiV1ScorersByIdResponse200
+from .types import UNSET, Unset
+
+ScorerDefinition = GetApiV1ScorersByIdResponse200
+
+_SCORERS_PATH = "/api/v1/scorers"
+# Sub-collections of /api/v1/scorers that are not scorer definitions
+_OTHER_COLLECTIONS = frozenset({"results"})
+
+
+@define
+class RegistryStats:
+    """Lookup counters of a ``ScorerRegistry``."""
+
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+        }
+
+
+def fetch_scorer(
+    client: AuthenticatedClient | Client,
+    scorer_id: str,
+    organization_slug: str | Unset = UNSET,
+) -> ScorerDefinition:
+    """
+    Fetch one scorer with ``GET /api/v1/scorers/{id}``.
+
+    Raises:
+        errors.UnexpectedStatus: If the scorer cannot be fetched.
+    """
+    response = get_api_v1_scorers_by_id.sync_detailed(
+        scorer_id, client=client, id_query=scorer_id, organization_slug=organization_slug
+    )
+    if not isinstance(response.parsed, GetApiV1ScorersByIdResponse200):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed
+
+
+class ScorerRegistry:
+    """
+    Scorer definitions cached in memory.
+
+    Args:
+        client: API client
+        ttl: Seconds a loaded scorer is served before it is fetched again
+        organization_slug: Organization whose scorers are loaded
+    """
+
+    def __init__(
+        self,
+        client: AuthenticatedClient | Client,
+        *,
+        ttl: float = 300.0,
+        organization_slug: str | Unset = UNSET,
+    ):
+        self._client = client
+        self.ttl = ttl
+        self.organization_slug = organization_slug
+        self.stats = RegistryStats()
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[ScorerDefinition, float]] = {}
+        # When the full list was last loaded; None once it may be incomplete
+        self._listed_at: float | None = None
+        # Bumped by every invalidation, so a fetch racing a write is not stored
+        self._generation = 0
+
+    def _fresh(self, loaded_at: float | None, now: float) -> bool:
+        return loaded_at is not None and now - loaded_at < self.ttl
+
+    def preload(self) -> int:
+        """
+        Load every scorer with a single list request.
+
+        Returns:
+            Number of scorers loaded
+
+        Raises:
+            errors.UnexpectedStatus: If the list request fails.
+        """
+        with self._lock:
+            generation = self._generation
+        response = get_api_v1_scorers.sync_detailed(client=self._client, organization_slug=self.organization_slug)
+        records = unwrap(unwrap(parse_json(response), "data"), "scorers") or []
+        loaded = {}
+        for record in records:
+            try:
+                scorer = ScorerDefinition.from_dict(record)
+            except (KeyError, TypeError):
+                # Incomplete list entry: fetched individually on first use
+                continue
+            loaded[scorer.id] = scorer
+        now = time.monotonic()
+        with self._lock:
+            self.stats.loads += 1
+            if generation == self._generation:
+                self._entries = {scorer_id: (scorer, now) for scorer_id, scorer in loaded.items()}
+                self._listed_at = now
+        return len(loaded)
+
+    def get(self, scorer_id: str) -> ScorerDefinition:
+        """
+        Get a scorer, from memory when a fresh copy is loaded.
+
+        Raises:
+            errors.UnexpectedStatus: If the scorer has to be fetched and cannot be.
+        """
+        with self._lock:
+            entry = self._entries.get(scorer_id)
+            if entry is not None and self._fresh(entry[1], time.monotonic()):
+                self.stats.hits += 1
+                return entry[0]
+            self.stats.misses += 1
+            generation = self._generation
+        scorer = fetch_scorer(self._client, scorer_id, self.organization_slug)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[scorer_id] = (scorer, time.monotonic())
+        return scorer
+
+    def all(self) -> list[ScorerDefinition]:
+        """Every scorer, reloading the list when it is stale or was invalidated."""
+        with self._lock:
+            fresh = self._fresh(self._listed_at, time.monotonic())
+        if not fresh:
+            self.preload()
+        with self._lock:
+            return [scorer for scorer, _ in self._entries.values()]
+
+    def invalidate(self, scorer_id: str | None = None) -> None:
+        """Drop one scorer, or every scorer when ``scorer_id`` is omitted."""
+        with self._lock:
+            if scorer_id is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(scorer_id, None) is not None:
+                self.stats.invalidations += 1
+            self._listed_at = None
+            self._generation += 1
+
+    def on_write(self, method: str, path: str) -> None:
+        """
+        ``WriteHookTransport`` listener invalidating scorers changed by this client.
+
+        Args:
+            method: HTTP method of the successful write
+            path: URL path of the write
+        """
+        _, found, rest = path.partition(_SCORERS_PATH)
+        if not found or (rest and not rest.startswith("/")):
+            return
+        segments = [unquote(segment) for segment in rest.split("/") if segment]
+        if segments and segments[0] in _OTHER_COLLECTIONS:
+            return
+        if segments:
+            self.invalidate(segments[0])
+        else:
+            # A scorer was created: the loaded list is incomplete
+            with self._lock:
+                self._listed_at = None
+                self._generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, scorer_id: object) -> bool:
+        with self._lock:
+            return scorer_id in self._entries
+
+
+__all__ = ["RegistryStats", "ScorerDefinition", "ScorerRegistry", "fetch_scorer"]
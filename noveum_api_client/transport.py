@@ -0,0 +1,253 @@
+"""
+Composable httpx transports for the Noveum API client.
+
+The generated endpoint functions send every request through
+``client.get_httpx_client().request(...)`` (or the async equivalent), so the
+least intrusive place to add client-wide behaviour is the httpx transport.
+``Client`` passes the same ``httpx_args`` to both ``httpx.Client`` and
+``httpx.AsyncClient``, which is why every transport in this module implements
+both the sync and the async transport interfaces.
+
+Example:
+    ```python
+    from noveum_api_client import Client
+    from noveum_api_client.transport import LatencyTransport
+
+    latency = LatencyTransport()
+    client = Client(base_url="https://api.noveum.ai", httpx_args={"transport": latency})
+    ...
+    print(latency.snapshot())
+    ```
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from attrs import define
+
+# Methods that change server state
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Headers describing the wire encoding of a body; they no longer apply once a
+# response body has been read (and decoded) into memory.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def decoded_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    """Return ``headers`` without the wire-format headers, for re-serving a decoded body."""
+    return [(key, value) for key, value in headers.items() if key.lower() not in _WIRE_HEADERS]
+
+
+class LayeredTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Base class for transports that wrap another transport.
+
+    Subclasses override ``handle_request`` / ``handle_async_request`` and call
+    ``super()`` to forward the request to the wrapped transport.
+
+    Args:
+        transport: Transport to forward requests to. It must implement
+            ``handle_request`` for sync use and ``handle_async_request`` for
+            async use (any ``LayeredTransport`` implements both). When omitted,
+            ``httpx.HTTPTransport`` / ``httpx.AsyncHTTPTransport`` are created
+            lazily from ``transport_kwargs``.
+        **transport_kwargs: Keyword arguments for the default httpx transports
+            (``verify``, ``limits``, ``http2``, ``retries``, ...).
+    """
+
+    def __init__(self, transport: Any = None, **transport_kwargs: Any):
+        self._transport_kwargs = transport_kwargs
+        self._sync_transport: Any = transport
+        self._async_transport: Any = transport
+        self._init_lock = threading.Lock()
+
+    def _get_sync_transport(self) -> httpx.BaseTransport:
+        if self._sync_transport is None:
+            with self._init_lock:
+                if self._sync_transport is None:
+                    self._sync_transport = httpx.HTTPTransport(**self._transport_kwargs)
+        return self._sync_transport
+
+    def _get_async_transport(self) -> httpx.AsyncBaseTransport:
+        if self._async_transport is None:
+            with self._init_lock:
+                if self._async_transport is None:
+                    self._async_transport = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+        return self._async_transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._get_sync_transport().handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._get_async_transport().handle_async_request(request)
+
+    def close(self) -> None:
+        if self._sync_transport is not None:
+            self._sync_transport.close()
+
+    async def aclose(self) -> None:
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+
+@define
+class LatencyStats:
+    """Aggregated request timings for one class of requests (cold or warm)."""
+
+    requests: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    connect_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean time to response headers in milliseconds."""
+        return self.total_ms / self.requests if self.requests else 0.0
+
+    def add(self, elapsed_ms: float, connect_ms: float) -> None:
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.connect_ms += connect_ms
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "requests": self.requests,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_ms,
+            "total_ms": self.total_ms,
+            "connect_ms": self.connect_ms,
+        }
+
+
+class LatencyTransport(LayeredTransport):
+    """
+    Transport that records cold vs warm request latency.
+
+    A request is *cold* when it had to open a new connection (DNS, TCP and TLS
+    handshakes) and *warm* when it reused a pooled connection. The distinction
+    is taken from httpcore's ``trace`` request extension, so it is exact rather
+    than inferred from timings. Latency is measured up to the response headers.
+    """
+
+    def __init__(self, transport: Any = None, **transport_kwargs: Any):
+        super().__init__(transport, **transport_kwargs)
+        self._lock = threading.Lock()
+        self.cold = LatencyStats()
+        self.warm = LatencyStats()
+
+    def _record(self, started: float, connection: dict[str, float]) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        connect_ms = connection.get("connect_ms", 0.0)
+        with self._lock:
+            if connection:
+                self.cold.add(elapsed_ms, connect_ms)
+            else:
+                self.warm.add(elapsed_ms, 0.0)
+
+    @staticmethod
+    def _on_trace(connection: dict[str, float], event_name: str) -> None:
+        # "connection.connect_tcp.started" / "connection.start_tls.complete" etc.
+        if event_name == "connection.connect_tcp.started":
+            connection["connect_started"] = time.perf_counter()
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            started = connection.get("connect_started")
+            if started is not None:
+                connection["connect_ms"] = (time.perf_counter() - started) * 1000
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        connection: dict[str, float] = {}
+        previous = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            self._on_trace(connection, event_name)
+            if previous is not None:
+                previous(event_name, info)
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        response = super().handle_request(request)
+        self._record(started, connection)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        connection: dict[str, float] = {}
+        previous = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            self._on_trace(connection, event_name)
+            if previous is not None:
+                await previous(event_name, info)
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        response = await super().handle_async_request(request)
+        self._record(started, connection)
+        return response
+
+    def reset(self) -> None:
+        """Discard all recorded timings."""
+        with self._lock:
+            self.cold = LatencyStats()
+            self.warm = LatencyStats()
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return cold and warm timings as plain dictionaries."""
+        with self._lock:
+            return {"cold": self.cold.to_dict(), "warm": self.warm.to_dict()}
+
+
+WriteListener = Callable[[str, str], None]
+
+
+class WriteHookTransport(LayeredTransport):
+    """
+    Transport that reports successful writes to subscribed listeners.
+
+    After every POST/PUT/PATCH/DELETE answered with a status below 400, each
+    listener is called with the request method and URL path. In-process
+    caches use this to drop entries the client itself just changed.
+    """
+
+    def __init__(self, transport: Any = None, **transport_kwargs: Any):
+        super().__init__(transport, **transport_kwargs)
+        self._listeners: list[WriteListener] = []
+
+    def subscribe(self, listener: WriteListener) -> None:
+        """Call ``listener(method, path)`` after every successful write."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: WriteListener) -> None:
+        """Stop calling ``listener``."""
+        self._listeners.remove(listener)
+
+    def _notify(self, request: httpx.Request, response: httpx.Response) -> None:
+        if request.method not in WRITE_METHODS or response.status_code >= 400:
+            return
+        path = request.url.path.rstrip("/")
+        for listener in list(self._listeners):
+            listener(request.method, path)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = super().handle_request(request)
+        self._notify(request, response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handle_async_request(request)
+        self._notify(request, response)
+        return response
+
+
+__all__ = [
+    "WRITE_METHODS",
+    "LatencyStats",
+    "LatencyTransport",
+    "LayeredTransport",
+    "WriteHookTransport",
+    "WriteListener",
+    "decoded_headers",
+]
@@ -0,0 +1,214 @@
+"""
+Unit Tests for the On-Disk Audio Cache
+
+Tests hits and misses, content addressing, LRU eviction, sharing between
+cache instances and the metrics.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient, errors
+from noveum_api_client.audio_cache import AudioCache
+from noveum_api_client.audio_download import AudioIntegrityError
+
+AUDIO = {"a1": b"\x01" * 4000, "a2": b"\x02" * 5000, "a3": b"\x03" * 6000, "dup": b"\x01" * 4000}
+
+
+class _AudioServer:
+    """MockTransport handler serving audio and counting downloads"""
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        audio_id = request.url.path.split("/")[4]
+        with self._lock:
+            self.requests.append(audio_id)
+        if audio_id not in AUDIO:
+            return httpx.Response(404, json={"error": "Audio not found"})
+        return httpx.Response(200, headers={"content-type": "audio/wav"}, content=AUDIO[audio_id])
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestAudioCache:
+    """Test reading audio through the cache"""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Test a clip is downloaded once and then memory-mapped from disk"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path)
+
+        with cache.open(_client(server), "a1") as first:
+            assert first.read() == AUDIO["a1"]
+        with cache.open(_client(server), "a1") as second:
+            assert second.data[:10] == AUDIO["a1"][:10]
+            assert second.checksum == _sha(AUDIO["a1"])
+
+        assert server.requests == ["a1"]
+        assert cache.stats.to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "stores": 1,
+            "evictions": 0,
+            "bytes_saved": 4000,
+            "bytes_downloaded": 4000,
+        }
+        assert list((tmp_path / "tmp").iterdir()) == []
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        """Test two IDs with the same bytes share one blob"""
+        cache = AudioCache(tmp_path)
+        cache.store("a1", AUDIO["a1"])
+
+        assert cache.get(_client(_AudioServer()), "dup") == AUDIO["dup"]
+        assert len(list((tmp_path / "blobs").glob("*/*.audio"))) == 1
+
+    def test_known_checksum_skips_the_download(self, tmp_path):
+        """Test a clip whose hash is already cached is served for a new ID"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path)
+        cache.store("a1", AUDIO["a1"])
+
+        assert cache.get(_client(server), "dup", checksum=_sha(AUDIO["dup"])) == AUDIO["dup"]
+        assert server.requests == []
+        assert "dup" in cache
+
+    def test_checksum_mismatch(self, tmp_path):
+        """Test a stale clip is downloaded again and a wrong download fails"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path)
+        cache.store("a2", b"old")
+
+        assert cache.get(_client(server), "a2", checksum=_sha(AUDIO["a2"])) == AUDIO["a2"]
+        with pytest.raises(AudioIntegrityError):
+            cache.get(_client(server), "a3", checksum="00" * 32)
+        assert "a3" not in cache
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used clips are evicted past max_bytes"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path, max_bytes=10_000)
+        cache.get(_client(server), "a1")
+        cache.get(_client(server), "a2")
+        old = os.stat(tmp_path).st_mtime - 100  # both untouched for a while
+        for path in (tmp_path / "blobs").glob("*/*.audio"):
+            os.utime(path, (old, old))
+        cache.get(_client(server), "a1")
+
+        cache.get(_client(server), "a3")
+
+        assert ("a1" in cache, "a2" in cache, "a3" in cache) == (True, False, True)
+        assert cache.size_bytes == 10_000
+        assert cache.stats.evictions == 1
+
+    def test_clip_larger_than_the_cache(self, tmp_path):
+        """Test a clip over max_bytes is still returned, and evicted by the next store"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path, max_bytes=4000)
+
+        with cache.open(_client(server), "a2") as blob:
+            assert blob.read() == AUDIO["a2"]
+        cache.get(_client(server), "a1")
+
+        assert ("a1" in cache, "a2" in cache) == (True, False)
+
+    def test_retried_download_is_not_duplicated(self, tmp_path):
+        """Test a thread arriving while a waiter retries a failed download waits for it"""
+        server = _AudioServer()
+        entered, gate = threading.Semaphore(0), threading.Semaphore(0)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            attempt = len(calls)
+            entered.release()
+            gate.acquire(timeout=2)
+            if attempt == 1:
+                return httpx.Response(404, json={"error": "Audio not found"})
+            return server(request)
+
+        def users():
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline and cache._fetching.get("a1", (None, 0))[1] < 2:
+                time.sleep(0.005)
+
+        cache = AudioCache(tmp_path)
+        client = _client(handler)
+        client.get_httpx_client()
+        with ThreadPoolExecutor(3) as pool:
+            first = pool.submit(cache.get, client, "a1", max_retries=0)
+            entered.acquire(timeout=2)
+            second = pool.submit(cache.get, client, "a1")
+            users()
+            gate.release()  # the first download fails, the waiter retries
+            entered.acquire(timeout=2)
+            third = pool.submit(cache.get, client, "a1")
+            users()
+            gate.release()
+
+            with pytest.raises(errors.UnexpectedStatus):
+                first.result()
+            assert second.result() == third.result() == AUDIO["a1"]
+        assert len(calls) == 2
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test a second cache on the same directory (another process) hits"""
+        server = _AudioServer()
+        AudioCache(tmp_path).get(_client(server), "a1")
+
+        other = AudioCache(tmp_path)
+
+        assert other.get(_client(server), "a1") == AUDIO["a1"]
+        assert (other.stats.hits, other.stats.misses) == (1, 0)
+        assert server.requests == ["a1"]
+
+    def test_concurrent_misses_download_once(self, tmp_path):
+        """Test threads missing the same clip share one download"""
+        server = _AudioServer()
+        cache = AudioCache(tmp_path)
+        client = _client(server)
+        client.get_httpx_client()
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: cache.get(client, "a3"), range(8)))
+
+        assert results == [AUDIO["a3"]] * 8
+        assert server.requests == ["a3"]
+
+    def test_clear(self, tmp_path):
+        """Test clear removes every clip"""
+        cache = AudioCache(tmp_path)
+        cache.store("a1", AUDIO["a1"])
+
+        cache.clear()
+
+        assert "a1" not in cache and cache.size_bytes == 0
+
+    def test_noveum_client_open_audio(self, tmp_path):
+        """Test NoveumClient.open_audio reads through its audio cache"""
+        server = _AudioServer()
+        client = NoveumClient(api_key="test_key", base_url="https://api.test", audio_cache=AudioCache(tmp_path))
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        for _ in range(3):
+            with client.open_audio("a2") as blob:
+                assert len(blob) == len(AUDIO["a2"])
+
+        assert server.requests == ["a2"]
+        assert client.audio_cache.stats.bytes_saved == 2 * len(AUDIO["a2"])
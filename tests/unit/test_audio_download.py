@@ -0,0 +1,208 @@
+"""
+Unit Tests for Streaming Audio Downloads
+
+Tests streaming, range reads, resuming, size and checksum verification and
+bulk downloads.
+"""
+
+import asyncio
+import hashlib
+import threading
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.audio_download import (
+    AudioIntegrityError,
+    astream_audio,
+    download_audio,
+    download_audio_files,
+    stream_audio,
+)
+
+AUDIO = {f"a{i}": bytes([i]) * (10_000 + i) for i in range(5)}
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    """Response body that drops the connection after ``limit`` bytes"""
+
+    def __init__(self, data, limit):
+        self.data = data
+        self.limit = limit
+
+    def __iter__(self):
+        yield self.data[: self.limit]
+        raise httpx.ReadError("connection reset")
+
+
+class _AudioServer:
+    """MockTransport handler serving audio with Range support and a paginated listing"""
+
+    def __init__(self, audio=AUDIO, ranges=True, drop_after=None):
+        self.audio = dict(audio)
+        self.ranges = ranges
+        self.drop_after = drop_after
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _listing(self, request):
+        page = int(request.url.params["page"])
+        size = int(request.url.params["pageSize"])
+        ids = sorted(self.audio)[(page - 1) * size : page * size]
+        records = [
+            {"id": audio_id, "fileName": f"{audio_id}.wav", "fileSize": len(self.audio[audio_id])} for audio_id in ids
+        ]
+        return httpx.Response(200, json={"data": records, "pagination": {"total": len(self.audio)}})
+
+    def __call__(self, request):
+        if request.url.path == "/api/v1/audio":
+            return self._listing(request)
+        audio_id = request.url.path.split("/")[4]
+        header = request.headers.get("range")
+        with self._lock:
+            self.requests.append((audio_id, header))
+            drop, self.drop_after = self.drop_after, None
+        if audio_id not in self.audio:
+            return httpx.Response(404, json={"error": "Audio not found"})
+        data = self.audio[audio_id]
+        status, headers, body = 200, {"content-type": "audio/wav"}, data
+        if header and self.ranges:
+            start, _, end = header.removeprefix("bytes=").partition("-")
+            start, end = int(start), int(end) if end else len(data) - 1
+            if start >= len(data):
+                return httpx.Response(416, headers={"content-range": f"bytes */{len(data)}"})
+            body = data[start : end + 1]
+            status = 206
+            headers["content-range"] = f"bytes {start}-{start + len(body) - 1}/{len(data)}"
+        headers["content-length"] = str(len(body))
+        if drop is not None:
+            return httpx.Response(status, headers=headers, stream=_BrokenStream(body, drop))
+        return httpx.Response(status, headers=headers, content=body)
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestStreamAudio:
+    """Test reading audio as a stream"""
+
+    def test_stream_in_chunks(self):
+        """Test the recording is yielded in bounded chunks"""
+        chunks = list(stream_audio(_client(_AudioServer()), "a1", chunk_size=4096))
+
+        assert b"".join(chunks) == AUDIO["a1"]
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    @pytest.mark.parametrize("ranges", [True, False])
+    def test_range_reads(self, ranges):
+        """Test partial reads, also from servers that ignore Range"""
+        server = _AudioServer(ranges=ranges)
+
+        data = b"".join(stream_audio(_client(server), "a2", start=100, end=299, chunk_size=64))
+
+        assert data == AUDIO["a2"][100:300]
+        assert server.requests == [("a2", "bytes=100-299")]
+
+    def test_async_stream(self):
+        """Test the async stream yields the same bytes"""
+
+        async def read():
+            return b"".join([chunk async for chunk in astream_audio(_client(_AudioServer()), "a3", start=10)])
+
+        assert asyncio.run(read()) == AUDIO["a3"][10:]
+
+    def test_missing_audio(self):
+        """Test an unknown ID raises"""
+        from noveum_api_client import errors
+
+        with pytest.raises(errors.UnexpectedStatus):
+            list(stream_audio(_client(_AudioServer()), "nope"))
+
+
+class TestDownloadAudio:
+    """Test downloading to disk"""
+
+    def test_download_and_checksum(self, tmp_path):
+        """Test the file is written, verified and moved into place"""
+        digest = hashlib.sha256(AUDIO["a1"]).hexdigest()
+
+        downloaded = download_audio(_client(_AudioServer()), "a1", tmp_path / "a1.wav", checksum=digest)
+
+        assert (tmp_path / "a1.wav").read_bytes() == AUDIO["a1"]
+        assert (downloaded.size, downloaded.checksum) == (len(AUDIO["a1"]), digest)
+        assert not (tmp_path / "a1.wav.part").exists()
+
+    def test_resume_after_dropped_connection(self, tmp_path):
+        """Test a dropped transfer continues from the bytes already written"""
+        server = _AudioServer(drop_after=3000)
+
+        downloaded = download_audio(_client(server), "a2", tmp_path / "a2.wav", retry_backoff=0)
+
+        assert (tmp_path / "a2.wav").read_bytes() == AUDIO["a2"]
+        assert server.requests == [("a2", None), ("a2", "bytes=3000-")]
+        assert downloaded.retries == 1
+
+    def test_resume_from_part_file(self, tmp_path):
+        """Test an existing .part file is continued with a Range request"""
+        (tmp_path / "a3.wav.part").write_bytes(AUDIO["a3"][:5000])
+        server = _AudioServer()
+
+        downloaded = download_audio(_client(server), "a3", tmp_path / "a3.wav")
+
+        assert (tmp_path / "a3.wav").read_bytes() == AUDIO["a3"]
+        assert downloaded.resumed_from == 5000
+        assert downloaded.checksum == hashlib.sha256(AUDIO["a3"]).hexdigest()
+
+    def test_resume_without_range_support_restarts(self, tmp_path):
+        """Test a server ignoring Range makes the download start over"""
+        (tmp_path / "a3.wav.part").write_bytes(b"stale")
+
+        download_audio(_client(_AudioServer(ranges=False)), "a3", tmp_path / "a3.wav")
+
+        assert (tmp_path / "a3.wav").read_bytes() == AUDIO["a3"]
+
+    def test_verification_failures(self, tmp_path):
+        """Test a wrong size or checksum raises and removes the partial file"""
+        with pytest.raises(AudioIntegrityError):
+            download_audio(_client(_AudioServer()), "a1", tmp_path / "x.wav", checksum="00" * 32)
+        with pytest.raises(AudioIntegrityError):
+            download_audio(_client(_AudioServer()), "a1", tmp_path / "x.wav", expected_size=5)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestBulkDownload:
+    """Test downloading many recordings"""
+
+    def test_download_listed_audio(self, tmp_path):
+        """Test every listed recording is downloaded and existing files are skipped"""
+        server = _AudioServer()
+        (tmp_path / "a0.wav").write_bytes(AUDIO["a0"])
+        progress = []
+
+        result = download_audio_files(
+            _client(server), tmp_path, concurrency=3, page_size=2, on_progress=lambda r: progress.append(r.to_dict())
+        )
+
+        assert (result.downloaded, result.skipped, result.failed) == (4, 1, [])
+        assert result.bytes_received == sum(len(AUDIO[f"a{i}"]) for i in range(1, 5))
+        assert all((tmp_path / f"{audio_id}.wav").read_bytes() == data for audio_id, data in AUDIO.items())
+        assert len(progress) == 5
+
+    def test_download_ids_with_failures(self, tmp_path):
+        """Test IDs are downloaded by name and failures are collected"""
+        result = download_audio_files(_client(_AudioServer()), tmp_path, ["a1", "nope"], max_retries=0)
+
+        assert [item.audio_id for item in result.files] == ["a1"]
+        assert [audio_id for audio_id, _ in result.failed] == ["nope"]
+
+    def test_noveum_client_wrappers(self, tmp_path):
+        """Test NoveumClient.stream_audio, download_audio and download_audio_files"""
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(_AudioServer())
+
+        assert b"".join(client.stream_audio("a1", end=9)) == AUDIO["a1"][:10]
+        assert client.download_audio("a2", tmp_path / "a2.wav").size == len(AUDIO["a2"])
+        assert client.download_audio_files(tmp_path / "all").downloaded == 5
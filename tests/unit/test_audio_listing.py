@@ -0,0 +1,144 @@
+"""
+Unit Tests for the Audio Listing Iterator
+
+Tests page/pageSize walking, prefetch, parallel pages, capped page sizes,
+lightweight records and hydration.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.audio_listing import AudioRecord, aiter_audio, iter_audio
+
+RECORDINGS = [
+    {"id": f"a{i:02}", "fileName": f"{i}.wav", "mimeType": "audio/wav", "fileSize": 1000 + i, "traceId": f"t{i}"}
+    for i in range(23)
+]
+
+
+class _AudioServer:
+    """MockTransport handler for the paginated audio listing and metadata endpoints"""
+
+    def __init__(self, recordings=RECORDINGS, total=True, max_page_size=None, delay=0.0):
+        self.recordings = recordings
+        self.total = total
+        self.max_page_size = max_page_size
+        self.delay = delay
+        self.pages = []
+        self.details = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        if request.url.path == "/api/v1/audio":
+            return self._listing(request)
+        audio_id = request.url.path.rsplit("/", 1)[1]
+        with self._lock:
+            self.details.append(audio_id)
+        return httpx.Response(
+            200, json={"success": True, "data": {"id": audio_id, "duration": 1.5, "metadata": {"lang": "en"}}}
+        )
+
+    def _listing(self, request):
+        page = int(request.url.params["page"])
+        size = int(request.url.params["pageSize"])
+        if self.max_page_size:
+            size = min(size, self.max_page_size)
+        with self._lock:
+            self.pages.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        body = {"data": self.recordings[(page - 1) * size : page * size]}
+        if self.total:
+            body["pagination"] = {"page": page, "pageSize": size, "total": len(self.recordings)}
+        return httpx.Response(200, json=body)
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestIterAudio:
+    """Test walking the audio listing"""
+
+    def test_records_in_order(self):
+        """Test every recording is yielded once, as a lightweight record"""
+        server = _AudioServer()
+
+        records = list(iter_audio(_client(server), page_size=5))
+
+        assert [record.id for record in records] == [item["id"] for item in RECORDINGS]
+        assert records[3] == AudioRecord(id="a03", file_name="3.wav", mime_type="audio/wav", size=1003, trace_id="t3")
+        assert sorted(server.pages) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.parametrize(("total", "pages"), [(True, [1]), (False, [1, 2])])
+    def test_stops_at_the_last_page(self, total, pages):
+        """Test a known total avoids probing past a full last page"""
+        server = _AudioServer(total=total)
+
+        records = list(iter_audio(_client(server), page_size=23, raw=True))
+
+        assert records == RECORDINGS
+        assert server.pages == pages
+
+    def test_parallel_pages(self):
+        """Test pages are fetched concurrently once the total is known"""
+        server = _AudioServer(delay=0.05)
+
+        records = list(iter_audio(_client(server), page_size=2, parallel=4))
+
+        assert [record.id for record in records] == [item["id"] for item in RECORDINGS]
+        assert server.max_in_flight > 1
+        assert sorted(server.pages) == list(range(1, 13))
+
+    def test_capped_page_size(self):
+        """Test a server capping pageSize is still walked to the end"""
+        server = _AudioServer(max_page_size=4)
+
+        records = list(iter_audio(_client(server), page_size=10, parallel=3))
+
+        assert len(records) == len(RECORDINGS)
+        assert sorted(server.pages) == [1, 2, 3, 4, 5, 6]
+
+    def test_hydrate(self):
+        """Test records are completed from the metadata endpoint"""
+        server = _AudioServer(recordings=RECORDINGS[:7])
+
+        records = list(iter_audio(_client(server), page_size=3, hydrate=True, hydrate_concurrency=4))
+
+        assert sorted(server.details) == [item["id"] for item in RECORDINGS[:7]]
+        assert records[0].duration == 1.5 and records[0].metadata == {"lang": "en"}
+        assert records[0].file_name == "0.wav"
+
+    def test_async_iterator(self):
+        """Test the async iterator yields the same records, hydrated"""
+
+        async def collect():
+            return [
+                record async for record in aiter_audio(_client(_AudioServer()), page_size=4, parallel=3, hydrate=True)
+            ]
+
+        records = asyncio.run(collect())
+
+        assert [record.id for record in records] == [item["id"] for item in RECORDINGS]
+        assert all(record.duration == 1.5 for record in records)
+
+    def test_empty_listing(self):
+        """Test an organization without recordings yields nothing"""
+        assert list(iter_audio(_client(_AudioServer(recordings=[])))) == []
+
+    def test_noveum_client_iter_audio(self):
+        """Test NoveumClient.iter_audio"""
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(_AudioServer())
+
+        assert len(list(client.iter_audio(page_size=10, parallel=2))) == len(RECORDINGS)
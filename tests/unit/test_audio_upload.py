@@ -0,0 +1,202 @@
+"""
+Unit Tests for Streaming Audio Uploads
+
+Tests the multipart body for each source type, bounded chunks, retries of
+replayable sources and bulk uploads.
+"""
+
+import asyncio
+import io
+import threading
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.audio_upload import (
+    AudioUploadBody,
+    aupload_audio,
+    aupload_audio_files,
+    upload_audio,
+    upload_audio_files,
+)
+
+AUDIO = bytes(range(256)) * 1000
+
+
+def _parse(request):
+    """Split a multipart body into its form fields and file part"""
+    boundary = request.headers["content-type"].split("boundary=")[1].encode()
+    parts = request.content.split(b"--" + boundary)[1:-1]
+    fields, file = {}, None
+    for part in parts:
+        head, _, value = part[2:-2].partition(b"\r\n\r\n")
+        name = head.split(b'name="')[1].split(b'"')[0].decode()
+        if name == "file":
+            file = {"name": head.split(b'filename="')[1].split(b'"')[0].decode(), "content": value}
+            file["type"] = head.split(b"Content-Type: ")[1].decode()
+        else:
+            fields[name] = value.decode()
+    return fields, file
+
+
+class _AudioServer:
+    """MockTransport handler storing uploaded audio, optionally failing first attempts"""
+
+    def __init__(self, fail_first=0, reject=()):
+        self.fail_first = fail_first
+        self.reject = set(reject)
+        self.uploads = {}
+        self.headers = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        fields, file = _parse(request)
+        with self._lock:
+            self.headers.append(dict(request.headers))
+            if self.fail_first:
+                self.fail_first -= 1
+                return httpx.Response(503, headers={"retry-after": "0"}, json={"error": "Unavailable"})
+            if fields["audio_uuid"] in self.reject:
+                return httpx.Response(400, json={"error": "Unsupported format"})
+            self.uploads[fields["audio_uuid"]] = (fields, file)
+        return httpx.Response(
+            201, json={"success": True, "data": {"id": fields["audio_uuid"], "size": len(file["content"])}}
+        )
+
+
+def _client(server):
+    return Client(
+        base_url="https://api.test",
+        httpx_args={"transport": httpx.MockTransport(server)},
+    )
+
+
+async def _chunks(data, size):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class TestAudioUploadBody:
+    """Test building the streaming multipart body"""
+
+    def test_chunks_are_bounded(self):
+        """Test audio is streamed in chunks of at most chunk_size with a Content-Length"""
+        body = AudioUploadBody(AUDIO, trace_id="t", span_id="s", audio_uuid="a", chunk_size=4096)
+
+        chunks = list(body)
+
+        assert max(len(chunk) for chunk in chunks[1:-1]) == 4096
+        assert int(body.headers()["Content-Length"]) == sum(len(chunk) for chunk in chunks)
+        assert body.bytes_sent == len(AUDIO)
+
+    def test_file_object_is_replayed_from_its_position(self):
+        """Test a seekable file object is re-read from where its audio starts"""
+        file = io.BytesIO(b"junk" + AUDIO)
+        file.seek(4)
+        body = AudioUploadBody(file, trace_id="t", span_id="s", audio_uuid="a")
+
+        first, second = b"".join(body), b"".join(body)
+
+        assert first == second
+        assert body.replayable
+        assert body.headers()["Content-Length"] == str(len(first))
+
+    def test_unknown_size_uses_chunked_encoding(self):
+        """Test async sources have no Content-Length and cannot be replayed"""
+        body = AudioUploadBody(_chunks(AUDIO, 10_000), trace_id="t", span_id="s", audio_uuid="a")
+
+        assert "Content-Length" not in body.headers()
+        assert not body.replayable
+
+
+class TestUploadAudio:
+    """Test single uploads"""
+
+    def test_upload_from_path(self, tmp_path):
+        """Test a file path is streamed with its name and guessed content type"""
+        path = tmp_path / "call.wav"
+        path.write_bytes(AUDIO)
+        server = _AudioServer()
+
+        record = upload_audio(_client(server), path, trace_id="t1", span_id="s1", audio_uuid="a1")
+
+        fields, file = server.uploads["a1"]
+        assert record == {"id": "a1", "size": len(AUDIO)}
+        assert fields == {"traceId": "t1", "spanId": "s1", "audio_uuid": "a1"}
+        assert (file["name"], file["type"], file["content"]) == ("call.wav", "audio/x-wav", AUDIO)
+
+    def test_replayable_sources_are_retried(self):
+        """Test transient failures re-send the whole recording"""
+        server = _AudioServer(fail_first=2)
+
+        upload_audio(_client(server), io.BytesIO(AUDIO), trace_id="t", span_id="s", audio_uuid="a", retry_backoff=0)
+
+        assert server.uploads["a"][1]["content"] == AUDIO
+        assert len(server.headers) == 3
+
+    def test_async_iterator_upload(self):
+        """Test an async byte iterator is streamed with an async client"""
+        server = _AudioServer()
+
+        record = asyncio.run(
+            aupload_audio(_client(server), _chunks(AUDIO, 100_000), trace_id="t", span_id="s", audio_uuid="a")
+        )
+
+        assert record["size"] == len(AUDIO)
+        assert server.headers[0]["transfer-encoding"] == "chunked"
+        assert server.uploads["a"][1]["name"] == "a"
+
+    def test_async_iterator_needs_an_async_upload(self):
+        """Test sync uploads reject async sources up front"""
+        with pytest.raises(TypeError):
+            upload_audio(_client(_AudioServer()), _chunks(AUDIO, 10), trace_id="t", span_id="s", audio_uuid="a")
+
+
+class TestBulkUpload:
+    """Test uploading many recordings"""
+
+    def test_upload_files(self, tmp_path):
+        """Test every tuple is uploaded, progress reported and failures collected"""
+        for i in range(5):
+            (tmp_path / f"{i}.mp3").write_bytes(AUDIO[: 1000 * (i + 1)])
+        server = _AudioServer(reject={"a3"})
+        progress = []
+
+        result = upload_audio_files(
+            _client(server),
+            [(f"t{i}", f"s{i}", f"a{i}", tmp_path / f"{i}.mp3") for i in range(5)],
+            concurrency=3,
+            on_progress=lambda r: progress.append(r.uploaded + len(r.failed)),
+        )
+
+        assert sorted(server.uploads) == ["a0", "a1", "a2", "a4"]
+        assert result.uploaded == 4 and result.bytes_sent == 1000 * (1 + 2 + 3 + 5)
+        assert [upload.audio_uuid for upload, _ in result.failed] == ["a3"]
+        assert sorted(progress) == [1, 2, 3, 4, 5]
+
+    def test_async_upload_files(self):
+        """Test the async bulk upload accepts async sources"""
+        server = _AudioServer()
+
+        result = asyncio.run(
+            aupload_audio_files(
+                _client(server), [("t", "s", f"a{i}", _chunks(AUDIO, 50_000)) for i in range(4)], concurrency=2
+            )
+        )
+
+        assert result.uploaded == 4 and result.bytes_sent == 4 * len(AUDIO)
+
+    def test_noveum_client_wrappers(self, tmp_path):
+        """Test NoveumClient.upload_audio and upload_audio_files"""
+        path = tmp_path / "call.wav"
+        path.write_bytes(AUDIO)
+        server = _AudioServer()
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        client.upload_audio(path, "t", "s", "a0")
+        result = client.upload_audio_files([("t", "s", "a1", AUDIO)])
+
+        assert sorted(server.uploads) == ["a0", "a1"]
+        assert result.uploaded == 1
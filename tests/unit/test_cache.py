@@ -0,0 +1,261 @@
+"""
+Unit Tests for the HTTP Response Cache
+
+Tests CachingTransport and its backends through the generated API functions.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.api.scorer_results import get_api_v1_scorers_results
+from noveum_api_client.api.scorers import get_api_v1_scorers, put_api_v1_scorers_by_id
+from noveum_api_client.cache import CachedResponse, CachingTransport, DiskCacheBackend, MemoryCacheBackend
+from noveum_api_client.models import PutApiV1ScorersByIdBody
+
+
+class _CountingServer:
+    """MockTransport handler that counts requests and supports ETags"""
+
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.method != "GET":
+            return httpx.Response(200, json={})
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, json={"scorers": [{"id": "s1"}]}, headers=headers)
+
+
+def _client(transport):
+    return Client(base_url="https://api.test", httpx_args={"transport": transport})
+
+
+class TestCachingTransport:
+    """Test cache behaviour through generated sync_detailed/asyncio_detailed calls"""
+
+    def test_fresh_hit_skips_network(self):
+        """Test a second call within the TTL is served from the cache"""
+        server = _CountingServer()
+        cache = CachingTransport(transport=httpx.MockTransport(server))
+        client = _client(cache)
+
+        first = get_api_v1_scorers.sync_detailed(client=client)
+        second = get_api_v1_scorers.sync_detailed(client=client)
+
+        assert len(server.requests) == 1
+        assert first.content == second.content
+        assert cache.stats.hits == 1
+
+    def test_uncached_endpoint_is_forwarded(self):
+        """Test endpoints without a TTL rule always hit the network"""
+        server = _CountingServer()
+        client = _client(CachingTransport(transport=httpx.MockTransport(server)))
+
+        get_api_v1_scorers_results.sync_detailed(client=client)
+        get_api_v1_scorers_results.sync_detailed(client=client)
+
+        assert len(server.requests) == 2
+
+    def test_stale_entry_is_revalidated_with_etag(self):
+        """Test stale entries send If-None-Match and reuse the body on 304"""
+        server = _CountingServer()
+        cache = CachingTransport(ttls={"/api/v1/scorers": 0.01}, transport=httpx.MockTransport(server))
+        client = _client(cache)
+
+        get_api_v1_scorers.sync_detailed(client=client)
+        time.sleep(0.02)
+        response = get_api_v1_scorers.sync_detailed(client=client)
+
+        assert server.requests[-1].headers["if-none-match"] == '"v1"'
+        assert response.status_code == 200
+        assert b"s1" in response.content
+        assert cache.stats.revalidated == 1
+
+    def test_write_invalidates_collection(self):
+        """Test a PUT on an item invalidates its cached collection"""
+        server = _CountingServer()
+        cache = CachingTransport(transport=httpx.MockTransport(server))
+        client = _client(cache)
+
+        get_api_v1_scorers.sync_detailed(client=client)
+        put_api_v1_scorers_by_id.sync_detailed(
+            "s1", client=client, id_query="s1", body=PutApiV1ScorersByIdBody(name="renamed")
+        )
+        get_api_v1_scorers.sync_detailed(client=client)
+
+        assert [request.method for request in server.requests] == ["GET", "PUT", "GET"]
+        assert cache.stats.invalidations == 1
+
+    def test_credentials_are_part_of_the_key(self):
+        """Test responses are not shared between API keys"""
+        server = _CountingServer()
+        cache = CachingTransport(transport=httpx.MockTransport(server))
+
+        for token in ("key-a", "key-b"):
+            client = Client(
+                base_url="https://api.test",
+                headers={"Authorization": f"Bearer {token}"},
+                httpx_args={"transport": cache},
+            )
+            get_api_v1_scorers.sync_detailed(client=client)
+
+        assert len(server.requests) == 2
+
+    def test_no_store_response_is_not_cached(self):
+        """Test Cache-Control: no-store responses are never stored"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[], headers={"Cache-Control": "no-store"})
+
+        client = _client(CachingTransport(transport=httpx.MockTransport(handler)))
+        get_api_v1_scorers.sync_detailed(client=client)
+        get_api_v1_scorers.sync_detailed(client=client)
+
+        assert len(requests) == 2
+
+    def test_write_invalidates_entries_of_other_processes(self, tmp_path):
+        """Test a write invalidates disk entries stored by another transport on the same directory"""
+        server = _CountingServer()
+        get_api_v1_scorers.sync_detailed(
+            client=_client(CachingTransport(DiskCacheBackend(tmp_path), transport=httpx.MockTransport(server)))
+        )
+        cache = CachingTransport(DiskCacheBackend(tmp_path), transport=httpx.MockTransport(server))
+        client = _client(cache)
+
+        put_api_v1_scorers_by_id.sync_detailed(
+            "s1", client=client, id_query="s1", body=PutApiV1ScorersByIdBody(name="renamed")
+        )
+        get_api_v1_scorers.sync_detailed(client=client)
+
+        assert [request.method for request in server.requests] == ["GET", "PUT", "GET"]
+        assert cache.stats.invalidations == 1
+
+    def test_write_to_uncached_path_skips_invalidation(self):
+        """Test writes under paths without a TTL rule never reach the backend"""
+        calls = []
+
+        class _Backend(MemoryCacheBackend):
+            def delete_paths(self, paths):
+                calls.append(paths)
+                return super().delete_paths(paths)
+
+        server = _CountingServer()
+        client = _client(CachingTransport(_Backend(), transport=httpx.MockTransport(server)))
+
+        client.get_httpx_client().post("/api/v1/traces/t1/spans", json={})
+        put_api_v1_scorers_by_id.sync_detailed(
+            "s1", client=client, id_query="s1", body=PutApiV1ScorersByIdBody(name="renamed")
+        )
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_hit_skips_network(self):
+        """Test the async path shares the same cache"""
+        server = _CountingServer()
+        client = _client(CachingTransport(transport=httpx.MockTransport(server)))
+
+        await get_api_v1_scorers.asyncio_detailed(client=client)
+        response = await get_api_v1_scorers.asyncio_detailed(client=client)
+
+        assert len(server.requests) == 1
+        assert response.status_code == 200
+
+
+class TestCacheBackends:
+    """Test cache storage backends"""
+
+    @staticmethod
+    def _entry(size):
+        return CachedResponse(status_code=200, headers=[], content=b"x" * size, expires_at=time.time() + 60)
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        """Test the memory backend enforces its byte budget in LRU order"""
+        backend = MemoryCacheBackend(max_bytes=25)
+        backend.set("a", self._entry(10))
+        backend.set("b", self._entry(10))
+        backend.get("a")
+        backend.set("c", self._entry(10))
+
+        assert backend.get("a") is not None
+        assert backend.get("b") is None
+        assert len(backend) == 2
+
+    def test_memory_backend_enforces_entry_limit(self):
+        """Test the memory backend enforces max_entries"""
+        backend = MemoryCacheBackend(max_entries=1)
+        backend.set("a", self._entry(1))
+        backend.set("b", self._entry(1))
+
+        assert backend.get("a") is None
+
+    def test_disk_backend_round_trip(self, tmp_path):
+        """Test entries survive a new backend instance on the same directory"""
+        entry = CachedResponse(
+            status_code=200, headers=[("ETag", '"v1"')], content=b'{"a":\n1}', expires_at=time.time() + 60
+        )
+        DiskCacheBackend(tmp_path).set("key", entry)
+
+        loaded = DiskCacheBackend(tmp_path).get("key")
+        assert loaded == entry
+        assert loaded.etag == '"v1"'
+
+    def test_disk_backend_evicts_to_budget(self, tmp_path):
+        """Test the disk backend stays within max_bytes"""
+        backend = DiskCacheBackend(tmp_path, max_bytes=400)
+        for key in ("a", "b", "c"):
+            backend.set(key, self._entry(150))
+
+        assert backend.get("c") is not None
+        total = sum(path.stat().st_size for path in tmp_path.glob("*.entry"))
+        assert total <= 400
+
+    def test_disk_backend_invalidates_from_its_index(self, tmp_path):
+        """Test indexed files are not read again, and files added by another process are found"""
+        backend = DiskCacheBackend(tmp_path)
+        backend.set("a", CachedResponse(200, [], b"a", time.time() + 60, path="/x"))
+        assert backend.delete_paths({"/y"}) == 0
+        # Rewritten in place: the index still knows the file by its original path
+        (entry,) = tmp_path.glob("*.entry")
+        entry.write_bytes(b"not json")
+
+        DiskCacheBackend(tmp_path).set("b", CachedResponse(200, [], b"b", time.time() + 60, path="/y"))
+
+        assert backend.delete_paths({"/x", "/y"}) == 2
+        assert list(tmp_path.glob("*.entry")) == []
+
+    def test_disk_backend_size_tracks_replacements_and_deletes(self, tmp_path):
+        """Test replacing and deleting entries keeps the running size exact"""
+        backend = DiskCacheBackend(tmp_path, max_bytes=10_000)
+        for _ in range(5):
+            backend.set("a", self._entry(150))
+        backend.set("b", self._entry(150))
+        backend.delete("b")
+        backend.set("c", self._entry(150))
+
+        assert backend._size == sum(path.stat().st_size for path in tmp_path.glob("*.entry"))
+
+
+class TestNoveumClientCache:
+    """Test cache wiring in NoveumClient"""
+
+    def test_cache_stats_requires_backend(self):
+        """Test cache_stats raises when caching is disabled"""
+        with pytest.raises(RuntimeError):
+            NoveumClient(api_key="test_key").cache_stats()
+
+    def test_cache_is_installed_as_transport(self):
+        """Test a cache backend enables the caching transport"""
+        client = NoveumClient(api_key="test_key", cache=MemoryCacheBackend())
+
+        assert client.cache_stats()["hits"] == 0
+        assert isinstance(client.client.get_httpx_client()._transport, CachingTransport)
@@ -0,0 +1,195 @@
+"""
+Unit Tests for Request Coalescing
+
+Tests that identical concurrent GET requests are sent once and fanned out.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.api.datasets import get_api_v1_datasets_by_slug
+from noveum_api_client.coalescing import NO_COALESCE, CoalescingTransport
+
+
+def _client(transport, token="test_key"):
+    return Client(
+        base_url="https://api.test",
+        headers={"Authorization": f"Bearer {token}"},
+        httpx_args={"transport": transport},
+    )
+
+
+class TestSyncCoalescing:
+    """Test coalescing across threads"""
+
+    def test_concurrent_gets_share_one_request(self):
+        """Test concurrent identical GETs are sent once"""
+        sent = []
+        coalescing = CoalescingTransport()
+
+        def handler(request):
+            sent.append(request)
+            # Hold the flight open until every other caller has joined it
+            deadline = time.monotonic() + 2
+            while coalescing.requests_coalesced < 4 and time.monotonic() < deadline:
+                time.sleep(0.005)
+            return httpx.Response(200, json={"id": "d1"})
+
+        coalescing = CoalescingTransport(httpx.MockTransport(handler))
+        client = _client(coalescing)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(
+                executor.map(lambda _: get_api_v1_datasets_by_slug.sync_detailed("d1", client=client), range(5))
+            )
+
+        assert len(sent) == 1
+        assert coalescing.requests_coalesced == 4
+        assert all(response.content == b'{"id":"d1"}' for response in responses)
+
+    def test_sequential_gets_are_not_coalesced(self):
+        """Test only in-flight requests are shared"""
+        sent = []
+        client = _client(CoalescingTransport(httpx.MockTransport(lambda r: sent.append(r) or httpx.Response(200))))
+
+        get_api_v1_datasets_by_slug.sync_detailed("d1", client=client)
+        get_api_v1_datasets_by_slug.sync_detailed("d1", client=client)
+
+        assert len(sent) == 2
+
+    def test_writes_are_never_coalesced(self):
+        """Test non-GET requests get no flight key"""
+        request = httpx.Request("POST", "https://api.test/api/v1/datasets")
+
+        assert CoalescingTransport.flight_key(request) is None
+
+    def test_key_includes_params_and_credentials(self):
+        """Test different params or credentials produce different keys"""
+        base = httpx.Request("GET", "https://api.test/api/v1/datasets?limit=1", headers={"Authorization": "a"})
+        other_params = httpx.Request("GET", "https://api.test/api/v1/datasets?limit=2", headers={"Authorization": "a"})
+        other_auth = httpx.Request("GET", "https://api.test/api/v1/datasets?limit=1", headers={"Authorization": "b"})
+
+        keys = {CoalescingTransport.flight_key(request) for request in (base, other_params, other_auth)}
+        assert len(keys) == 3
+
+    def test_per_request_headers_are_not_coalesced(self):
+        """Test Range, conditional and opted-out requests get no flight key, Accept is keyed"""
+        url = "https://api.test/api/v1/audio/a/serve"
+        for headers in ({"Range": "bytes=0-9"}, {"If-None-Match": '"v1"'}, {"If-Modified-Since": "x"}):
+            assert CoalescingTransport.flight_key(httpx.Request("GET", url, headers=headers)) is None
+        assert CoalescingTransport.flight_key(httpx.Request("GET", url, extensions={NO_COALESCE: True})) is None
+
+        keys = {
+            CoalescingTransport.flight_key(httpx.Request("GET", url, headers={"Accept": accept}))
+            for accept in ("audio/wav", "application/json")
+        }
+        assert len(keys) == 2
+
+    def test_concurrent_range_reads_get_their_own_bytes(self):
+        """Test concurrent partial audio reads are not served each other's ranges"""
+        from noveum_api_client.audio_download import stream_audio
+
+        data = bytes(range(256)) * 4
+        barrier = threading.Barrier(2, timeout=2)
+
+        def handler(request):
+            barrier.wait()
+            start, _, end = request.headers["range"].removeprefix("bytes=").partition("-")
+            body = data[int(start) : int(end) + 1]
+            headers = {"content-range": f"bytes {start}-{end}/{len(data)}"}
+            return httpx.Response(206, headers=headers, content=body)
+
+        coalescing = CoalescingTransport(httpx.MockTransport(handler))
+        client = _client(coalescing)
+        client.get_httpx_client()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ranges = [(0, 9), (500, 509)]
+            reads = list(executor.map(lambda r: b"".join(stream_audio(client, "a", start=r[0], end=r[1])), ranges))
+
+        assert reads == [data[0:10], data[500:510]]
+        assert coalescing.requests_coalesced == 0
+
+    def test_errors_reach_every_waiter(self):
+        """Test a failed leader request raises for all followers"""
+        started = threading.Event()
+        coalescing = CoalescingTransport()
+
+        def handler(request):
+            started.set()
+            deadline = time.monotonic() + 2
+            while coalescing.requests_coalesced < 1 and time.monotonic() < deadline:
+                time.sleep(0.005)
+            raise httpx.ConnectError("boom")
+
+        coalescing = CoalescingTransport(httpx.MockTransport(handler))
+        client = _client(coalescing)
+
+        def call(_):
+            try:
+                get_api_v1_datasets_by_slug.sync_detailed("d1", client=client)
+            except httpx.ConnectError:
+                return "error"
+            return "ok"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(call, range(2)))
+
+        assert results == ["error", "error"]
+
+
+class TestAsyncCoalescing:
+    """Test coalescing across asyncio tasks"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self):
+        """Test concurrent identical async GETs are sent once"""
+        sent = []
+
+        async def handler(request):
+            sent.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": "d1"})
+
+        coalescing = CoalescingTransport(httpx.MockTransport(handler))
+        client = _client(coalescing)
+
+        responses = await asyncio.gather(
+            *(get_api_v1_datasets_by_slug.asyncio_detailed("d1", client=client) for _ in range(10))
+        )
+
+        assert len(sent) == 1
+        assert coalescing.requests_coalesced == 9
+        assert {response.status_code for response in responses} == {200}
+
+    @pytest.mark.asyncio
+    async def test_different_urls_are_not_shared(self):
+        """Test distinct resources are fetched separately"""
+        sent = []
+
+        async def handler(request):
+            sent.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200)
+
+        client = _client(CoalescingTransport(httpx.MockTransport(handler)))
+        await asyncio.gather(*(get_api_v1_datasets_by_slug.asyncio_detailed(f"d{i}", client=client) for i in range(3)))
+
+        assert len(sent) == 3
+
+
+class TestNoveumClientCoalescing:
+    """Test coalescing wiring in NoveumClient"""
+
+    def test_coalescing_is_opt_in(self):
+        """Test coalescing installs a transport only when requested"""
+        assert "transport" not in NoveumClient(api_key="test_key").client._httpx_args
+
+        client = NoveumClient(api_key="test_key", coalesce_requests=True)
+        assert isinstance(client.client._httpx_args["transport"], CoalescingTransport)
@@ -0,0 +1,178 @@
+"""
+Unit Tests for the Versioned Dataset Snapshot Cache
+
+Tests snapshot storage, memory-mapped reads and published/draft revalidation.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_cache import DatasetSnapshot, DatasetSnapshotCache, aiter_dataset_items, is_published
+from noveum_api_client.errors import UnexpectedStatus
+
+
+class _DatasetServer:
+    """MockTransport handler serving one dataset version"""
+
+    def __init__(self, items, version_data, max_page_size=None, total=True):
+        self.items = items
+        self.version_data = version_data
+        self.max_page_size = max_page_size
+        self.total = total
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.url.path.endswith("/items"):
+            offset = int(float(request.url.params["offset"]))
+            limit = min(int(float(request.url.params["limit"])), self.max_page_size or len(self.items) + 1)
+            body = {"items": self.items[offset : offset + limit]}
+            if self.total:
+                body["pagination"] = {"total": len(self.items)}
+            return httpx.Response(200, json=body)
+        return httpx.Response(200, json={"data": self.version_data})
+
+
+def _items(count):
+    return [{"item_id": f"item-{i}", "content": {"input": f"question {i}", "unicode": "é"}} for i in range(count)]
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestDatasetSnapshot:
+    """Test reading stored snapshots"""
+
+    def test_store_and_read_items(self, tmp_path):
+        """Test stored items are readable by index, iteration and ID"""
+        cache = DatasetSnapshotCache(tmp_path)
+        items = _items(5)
+        cache.store("ds", "1.0.0", items, {"status": "published"})
+
+        with cache.open("ds", "1.0.0") as snapshot:
+            assert len(snapshot) == 5
+            assert snapshot[0] == items[0]
+            assert snapshot[-1] == items[-1]
+            assert list(snapshot) == items
+            assert snapshot.get("item-3") == items[3]
+            assert snapshot.get("missing") is None
+            assert json.loads(snapshot.raw(1)) == items[1]
+            assert snapshot.published
+
+    def test_index_out_of_range(self, tmp_path):
+        """Test out-of-range access raises IndexError"""
+        cache = DatasetSnapshotCache(tmp_path)
+        cache.store("ds", "1.0.0", _items(1), {})
+
+        with cache.open("ds", "1.0.0") as snapshot, pytest.raises(IndexError):
+            snapshot[1]
+
+    def test_empty_version(self, tmp_path):
+        """Test an empty version produces an empty snapshot"""
+        cache = DatasetSnapshotCache(tmp_path)
+        path = cache.store("ds", "1.0.0", [], {})
+
+        with DatasetSnapshot(path) as snapshot:
+            assert len(snapshot) == 0
+            assert list(snapshot) == []
+
+    def test_path_segments_are_escaped(self, tmp_path):
+        """Test slugs and versions cannot escape the cache directory"""
+        cache = DatasetSnapshotCache(tmp_path)
+
+        assert cache.path_for("../etc", "..").parent.parent == tmp_path
+        assert cache.path_for("a/b", "1").parent.name == "a%2Fb"
+
+    def test_open_missing_version(self, tmp_path):
+        """Test opening an uncached version returns None"""
+        assert DatasetSnapshotCache(tmp_path).open("ds", "9.9.9") is None
+
+
+class TestDatasetSnapshotCacheLoad:
+    """Test downloading and revalidating versions"""
+
+    def test_published_version_is_a_permanent_hit(self, tmp_path):
+        """Test a published version is downloaded once"""
+        server = _DatasetServer(_items(7), {"version": "1.0.0", "status": "published"})
+        cache = DatasetSnapshotCache(tmp_path, page_size=3)
+
+        with cache.load(_client(server), "ds", "1.0.0") as snapshot:
+            assert len(snapshot) == 7
+        requests_after_download = len(server.requests)
+        with cache.load(_client(server), "ds", "1.0.0") as snapshot:
+            assert snapshot.get("item-6") is not None
+
+        assert requests_after_download == 1 + 3
+        assert len(server.requests) == requests_after_download
+        assert cache.stats.to_dict() == {"hits": 1, "revalidated": 0, "downloads": 1}
+
+    @pytest.mark.parametrize("total", [True, False])
+    def test_server_page_cap(self, tmp_path, total):
+        """Test a server returning fewer items than requested per page still yields the whole version"""
+        server = _DatasetServer(_items(7), {"version": "1.0.0", "status": "published"}, max_page_size=2, total=total)
+        cache = DatasetSnapshotCache(tmp_path, page_size=5)
+
+        with cache.load(_client(server), "ds", "1.0.0") as snapshot:
+            assert list(snapshot) == _items(7)
+
+        async def collect():
+            return [item async for item in aiter_dataset_items(_client(server), "ds", page_size=5)]
+
+        assert asyncio.run(collect()) == _items(7)
+
+    def test_unchanged_draft_is_revalidated(self, tmp_path):
+        """Test an unchanged draft only fetches version metadata"""
+        server = _DatasetServer(_items(2), {"version": "draft", "status": "draft", "item_count": 2})
+        cache = DatasetSnapshotCache(tmp_path)
+
+        cache.load(_client(server), "ds", "draft").close()
+        server.requests.clear()
+        cache.load(_client(server), "ds", "draft").close()
+
+        assert [request.url.path for request in server.requests] == ["/api/v1/datasets/ds/versions/draft"]
+        assert cache.stats.revalidated == 1
+
+    def test_changed_draft_is_downloaded_again(self, tmp_path):
+        """Test a changed draft replaces the cached snapshot"""
+        server = _DatasetServer(_items(2), {"version": "draft", "status": "draft", "item_count": 2})
+        cache = DatasetSnapshotCache(tmp_path)
+        cache.load(_client(server), "ds", "draft").close()
+
+        server.items = _items(3)
+        server.version_data = {"version": "draft", "status": "draft", "item_count": 3}
+        with cache.load(_client(server), "ds", "draft") as snapshot:
+            assert len(snapshot) == 3
+        assert cache.stats.downloads == 2
+
+    def test_missing_version_raises(self, tmp_path):
+        """Test API errors surface as UnexpectedStatus"""
+        client = Client(
+            base_url="https://api.test",
+            httpx_args={"transport": httpx.MockTransport(lambda request: httpx.Response(404, json={}))},
+        )
+
+        with pytest.raises(UnexpectedStatus):
+            DatasetSnapshotCache(tmp_path).load(client, "ds", "1.0.0")
+
+
+class TestIsPublished:
+    """Test published-version detection"""
+
+    @pytest.mark.parametrize(
+        "version_data,expected",
+        [
+            ({"status": "published"}, True),
+            ({"status": "PUBLISHED"}, True),
+            ({"published_at": "2024-01-01T00:00:00Z"}, True),
+            ({"status": "draft"}, False),
+            ({}, False),
+        ],
+    )
+    def test_is_published(self, version_data, expected):
+        """Test status and published_at both mark a version as published"""
+        assert is_published(version_data) is expected
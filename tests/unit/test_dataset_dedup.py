@@ -0,0 +1,166 @@
+"""
+Unit Tests for Content-Hash Deduplication of Dataset Uploads
+
+Tests content hashing, the persistent hash index and dedup-aware uploads.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_dedup import HashIndex, content_hash
+from noveum_api_client.dataset_upload import upload_items
+from noveum_api_client.errors import UnexpectedStatus
+
+
+def _item(index, text=None, item_type="qa"):
+    return {"item_id": f"item-{index}", "item_type": item_type, "content": {"input": text or f"question {index}"}}
+
+
+class _DatasetServer:
+    """MockTransport handler recording posted and deleted item IDs"""
+
+    def __init__(self, listing=(), fail_posts=False, missing=()):
+        self.listing = list(listing)
+        self.fail_posts = fail_posts
+        self.missing = set(missing)
+        self.posted = []
+        self.deleted = []
+        self.methods = []
+
+    def __call__(self, request):
+        self.methods.append(request.method)
+        if request.method == "GET":
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            return httpx.Response(200, json={"items": self.listing[offset : offset + limit]})
+        body = json.loads(request.content)
+        if request.method == "DELETE":
+            if self.missing & set(body["itemIds"]):
+                return httpx.Response(404, json={"error": "Item not found"})
+            self.deleted.extend(body["itemIds"])
+            return httpx.Response(200, json={})
+        if self.fail_posts:
+            return httpx.Response(400, json={})
+        self.posted.extend(item.get("item_id") for item in body["items"])
+        return httpx.Response(201, json={})
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestContentHash:
+    """Test canonical hashing"""
+
+    def test_key_order_does_not_matter(self):
+        """Test the hash is computed over canonical JSON"""
+        first = {"item_type": "qa", "content": {"a": 1, "b": [1, 2]}, "item_id": "x"}
+        second = {"content": {"b": [1, 2], "a": 1}, "item_type": "qa", "metadata": {"ignored": True}}
+
+        assert content_hash(first) == content_hash(second)
+
+    def test_item_type_is_part_of_the_hash(self):
+        """Test equal content with another item type hashes differently"""
+        assert content_hash(_item(1)) != content_hash(_item(1, item_type="other"))
+
+
+class TestHashIndex:
+    """Test the per-dataset hash index"""
+
+    def test_save_and_reload(self, tmp_path):
+        """Test named and anonymous hashes survive a reload"""
+        index = HashIndex.for_dataset("my/ds", tmp_path)
+        index.add("item-1", content_hash(_item(1)))
+        index.add("", content_hash(_item(2)))
+        index.save()
+
+        reloaded = HashIndex.for_dataset("my/ds", tmp_path)
+        assert reloaded.get("item-1") == content_hash(_item(1))
+        assert content_hash(_item(2)) in reloaded
+
+    def test_seed_from_listing(self):
+        """Test seeding reads every listed item"""
+        server = _DatasetServer(listing=[_item(i) for i in range(3)])
+        index = HashIndex()
+
+        assert index.seed(_client(server), "ds", page_size=2) == 3
+        assert index.get("item-2") == content_hash(_item(2))
+
+
+class TestDedupUpload:
+    """Test dedup-aware uploads"""
+
+    def test_unchanged_items_are_skipped(self):
+        """Test a second identical upload sends nothing"""
+        items = [_item(i) for i in range(4)]
+        index = HashIndex()
+        upload_items(_client(_DatasetServer()), "ds", items, dedup=index)
+
+        server = _DatasetServer()
+        result = upload_items(_client(server), "ds", items, dedup=index)
+
+        assert server.methods == []
+        assert result.items_unchanged == 4
+        assert result.dedup_hit_rate == 1.0
+        assert result.bytes_saved > 0
+
+    def test_changed_items_replace_old_versions(self):
+        """Test a changed item is re-posted and its old version deleted, new items are posted"""
+        index = HashIndex()
+        index.seed(_client(_DatasetServer(listing=[_item(0), _item(1)])), "ds")
+        server = _DatasetServer()
+
+        result = upload_items(_client(server), "ds", [_item(0), _item(1, "edited"), _item(2)], dedup=index)
+
+        assert server.deleted == ["item-1"]
+        assert server.posted == ["item-1", "item-2"]
+        assert server.methods == ["POST", "DELETE"]
+        assert (result.items_unchanged, result.items_replaced, result.items_uploaded) == (1, 1, 2)
+        assert index.get("item-1") == content_hash(_item(1, "edited"))
+
+    def test_failed_post_keeps_the_old_version(self):
+        """Test the replaced version is not deleted when its new version is never stored"""
+        index = HashIndex()
+        index.add("item-1", content_hash(_item(1)))
+        server = _DatasetServer(fail_posts=True)
+
+        with pytest.raises(UnexpectedStatus):
+            upload_items(_client(server), "ds", [_item(1, "edited")], dedup=index)
+
+        assert server.methods == ["POST"] and server.deleted == []
+        assert index.get("item-1") == content_hash(_item(1))
+
+    def test_already_deleted_old_version(self):
+        """Test a 404 deleting a replaced version counts as deleted"""
+        index = HashIndex()
+        index.add("item-1", content_hash(_item(1)))
+        server = _DatasetServer(missing={"item-1"})
+
+        result = upload_items(_client(server), "ds", [_item(1, "edited")], dedup=index)
+
+        assert server.posted == ["item-1"]
+        assert result.items_replaced == 1
+        assert index.get("item-1") == content_hash(_item(1, "edited"))
+
+    def test_duplicates_without_ids_are_sent_once(self):
+        """Test anonymous items are deduplicated by hash within a run"""
+        item = {"item_type": "qa", "content": {"input": "same"}}
+        server = _DatasetServer()
+
+        result = upload_items(_client(server), "ds", [item, dict(item)], dedup=HashIndex())
+
+        assert len(server.posted) == 1
+        assert result.items_unchanged == 1
+
+    def test_failed_upload_does_not_record_hashes(self, tmp_path):
+        """Test hashes are only recorded for acknowledged chunks"""
+        index = HashIndex(tmp_path / "ds.tsv")
+
+        with pytest.raises(UnexpectedStatus):
+            upload_items(_client(_DatasetServer(fail_posts=True)), "ds", [_item(0)], dedup=index)
+
+        assert index.get("item-0") is None
+        assert HashIndex(tmp_path / "ds.tsv").get("item-0") is None
@@ -0,0 +1,113 @@
+"""
+Unit Tests for Bulk Dataset Item Deletion
+
+Tests chunked deletion by ID and the predicate scan-and-delete pipeline.
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_delete import bulk_delete_items
+from noveum_api_client.errors import UnexpectedStatus
+
+
+class _LiveDatasetServer:
+    """MockTransport handler over a mutable item list, so deletions shift offsets"""
+
+    def __init__(self, count, report_total=True, fail_deletes=0, max_page_size=None):
+        self.items = [{"item_id": f"item-{i}", "item_type": "even" if i % 2 == 0 else "odd"} for i in range(count)]
+        self.report_total = report_total
+        self.fail_deletes = fail_deletes
+        self.max_page_size = max_page_size
+        self.delete_requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            if request.method == "GET":
+                offset = int(float(request.url.params["offset"]))
+                limit = int(float(request.url.params["limit"]))
+                if self.max_page_size:
+                    limit = min(limit, self.max_page_size)
+                data = {"items": self.items[offset : offset + limit]}
+                if self.report_total:
+                    data["pagination"] = {"total": len(self.items)}
+                return httpx.Response(200, json=data)
+            self.delete_requests += 1
+            if self.delete_requests <= self.fail_deletes:
+                return httpx.Response(503, json={})
+            ids = set(json.loads(request.content)["itemIds"])
+            self.items = [item for item in self.items if item["item_id"] not in ids]
+            return httpx.Response(200, json={})
+
+    def ids(self):
+        return [item["item_id"] for item in self.items]
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestDeleteByIds:
+    """Test chunked deletion of explicit IDs"""
+
+    def test_ids_are_deleted_in_chunks(self):
+        """Test every ID is deleted with chunk_size IDs per request"""
+        server = _LiveDatasetServer(10)
+        result = bulk_delete_items(_client(server), "ds", (f"item-{i}" for i in range(7)), chunk_size=3)
+
+        assert server.ids() == ["item-7", "item-8", "item-9"]
+        assert (result.items_deleted, result.chunks) == (7, 3)
+
+    def test_transient_failures_are_retried(self):
+        """Test 503 responses are retried"""
+        server = _LiveDatasetServer(3, fail_deletes=1)
+        result = bulk_delete_items(_client(server), "ds", ["item-0"], retry_backoff=0)
+
+        assert server.ids() == ["item-1", "item-2"]
+        assert result.retries == 1
+
+    def test_permanent_failure_raises(self):
+        """Test exhausted retries surface as UnexpectedStatus"""
+        server = _LiveDatasetServer(3, fail_deletes=10)
+
+        with pytest.raises(UnexpectedStatus):
+            bulk_delete_items(_client(server), "ds", ["item-0"], max_retries=1, retry_backoff=0)
+
+
+class TestDeleteByPredicate:
+    """Test the scan-and-delete pipeline"""
+
+    @pytest.mark.parametrize("report_total", [True, False])
+    def test_every_match_is_deleted(self, report_total):
+        """Test no matching item is missed although deletions shift offsets"""
+        server = _LiveDatasetServer(95, report_total=report_total)
+
+        result = bulk_delete_items(
+            _client(server), "ds", lambda item: item["item_type"] == "even", page_size=10, chunk_size=4
+        )
+
+        assert server.ids() == [f"item-{i}" for i in range(1, 95, 2)]
+        assert result.items_deleted == 48
+        assert result.items_scanned == 95
+
+    @pytest.mark.parametrize("report_total", [True, False])
+    def test_server_page_cap(self, report_total):
+        """Test a server capping limit below page_size still has every item scanned"""
+        server = _LiveDatasetServer(1000, report_total=report_total, max_page_size=100)
+
+        result = bulk_delete_items(_client(server), "ds", lambda item: True, page_size=500)
+
+        assert server.ids() == []
+        assert (result.items_deleted, result.items_scanned) == (1000, 1000)
+
+    def test_empty_dataset(self):
+        """Test an empty dataset sends no deletes"""
+        server = _LiveDatasetServer(0)
+
+        assert bulk_delete_items(_client(server), "ds", lambda item: True).chunks == 0
+        assert server.delete_requests == 0
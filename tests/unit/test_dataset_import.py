@@ -0,0 +1,181 @@
+"""
+Unit Tests for the Streaming Dataset Importer
+
+Tests schema validation, type coercion, batch error handling and file readers.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from noveum_api_client import NoveumClient
+from noveum_api_client.dataset_import import (
+    CONTENT_FIELD_TYPES,
+    ImportSchema,
+    ImportStats,
+    ImportValidationError,
+    import_items,
+)
+from noveum_api_client.dataset_upload import UploadResult
+from noveum_api_client.models import PostApiV1DatasetsByDatasetSlugItemsBodyItemsItem
+
+
+@pytest.fixture
+def schema():
+    return ImportSchema(
+        item_type="conversational",
+        item_id_column="id",
+        content={
+            "input_text": "prompt",
+            "tool_calls": "tools",
+            "quality_score": "score",
+            "agent_name": "agent.name",
+        },
+        metadata_columns=["source"],
+        required=["input_text"],
+    )
+
+
+class TestImportSchema:
+    """Test schema declaration checks"""
+
+    def test_content_field_types_follow_model(self):
+        """Test field types are derived from the generated content model"""
+        assert CONTENT_FIELD_TYPES["agent_name"] is str
+        assert CONTENT_FIELD_TYPES["tool_calls"] is list
+        assert CONTENT_FIELD_TYPES["quality_score"] is float
+        assert CONTENT_FIELD_TYPES["custom_attributes"] is dict
+
+    def test_unknown_field_is_rejected(self):
+        """Test mapping a field the model does not have fails early"""
+        with pytest.raises(ValueError, match="not_a_field"):
+            ImportSchema(item_type="qa", content={"not_a_field": "x"})
+
+    def test_required_field_must_be_mapped(self):
+        """Test required fields must appear in the mapping"""
+        with pytest.raises(ValueError):
+            ImportSchema(item_type="qa", content={}, required=["input_text"])
+
+
+class TestImportItems:
+    """Test record conversion"""
+
+    def test_records_become_item_bytes(self, schema):
+        """Test records are converted, coerced and serialized"""
+        records = [
+            {
+                "id": 7,
+                "prompt": "hi",
+                "tools": '[{"name": "search"}]',
+                "score": "0.5",
+                "agent": {"name": "bot"},
+                "source": "logs",
+            }
+        ]
+
+        (data,) = import_items(records, schema)
+        item = json.loads(data)
+
+        assert item == {
+            "item_type": "conversational",
+            "item_id": "7",
+            "content": {
+                "input_text": "hi",
+                "tool_calls": [{"name": "search"}],
+                "quality_score": 0.5,
+                "agent_name": "bot",
+            },
+            "metadata": {"source": "logs"},
+        }
+        assert PostApiV1DatasetsByDatasetSlugItemsBodyItemsItem.from_dict(item).to_dict() == item
+
+    def test_batch_errors_are_raised_together(self, schema):
+        """Test every invalid field of a batch is reported in one error"""
+        records = [{"prompt": "ok"}, {"tools": "not json"}, {"prompt": "x", "score": "high"}]
+
+        with pytest.raises(ImportValidationError) as exc_info:
+            list(import_items(records, schema))
+
+        assert [(error.line, error.field) for error in exc_info.value.errors] == [
+            (2, "input_text"),
+            (2, "tool_calls"),
+            (3, "quality_score"),
+        ]
+
+    @pytest.mark.parametrize("score", ["nan", "inf", "-Infinity", float("nan"), float("inf")])
+    def test_non_finite_numbers_are_row_errors(self, schema, score):
+        """Test NaN and infinities are reported like other invalid numbers"""
+        with pytest.raises(ImportValidationError) as exc_info:
+            list(import_items([{"prompt": "x", "score": score}], schema))
+
+        [error] = exc_info.value.errors
+        assert (error.line, error.field) == (1, "quality_score")
+        assert "finite" in error.message
+
+    def test_skip_mode_drops_invalid_records(self, schema):
+        """Test invalid records are counted and skipped"""
+        stats = ImportStats()
+        records = [{"prompt": "a"}, {"prompt": ["wrong"]}, {"prompt": "b"}]
+
+        items = [json.loads(data) for data in import_items(records, schema, on_error="skip", stats=stats)]
+
+        assert [item["content"]["input_text"] for item in items] == ["a", "b"]
+        assert stats.to_dict() == {"records": 3, "items": 2, "invalid": 1}
+        assert stats.errors[0].field == "input_text"
+
+    def test_earlier_batches_are_emitted_before_an_error(self, schema):
+        """Test validation is per batch, so output streams before a bad batch"""
+        records = [{"prompt": "a"}, {"prompt": "b"}, {}, {"score": "x", "prompt": "c"}]
+        items = import_items(records, schema, batch_size=2)
+
+        assert len([next(items), next(items)]) == 2
+        with pytest.raises(ImportValidationError):
+            next(items)
+
+
+class TestReaders:
+    """Test JSONL and CSV sources"""
+
+    def test_jsonl_file(self, tmp_path, schema):
+        """Test JSONL files, including malformed lines"""
+        path = tmp_path / "logs.jsonl"
+        path.write_text('{"prompt": "a"}\n\n{broken\n')
+        stats = ImportStats()
+
+        items = list(import_items(path, schema, on_error="skip", stats=stats))
+
+        assert len(items) == 1
+        assert stats.errors[0].line == 3
+
+    def test_csv_file(self, tmp_path, schema):
+        """Test CSV cells are coerced to the field types"""
+        path = tmp_path / "logs.csv"
+        path.write_text('id,prompt,tools,score\n1,hello,"[1, 2]",0.25\n2,world,,\n')
+
+        items = [json.loads(data) for data in import_items(path, schema)]
+
+        assert items[0]["content"] == {"input_text": "hello", "tool_calls": [1, 2], "quality_score": 0.25}
+        assert items[1]["content"] == {"input_text": "world"}
+
+    def test_unknown_suffix_requires_format(self, tmp_path, schema):
+        """Test the format must be given for unknown suffixes"""
+        with pytest.raises(ValueError):
+            list(import_items(tmp_path / "logs.txt", schema))
+
+
+class TestNoveumClientImport:
+    """Test the NoveumClient wrapper"""
+
+    def test_import_streams_into_upload(self, tmp_path, schema):
+        """Test import_items feeds converted bytes to upload_items"""
+        path = tmp_path / "logs.jsonl"
+        path.write_text('{"prompt": "a"}\n')
+        client = NoveumClient(api_key="test_key")
+
+        with patch("noveum_api_client.noveum_client.upload_items", return_value=UploadResult()) as upload:
+            client.import_items("ds", path, schema, concurrency=2)
+
+        items = list(upload.call_args.args[2])
+        assert json.loads(items[0])["content"] == {"input_text": "a"}
+        assert upload.call_args.kwargs["concurrency"] == 2
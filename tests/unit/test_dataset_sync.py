@@ -0,0 +1,163 @@
+"""
+Unit Tests for Incremental Dataset Sync
+
+Tests the typed version diff models and diff-based snapshot updates.
+"""
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_cache import DatasetSnapshotCache
+from noveum_api_client.dataset_sync import fetch_version_diff, sync_dataset
+from noveum_api_client.models import GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200
+
+
+def _item(index, text=None):
+    return {"item_id": f"item-{index}", "item_type": "qa", "content": {"input": text or f"question {index}"}}
+
+
+class _ReleaseServer:
+    """MockTransport handler serving two releases of one dataset and their diff"""
+
+    def __init__(self, versions, diff):
+        self.versions = versions
+        self.diff = diff
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path
+        if path.endswith("/versions/diff"):
+            return httpx.Response(200, json=self.diff)
+        if path.endswith("/items"):
+            items = self.versions[request.url.params["version"]]
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            return httpx.Response(
+                200, json={"items": items[offset : offset + limit], "pagination": {"total": len(items)}}
+            )
+        version = path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"data": {"version": version, "status": "published"}})
+
+    def item_requests(self):
+        return [request for request in self.requests if request.url.path.endswith("/items")]
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+@pytest.fixture
+def releases():
+    base = [_item(i) for i in range(10)]
+    target = [_item(i) for i in range(10) if i != 3]
+    target[4] = _item(5, "changed")
+    target.append(_item(10))
+    diff = {
+        "from_version": "1.0.0",
+        "to_version": "1.1.0",
+        "added": [_item(10)],
+        "removed": ["item-3"],
+        "modified": [_item(5, "changed")],
+        "summary": {"added": 1, "removed": 1, "modified": 1},
+    }
+    return {"1.0.0": base, "1.1.0": target}, diff
+
+
+class TestVersionDiffModel:
+    """Test the typed diff response"""
+
+    def test_bare_ids_are_parsed(self, releases):
+        """Test removed items given as bare IDs are parsed into change items"""
+        _, diff = releases
+        parsed = fetch_version_diff(_client(_ReleaseServer({}, diff)), "ds")
+
+        assert parsed.to_version == "1.1.0"
+        assert [change.item_id for change in parsed.removed] == ["item-3"]
+        assert parsed.modified[0].content == {"input": "changed"}
+        assert parsed.to_dict()["added"] == [_item(10)]
+
+    def test_deleted_is_an_alias_of_removed(self, releases):
+        """Test removals reported under "deleted" are not dropped"""
+        _, diff = releases
+        diff["deleted"] = diff.pop("removed")
+
+        parsed = fetch_version_diff(_client(_ReleaseServer({}, diff)), "ds")
+
+        assert [change.item_id for change in parsed.removed] == ["item-3"]
+
+    def test_diff_without_change_lists_raises(self):
+        """Test an unrecognised diff is rejected instead of treated as empty"""
+        server = _ReleaseServer({}, {"from_version": "1.0.0", "to_version": "1.1.0", "changes": []})
+
+        with pytest.raises(ValueError, match="no added, removed or modified"):
+            fetch_version_diff(_client(server), "ds")
+
+    @pytest.mark.parametrize("wrapped", [False, True])
+    def test_fetch_version_diff(self, releases, wrapped):
+        """Test the diff is parsed into the typed model, with or without the data envelope"""
+        _, diff = releases
+        body = {"success": True, "data": diff} if wrapped else diff
+
+        parsed = fetch_version_diff(_client(_ReleaseServer({}, body)), "ds")
+
+        assert isinstance(parsed, GetApiV1DatasetsByDatasetSlugVersionsDiffResponse200)
+        assert parsed.summary == {"added": 1, "removed": 1, "modified": 1}
+
+
+class TestSyncDataset:
+    """Test diff-based snapshot updates"""
+
+    def test_diff_is_applied_to_cached_base(self, tmp_path, releases):
+        """Test the next release is built from the base without downloading items"""
+        versions, diff = releases
+        server = _ReleaseServer(versions, diff)
+        cache = DatasetSnapshotCache(tmp_path)
+        cache.store("ds", "1.0.0", versions["1.0.0"], {"status": "published"})
+
+        result = sync_dataset(_client(server), "ds", cache)
+
+        assert (result.mode, result.version) == ("diff", "1.1.0")
+        assert (result.added, result.removed, result.modified) == (1, 1, 1)
+        assert server.item_requests() == []
+        with cache.open("ds", "1.1.0") as snapshot:
+            assert list(snapshot) == versions["1.1.0"]
+            assert snapshot.published
+
+    def test_second_sync_is_up_to_date(self, tmp_path, releases):
+        """Test a synced published release is not rebuilt"""
+        versions, diff = releases
+        cache = DatasetSnapshotCache(tmp_path)
+        cache.store("ds", "1.0.0", versions["1.0.0"], {"status": "published"})
+        sync_dataset(_client(_ReleaseServer(versions, diff)), "ds", cache)
+
+        assert sync_dataset(_client(_ReleaseServer(versions, diff)), "ds", cache).mode == "up_to_date"
+
+    def test_missing_base_downloads_everything(self, tmp_path, releases):
+        """Test a full download is used when the base release is not cached"""
+        versions, diff = releases
+        server = _ReleaseServer(versions, diff)
+        cache = DatasetSnapshotCache(tmp_path)
+
+        result = sync_dataset(_client(server), "ds", cache)
+
+        assert result.mode == "full"
+        assert len(server.item_requests()) == 1
+        with cache.open("ds", "1.1.0") as snapshot:
+            assert list(snapshot) == versions["1.1.0"]
+
+    def test_large_diff_downloads_everything(self, tmp_path, releases):
+        """Test a full download is used when the diff exceeds max_change_ratio"""
+        versions, diff = releases
+        server = _ReleaseServer(versions, diff)
+        cache = DatasetSnapshotCache(tmp_path)
+        cache.store("ds", "1.0.0", versions["1.0.0"], {"status": "published"})
+
+        assert sync_dataset(_client(server), "ds", cache, max_change_ratio=0.1).mode == "full"
+        assert len(server.item_requests()) == 1
+
+    def test_diff_without_release_raises(self, tmp_path):
+        """Test a diff naming no version is rejected"""
+        with pytest.raises(ValueError):
+            sync_dataset(_client(_ReleaseServer({}, {})), "ds", DatasetSnapshotCache(tmp_path))
@@ -0,0 +1,206 @@
+"""
+Unit Tests for the Bulk Dataset Item Uploader
+
+Tests chunk packing, parallel upload, retries and checkpoint resume.
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.dataset_dedup import HashIndex
+from noveum_api_client.dataset_upload import UploadCheckpoint, encode_item, pack_chunks, upload_items
+from noveum_api_client.errors import UnexpectedStatus
+from noveum_api_client.models import (
+    PostApiV1DatasetsByDatasetSlugItemsBodyItemsItem,
+    PostApiV1DatasetsByDatasetSlugItemsBodyItemsItemContent,
+)
+
+
+def _items(count):
+    return [{"item_id": f"item-{i}", "item_type": "qa", "content": {"input": f"question {i}"}} for i in range(count)]
+
+
+class _ItemServer:
+    """MockTransport handler collecting uploaded items, with scripted failures"""
+
+    def __init__(self, fail=None, headers=None):
+        self.fail = fail or (lambda body, attempt: None)
+        self.headers = headers
+        self.bodies = []
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        with self._lock:
+            self.attempts += 1
+            status = self.fail(body, self.attempts)
+            if status is None:
+                self.bodies.append(body)
+        if status == "timeout":
+            raise httpx.ReadTimeout("Timed out waiting for the response", request=request)
+        if status is not None:
+            return httpx.Response(status, headers=self.headers, json={"error": "failed"})
+        return httpx.Response(201, json={"created": len(body["items"])})
+
+    def uploaded(self):
+        return sorted((item for body in self.bodies for item in body["items"]), key=lambda item: item["item_id"])
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestPackChunks:
+    """Test size- and count-limited chunk packing"""
+
+    def test_count_limit(self):
+        """Test chunks hold at most max_items items"""
+        chunks = list(pack_chunks(((i, b"{}") for i in range(5)), max_items=2))
+
+        assert [chunk.count for chunk in chunks] == [2, 2, 1]
+        assert [(chunk.start, chunk.end) for chunk in chunks] == [(0, 2), (2, 4), (4, 5)]
+        assert json.loads(chunks[0].body) == {"items": [{}, {}]}
+
+    def test_byte_limit(self):
+        """Test chunk bodies stay within max_bytes"""
+        data = encode_item({"value": "x" * 50})
+        chunks = list(pack_chunks(((i, data) for i in range(10)), max_bytes=200))
+
+        assert all(len(chunk.body) <= 200 for chunk in chunks)
+        assert sum(chunk.count for chunk in chunks) == 10
+
+    def test_oversized_item_is_sent_alone(self):
+        """Test an item larger than max_bytes gets its own chunk"""
+        chunks = list(pack_chunks([(0, b"{}"), (1, b'"' + b"x" * 100 + b'"'), (2, b"{}")], max_bytes=50))
+
+        assert [chunk.count for chunk in chunks] == [1, 1, 1]
+
+
+class TestEncodeItem:
+    """Test item serialization"""
+
+    def test_model_and_bytes(self):
+        """Test models use to_dict and bytes pass through untouched"""
+        model = PostApiV1DatasetsByDatasetSlugItemsBodyItemsItem(
+            item_type="qa", content=PostApiV1DatasetsByDatasetSlugItemsBodyItemsItemContent()
+        )
+
+        assert json.loads(encode_item(model)) == model.to_dict()
+        assert encode_item(b'{"a": 1}') == b'{"a": 1}'
+
+
+class TestUploadItems:
+    """Test parallel uploads"""
+
+    def test_uploads_every_item(self):
+        """Test all items arrive exactly once"""
+        server = _ItemServer()
+        result = upload_items(_client(server), "ds", iter(_items(25)), concurrency=4, max_items=10)
+
+        assert server.uploaded() == sorted(_items(25), key=lambda item: item["item_id"])
+        assert result.items_uploaded == 25
+        assert result.chunks == 3
+
+    def test_jsonl_file(self, tmp_path):
+        """Test a JSONL path is streamed line by line"""
+        path = tmp_path / "items.jsonl"
+        path.write_text("\n".join(json.dumps(item) for item in _items(3)) + "\n\n")
+        server = _ItemServer()
+
+        result = upload_items(_client(server), "ds", path)
+
+        assert result.items_uploaded == 3
+        assert len(server.uploaded()) == 3
+
+    def test_transient_failures_are_retried(self):
+        """Test 503 responses are retried"""
+        server = _ItemServer(fail=lambda body, attempt: 503 if attempt <= 2 else None)
+        result = upload_items(_client(server), "ds", _items(5), retry_backoff=0)
+
+        assert result.retries == 2
+        assert len(server.uploaded()) == 5
+
+    @pytest.mark.parametrize("failure", [502, 504, "timeout"])
+    def test_ambiguous_failures_are_retried_only_when_idempotent(self, failure):
+        """Test a chunk the server may already have stored is not resent unless that is safe"""
+        server = _ItemServer(fail=lambda body, attempt: failure if attempt == 1 else None)
+
+        with pytest.raises((UnexpectedStatus, httpx.ReadTimeout)):
+            upload_items(_client(server), "ds", _items(5), retry_backoff=0)
+        result = upload_items(_client(server), "ds", _items(5), retry_backoff=0, idempotent=True)
+
+        assert server.attempts == 2
+        assert result.retries == 0 and len(server.uploaded()) == 5
+
+    def test_dedup_does_not_make_ambiguous_failures_retryable(self):
+        """Test a dedup index alone does not resend a chunk the server may have stored"""
+        server = _ItemServer(fail=lambda body, attempt: 502 if attempt == 1 else None)
+
+        with pytest.raises(UnexpectedStatus):
+            upload_items(_client(server), "ds", _items(5), retry_backoff=0, dedup=HashIndex())
+        assert server.attempts == 1
+
+    def test_retry_after_is_capped(self, monkeypatch):
+        """Test a huge Retry-After does not stall the upload for its full length"""
+        delays = []
+        monkeypatch.setattr("noveum_api_client._utils.time.sleep", delays.append)
+        server = _ItemServer(fail=lambda body, attempt: 503 if attempt == 1 else None, headers={"Retry-After": "86400"})
+
+        upload_items(_client(server), "ds", _items(5))
+
+        assert delays == [60.0]
+
+    def test_permanent_failure_raises(self):
+        """Test client errors are not retried"""
+        server = _ItemServer(fail=lambda body, attempt: 400)
+
+        with pytest.raises(UnexpectedStatus):
+            upload_items(_client(server), "ds", _items(5), retry_backoff=0)
+        assert server.attempts == 1
+
+
+class TestUploadCheckpoint:
+    """Test resuming interrupted uploads"""
+
+    def test_resume_skips_uploaded_items(self, tmp_path):
+        """Test a rerun with the checkpoint only sends items that were not acknowledged"""
+        checkpoint = tmp_path / "upload.ckpt"
+
+        def fail_item_5(body, attempt):
+            return 400 if any(item["item_id"] == "item-5" for item in body["items"]) else None
+
+        first = _ItemServer(fail_item_5)
+        with pytest.raises(UnexpectedStatus):
+            upload_items(_client(first), "ds", _items(10), concurrency=1, max_items=2, checkpoint=checkpoint)
+
+        second = _ItemServer()
+        result = upload_items(_client(second), "ds", _items(10), max_items=2, checkpoint=checkpoint)
+
+        resent = [item["item_id"] for item in second.uploaded()]
+        assert "item-4" in resent and "item-5" in resent
+        assert not {"item-0", "item-1", "item-2", "item-3"} & set(resent)
+        assert len(first.uploaded()) + len(resent) == 10
+        assert result.items_skipped == 10 - len(resent)
+        assert UploadCheckpoint.load(checkpoint, "ds").done == [[0, 10]]
+
+    def test_ranges_are_merged(self, tmp_path):
+        """Test adjacent and overlapping ranges collapse"""
+        checkpoint = UploadCheckpoint(tmp_path / "ckpt", "ds")
+        for start, end in [(4, 6), (0, 2), (2, 3), (5, 8)]:
+            checkpoint.add(start, end)
+
+        assert checkpoint.done == [[0, 3], [4, 8]]
+        assert checkpoint.completed == 7
+
+    def test_checkpoint_of_other_dataset_is_rejected(self, tmp_path):
+        """Test a checkpoint cannot be reused for another dataset"""
+        checkpoint = UploadCheckpoint(tmp_path / "ckpt", "ds")
+        checkpoint.save()
+
+        with pytest.raises(ValueError):
+            UploadCheckpoint.load(tmp_path / "ckpt", "other")
@@ -0,0 +1,225 @@
+"""
+Unit Tests for Sharded ETL Backfills
+
+Tests shard construction, the in-flight limit, backpressure, failed and
+unknown shards and the aggregated counters.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.etl_backfill import backfill_etl_job, time_shards, trace_id_shards
+
+FAST = {"initial_interval": 0.001, "max_interval": 0.002, "retry_backoff": 0.001}
+
+
+def _run(run_id, status, processed, failed=0, error=None):
+    return {
+        "id": run_id,
+        "etlJobId": "job-1",
+        "datasetSlug": "ds",
+        "startTime": None,
+        "endTime": None,
+        "status": status,
+        "tracesProcessed": processed,
+        "tracesFailed": failed,
+        "datasetItemsCreated": processed - failed,
+        "error": error,
+        "traceIds": [],
+        "filterConfig": None,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class _JobServer:
+    """MockTransport handler creating runs on trigger; each run finishes after a few polls"""
+
+    def __init__(self, polls_per_run=2, throttle=0, fail_shards=(), drop_shards=()):
+        self.polls_per_run = polls_per_run
+        self.throttle = throttle
+        self.fail_shards = set(fail_shards)
+        self.drop_shards = set(drop_shards)
+        self.bodies = []
+        self.runs = {}
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def active(self):
+        return sum(1 for run in self.runs.values() if run["polls"] < self.polls_per_run)
+
+    def __call__(self, request):
+        with self._lock:
+            if request.method == "POST":
+                if self.throttle:
+                    self.throttle -= 1
+                    return httpx.Response(429, headers={"retry-after": "0"}, json={"error": "Too many runs"})
+                body = json.loads(request.content)
+                self.bodies.append(body)
+                if body.get("traceIds", [None])[0] in self.drop_shards:
+                    raise httpx.ReadTimeout("Trigger timed out", request=request)
+                run_id = f"run-{len(self.runs)}"
+                size = len(body.get("traceIds", [])) or 10
+                first = (body.get("traceIds") or [body.get("filterConfig", {}).get("startDate")])[0]
+                self.runs[run_id] = {"polls": 0, "size": size, "failed": first in self.fail_shards}
+                self.peak_active = max(self.peak_active, self.active())
+                return httpx.Response(200, json=_run(run_id, "pending", 0))
+            items = []
+            for run_id, run in self.runs.items():
+                run["polls"] += 1
+                if run["polls"] < self.polls_per_run:
+                    items.append(_run(run_id, "running", run["size"] // 2))
+                elif run["failed"]:
+                    items.append(_run(run_id, "failed", run["size"] // 2, run["size"] // 2, error="mapper crashed"))
+                else:
+                    items.append(_run(run_id, "completed", run["size"], 1))
+            return httpx.Response(200, json=items)
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestShards:
+    """Test splitting backfills into shards"""
+
+    def test_time_shards(self):
+        """Test a range is split into consecutive windows, the last one shorter"""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        shards = time_shards(start, start + timedelta(hours=60), timedelta(days=1))
+
+        assert [(shard.start[:13], shard.end[:13]) for shard in shards] == [
+            ("2026-01-01T00", "2026-01-02T00"),
+            ("2026-01-02T00", "2026-01-03T00"),
+            ("2026-01-03T00", "2026-01-03T12"),
+        ]
+        with pytest.raises(ValueError):
+            time_shards(start, start, timedelta(0))
+
+    def test_trace_id_shards(self):
+        """Test trace IDs are chunked"""
+        assert [len(shard.trace_ids) for shard in trace_id_shards(map(str, range(7)), 3)] == [3, 3, 1]
+
+
+class TestBackfill:
+    """Test triggering and following shard runs"""
+
+    def test_runs_all_shards_within_the_limit(self):
+        """Test every shard is triggered, at most in_flight at a time, and counters are summed"""
+        server = _JobServer(polls_per_run=3)
+        shards = trace_id_shards([f"t{i}" for i in range(40)], 4)
+
+        result = backfill_etl_job(_client(server), "job-1", shards, in_flight=3, **FAST)
+
+        assert len(server.bodies) == 10
+        assert server.peak_active <= 3
+        assert result.completed == 10
+        assert (result.traces_processed, result.traces_failed, result.dataset_items_created) == (40, 10, 30)
+        assert sorted(tid for body in server.bodies for tid in body["traceIds"]) == sorted(f"t{i}" for i in range(40))
+
+    def test_time_shards_are_sent_as_filter_config(self):
+        """Test time windows become filterConfig start/end dates with the project filter"""
+        server = _JobServer(polls_per_run=1)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        backfill_etl_job(
+            _client(server),
+            "job-1",
+            time_shards(start, start + timedelta(days=2), timedelta(days=1)),
+            project_id="p1",
+            dataset_slug="ds",
+            **FAST,
+        )
+
+        assert server.bodies[0] == {
+            "filterConfig": {
+                "startDate": start.isoformat(),
+                "endDate": (start + timedelta(days=1)).isoformat(),
+                "projectId": "p1",
+            },
+            "datasetSlug": "ds",
+        }
+
+    def test_backpressure_requeues_and_shrinks(self):
+        """Test triggers refused with 429 are retried later instead of failing the shard"""
+        server = _JobServer(polls_per_run=1, throttle=2)
+        progress = []
+
+        result = backfill_etl_job(
+            _client(server),
+            "job-1",
+            trace_id_shards(["a", "b", "c"], 1),
+            in_flight=4,
+            on_progress=lambda r: progress.append(r.to_dict()),
+            **FAST,
+        )
+
+        assert result.throttled == 2
+        assert result.completed == 3
+        assert progress[-1]["completed"] == 3
+
+    def test_failed_shards_can_be_retried(self):
+        """Test failed runs are reported and only they run again when passed back in"""
+        server = _JobServer(polls_per_run=1, fail_shards={"b"})
+        result = backfill_etl_job(_client(server), "job-1", trace_id_shards(["a", "b"], 1), **FAST)
+
+        assert [shard.trace_ids for shard in result.failed_shards] == [["b"]]
+        assert result.failed_shards[0].error == "mapper crashed"
+
+        server.fail_shards.clear()
+        retried = backfill_etl_job(_client(server), "job-1", result.shards, **FAST)
+
+        assert [body["traceIds"] for body in server.bodies] == [["a"], ["b"], ["b"]]
+        assert retried.completed == 2 and not retried.failed_shards
+
+    def test_trigger_transport_error_fails_only_its_shard(self):
+        """Test a trigger lost in transport is reported with an unknown status and the rest still run"""
+        server = _JobServer(polls_per_run=1, drop_shards={"b"})
+
+        result = backfill_etl_job(_client(server), "job-1", trace_id_shards(["a", "b", "c"], 1), **FAST)
+
+        assert result.completed == 2 and not result.failed_shards
+        [unknown] = result.unknown_shards
+        assert (unknown.trace_ids, unknown.status, unknown.run_id) == (["b"], "unknown", None)
+        assert "ReadTimeout" in unknown.error
+        assert result.to_dict()["unknown"] == 1
+
+    def test_unknown_shards_are_not_retriggered(self):
+        """Test passing back a shard whose run may have started does not trigger it again"""
+        server = _JobServer(polls_per_run=1, drop_shards={"b"}, fail_shards={"c"})
+        result = backfill_etl_job(_client(server), "job-1", trace_id_shards(["a", "b", "c"], 1), **FAST)
+
+        server.drop_shards.clear()
+        server.fail_shards.clear()
+        retried = backfill_etl_job(_client(server), "job-1", result.shards, **FAST)
+
+        assert [body["traceIds"] for body in server.bodies] == [["a"], ["b"], ["c"], ["c"]]
+        assert retried.completed == 2 and [shard.trace_ids for shard in retried.unknown_shards] == [["b"]]
+
+    def test_timeout_returns_resumable_result(self):
+        """Test the backfill stops at its deadline and resumes from the returned shards"""
+        server = _JobServer(polls_per_run=10**9)
+
+        result = backfill_etl_job(
+            _client(server), "job-1", trace_id_shards(["a", "b", "c"], 1), in_flight=2, timeout=0.05, **FAST
+        )
+
+        assert result.timed_out and result.active == 2 and not result.failed_shards
+        assert [shard.run_id for shard in result.shards] == ["run-0", "run-1", None]
+
+        server.polls_per_run = 0
+        resumed = backfill_etl_job(_client(server), "job-1", result.shards, **FAST)
+
+        assert not resumed.timed_out and resumed.completed == 3
+        assert [body["traceIds"] for body in server.bodies] == [["a"], ["b"], ["c"]]
+
+    def test_noveum_client_requires_a_range(self):
+        """Test NoveumClient.backfill_etl_job needs a time range or trace IDs"""
+        with pytest.raises(ValueError):
+            NoveumClient(api_key="test_key").backfill_etl_job("job-1")
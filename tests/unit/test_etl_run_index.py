@@ -0,0 +1,128 @@
+"""
+Unit Tests for the ETL Run History Index
+
+Tests incremental refresh, on-demand trace IDs, the trace → run lookup and
+persistence.
+"""
+
+import sys
+import threading
+
+import httpx
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.etl_run_index import EtlRunIndex
+
+
+def _run(job_id, index, traces, status="completed", updated="2026-01-01T00:00:00Z"):
+    return {
+        "id": f"{job_id}-run-{index}",
+        "etlJobId": job_id,
+        "datasetSlug": "ds",
+        "startTime": None,
+        "endTime": None,
+        "status": status,
+        "tracesProcessed": len(traces),
+        "tracesFailed": 0,
+        "datasetItemsCreated": len(traces),
+        "error": None,
+        "traceIds": list(traces),
+        "filterConfig": None,
+        "createdAt": f"2026-01-01T00:00:0{index}Z",
+        "updatedAt": updated,
+    }
+
+
+class _RunsServer:
+    """MockTransport handler listing the runs of each job"""
+
+    def __init__(self, runs):
+        self.runs = runs
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        job_id = request.url.path.split("/")[4]
+        with self._lock:
+            self.requests.append(job_id)
+        return httpx.Response(200, json=self.runs.get(job_id, []))
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestEtlRunIndex:
+    """Test the local run history index"""
+
+    def test_refresh_is_incremental(self):
+        """Test unchanged runs are skipped and changed or removed runs are applied"""
+        server = _RunsServer({"job": [_run("job", 0, ["a", "b"]), _run("job", 1, ["c"], "running")]})
+        index = EtlRunIndex()
+        client = _client(server)
+
+        first = index.refresh(client, "job")
+        server.runs["job"][1] = _run("job", 1, ["c", "d"], "completed", updated="2026-01-02T00:00:00Z")
+        second = index.refresh(client, "job")
+        server.runs["job"].pop(0)
+        third = index.refresh(client, "job")
+
+        assert (first.added, first.unchanged) == (2, 0)
+        assert (second.updated, second.unchanged) == (1, 1)
+        assert third.removed == 1
+        assert [run.id for run in index.runs("job")] == ["job-run-1"]
+        assert index.get("job-run-1").status == "completed"
+        assert index.watermark("job") == "2026-01-02T00:00:00Z"
+
+    def test_trace_ids_are_loaded_on_demand(self):
+        """Test summaries carry counts only and trace IDs are decompressed on request"""
+        traces = [f"trace-{i:05d}" for i in range(5000)]
+        index = EtlRunIndex()
+        index.apply("job", [_run("job", 0, traces)])
+
+        summary = index.get("job-run-0")
+        assert summary.trace_count == 5000
+        assert not hasattr(summary, "trace_ids")
+        assert index.trace_ids("job-run-0") == traces
+        assert index.hydrate("job-run-0").trace_ids == traces
+        assert index.memory_bytes() < sum(sys.getsizeof(trace_id) for trace_id in traces)
+
+    def test_runs_for_trace(self):
+        """Test the inverted index finds every run that processed a trace"""
+        index = EtlRunIndex()
+        index.apply("job-1", [_run("job-1", 0, ["a", "b"]), _run("job-1", 1, ["b", "c"])])
+        index.apply("job-2", [_run("job-2", 2, ["c"])])
+
+        assert [run.id for run in index.runs_for_trace("b")] == ["job-1-run-0", "job-1-run-1"]
+        assert [run.id for run in index.runs_for_trace("c")] == ["job-1-run-1", "job-2-run-2"]
+        assert index.runs_for_trace("z") == []
+
+        index.apply("job-1", [_run("job-1", 1, ["b"], updated="2026-02-01T00:00:00Z")])
+        assert [run.id for run in index.runs_for_trace("c")] == ["job-2-run-2"]
+        assert index.runs_for_trace("a") == []
+
+    def test_refresh_all_and_persistence(self, tmp_path):
+        """Test several jobs are refreshed together and the index survives a reload"""
+        server = _RunsServer({f"job-{i}": [_run(f"job-{i}", 0, [f"t{i}"])] for i in range(5)})
+        index = EtlRunIndex(tmp_path / "runs.jsonl")
+
+        stats = index.refresh_all(_client(server), [f"job-{i}" for i in range(5)], concurrency=3)
+        index.save()
+        reloaded = EtlRunIndex(tmp_path / "runs.jsonl")
+
+        assert stats.added == 5
+        assert len(reloaded) == 5
+        assert [run.etl_job_id for run in reloaded.runs_for_trace("t3")] == ["job-3"]
+        assert reloaded.refresh(_client(server), "job-3").unchanged == 1
+
+    def test_noveum_client_wrapper(self):
+        """Test NoveumClient.refresh_etl_run_index builds and refreshes an index"""
+        server = _RunsServer({"job": [_run("job", 0, ["a"])]})
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        index = client.refresh_etl_run_index(["job"])
+
+        assert client.refresh_etl_run_index(["job"], index) is index
+        assert server.requests == ["job", "job"]
+        assert len(index) == 1
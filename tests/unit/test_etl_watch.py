@@ -0,0 +1,198 @@
+"""
+Unit Tests for the ETL Job Watcher
+
+Tests status transitions, adaptive polling, multiplexing several jobs and
+timeouts.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.errors import UnexpectedStatus
+from noveum_api_client.etl_watch import PollSchedule, reported_status, watch_etl_job, watch_etl_jobs
+
+FAST = {"initial_interval": 0.001, "max_interval": 0.005, "confirm_interval": 60.0}
+
+
+def _run(run_id, job_id, status, processed=0):
+    return {
+        "id": run_id,
+        "etlJobId": job_id,
+        "datasetSlug": "ds",
+        "startTime": None,
+        "endTime": None,
+        "status": status,
+        "tracesProcessed": processed,
+        "tracesFailed": 0,
+        "datasetItemsCreated": processed,
+        "error": None,
+        "traceIds": [],
+        "filterConfig": None,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class _EtlServer:
+    """MockTransport handler advancing each job through a list of statuses"""
+
+    def __init__(self, statuses, report_status=True, other_runs=(), unlisted_fetches=0):
+        self.statuses = {job_id: list(sequence) for job_id, sequence in statuses.items()}
+        self.report_status = report_status
+        self.other_runs = list(other_runs)
+        self.unlisted_fetches = unlisted_fetches
+        self.status_polls = dict.fromkeys(statuses, 0)
+        self.run_fetches = dict.fromkeys(statuses, 0)
+
+    def current(self, job_id):
+        sequence = self.statuses[job_id]
+        return sequence[min(self.status_polls[job_id] - 1, len(sequence) - 1)]
+
+    def __call__(self, request):
+        _, _, _, _, job_id, resource = request.url.path.split("/")
+        if job_id not in self.statuses:
+            return httpx.Response(404, json={"error": "Job not found"})
+        if resource == "status":
+            self.status_polls[job_id] += 1
+            body = {"status": self.current(job_id), "queue": {"waiting": 0}} if self.report_status else {"queue": {}}
+            return httpx.Response(200, json={"data": body})
+        self.run_fetches[job_id] += 1
+        if self.run_fetches[job_id] <= self.unlisted_fetches:
+            return httpx.Response(200, json=list(self.other_runs))
+        status = self.current(job_id)
+        processed = 10 if status == "completed" else 0
+        return httpx.Response(200, json=[*self.other_runs, _run(f"run-{job_id}", job_id, status, processed)])
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+class TestPollSchedule:
+    """Test the adaptive poll interval"""
+
+    def test_backs_off_and_resets(self):
+        """Test the interval grows while unchanged and resets on a change"""
+        schedule = PollSchedule(initial=1.0, maximum=3.0, factor=2.0)
+
+        assert [schedule.next(False) for _ in range(3)] == [2.0, 3.0, 3.0]
+        assert schedule.next(True) == 1.0
+
+
+class TestReportedStatus:
+    """Test reading the status endpoint payload"""
+
+    def test_run_status_wins_over_job_status(self):
+        """Test a nested run status is preferred"""
+        assert reported_status({"status": "active", "latestRun": {"status": "running"}}) == "running"
+        assert reported_status({"data": {"status": "queued"}}) == "queued"
+        assert reported_status({"queue": {}}) is None
+
+
+class TestWatchEtlJob:
+    """Test following ETL job runs"""
+
+    def test_transitions_until_terminal(self):
+        """Test each status change is yielded once and the final run is attached"""
+        server = _EtlServer({"job-1": ["queued", "running", "running", "running", "completed"]})
+
+        events = asyncio.run(_collect(watch_etl_job(_client(server), "job-1", **FAST)))
+
+        assert [(e.previous_status, e.status) for e in events] == [
+            (None, "queued"),
+            ("queued", "running"),
+            ("running", "completed"),
+        ]
+        assert events[-1].terminal
+        assert events[-1].run.traces_processed == 10
+        assert server.status_polls["job-1"] == 5
+        assert server.run_fetches["job-1"] == 3
+
+    def test_many_jobs_share_one_loop(self):
+        """Test several jobs are followed until each one finishes"""
+        server = _EtlServer(
+            {
+                "job-1": ["running", "completed"],
+                "job-2": ["running", "running", "running", "failed"],
+            }
+        )
+
+        events = asyncio.run(_collect(watch_etl_jobs(_client(server), ["job-1", "job-2"], **FAST)))
+
+        finals = {event.job_id: event.status for event in events if event.terminal}
+        assert finals == {"job-1": "completed", "job-2": "failed"}
+        assert server.status_polls == {"job-1": 2, "job-2": 4}
+
+    def test_run_id_selects_the_run(self):
+        """Test the run with the requested ID is followed, not the newest"""
+        other = _run("run-old", "job-1", "failed")
+        other["createdAt"] = "2027-01-01T00:00:00Z"
+        server = _EtlServer({"job-1": ["running", "completed"]}, other_runs=[other])
+
+        events = asyncio.run(_collect(watch_etl_job(_client(server), "job-1", run_id="run-job-1", **FAST)))
+
+        assert [event.status for event in events] == ["running", "completed"]
+        assert {event.run.id for event in events} == {"run-job-1"}
+
+    def test_run_id_not_listed_yet(self):
+        """Test a stale job-level status does not end the watch before the run is listed"""
+        server = _EtlServer({"job-1": ["completed", "running", "completed"]}, unlisted_fetches=1)
+
+        events = asyncio.run(_collect(watch_etl_job(_client(server), "job-1", run_id="run-job-1", **FAST)))
+
+        assert [(event.status, event.run.id) for event in events] == [
+            ("running", "run-job-1"),
+            ("completed", "run-job-1"),
+        ]
+
+    def test_run_never_listed_raises(self):
+        """Test a finished job whose followed run never shows up ends the watch with an error"""
+        server = _EtlServer({"job-1": ["completed"]}, unlisted_fetches=10**9)
+        options = {**FAST, "confirm_interval": 0.02}
+
+        with pytest.raises(LookupError, match="run-job-1"):
+            asyncio.run(_collect(watch_etl_job(_client(server), "job-1", run_id="run-job-1", **options)))
+        # A finished job only has its runs re-read once per confirm interval
+        assert server.run_fetches["job-1"] <= 3 < server.status_polls["job-1"]
+
+    def test_runs_are_read_when_status_is_not_reported(self):
+        """Test the run list decides when the status endpoint has no status"""
+        server = _EtlServer({"job-1": ["running", "completed"]}, report_status=False)
+
+        events = asyncio.run(_collect(watch_etl_job(_client(server), "job-1", **FAST)))
+
+        assert events[-1].status == "completed"
+        assert server.run_fetches["job-1"] == 2
+
+    def test_timeout(self):
+        """Test a job that never finishes raises TimeoutError"""
+        server = _EtlServer({"job-1": ["running"]})
+
+        async def watch():
+            async for _ in watch_etl_job(_client(server), "job-1", timeout=0.02, **FAST):
+                pass
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(watch())
+
+    def test_unknown_job_raises(self):
+        """Test a failing status request surfaces as UnexpectedStatus"""
+        with pytest.raises(UnexpectedStatus):
+            asyncio.run(_collect(watch_etl_job(_client(_EtlServer({})), "missing", max_retries=0)))
+
+    def test_noveum_client_wrapper(self):
+        """Test NoveumClient.watch_etl_job follows a run"""
+        server = _EtlServer({"job-1": ["completed"]})
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        events = asyncio.run(_collect(client.watch_etl_job("job-1")))
+
+        assert [event.status for event in events] == ["completed"]
@@ -0,0 +1,226 @@
+"""
+Unit Tests for the Evaluation Runner
+
+Tests scoring in thread, process and asyncio mode, result batching, the
+per-stage statistics and incremental runs.
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.errors import UnexpectedStatus
+from noveum_api_client.evaluation import EvaluationRunner, ScoreResult, make_result
+
+
+def length_scorer(item):
+    """Module-level scorer, picklable for the process pool"""
+    return len(item["content"]["input"]) / 10
+
+
+def _items(count):
+    return [{"item_id": f"item-{i}", "content": {"input": "x" * (i % 10)}} for i in range(count)]
+
+
+class _ScorerServer:
+    """MockTransport handler serving dataset pages and recording result batches"""
+
+    def __init__(self, items=(), fail_batches=False, stored=(), conflicting=()):
+        self.items = list(items)
+        self.fail_batches = fail_batches
+        self.stored = list(stored)
+        self.conflicting = set(conflicting)
+        self.batches = []
+        self.puts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        if request.method == "GET":
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            if request.url.path == "/api/v1/scorers/results":
+                return httpx.Response(200, json={"results": self.stored[offset : offset + limit]})
+            return httpx.Response(200, json={"items": self.items[offset : offset + limit]})
+        if self.fail_batches:
+            return httpx.Response(400, json={})
+        body = json.loads(request.content)
+        with self._lock:
+            if request.method == "PUT":
+                self.puts.append(request.url.params["itemId"])
+                return httpx.Response(200, json={})
+            if self.conflicting & {r["itemId"] for r in body["results"]}:
+                return httpx.Response(409, json={})
+            self.batches.append(body["results"])
+        return httpx.Response(201, json={})
+
+    def results(self):
+        return {(r["itemId"], r["scorerId"]): r for batch in self.batches for r in batch}
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestMakeResult:
+    """Test conversion of scorer outputs"""
+
+    def test_output_types(self):
+        """Test numbers, bools, ScoreResult and mappings are accepted"""
+        assert make_result("ds", "i", "s", 0.7, 1.0)["passed"] is True
+        assert make_result("ds", "i", "s", False, 1.0)["score"] == 0.0
+        detailed = make_result("ds", "i", "s", ScoreResult(0.9, passed=False, metadata={"k": 1}), 1.0)
+        assert (detailed["passed"], detailed["metadata"]) == (False, {"k": 1})
+        assert make_result("ds", "i", "s", {"score": 0.2}, 1.0, pass_threshold=0.1)["passed"] is True
+
+    def test_invalid_output_is_an_error(self):
+        """Test an unusable scorer output is recorded as an error"""
+        result = make_result("ds", "i", "s", None, 1.0)
+
+        assert result["error"].startswith("Invalid scorer output")
+        assert (result["score"], result["passed"]) == (0.0, False)
+
+
+class TestEvaluationRunner:
+    """Test the fetch → score → upload pipeline"""
+
+    @pytest.mark.parametrize("executor", ["thread", "asyncio"])
+    def test_every_item_is_scored_and_uploaded(self, executor):
+        """Test each item/scorer pair is uploaded once in batches of batch_size"""
+        server = _ScorerServer(_items(25))
+        runner = EvaluationRunner(
+            _client(server),
+            "ds",
+            {"length": length_scorer, "nonempty": lambda item: bool(item["content"]["input"])},
+            executor=executor,
+            workers=4,
+            batch_size=10,
+            page_size=7,
+        )
+
+        stats = runner.run()
+
+        results = server.results()
+        assert len(results) == 50
+        assert all(len(batch) <= 10 for batch in server.batches)
+        assert results[("item-3", "length")]["score"] == pytest.approx(0.3)
+        assert results[("item-0", "nonempty")]["passed"] is False
+        assert results[("item-0", "length")]["datasetSlug"] == "ds"
+        assert (stats.fetch.count, stats.score.count, stats.upload.count) == (25, 25, 50)
+        assert stats.bottleneck in ("fetch", "score", "upload")
+
+    def test_process_pool(self):
+        """Test scorers run in a process pool"""
+        server = _ScorerServer()
+
+        stats = EvaluationRunner(_client(server), "ds", {"length": length_scorer}, executor="process", workers=2).run(
+            _items(6)
+        )
+
+        assert stats.results == 6
+        assert server.results()[("item-5", "length")]["score"] == pytest.approx(0.5)
+
+    def test_scorer_errors_are_recorded(self):
+        """Test a raising scorer produces an error result instead of aborting"""
+
+        def broken(item):
+            raise RuntimeError("boom")
+
+        server = _ScorerServer()
+        stats = EvaluationRunner(_client(server), "ds", {"broken": broken}).run(_items(3))
+
+        assert stats.errors == 3
+        assert server.results()[("item-0", "broken")]["error"] == "RuntimeError: boom"
+
+    def test_async_scorers(self):
+        """Test coroutine scorers are awaited concurrently in asyncio mode"""
+        running = 0
+        peak = 0
+
+        async def slow(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 1.0
+
+        server = _ScorerServer()
+        stats = EvaluationRunner(_client(server), "ds", {"slow": slow}, executor="asyncio", workers=4).run(_items(12))
+
+        assert stats.results == 12
+        assert 1 < peak <= 4
+
+    @pytest.mark.parametrize("executor", ["thread", "asyncio"])
+    def test_upload_failure_raises(self, executor):
+        """Test a permanently failing batch upload surfaces as UnexpectedStatus"""
+        server = _ScorerServer(fail_batches=True)
+        runner = EvaluationRunner(_client(server), "ds", {"length": length_scorer}, executor=executor, batch_size=5)
+
+        with pytest.raises(UnexpectedStatus):
+            runner.run(_items(50))
+
+    @pytest.mark.parametrize("executor", ["thread", "asyncio"])
+    def test_existing_results_are_updated(self, executor):
+        """Test results rejected as existing are PUT instead"""
+        server = _ScorerServer(conflicting={"item-2", "item-7"})
+
+        EvaluationRunner(_client(server), "ds", {"length": length_scorer}, executor=executor).run(_items(10))
+
+        assert sorted(server.puts) == ["item-2", "item-7"]
+        assert len(server.results()) == 8
+
+    def test_unknown_executor(self):
+        """Test an unknown executor kind is rejected"""
+        with pytest.raises(ValueError):
+            EvaluationRunner(_client(_ScorerServer()), "ds", {}, executor="gpu")
+
+
+class TestIncrementalEvaluation:
+    """Test skipping item/scorer pairs that already have results"""
+
+    @pytest.mark.parametrize("executor", ["thread", "asyncio"])
+    def test_only_missing_pairs_are_scored(self, executor):
+        """Test existing results are skipped and missing ones scored"""
+        stored = [{"itemId": f"item-{i}", "scorerId": "length", "updatedAt": "2026-01-01T00:00:00Z"} for i in range(8)]
+        server = _ScorerServer(_items(10), stored=stored)
+        calls = []
+
+        def counted(item):
+            calls.append(item["item_id"])
+            return 1.0
+
+        stats = EvaluationRunner(
+            _client(server), "ds", {"length": length_scorer, "other": counted}, executor=executor, incremental=True
+        ).run()
+
+        assert set(server.results()) == {("item-8", "length"), ("item-9", "length")} | {
+            (f"item-{i}", "other") for i in range(10)
+        }
+        assert len(calls) == 10
+        assert stats.skipped == 8
+
+    def test_stale_results_are_redone(self):
+        """Test results older than stale_before or the item's updated_at are rescored"""
+        items = _items(3)
+        items[1]["updated_at"] = "2026-03-01T00:00:00Z"
+        stored = [
+            {"item_id": "item-0", "scorer_id": "length", "created_at": "2026-02-01T00:00:00Z"},
+            {"item_id": "item-1", "scorer_id": "length", "created_at": "2026-02-01T00:00:00Z"},
+            {"item_id": "item-2", "scorer_id": "length", "created_at": "2025-01-01T00:00:00Z"},
+        ]
+        server = _ScorerServer(items, stored=stored)
+
+        EvaluationRunner(
+            _client(server),
+            "ds",
+            {"length": length_scorer},
+            incremental=True,
+            stale_before=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ).run()
+
+        assert {item_id for item_id, _ in server.results()} == {"item-1", "item-2"}
@@ -0,0 +1,149 @@
+"""
+Unit Tests for Local Mapper Dry Runs
+
+Tests item reporting, error and timeout handling, the trace mirror and trace
+fetching.
+"""
+
+import os
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.mapper_dry_run import TraceMirror, dry_run_mapper
+
+MAPPER = """
+def map_trace(trace):
+    if trace.get("skip"):
+        return None
+    if trace.get("boom"):
+        raise KeyError("missing")
+    return {"item_id": trace["trace_id"], "item_type": "trace", "content": {"name": trace["name"]}}
+"""
+
+SLOW_MAPPER = """
+def map_trace(trace):
+    try:
+        while True:
+            pass
+    except Exception:
+        return {}
+"""
+
+
+def _trace(index, **extra):
+    return {"trace_id": f"trace-{index}", "name": f"op-{index}", **extra}
+
+
+class _TracesServer:
+    """MockTransport handler serving traces by ID"""
+
+    def __init__(self, *indexes):
+        self.traces = {f"trace-{i}": _trace(i) for i in indexes}
+        self.requests = []
+
+    def __call__(self, request):
+        trace_id = request.url.path.rsplit("/", 1)[-1]
+        self.requests.append(trace_id)
+        if trace_id not in self.traces:
+            return httpx.Response(404, json={"error": "Trace not found"})
+        return httpx.Response(200, json={"success": True, "data": self.traces[trace_id]})
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestDryRunMapper:
+    """Test running mapper code locally"""
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_reports_items_and_errors(self, workers):
+        """Test produced items, skipped traces and mapper errors are reported per trace"""
+        traces = [_trace(0), _trace(1, skip=True), _trace(2, boom=True), _trace(3)]
+
+        report = dry_run_mapper(MAPPER, traces, workers=workers)
+
+        assert [run.trace_id for run in report.runs] == ["trace-0", "trace-1", "trace-2", "trace-3"]
+        assert [item["item_id"] for item in report.items] == ["trace-0", "trace-3"]
+        assert report.runs[1].items == [] and report.runs[1].ok
+        assert [run.trace_id for run in report.failed] == ["trace-2"]
+        assert report.runs[2].error.startswith("KeyError") and "mapper line" in report.runs[2].error
+        assert set(report.timing()) == {"mean", "max", "p50", "p90", "p99"}
+        assert report.to_dict()["items"] == 2
+
+    def test_invalid_output(self):
+        """Test outputs that are not item dicts are reported as errors"""
+        report = dry_run_mapper("def map_trace(trace):\n    return 42\n", [_trace(0)], workers=0)
+
+        assert report.failed[0].error.startswith("TypeError")
+
+    def test_timeout(self):
+        """Test a mapper stuck on a trace is stopped and reported as timed out"""
+        report = dry_run_mapper(SLOW_MAPPER, [_trace(0)], workers=1, timeout=0.1)
+
+        assert report.runs[0].timed_out
+        assert report.runs[0].seconds < 5
+
+    def test_worker_crash_fails_only_its_trace(self):
+        """Test a mapper killing its worker process fails that trace and the rest still run"""
+        mapper = MAPPER.replace(
+            'if trace.get("skip")',
+            'if trace.get("die"):\n        import os\n        os._exit(1)\n    if trace.get("skip")',
+        )
+        traces = [_trace(0), _trace(1, die=True), *(_trace(i) for i in range(2, 8))]
+
+        report = dry_run_mapper(mapper, traces, workers=2)
+
+        assert [run.trace_id for run in report.runs] == [f"trace-{i}" for i in range(8)]
+        assert [run.trace_id for run in report.failed] == ["trace-1"]
+        assert "died" in report.runs[1].error
+        assert len(report.items) == 7
+
+    def test_mapper_code_runs_only_in_workers(self, tmp_path):
+        """Test top-level mapper code is not executed in the calling process"""
+        marker = tmp_path / "pids"
+        mapper = f"import os\nopen({str(marker)!r}, 'a').write(f'{{os.getpid()}}\\n')\n" + MAPPER
+
+        report = dry_run_mapper(mapper, [_trace(0)], workers=1)
+
+        assert report.runs[0].ok
+        assert str(os.getpid()) not in marker.read_text().split()
+
+    def test_load_errors_in_workers_are_reported(self):
+        """Test top-level errors of the mapper code fail every trace instead of the pool"""
+        report = dry_run_mapper(
+            "raise RuntimeError('bad')\ndef map_trace(trace):\n    return None\n", [_trace(0)], workers=1
+        )
+
+        assert "RuntimeError: bad" in report.runs[0].error
+
+    def test_code_errors_fail_fast(self):
+        """Test code that does not compile or lacks the entrypoint raises before running"""
+        with pytest.raises(SyntaxError):
+            dry_run_mapper("def map_trace(:", [_trace(0)])
+        with pytest.raises(ValueError):
+            dry_run_mapper("x = 1", [_trace(0)])
+
+
+class TestTraceSources:
+    """Test reading traces from the mirror and the API"""
+
+    def test_fetched_traces_are_mirrored(self, tmp_path):
+        """Test missing traces are fetched once and served from the mirror afterwards"""
+        server = _TracesServer(0, 1)
+        client = _client(server)
+
+        first = dry_run_mapper(MAPPER, ["trace-0", "trace-1"], client=client, mirror=tmp_path, workers=0)
+        second = dry_run_mapper(MAPPER, ["trace-0", "trace-1"], client=client, mirror=tmp_path, workers=0)
+
+        assert sorted(server.requests) == ["trace-0", "trace-1"]
+        assert (first.fetched, second.fetched) == (2, 0)
+        assert [item["content"]["name"] for item in second.items] == ["op-0", "op-1"]
+        assert "trace-0" in TraceMirror(tmp_path)
+
+    def test_ids_need_a_mirror_or_client(self):
+        """Test trace IDs without a way to load them are rejected"""
+        with pytest.raises(ValueError):
+            dry_run_mapper(MAPPER, ["trace-0"])
@@ -0,0 +1,116 @@
+"""
+Unit Tests for Project ↔ Dataset Association Reconciliation
+
+Tests planning, dry runs, applying the minimal changes and per-change
+failures.
+"""
+
+import json
+import threading
+
+import httpx
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.project_datasets import plan_associations, reconcile_associations
+
+
+class _AssociationServer:
+    """MockTransport handler keeping the associated datasets of each project"""
+
+    def __init__(self, associations, failing=()):
+        self.associations = {project_id: set(ids) for project_id, ids in associations.items()}
+        self.failing = set(failing)
+        self.writes = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        parts = request.url.path.split("/")
+        project_id = parts[4]
+        with self._lock:
+            if request.method == "GET":
+                datasets = [{"id": dataset_id, "name": dataset_id} for dataset_id in self.associations[project_id]]
+                return httpx.Response(200, json={"success": True, "data": datasets})
+            if request.method == "POST":
+                dataset_id = json.loads(request.content)["datasetId"]
+                self.writes.append(("associate", project_id, dataset_id))
+                if dataset_id in self.failing:
+                    return httpx.Response(400, json={"error": "Invalid dataset"})
+                if dataset_id in self.associations[project_id]:
+                    return httpx.Response(409, json={"error": "Already associated"})
+                self.associations[project_id].add(dataset_id)
+                return httpx.Response(200, json={"message": "Dataset associated"})
+            dataset_id = parts[6]
+            self.writes.append(("remove", project_id, dataset_id))
+            self.associations[project_id].discard(dataset_id)
+            return httpx.Response(200, json={"message": "Dataset removed"})
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestPlanAssociations:
+    """Test diffing current against desired associations"""
+
+    def test_plan(self):
+        """Test only missing pairs are associated and unwanted pairs removed"""
+        current = {"p1": {"a", "b"}, "p2": {"c"}, "p3": {"d"}}
+        desired = {"p1": {"b", "c"}, "p2": ["c"]}
+
+        plan = plan_associations(current, desired)
+
+        assert plan.associate == [("p1", "c")]
+        assert plan.remove == [("p1", "a")]
+        assert plan.unchanged == 2
+        assert not plan_associations(current, desired, prune=False).remove
+        assert not plan_associations(current, {"p2": {"c"}})
+
+
+class TestReconcileAssociations:
+    """Test applying association changes"""
+
+    def test_applies_minimal_changes(self):
+        """Test the server ends in the desired state with one request per change"""
+        server = _AssociationServer({"p1": {"a", "b"}, "p2": set(), "p3": {"x"}})
+
+        result = reconcile_associations(_client(server), {"p1": {"b", "c"}, "p2": {"a", "b"}}, concurrency=3)
+
+        assert server.associations == {"p1": {"b", "c"}, "p2": {"a", "b"}, "p3": {"x"}}
+        assert sorted(server.writes) == [
+            ("associate", "p1", "c"),
+            ("associate", "p2", "a"),
+            ("associate", "p2", "b"),
+            ("remove", "p1", "a"),
+        ]
+        assert (result.associated, result.removed, result.failed) == (3, 1, [])
+
+    def test_dry_run(self):
+        """Test a dry run returns the plan without writing"""
+        server = _AssociationServer({"p1": {"a"}})
+
+        result = reconcile_associations(_client(server), {"p1": {"b"}}, dry_run=True)
+
+        assert result.plan.to_dict() == {"associate": [["p1", "b"]], "remove": [["p1", "a"]], "unchanged": 0}
+        assert server.writes == []
+        assert server.associations == {"p1": {"a"}}
+
+    def test_failures_are_reported(self):
+        """Test a failed change is listed without stopping the others"""
+        server = _AssociationServer({"p1": set()}, failing={"bad"})
+
+        result = reconcile_associations(_client(server), {"p1": {"bad", "good"}}, max_retries=0)
+
+        assert result.associated == 1
+        assert [change for change, _ in result.failed] == [("associate", "p1", "bad")]
+        assert result.failed[0][1].startswith("UnexpectedStatus")
+
+    def test_noveum_client_wrapper(self):
+        """Test NoveumClient.reconcile_associations applies the plan"""
+        server = _AssociationServer({"p1": {"a"}})
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        result = client.reconcile_associations({"p1": {"a", "b"}}, prune=False)
+
+        assert result.associated == 1 and result.removed == 0
+        assert server.associations == {"p1": {"a", "b"}}
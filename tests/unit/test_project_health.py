@@ -0,0 +1,124 @@
+"""
+Unit Tests for the Project Health Matrix
+
+Tests the matrix layout, per-cell failures, the TTL cache and single-flight
+deduplication of concurrent fetches.
+"""
+
+import threading
+import time
+
+import httpx
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.project_health import HealthMonitor, fetch_health_matrix
+
+
+class _HealthServer:
+    """MockTransport handler serving project and scorer health"""
+
+    def __init__(self, projects=("p1", "p2"), delay=0.0, missing=(), failing=()):
+        self.projects = projects
+        self.delay = delay
+        self.missing = set(missing)
+        self.failing = set(failing)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        path = request.url.path
+        environment = request.url.params.get("environment")
+        with self._lock:
+            self.requests.append((path, environment))
+        if path == "/api/v1/projects":
+            return httpx.Response(200, json=[{"id": project_id} for project_id in self.projects])
+        time.sleep(self.delay)
+        parts = path.split("/")
+        project_id, scorer_id = parts[4], (parts[7] if len(parts) > 7 else None)
+        if (project_id, scorer_id) in self.missing:
+            return httpx.Response(404, json={"error": "Not found"})
+        if (project_id, scorer_id) in self.failing:
+            return httpx.Response(400, json={"error": "Bad request"})
+        return httpx.Response(
+            200,
+            json={"success": True, "data": {"project": project_id, "scorer": scorer_id, "env": environment}},
+        )
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestHealthMatrix:
+    """Test fetching and reading health matrices"""
+
+    def test_matrix_cells(self):
+        """Test every project, scorer and environment combination is fetched into its cell"""
+        server = _HealthServer()
+
+        matrix = fetch_health_matrix(_client(server), None, ["s1", "s2"], ["prod", "dev"], concurrency=4)
+
+        assert matrix.projects == ("p1", "p2")
+        assert len(matrix.health) == 4 and len(matrix.scorer_health) == 8
+        assert matrix.project("p2", "dev") == {"project": "p2", "scorer": None, "env": "dev"}
+        assert matrix.scorer("p1", "s2", "prod") == {"project": "p1", "scorer": "s2", "env": "prod"}
+        assert len(matrix.rows()) == 12
+        assert not matrix.errors
+
+    def test_failed_and_missing_cells(self):
+        """Test 404 cells are empty and failed cells are reported without failing the matrix"""
+        server = _HealthServer(missing={("p1", "s1")}, failing={("p2", "s1")})
+
+        matrix = fetch_health_matrix(_client(server), ["p1", "p2"], ["s1"], max_retries=0)
+
+        assert matrix.scorer("p1", "s1") is None
+        assert matrix.scorer("p2", "s1") is None
+        assert list(matrix.errors) == [("p2", "s1", None)]
+        assert matrix.errors[("p2", "s1", None)].startswith("UnexpectedStatus")
+        assert matrix.project("p2") is not None
+
+    def test_ttl_cache(self):
+        """Test refreshes within the TTL are served from memory"""
+        server = _HealthServer()
+        monitor = HealthMonitor(_client(server), ttl=60)
+
+        monitor.fetch(scorers=["s1"])
+        sent = len(server.requests)
+        matrix = monitor.fetch(scorers=["s1"])
+
+        assert len(server.requests) == sent == 5
+        assert monitor.stats.hits == 4
+        assert matrix.scorer("p1", "s1") is not None
+
+        monitor.ttl = 0
+        monitor.fetch(["p1"])
+        assert len(server.requests) == sent + 1
+
+    def test_single_flight(self):
+        """Test concurrent refreshes share in-flight cell requests"""
+        server = _HealthServer(delay=0.05)
+        monitor = HealthMonitor(_client(server), ttl=0)
+        matrices = []
+
+        threads = [
+            threading.Thread(target=lambda: matrices.append(monitor.fetch(["p1", "p2"], ["s1"]))) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(matrices) == 4
+        assert len(server.requests) < 16
+        assert monitor.stats.coalesced == 16 - len(server.requests)
+
+    def test_noveum_client_keeps_the_cache(self):
+        """Test NoveumClient.fetch_health_matrix reuses cells across calls"""
+        server = _HealthServer()
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(server)
+
+        client.fetch_health_matrix(["p1"], ["s1"])
+        client.fetch_health_matrix(["p1"], ["s1"])
+
+        assert len(server.requests) == 2
@@ -0,0 +1,57 @@
+"""
+Unit Tests for the Result Key Index
+
+Tests recording, staleness checks and fetching of existing scorer results.
+"""
+
+import httpx
+
+from noveum_api_client import Client
+from noveum_api_client.result_index import ResultKeyIndex, parse_timestamp
+
+
+class TestResultKeyIndex:
+    """Test the item × scorer timestamp matrix"""
+
+    def test_add_and_lookup(self):
+        """Test keys of tracked scorers are recorded once, others ignored"""
+        index = ResultKeyIndex(["a", "b"])
+        index.add("item-1", "a", 10.0)
+        index.add("item-1", "a", 20.0)
+        index.add("item-2", "untracked", 5.0)
+
+        assert len(index) == 1
+        assert ("item-1", "a") in index
+        assert ("item-1", "b") not in index
+        assert index.scored_at("item-1", "a") == 20.0
+
+    def test_missing(self):
+        """Test missing and stale scorers are reported per item"""
+        index = ResultKeyIndex(["a", "b"])
+        index.add("item-1", "a", parse_timestamp("2026-01-01T00:00:00Z"))
+        index.add("item-1", "b")
+
+        assert index.missing({"item_id": "item-0"}) == ["a", "b"]
+        assert index.missing({"item_id": "item-1"}) == []
+        # Results without a timestamp are never stale
+        assert index.missing({"item_id": "item-1", "updated_at": "2026-02-01T00:00:00Z"}) == ["a"]
+        assert index.missing({"item_id": "item-1"}, stale_before=parse_timestamp("2026-02-01T00:00:00Z")) == ["a"]
+
+    def test_fetch_pages_through_results(self):
+        """Test every page is read and a single scorer is filtered server-side"""
+        stored = [{"itemId": f"item-{i}", "scorerId": "a"} for i in range(5)]
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.params)
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            return httpx.Response(200, json={"results": stored[offset : offset + limit]})
+
+        client = Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(handler)})
+        index = ResultKeyIndex.fetch(client, "ds", ["a"], page_size=2)
+
+        assert len(index) == 5
+        assert len(requests) == 3
+        assert requests[0]["scorerId"] == "a"
+        assert requests[0]["datasetSlug"] == "ds"
@@ -0,0 +1,179 @@
+"""
+Unit Tests for Streaming Scorer Result Iteration
+
+Tests prefetching, sharded paging, server page caps, adaptive page sizes and
+the lightweight records.
+"""
+
+import random
+import threading
+import time
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.result_stream import AdaptivePageSize, ResultRecord, aiter_results, iter_results
+
+
+class _ResultsServer:
+    """MockTransport handler paging over synthetic results"""
+
+    def __init__(self, count, report_total=True, cap=None, jitter=0.0):
+        self.results = [
+            {"datasetSlug": "ds", "itemId": f"item-{i}", "scorerId": "s", "score": i / count, "passed": i % 2 == 0}
+            for i in range(count)
+        ]
+        self.report_total = report_total
+        self.cap = cap
+        self.jitter = jitter
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        offset = int(float(request.url.params["offset"]))
+        limit = int(float(request.url.params["limit"]))
+        with self._lock:
+            self.requests.append((offset, limit, dict(request.url.params)))
+        if self.jitter:
+            time.sleep(random.random() * self.jitter)
+        if self.cap:
+            limit = min(limit, self.cap)
+        data = {"results": self.results[offset : offset + limit]}
+        if self.report_total:
+            data["pagination"] = {"total": len(self.results)}
+        return httpx.Response(200, json=data)
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+def _ids(records):
+    return [record.item_id for record in records]
+
+
+class TestIterResults:
+    """Test the synchronous iterator"""
+
+    def test_shards_keep_offset_order(self):
+        """Test parallel pages are yielded complete and in order"""
+        server = _ResultsServer(230, jitter=0.005)
+
+        records = list(iter_results(_client(server), page_size=20, shards=4))
+
+        assert _ids(records) == [f"item-{i}" for i in range(230)]
+        assert len(server.requests) == 12
+
+    def test_without_total_stops_at_short_page(self):
+        """Test sequential paging ends at the first short page"""
+        server = _ResultsServer(45, report_total=False)
+
+        records = list(iter_results(_client(server), page_size=20, prefetch=1, shards=8))
+
+        assert len(records) == 45
+        assert max(offset for offset, _, _ in server.requests) <= 60
+
+    def test_server_page_cap(self):
+        """Test a server capping the page size does not cause gaps"""
+        server = _ResultsServer(100, cap=30)
+
+        records = list(iter_results(_client(server), page_size=None, shards=3))
+
+        assert _ids(records) == [f"item-{i}" for i in range(100)]
+
+    @pytest.mark.parametrize("report_total", [True, False])
+    def test_cap_below_grown_page_size(self, report_total):
+        """Test a cap hit only after the adaptive size has grown re-requests the gap"""
+        server = _ResultsServer(3000, report_total=report_total, cap=700)
+
+        records = list(iter_results(_client(server), page_size=None, shards=4))
+
+        assert _ids(records) == [f"item-{i}" for i in range(3000)]
+
+    def test_filters_are_pushed_down(self):
+        """Test filters are sent as query parameters"""
+        server = _ResultsServer(3)
+
+        list(iter_results(_client(server), dataset_slug="ds", scorer_id="s", item_id="item-1"))
+
+        assert (
+            server.requests[0][2] | {"datasetSlug": "ds", "scorerId": "s", "itemId": "item-1"} == server.requests[0][2]
+        )
+
+    def test_early_exit(self):
+        """Test breaking out of the iteration stops paging"""
+        server = _ResultsServer(1000)
+
+        iterator = iter_results(_client(server), page_size=10, shards=2)
+        assert [next(iterator).item_id for _ in range(15)][-1] == "item-14"
+        iterator.close()
+
+        assert len(server.requests) < 10
+
+    def test_raw_records(self):
+        """Test raw mode yields the API dicts"""
+        assert next(iter_results(_client(_ResultsServer(2)), raw=True))["itemId"] == "item-0"
+
+
+class TestAiterResults:
+    """Test the asynchronous iterator"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("report_total", [True, False])
+    async def test_every_record_in_order(self, report_total):
+        """Test async paging yields every record in order"""
+        server = _ResultsServer(95, report_total=report_total)
+
+        records = [record async for record in aiter_results(_client(server), page_size=10, shards=4, prefetch=2)]
+
+        assert _ids(records) == [f"item-{i}" for i in range(95)]
+
+    @pytest.mark.asyncio
+    async def test_server_page_cap(self):
+        """Test async paging re-requests the records a capped page left out"""
+        server = _ResultsServer(250, cap=30)
+
+        records = [record async for record in aiter_results(_client(server), page_size=100, shards=3)]
+
+        assert _ids(records) == [f"item-{i}" for i in range(250)]
+
+
+class TestAdaptivePageSize:
+    """Test page size adaptation"""
+
+    def test_grows_when_fast_and_small(self):
+        """Test the size at most doubles per page up to the maximum"""
+        sizer = AdaptivePageSize(100, maximum=1000)
+        sizer.observe(100, 0.01, 10_000)
+        assert sizer.size == 200
+        for _ in range(5):
+            sizer.observe(sizer.size, 0.01, 10_000)
+        assert sizer.size == 1000
+
+    def test_shrinks_for_slow_or_large_pages(self):
+        """Test the size follows the latency and byte targets"""
+        sizer = AdaptivePageSize(1000, minimum=10, target_seconds=0.5)
+        sizer.observe(1000, 2.0, 1000)
+        assert sizer.size == 250
+        sizer.observe(250, 0.1, 250 * 1024 * 1024)
+        assert sizer.size == 10
+
+
+class TestResultRecord:
+    """Test the record conversion"""
+
+    def test_round_trip(self):
+        """Test both key styles are read and to_dict drops empty fields"""
+        record = ResultRecord.from_dict(
+            {"dataset_slug": "ds", "itemId": "i", "scorerId": "s", "score": 1, "passed": True, "executionTimeMs": 3.0}
+        )
+
+        assert record.to_dict() == {
+            "dataset_slug": "ds",
+            "item_id": "i",
+            "scorer_id": "s",
+            "score": 1.0,
+            "passed": True,
+            "execution_time_ms": 3.0,
+        }
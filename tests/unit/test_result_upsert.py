@@ -0,0 +1,123 @@
+"""
+Unit Tests for Scorer Result Upserts
+
+Tests batch creation, conflict detection and the PUT fallback.
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from noveum_api_client import Client
+from noveum_api_client.errors import UnexpectedStatus
+from noveum_api_client.result_upsert import find_conflicts, upsert_results, wire_result
+
+
+def _result(index, score=0.5):
+    return {"dataset_slug": "ds", "item_id": f"item-{index}", "scorer_id": "s", "score": score}
+
+
+class _ResultsServer:
+    """MockTransport handler holding results, rejecting batches with existing keys"""
+
+    def __init__(self, existing=(), report="whole"):
+        self.stored = {("ds", f"item-{i}", "s"): {"score": 0.0} for i in existing}
+        self.report = report
+        self.posts = 0
+        self.puts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        with self._lock:
+            if request.method == "PUT":
+                _, _, _, _, _, dataset, item, scorer = request.url.path.split("/")
+                self.puts.append(item)
+                self.stored[(dataset, item, scorer)] = body
+                return httpx.Response(200, json={})
+            self.posts += 1
+            keys = [(r["datasetSlug"], r["itemId"], r["scorerId"]) for r in body["results"]]
+            existing = [i for i, key in enumerate(keys) if key in self.stored]
+            # A batch rejected with 409 inserts nothing
+            if existing and self.report == "whole":
+                return httpx.Response(409, json={"error": "conflict"})
+            if existing and self.report == "409-index":
+                return httpx.Response(409, json={"conflicts": existing})
+            if existing and self.report == "409-keys":
+                conflicts = [{"itemId": keys[i][1], "scorerId": "s", "datasetSlug": "ds"} for i in existing]
+                return httpx.Response(409, json={"errors": [{**c, "code": "ALREADY_EXISTS"} for c in conflicts]})
+            for i, (key, result) in enumerate(zip(keys, body["results"], strict=True)):
+                if i not in existing:
+                    self.stored[key] = result
+            if existing and self.report == "index":
+                return httpx.Response(201, json={"data": {"conflicts": existing}})
+            return httpx.Response(201, json={})
+
+
+def _client(server):
+    return Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(server)})
+
+
+class TestUpsertResults:
+    """Test insert-or-update of results"""
+
+    def test_new_results_are_only_posted(self):
+        """Test results without conflicts are created in batches"""
+        server = _ResultsServer()
+        outcome = upsert_results(_client(server), [_result(i) for i in range(25)], batch_size=10)
+
+        assert (outcome.created, outcome.updated, outcome.batches) == (25, 0, 3)
+        assert server.puts == []
+
+    @pytest.mark.parametrize("report", ["whole", "index", "409-index", "409-keys"])
+    def test_only_conflicts_are_put(self, report):
+        """Test existing results are PUT, identified from the response or by splitting"""
+        server = _ResultsServer(existing=[3, 17], report=report)
+
+        outcome = upsert_results(_client(server), [_result(i, 0.9) for i in range(20)], batch_size=10, concurrency=4)
+
+        assert sorted(server.puts) == ["item-17", "item-3"]
+        assert (outcome.created, outcome.updated) == (18, 2)
+        assert all(stored["score"] == 0.9 for stored in server.stored.values())
+        assert len(server.stored) == 20
+        if report == "whole":
+            assert outcome.splits > 0
+
+    def test_rejected_batch_remainder_is_posted_again(self):
+        """Test a 409 naming its conflicts re-posts the rest of the batch"""
+        server = _ResultsServer(existing=[0], report="409-index")
+
+        outcome = upsert_results(_client(server), [_result(i, 0.9) for i in range(3)])
+
+        assert (outcome.created, outcome.updated, outcome.batches) == (2, 1, 2)
+        assert sorted(server.stored) == [("ds", f"item-{i}", "s") for i in range(3)]
+        assert all(stored["score"] == 0.9 for stored in server.stored.values())
+
+    def test_put_body_keeps_value_fields(self):
+        """Test the PUT body carries the values but not the key fields"""
+        server = _ResultsServer(existing=[0])
+        upsert_results(_client(server), [{**_result(0), "execution_time_ms": 12.5, "passed": True}])
+
+        assert server.stored[("ds", "item-0", "s")] == {"score": 0.5, "passed": True, "executionTimeMs": 12.5}
+
+    def test_other_errors_raise(self):
+        """Test non-conflict failures are not turned into PUTs"""
+        client = _client(lambda request: httpx.Response(400, json={}))
+
+        with pytest.raises(UnexpectedStatus):
+            upsert_results(client, [_result(0)])
+
+
+class TestFindConflicts:
+    """Test parsing of batch responses"""
+
+    def test_formats(self):
+        """Test indexes, index objects and key objects are understood"""
+        batch = [wire_result(_result(i)) for i in range(3)]
+
+        assert find_conflicts(b'{"conflicts": [2]}', batch) == [batch[2]]
+        assert find_conflicts(b'{"data": {"failed": [{"index": 0, "status": 409}]}}', batch) == [batch[0]]
+        assert find_conflicts(b'{"errors": [{"index": 1, "message": "invalid score"}]}', batch) is None
+        assert find_conflicts(b"not json", batch) is None
@@ -0,0 +1,123 @@
+"""
+Unit Tests for the Columnar Results Frame
+
+Tests loading, interning and grouped aggregation, with and without NumPy.
+"""
+
+import random
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, results_frame
+from noveum_api_client.results_frame import ResultsFrame
+
+
+def _records(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "datasetSlug": f"ds-{i % 2}",
+            "scorerId": f"scorer-{i % 3}",
+            "score": round(rng.random(), 3),
+            "passed": i % 4 != 0,
+            "executionTimeMs": float(i % 10),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test against the NumPy and the pure-Python implementation"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(results_frame, "np", None)
+    return request.param
+
+
+class TestResultsFrame:
+    """Test columnar loading and aggregation"""
+
+    def test_columns_are_interned(self, backend):
+        """Test IDs are stored as codes and both key styles are read"""
+        frame = ResultsFrame(
+            [
+                {"scorerId": "a", "datasetSlug": "ds", "score": 0.5, "passed": True},
+                {"scorer_id": "b", "dataset_slug": "ds", "score": 1, "execution_time_ms": 3},
+                {"scorerId": "a", "datasetSlug": "ds"},
+            ]
+        )
+
+        columns = frame.columns()
+        assert len(frame) == 3
+        assert (frame.scorer_ids, frame.dataset_slugs) == (["a", "b"], ["ds"])
+        assert list(columns["scorer"]) == [0, 1, 0]
+        assert list(columns["score"]) == [0.5, 1.0, 0.0]
+        assert [bool(value) for value in columns["passed"]] == [True, False, False]
+
+    def test_aggregate_by_scorer(self, backend):
+        """Test counts, pass rates, means and percentiles per scorer"""
+        records = _records(300)
+        stats = ResultsFrame(records).aggregate(by="scorer", percentiles=(0, 50, 100))
+
+        assert set(stats) == {"scorer-0", "scorer-1", "scorer-2"}
+        group = [r for r in records if r["scorerId"] == "scorer-1"]
+        scores = sorted(r["score"] for r in group)
+        expected = stats["scorer-1"]
+        assert expected.count == len(group) == 100
+        assert expected.passed == sum(r["passed"] for r in group)
+        assert expected.mean_score == pytest.approx(sum(scores) / len(scores))
+        assert (expected.min_score, expected.max_score) == (scores[0], scores[-1])
+        assert expected.percentiles[0] == scores[0]
+        assert expected.percentiles[50] == pytest.approx((scores[49] + scores[50]) / 2)
+        assert expected.percentiles[100] == scores[-1]
+
+    def test_group_keys(self, backend):
+        """Test dataset, dataset/scorer and whole-frame groupings"""
+        frame = ResultsFrame(_records(12))
+
+        assert {key: s.count for key, s in frame.aggregate(by="dataset").items()} == {"ds-0": 6, "ds-1": 6}
+        combined = frame.aggregate(by="dataset_scorer")
+        assert len(combined) == 6
+        assert combined[("ds-1", "scorer-2")].count == 2
+        assert frame.aggregate(by=None)[None].count == 12
+
+    def test_histogram(self, backend):
+        """Test scores are binned per group, the upper bound in the last bin"""
+        frame = ResultsFrame(
+            [{"scorerId": "a", "score": score} for score in (0.0, 0.05, 0.5, 1.0, 1.5)] + [{"scorerId": "b"}]
+        )
+
+        assert frame.histogram(bins=4) == {"a": [2, 0, 1, 1], "b": [1, 0, 0, 0]}
+
+    def test_backends_agree(self):
+        """Test the NumPy and pure-Python aggregates are equal"""
+        pytest.importorskip("numpy")
+        frame = ResultsFrame(_records(1000))
+        vectorized = frame.aggregate(by="dataset_scorer", percentiles=(10, 50, 90, 99))
+        results_frame.np, saved = None, results_frame.np
+        try:
+            plain = frame.aggregate(by="dataset_scorer", percentiles=(10, 50, 90, 99))
+        finally:
+            results_frame.np = saved
+
+        assert vectorized.keys() == plain.keys()
+        for key, stats in vectorized.items():
+            expected = plain[key].to_dict()
+            assert stats.percentiles == pytest.approx(expected.pop("percentiles"))
+            assert {k: v for k, v in stats.to_dict().items() if k != "percentiles"} == pytest.approx(expected)
+
+    def test_fetch(self):
+        """Test fetch loads every page of results"""
+        records = _records(5)
+
+        def handler(request):
+            offset = int(float(request.url.params["offset"]))
+            limit = int(float(request.url.params["limit"]))
+            return httpx.Response(200, json={"results": records[offset : offset + limit]})
+
+        client = Client(base_url="https://api.test", httpx_args={"transport": httpx.MockTransport(handler)})
+
+        assert len(ResultsFrame.fetch(client, dataset_slug="ds", page_size=2)) == 5
@@ -0,0 +1,208 @@
+"""
+Unit Tests for the Scorer Registry
+
+Tests preloading, write invalidation through the same client, TTL expiry and
+the NoveumClient wiring.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from noveum_api_client import Client, NoveumClient
+from noveum_api_client.api.scorer_results import delete_api_v1_scorers_results_by_dataset_slug_by_item_id_by_scorer_id
+from noveum_api_client.api.scorers import delete_api_v1_scorers_by_id, post_api_v1_scorers, put_api_v1_scorers_by_id
+from noveum_api_client.errors import UnexpectedStatus
+from noveum_api_client.models import PostApiV1ScorersBody, PutApiV1ScorersByIdBody
+from noveum_api_client.scorer_registry import ScorerRegistry
+from noveum_api_client.transport import WriteHookTransport
+
+
+def _scorer(scorer_id, name=None):
+    return {
+        "id": scorer_id,
+        "name": name or scorer_id,
+        "description": "",
+        "type": "llm",
+        "tag": "quality",
+        "isDefault": False,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class _ScorersServer:
+    """MockTransport handler serving scorer definitions and counting reads"""
+
+    def __init__(self, *scorer_ids):
+        self.scorers = {scorer_id: _scorer(scorer_id) for scorer_id in scorer_ids}
+        self.lists = 0
+        self.gets = []
+
+    def __call__(self, request):
+        path = request.url.path.rstrip("/")
+        scorer_id = path.rsplit("/", 1)[-1]
+        if request.method == "GET" and path == "/api/v1/scorers":
+            self.lists += 1
+            return httpx.Response(200, json={"scorers": list(self.scorers.values())})
+        if request.method == "GET":
+            self.gets.append(scorer_id)
+            if scorer_id not in self.scorers:
+                return httpx.Response(404, json={"error": "Scorer not found"})
+            return httpx.Response(200, json=self.scorers[scorer_id])
+        if request.method == "DELETE":
+            self.scorers.pop(scorer_id, None)
+        elif request.method == "PUT":
+            self.scorers[scorer_id] = _scorer(scorer_id, json.loads(request.content)["name"])
+        elif request.method == "POST":
+            created = _scorer(json.loads(request.content)["name"])
+            self.scorers[created["id"]] = created
+        return httpx.Response(200, json={})
+
+
+def _registry(server, ttl=300.0):
+    hooks = WriteHookTransport(httpx.MockTransport(server))
+    client = Client(base_url="https://api.test", httpx_args={"transport": hooks})
+    registry = ScorerRegistry(client, ttl=ttl)
+    hooks.subscribe(registry.on_write)
+    return client, registry
+
+
+class TestScorerRegistry:
+    """Test in-memory scorer lookups"""
+
+    def test_preload_serves_lookups_from_memory(self):
+        """Test one list request answers every later lookup"""
+        server = _ScorersServer("a", "b")
+        _, registry = _registry(server)
+
+        assert registry.preload() == 2
+        assert registry.get("a").name == "a"
+        assert registry.get("b").type_ == "llm"
+        assert {scorer.id for scorer in registry.all()} == {"a", "b"}
+
+        assert (server.lists, server.gets) == (1, [])
+        assert registry.stats.to_dict() == {"hits": 2, "misses": 0, "loads": 1, "invalidations": 0}
+
+    def test_unknown_scorer_is_fetched_once(self):
+        """Test a miss is fetched individually and then cached"""
+        server = _ScorersServer("a")
+        _, registry = _registry(server)
+
+        registry.get("a")
+        registry.get("a")
+
+        assert server.gets == ["a"]
+        assert "a" in registry
+
+    def test_missing_scorer_raises(self):
+        """Test a scorer the API does not know raises UnexpectedStatus"""
+        _, registry = _registry(_ScorersServer())
+
+        with pytest.raises(UnexpectedStatus):
+            registry.get("nope")
+
+    def test_writes_through_the_client_invalidate(self):
+        """Test PUT and DELETE of a scorer drop it from the registry"""
+        server = _ScorersServer("a", "b")
+        client, registry = _registry(server)
+        registry.preload()
+
+        put_api_v1_scorers_by_id.sync_detailed(
+            "a", client=client, id_query="a", body=PutApiV1ScorersByIdBody(name="renamed")
+        )
+        delete_api_v1_scorers_by_id.sync_detailed("b", client=client, id_query="b")
+
+        assert "a" not in registry
+        assert registry.get("a").name == "renamed"
+        assert [scorer.id for scorer in registry.all()] == ["a"]
+        assert server.lists == 2
+        assert registry.stats.invalidations == 2
+
+    def test_create_reloads_the_list(self):
+        """Test a created scorer shows up in all()"""
+        server = _ScorersServer("a")
+        client, registry = _registry(server)
+        registry.preload()
+
+        post_api_v1_scorers.sync_detailed(
+            client=client, body=PostApiV1ScorersBody(name="new", description="", type_="llm", tag="quality")
+        )
+
+        assert {scorer.id for scorer in registry.all()} == {"a", "new"}
+
+    def test_result_writes_are_ignored(self):
+        """Test writes to /api/v1/scorers/results leave scorers cached"""
+        server = _ScorersServer("a")
+        client, registry = _registry(server)
+        registry.preload()
+
+        delete_api_v1_scorers_results_by_dataset_slug_by_item_id_by_scorer_id.sync_detailed(
+            "ds", "item", "a", client=client, dataset_slug_query="ds", item_id_query="item", scorer_id_query="a"
+        )
+
+        assert "a" in registry
+        assert registry.stats.invalidations == 0
+
+    def test_async_writes_invalidate(self):
+        """Test the hook also fires for requests sent by the async client"""
+        server = _ScorersServer("a")
+        client, registry = _registry(server)
+        registry.preload()
+
+        asyncio.run(delete_api_v1_scorers_by_id.asyncio_detailed("a", client=client, id_query="a"))
+
+        assert "a" not in registry
+
+    def test_expired_entries_are_refetched(self):
+        """Test entries older than the TTL are fetched again"""
+        server = _ScorersServer("a")
+        _, registry = _registry(server, ttl=0.0)
+        registry.preload()
+
+        registry.get("a")
+
+        assert server.gets == ["a"]
+        assert registry.stats.misses == 1
+
+
+class TestNoveumClientScorers:
+    """Test scorer registry wiring in NoveumClient"""
+
+    def test_registry_is_opt_in(self):
+        """Test the registry is only available with scorer_registry_ttl"""
+        with pytest.raises(RuntimeError):
+            _ = NoveumClient(api_key="test_key").scorers
+
+        client = NoveumClient(api_key="test_key", scorer_registry_ttl=60)
+        assert isinstance(client.client._httpx_args["transport"], WriteHookTransport)
+        assert client.scorers.ttl == 60
+
+    def test_get_scorer_uses_registry(self):
+        """Test get_scorer is served from memory and invalidated by writes"""
+        server = _ScorersServer("a")
+        client = NoveumClient(api_key="test_key", base_url="https://api.test", scorer_registry_ttl=60)
+        client.client._httpx_args["transport"]._sync_transport = httpx.MockTransport(server)
+
+        client.get_scorer("a")
+        client.get_scorer("a")
+        delete_api_v1_scorers_by_id.sync_detailed("a", client=client.client, id_query="a")
+
+        assert (server.lists, server.gets) == (1, [])
+        assert "a" not in client.scorers
+
+    def test_first_get_scorer_preloads_once(self):
+        """Test the first lookup loads the list and later misses are fetched individually"""
+        server = _ScorersServer("a", "b")
+        client = NoveumClient(api_key="test_key", base_url="https://api.test", scorer_registry_ttl=60)
+        client.client._httpx_args["transport"]._sync_transport = httpx.MockTransport(server)
+
+        client.get_scorer("a")
+        client.get_scorer("b")
+        server.scorers["c"] = _scorer("c")
+        client.get_scorer("c")
+
+        assert (server.lists, server.gets) == (1, ["c"])
+        assert client.scorers.stats.hits == 2
@@ -0,0 +1,172 @@
+"""
+Unit Tests for Layered Transports and Connection Warmup
+
+Uses a local keep-alive HTTP server so that connection reuse is real.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from noveum_api_client import NoveumClient
+from noveum_api_client.transport import LatencyStats, LatencyTransport, LayeredTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server_url():
+    """Start a local keep-alive HTTP server for the duration of a test"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestLayeredTransport:
+    """Test the base layered transport"""
+
+    def test_forwards_sync_requests(self):
+        """Test sync requests are forwarded to the wrapped transport"""
+        inner = httpx.MockTransport(lambda request: httpx.Response(200, json={"path": request.url.path}))
+        with httpx.Client(transport=LayeredTransport(inner), base_url="https://api.test") as http:
+            response = http.get("/api/health")
+
+        assert response.json() == {"path": "/api/health"}
+
+    @pytest.mark.asyncio
+    async def test_forwards_async_requests(self):
+        """Test async requests are forwarded to the wrapped transport"""
+        inner = httpx.MockTransport(lambda request: httpx.Response(204))
+        async with httpx.AsyncClient(transport=LayeredTransport(inner), base_url="https://api.test") as http:
+            response = await http.get("/api/health")
+
+        assert response.status_code == 204
+
+
+class TestLatencyTransport:
+    """Test cold vs warm latency instrumentation"""
+
+    def test_first_request_is_cold_then_warm(self, local_server_url):
+        """Test a reused connection is recorded as warm"""
+        latency = LatencyTransport()
+        with httpx.Client(transport=latency, base_url=local_server_url) as http:
+            http.get("/api/health")
+            http.get("/api/health")
+
+        snapshot = latency.snapshot()
+        assert snapshot["cold"]["requests"] == 1
+        assert snapshot["warm"]["requests"] == 1
+        assert snapshot["cold"]["connect_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_async_requests_are_recorded(self, local_server_url):
+        """Test async requests go through the trace hooks"""
+        latency = LatencyTransport()
+        async with httpx.AsyncClient(transport=latency, base_url=local_server_url) as http:
+            await http.get("/api/health")
+            await http.get("/api/health")
+
+        assert latency.cold.requests == 1
+        assert latency.warm.requests == 1
+
+    def test_reset_clears_stats(self):
+        """Test reset discards recorded timings"""
+        latency = LatencyTransport(httpx.MockTransport(lambda request: httpx.Response(200)))
+        with httpx.Client(transport=latency) as http:
+            http.get("https://api.test/api/health")
+        latency.reset()
+
+        assert latency.warm.requests == 0
+
+    def test_stats_mean(self):
+        """Test mean is computed over recorded requests"""
+        stats = LatencyStats()
+        assert stats.mean_ms == 0.0
+        stats.add(10.0, 0.0)
+        stats.add(30.0, 0.0)
+        assert stats.mean_ms == 20.0
+        assert stats.max_ms == 30.0
+
+
+class TestWarmup:
+    """Test NoveumClient connection pre-warming"""
+
+    def test_warmup_opens_distinct_connections(self, local_server_url):
+        """Test warmup fills the pool so later requests are warm"""
+        client = NoveumClient(api_key="test_key", base_url=local_server_url, track_latency=True)
+
+        assert client.warmup(3) == 3
+        for _ in range(3):
+            client.client.get_httpx_client().get("/api/health")
+
+        stats = client.latency_stats()
+        assert stats["cold"]["requests"] == 3
+        assert stats["warm"]["requests"] == 3
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_warmup_async_opens_distinct_connections(self, local_server_url):
+        """Test async warmup fills the async pool"""
+        client = NoveumClient(api_key="test_key", base_url=local_server_url, track_latency=True)
+
+        assert await client.warmup_async(2) == 2
+        await client.client.get_async_httpx_client().get("/api/health")
+
+        stats = client.latency_stats()
+        assert stats["cold"]["requests"] == 2
+        assert stats["warm"]["requests"] == 1
+        await client.client.get_async_httpx_client().aclose()
+
+    def test_warmup_is_not_coalesced(self, local_server_url):
+        """Test the concurrent health checks each open a connection with coalescing enabled"""
+        client = NoveumClient(api_key="test_key", base_url=local_server_url, track_latency=True, coalesce_requests=True)
+
+        assert client.warmup(4) == 4
+
+        assert client.latency_stats()["cold"]["requests"] == 4
+        client.close()
+
+    def test_warmup_counts_only_healthy_responses(self):
+        """Test connections answered with a server error are not counted as warmed"""
+        client = NoveumClient(api_key="test_key", base_url="https://api.test")
+        client.client._httpx_args["transport"] = httpx.MockTransport(lambda request: httpx.Response(503))
+
+        assert client.warmup(2, timeout=1.0) == 0
+
+    def test_warmup_reports_failed_connections(self):
+        """Test warmup counts only connections that opened"""
+        client = NoveumClient(api_key="test_key", base_url="http://127.0.0.1:9")
+
+        assert client.warmup(2, timeout=1.0) == 0
+
+    def test_warmup_rejects_non_positive_count(self):
+        """Test warmup validates n_connections"""
+        client = NoveumClient(api_key="test_key")
+
+        with pytest.raises(ValueError):
+            client.warmup(0)
+
+    def test_latency_stats_requires_tracking(self):
+        """Test latency_stats raises when tracking is disabled"""
+        client = NoveumClient(api_key="test_key")
+
+        with pytest.raises(RuntimeError):
+            client.latency_stats()